@@ -0,0 +1,290 @@
+"""Synthetic benchmark history generator.
+
+Writes a workspace with a `.ccbenchmark/settings.yaml` and a result store of
+`_iter_*` directories as `ccbenchmark run` would leave them, so ccbenchmark can
+be measured on histories far larger than any real project has yet (see
+`self_benchmark.py`). Google Benchmark results are written as JSON, CSV and
+console output, alternating between runnables, and pyperf results as JSON.
+
+Results are realistic enough to exercise every parser path: benchmarks come in
+families with arguments, some families are repeated (aggregates and samples),
+some have BigO/RMS entries, and times drift between iterations with occasional
+step changes. The same seed always produces the same files.
+
+Usage:
+    python benchmarks/generate_history.py WORKSPACE [--benchmarks N] [--iterations N]
+        [--formats json csv console pyperf] [--seed N]
+
+    # 20k Google Benchmark entries x 500 iterations
+    python benchmarks/generate_history.py /tmp/history --benchmarks 20000 --iterations 500 --formats json csv console
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+"""Formats written, Google Benchmark formats are file suffixes of the same framework."""
+FORMATS = ['json', 'csv', 'console', 'pyperf']
+GOOGLE_BENCHMARK_FORMATS = {'json', 'csv', 'console'}
+"""Arguments of every family, each is one benchmark."""
+FAMILY_ARGS = [8, 64, 512, 4096]
+REPETITIONS = 3
+"""Every n-th family is repeated, every m-th one has BigO and RMS entries."""
+REPEATED_FAMILY_PERIOD = 5
+COMPLEXITY_FAMILY_PERIOD = 10
+"""Chance per benchmark and iteration of a step change (e.g., a regression)."""
+STEP_PROBABILITY = 0.002
+NOISE = 0.02
+DRIFT = 0.005
+
+CSV_HEADER = 'name,iterations,real_time,cpu_time,time_unit,bytes_per_second,items_per_second,label,error_occurred,error_message\n'
+CONSOLE_HEADER = (
+    '-' * 62 + '\n'
+    + f'{"Benchmark":<31}{"Time":>10}{"CPU":>12}{"Iterations":>14}\n'
+    + '-' * 62 + '\n'
+)
+
+@dataclass(slots=True)
+class _Family:
+    name: str
+    repeated: bool
+    complexity: bool
+    """Current time of each argument in ns, updated every iteration."""
+    levels: list[float] = field(default_factory=lambda: [])
+
+@dataclass(slots=True)
+class _Runnable:
+    path: Path
+    output_format: str
+    families: list[_Family] = field(default_factory=lambda: [])
+
+@dataclass(slots=True)
+class GeneratedHistory:
+    """Summary of a generated workspace.
+
+    Attributes:
+        workspace: Directory containing `.ccbenchmark/settings.yaml`.
+        benchmark_count: Benchmarks (family and argument) of every runnable.
+        iteration_count: `_iter_*` directories of every runnable.
+        file_count: Result files written.
+        byte_count: Size of every result file.
+    """
+    workspace: Path
+    benchmark_count: int
+    iteration_count: int
+    file_count: int = 0
+    byte_count: int = 0
+
+def _create_runnables(rng: random.Random, benchmark_count: int, formats: list[str], benchmarks_per_runnable: int) -> list[_Runnable]:
+    runnables: list[_Runnable] = []
+    family_count = max(math.ceil(benchmark_count/len(FAMILY_ARGS)), 1)
+    families_per_runnable = max(benchmarks_per_runnable//len(FAMILY_ARGS), 1)
+    for family_index in range(family_count):
+        runnable_index = family_index//families_per_runnable
+        if runnable_index == len(runnables):
+            output_format = formats[runnable_index % len(formats)]
+            language = 'python' if output_format == 'pyperf' else 'cpp'
+            path = Path(language) / f'lib{runnable_index//8}' / f'bench_{runnable_index}'
+            runnables.append(_Runnable(path, output_format))
+        repeated = family_index % REPEATED_FAMILY_PERIOD == 0
+        complexity = family_index % COMPLEXITY_FAMILY_PERIOD == 1 and runnables[-1].output_format != 'pyperf'
+        base_time = math.exp(rng.uniform(2.0, 12.0))
+        runnables[-1].families.append(_Family(
+            f'BM_Family{family_index}', repeated, complexity,
+            [base_time*arg/FAMILY_ARGS[0] for arg in FAMILY_ARGS]
+        ))
+    return runnables
+
+def _advance(rng: random.Random, family: _Family) -> None:
+    """Moves every level of `family` to the next iteration."""
+    step = math.exp(rng.gauss(0.0, 0.2)) if rng.random() < STEP_PROBABILITY*len(FAMILY_ARGS) else 1.0
+    drift = math.exp(rng.gauss(0.0, DRIFT))
+    family.levels = [level*step*drift for level in family.levels]
+
+def _samples(rng: random.Random, level: float, count: int) -> list[float]:
+    return [level*max(rng.gauss(1.0, NOISE), 0.5) for _ in range(count)]
+
+def _aggregates(values: list[float]) -> dict[str, float]:
+    mean = sum(values)/len(values)
+    stddev = math.sqrt(sum((value - mean)**2 for value in values)/(len(values) - 1))
+    return {'mean': mean, 'median': sorted(values)[len(values)//2], 'stddev': stddev, 'cv': stddev/mean}
+
+def _iterations(level: float) -> int:
+    return max(int(1e9/level), 1)
+
+def _write_google_benchmark_json(rng: random.Random, runnable: _Runnable) -> str:
+    benchmarks: list[dict] = []
+    for family_index, family in enumerate(runnable.families):
+        repetitions = REPETITIONS if family.repeated else 1
+        for arg_index, (arg, level) in enumerate(zip(FAMILY_ARGS, family.levels)):
+            run_name = f'{family.name}/{arg}' + (f'/repeats:{REPETITIONS}' if family.repeated else '')
+            real_times = _samples(rng, level, repetitions)
+            cpu_times = [real_time*0.99 for real_time in real_times]
+            common = {
+                'family_index': family_index, 'per_family_instance_index': arg_index,
+                'run_name': run_name, 'repetitions': repetitions, 'threads': 1, 'time_unit': 'ns'
+            }
+            for repetition_index, (real_time, cpu_time) in enumerate(zip(real_times, cpu_times)):
+                benchmarks.append({
+                    'name': run_name, **common, 'run_type': 'iteration', 'repetition_index': repetition_index,
+                    'iterations': _iterations(level), 'real_time': real_time, 'cpu_time': cpu_time
+                })
+            if not family.repeated:
+                continue
+            real_aggregates = _aggregates(real_times)
+            cpu_aggregates = _aggregates(cpu_times)
+            for aggregate_name in real_aggregates:
+                benchmarks.append({
+                    'name': f'{run_name}_{aggregate_name}', **common, 'run_type': 'aggregate',
+                    'aggregate_name': aggregate_name, 'iterations': repetitions,
+                    'real_time': real_aggregates[aggregate_name], 'cpu_time': cpu_aggregates[aggregate_name]
+                })
+        if family.complexity:
+            coefficient = family.levels[-1]/(FAMILY_ARGS[-1]*math.log2(FAMILY_ARGS[-1]))
+            common = {'family_index': family_index, 'run_name': family.name, 'run_type': 'aggregate', 'repetitions': 1, 'threads': 1}
+            benchmarks.append({
+                'name': f'{family.name}_BigO', **common, 'aggregate_name': 'BigO',
+                'real_coefficient': coefficient, 'cpu_coefficient': coefficient*0.99, 'big_o': 'NlgN', 'time_unit': 'ns'
+            })
+            benchmarks.append({
+                'name': f'{family.name}_RMS', **common, 'aggregate_name': 'RMS', 'rms': abs(rng.gauss(0.0, NOISE))
+            })
+    context = {'executable': runnable.path.as_posix(), 'num_cpus': 8, 'library_build_type': 'release'}
+    return json.dumps({'context': context, 'benchmarks': benchmarks}, indent=1)
+
+def _text_rows(rng: random.Random, runnable: _Runnable) -> list[tuple[str, float, float, str, int]]:
+    """Rows (name, real time, CPU time, unit, iterations) of the CSV and console output."""
+    rows: list[tuple[str, float, float, str, int]] = []
+    for family in runnable.families:
+        repetitions = REPETITIONS if family.repeated else 1
+        for arg, level in zip(FAMILY_ARGS, family.levels):
+            name = f'{family.name}/{arg}' + (f'/repeats:{REPETITIONS}' if family.repeated else '')
+            real_times = _samples(rng, level, repetitions)
+            rows += [(name, real_time, real_time*0.99, 'ns', _iterations(level)) for real_time in real_times]
+            if family.repeated:
+                for aggregate_name, value in _aggregates(real_times).items():
+                    rows.append((f'{name}_{aggregate_name}', value, value*0.99, 'ns', repetitions))
+        if family.complexity:
+            coefficient = family.levels[-1]/(FAMILY_ARGS[-1]*math.log2(FAMILY_ARGS[-1]))
+            rms = abs(rng.gauss(0.0, NOISE))
+            rows.append((f'{family.name}_BigO', coefficient, coefficient*0.99, 'NlgN', 0))
+            rows.append((f'{family.name}_RMS', rms, rms, '%', 0))
+    return rows
+
+def _write_google_benchmark_csv(rng: random.Random, runnable: _Runnable) -> str:
+    lines = [CSV_HEADER]
+    for name, real_time, cpu_time, unit, iterations in _text_rows(rng, runnable):
+        lines.append(f'"{name}",{iterations},{real_time:.6g},{cpu_time:.6g},{unit},,,,,\n')
+    return ''.join(lines)
+
+def _write_google_benchmark_console(rng: random.Random, runnable: _Runnable) -> str:
+    lines = [CONSOLE_HEADER]
+    for name, real_time, cpu_time, unit, iterations in _text_rows(rng, runnable):
+        lines.append(f'{name:<30} {real_time:>10.4g} {unit:<3}{cpu_time:>8.4g} {unit:<3}{iterations:>10}\n')
+    return ''.join(lines)
+
+def _write_pyperf_json(rng: random.Random, runnable: _Runnable) -> str:
+    benchmarks: list[dict] = []
+    for family in runnable.families:
+        for arg, level in zip(FAMILY_ARGS, family.levels):
+            runs = [
+                {'metadata': {'date': '2024-01-01 00:00:00'}, 'values': [value*1e-9 for value in _samples(rng, level, 3)]}
+                for _ in range(REPETITIONS if family.repeated else 1)
+            ]
+            benchmarks.append({'metadata': {'name': f'{family.name}/{arg}', 'unit': 'second'}, 'runs': runs})
+    return json.dumps({'version': '1.0', 'metadata': {}, 'benchmarks': benchmarks})
+
+_WRITERS = {
+    'json': (_write_google_benchmark_json, '.json'),
+    'csv': (_write_google_benchmark_csv, '.csv'),
+    'console': (_write_google_benchmark_console, '.console'),
+    'pyperf': (_write_pyperf_json, '.json'),
+}
+
+def _write_settings(workspace: Path, formats: list[str]) -> None:
+    lines: list[str] = []
+    if any(output_format in GOOGLE_BENCHMARK_FORMATS for output_format in formats):
+        lines += ['cpp.google_benchmark:', '  benchmark_runnables:', '    - bin/cpp', '  output_dir: out/cpp', '  output_format: json']
+    if 'pyperf' in formats:
+        lines += ['python.pyperf:', '  benchmark_runnables:', '    - bin/python', '  output_dir: out/python', '  output_format: json']
+    settings_path = workspace / '.ccbenchmark' / 'settings.yaml'
+    settings_path.parent.mkdir(parents=True, exist_ok=True)
+    settings_path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+def generate_history(
+    workspace: Path,
+    benchmark_count: int = 2000,
+    iteration_count: int = 50,
+    formats: list[str] = FORMATS,
+    benchmarks_per_runnable: int = 400,
+    seed: int = 0
+) -> GeneratedHistory:
+    """Writes a workspace with `iteration_count` iterations of `benchmark_count` benchmarks.
+
+    Results of runnable `<language>/libN/bench_M` are written to
+    `WORKSPACE/out/<language>/libN/_iter_XXXX/bench_M.<suffix>`. Iterations are
+    named by their index and their files get increasing modification times, so
+    ccbenchmark orders them as they were generated.
+
+    Args:
+        workspace: Directory written to, created if missing.
+        benchmark_count: Benchmarks over every runnable, rounded up to whole families.
+        iteration_count: Iterations of every runnable.
+        formats: Formats of the runnables, assigned in turn (see `FORMATS`).
+        benchmarks_per_runnable: Benchmarks in each result file.
+        seed: Seed of the generated times.
+
+    Returns:
+        GeneratedHistory: Counts of what was written.
+    """
+    rng = random.Random(seed)
+    runnables = _create_runnables(rng, benchmark_count, formats, benchmarks_per_runnable)
+    _write_settings(workspace, formats)
+
+    history = GeneratedHistory(
+        workspace, sum(len(runnable.families) for runnable in runnables)*len(FAMILY_ARGS), iteration_count
+    )
+    start_time = time.time() - iteration_count
+    for iteration_index in range(iteration_count):
+        mtime = start_time + iteration_index
+        for runnable in runnables:
+            for family in runnable.families:
+                _advance(rng, family)
+            write, suffix = _WRITERS[runnable.output_format]
+            iteration_path = workspace / 'out' / runnable.path.parent / f'_iter_{iteration_index:04d}'
+            iteration_path.mkdir(parents=True, exist_ok=True)
+            file_path = iteration_path / f'{runnable.path.name}{suffix}'
+            contents = write(rng, runnable)
+            file_path.write_text(contents, encoding='utf-8')
+            os.utime(file_path, (mtime, mtime))
+            history.file_count += 1
+            history.byte_count += len(contents)
+    return history
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Generate a synthetic benchmark history for measuring ccbenchmark.')
+    parser.add_argument('workspace', type=Path, help='Directory the workspace is written to')
+    parser.add_argument('--benchmarks', type=int, default=2000, help='Number of benchmarks')
+    parser.add_argument('--iterations', type=int, default=50, help='Number of _iter_* directories')
+    parser.add_argument('--formats', nargs='+', choices=FORMATS, default=FORMATS, help='Formats assigned to runnables in turn')
+    parser.add_argument('--per_runnable', type=int, default=400, help='Benchmarks in each result file')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the generated times')
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    history = generate_history(args.workspace, args.benchmarks, args.iterations, args.formats, args.per_runnable, args.seed)
+    print(
+        f'{history.benchmark_count} benchmarks x {history.iteration_count} iterations: '
+        f'{history.file_count} files, {history.byte_count/1e6:.1f} MB in {time.perf_counter() - start_time:.1f} s'
+    )
+    print(f'Workspace: {history.workspace}')
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""Import-time benchmark for the ccbenchmark CLI.
+
+Imports the CLI module in fresh interpreters with ``python -X importtime`` and
+reports the median cumulative import time of every module it pulled in. The CLI
+is started for every action, so anything it imports up front is paid on every
+call, including ``ccbenchmark r``.
+
+Usage:
+    python benchmarks/import_time.py [--runs N] [--budget MS] [--module MODULE]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+CLI_MODULE = 'ccbenchmark.__main__'
+"""Median cumulative import time of `CLI_MODULE` allowed, in milliseconds."""
+IMPORT_TIME_BUDGET_MS = 100.0
+"""Modules that must only be imported by the action that needs them."""
+DEFERRED_MODULES = [
+    'PyQt5',
+    'yaml',
+    'ccbenchmark._ccbenchmark',
+    'ccbenchmark.gui',
+    'ccbenchmark.benchmark_helpers',
+    'ccbenchmark.frameworks',
+]
+"""Modules actions import first, each must import on its own without an import cycle."""
+ACTION_MODULES = [
+    'ccbenchmark.benchmark_framework',
+    'ccbenchmark.benchmark_settings',
+    'ccbenchmark.benchmark_helpers',
+    'ccbenchmark.frameworks.cpp.google_benchmark',
+    'ccbenchmark.frameworks.python.pyperf',
+]
+
+_SRC_DIR = Path(__file__).resolve().parent.parent / 'src'
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    """Parses ``-X importtime`` output into cumulative microseconds per module.
+
+    Args:
+        stderr: Output written by the interpreter to stderr.
+
+    Returns:
+        dict[str, int]: Module name mapped to its cumulative import time in us.
+    """
+    cumulative_times: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        cumulative_times[fields[2].strip()] = int(fields[1])
+    return cumulative_times
+
+def _get_env() -> dict[str, str]:
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [str(_SRC_DIR), env.get('PYTHONPATH')]))
+    return env
+
+def import_first(module: str) -> subprocess.CompletedProcess:
+    """Imports `module` as the first ccbenchmark module of a fresh interpreter, which is how an import cycle shows."""
+    return subprocess.run([sys.executable, '-c', f'import {module}'], env=_get_env(), capture_output=True, text=True)
+
+def measure_import_times(module: str = CLI_MODULE, runs: int = 5) -> dict[str, float]:
+    """Imports `module` in `runs` fresh interpreters.
+
+    Args:
+        module: Module to import.
+        runs: Number of interpreters started.
+
+    Returns:
+        dict[str, float]: Module name mapped to its median cumulative import time in us.
+    """
+    env = _get_env()
+    samples: dict[str, list[int]] = {}
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            env=env, capture_output=True, text=True, check=True
+        )
+        for name, cumulative_time in parse_importtime(completed.stderr).items():
+            samples.setdefault(name, []).append(cumulative_time)
+
+    return {name: statistics.median(times) for name, times in samples.items()}
+
+def get_deferred_imports(import_times: dict[str, float]) -> list[str]:
+    """Returns modules in `import_times` that should have been deferred."""
+    return [
+        name for name in import_times
+        if any(name == deferred or name.startswith(f'{deferred}.') for deferred in DEFERRED_MODULES)
+    ]
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Measure import time of the ccbenchmark CLI.')
+    parser.add_argument('--runs', type=int, default=10, help='Number of interpreters started')
+    parser.add_argument('--budget', type=float, default=IMPORT_TIME_BUDGET_MS, help='Allowed import time in ms')
+    parser.add_argument('--module', default=CLI_MODULE, help='Module imported')
+    parser.add_argument('--top', type=int, default=15, help='Number of slowest modules shown')
+    args = parser.parse_args()
+
+    import_times = measure_import_times(args.module, args.runs)
+    for name, cumulative_time in sorted(import_times.items(), key=lambda item: -item[1])[:args.top]:
+        print(f'{cumulative_time/1000.0:8.2f} ms  {name}')
+
+    total_ms = import_times.get(args.module, 0.0)/1000.0
+    print(f'\n{args.module}: {total_ms:.2f} ms (budget {args.budget:.2f} ms)')
+
+    deferred_imports = get_deferred_imports(import_times)
+    if len(deferred_imports) != 0:
+        print(f'Imported modules that should be deferred: {", ".join(deferred_imports)}')
+        return 1
+    return 0 if total_ms <= args.budget else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
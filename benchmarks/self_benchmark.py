@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""Benchmark suite of ccbenchmark itself.
+
+Measures the phases of `ccbenchmark compare` on a workspace, typically one
+written by `generate_history.py`:
+
+- BM_Discovery: finding `_iter_*` directories and their result files.
+- BM_Parse: parsing every result file with its framework.
+- BM_LoadBenchmarkData: loading every file into the Rust Manager.
+- BM_RunProfile/N: comparing N selected benchmarks and formatting every cell.
+- BM_TableModel/N: filling the GUI table model and reading every cell (needs PyQt5).
+
+Every repetition runs in a fresh interpreter, so imports, file caches of the
+interpreter and peak RSS are measured from the same starting point. Peak RSS is
+reported as the `peak_rss` counter.
+
+Results are printed and can be written in Google Benchmark's JSON format. The
+script accepts Google Benchmark's flags, so it can be listed as a runnable of
+the `cpp.google_benchmark` framework and ccbenchmark can track and check its
+own performance like any other project.
+
+`--benchmark_repetitions` overrides `--repetitions`, `--benchmark_min_time` is
+ignored (every repetition runs each phase once), as are Google Benchmark flags
+it does not know, so run profiles of the framework can be used.
+
+Usage:
+    python benchmarks/self_benchmark.py [--workspace DIR] [--repetitions N]
+        [--benchmark_out=FILE] [--benchmark_filter=REGEX] [--rss_budget MB]
+
+If no workspace is given (or `CCBENCHMARK_SELF_WORKSPACE` is not set), a default
+history is generated in a temporary directory.
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_BENCHMARKS_DIR = Path(__file__).resolve().parent
+_SRC_DIR = _BENCHMARKS_DIR.parent / 'src'
+
+"""Numbers of benchmarks selected by BM_RunProfile and BM_TableModel."""
+SELECTION_SIZES = [1, 64]
+WORKSPACE_ENVIRONMENT_VARIABLE = 'CCBENCHMARK_SELF_WORKSPACE'
+"""Every phase, in the order they run."""
+PHASE_NAMES = (
+    ['BM_Discovery', 'BM_Parse', 'BM_LoadBenchmarkData']
+    + [f'BM_RunProfile/{size}' for size in SELECTION_SIZES] + [f'BM_TableModel/{size}' for size in SELECTION_SIZES]
+)
+
+def get_run_name(name: str, repetitions: int) -> str:
+    """Name of a phase in the results, with the repetitions like a Google Benchmark family."""
+    return f'{name}/repeats:{repetitions}' if repetitions > 1 else name
+
+def _measure(phase_times: dict[str, float], name: str, func, *args):
+    start_time = time.perf_counter()
+    result = func(*args)
+    phase_times[name] = time.perf_counter() - start_time
+    return result
+
+def run_phases(workspace: Path, benchmark_filter: re.Pattern | None = None) -> dict[str, float]:
+    """Runs every phase once in this interpreter.
+
+    Args:
+        workspace: Directory containing `.ccbenchmark/settings.yaml`.
+        benchmark_filter: Only phases whose name it matches are run, loading
+            is always run when a later phase needs it.
+
+    Returns:
+        dict[str, float]: Seconds taken by each phase, and `peak_rss` in bytes.
+    """
+    import resource
+
+    from ccbenchmark.benchmark_settings import load_local_settings
+    from ccbenchmark.benchmark_framework import import_framework
+    from ccbenchmark.benchmark_helpers import get_iteration_paths, get_iteration_names_to_index
+    from ccbenchmark.benchmark_data import TimeType, get_result_files, load_benchmark_data
+
+    def selected(name: str) -> bool:
+        return benchmark_filter is None or benchmark_filter.search(name) is not None
+
+    local_settings = load_local_settings(workspace)
+    if local_settings is None:
+        raise FileNotFoundError(f'No local settings found in: {workspace}')
+    frameworks = [
+        import_framework(framework, output_format)
+        for framework, output_format in zip(local_settings.framework_name_list, local_settings.output_format_list)
+    ]
+
+    phase_times: dict[str, float] = {}
+
+    def discover():
+        iteration_paths = get_iteration_paths(local_settings.output_dir_list, frameworks)
+        iteration_names_to_index = get_iteration_names_to_index(iteration_paths)
+        return iteration_paths, iteration_names_to_index, get_result_files(iteration_names_to_index, iteration_paths)
+    iteration_paths, iteration_names_to_index, result_files = _measure(phase_times, 'BM_Discovery', discover)
+
+    if selected('BM_Parse'):
+        def parse():
+            for _, file_path, _, framework in result_files:
+                with open(file_path, 'r', encoding='locale') as file_stream:
+                    for _ in framework.parse(file_stream, file_path):
+                        pass
+        _measure(phase_times, 'BM_Parse', parse)
+
+    later_phases = [f'BM_RunProfile/{size}' for size in SELECTION_SIZES] + [f'BM_TableModel/{size}' for size in SELECTION_SIZES]
+    if not (selected('BM_LoadBenchmarkData') or any(selected(name) for name in later_phases)):
+        phase_times['peak_rss'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss*1024
+        return phase_times
+    benchmark_data = _measure(
+        phase_times, 'BM_LoadBenchmarkData', load_benchmark_data, iteration_names_to_index, iteration_paths
+    )
+    benchmark_count = len(benchmark_data.benchmark_names)
+
+    for size in SELECTION_SIZES:
+        name = f'BM_RunProfile/{size}'
+        if selected(name) and benchmark_count != 0:
+            selection = list(range(0, benchmark_count, max(benchmark_count//size, 1)))[:size]
+            _measure(phase_times, name, benchmark_data.get_str_matrix, selection, TimeType.REAL)
+
+    table_phases = [size for size in SELECTION_SIZES if selected(f'BM_TableModel/{size}')]
+    if len(table_phases) != 0 and benchmark_count != 0:
+        try:
+            from PyQt5 import QtCore, QtGui
+            from ccbenchmark.gui import BenchmarkDataTableModel
+        except ImportError:
+            table_phases = []
+        if len(table_phases) != 0:
+            application = QtGui.QGuiApplication.instance() or QtGui.QGuiApplication([sys.argv[0]])
+            for size in table_phases:
+                selection = list(range(0, benchmark_count, max(benchmark_count//size, 1)))[:size]
+                def populate():
+                    model = BenchmarkDataTableModel(QtGui.QColor(255, 255, 255))
+                    model.set_profile(benchmark_data, selection, TimeType.REAL)
+                    for row in range(model.rowCount()):
+                        for column in range(model.columnCount()):
+                            index = model.index(row, column)
+                            model.data(index, QtCore.Qt.DisplayRole)
+                            model.data(index, QtCore.Qt.ForegroundRole)
+                _measure(phase_times, f'BM_TableModel/{size}', populate)
+
+    phase_times['peak_rss'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss*1024
+    return phase_times
+
+def measure_phases(workspace: Path, repetitions: int, benchmark_filter: str | None = None) -> list[dict[str, float]]:
+    """Runs every phase in `repetitions` fresh interpreters.
+
+    Returns:
+        list[dict[str, float]]: Result of `run_phases` of each repetition.
+    """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [str(_SRC_DIR), env.get('PYTHONPATH')]))
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+    command = [sys.executable, str(Path(__file__).resolve()), '--worker', '--workspace', str(workspace)]
+    if benchmark_filter is not None:
+        command.append(f'--benchmark_filter={benchmark_filter}')
+    return [
+        json.loads(subprocess.run(command, env=env, capture_output=True, text=True, check=True).stdout)
+        for _ in range(repetitions)
+    ]
+
+def to_google_benchmark_json(repetition_results: list[dict[str, float]], workspace: Path) -> dict:
+    """Converts repetitions to Google Benchmark's JSON output, with every
+    repetition as an iteration followed by the mean, median, stddev and cv.
+
+    Times are in ms, `peak_rss` is a counter of every entry.
+    """
+    names = [name for name in repetition_results[0] if name != 'peak_rss']
+    repetitions = len(repetition_results)
+    benchmarks: list[dict] = []
+    for family_index, name in enumerate(names):
+        run_name = get_run_name(name, repetitions)
+        common = {
+            'family_index': family_index, 'per_family_instance_index': 0, 'run_name': run_name,
+            'repetitions': repetitions, 'threads': 1, 'time_unit': 'ms'
+        }
+        times = [result[name]*1e3 for result in repetition_results]
+        peak_rss = [result['peak_rss'] for result in repetition_results]
+        for repetition_index, (value, rss) in enumerate(zip(times, peak_rss)):
+            benchmarks.append({
+                'name': run_name, **common, 'run_type': 'iteration', 'repetition_index': repetition_index,
+                'iterations': 1, 'real_time': value, 'cpu_time': value, 'peak_rss': rss
+            })
+        if repetitions == 1:
+            continue
+        mean = statistics.mean(times)
+        stddev = statistics.stdev(times)
+        aggregates = {'mean': mean, 'median': statistics.median(times), 'stddev': stddev, 'cv': stddev/mean if mean != 0 else math.nan}
+        for aggregate_name, value in aggregates.items():
+            benchmarks.append({
+                'name': f'{run_name}_{aggregate_name}', **common, 'run_type': 'aggregate', 'aggregate_name': aggregate_name,
+                'iterations': repetitions, 'real_time': value, 'cpu_time': value, 'peak_rss': statistics.median(peak_rss)
+            })
+    context = {'executable': Path(__file__).name, 'workspace': str(workspace), 'num_cpus': os.cpu_count()}
+    return {'context': context, 'benchmarks': benchmarks}
+
+def _default_workspace() -> Path:
+    if __package__:
+        from .generate_history import generate_history
+    else:
+        # Run as a script, its directory is on sys.path.
+        from generate_history import generate_history
+
+    workspace = Path(tempfile.mkdtemp(prefix='ccbenchmark_self_'))
+    generate_history(workspace)
+    return workspace
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Measure the phases of ccbenchmark compare.')
+    parser.add_argument('--workspace', type=Path, default=os.environ.get(WORKSPACE_ENVIRONMENT_VARIABLE), help='Workspace measured, see generate_history.py')
+    parser.add_argument('--repetitions', type=int, default=5, help='Number of interpreters started')
+    parser.add_argument('--rss_budget', type=float, default=None, help='Allowed median peak RSS in MB')
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    # Flags of Google Benchmark, so ccbenchmark can run this script as a runnable.
+    parser.add_argument('--benchmark_out', type=Path, default=None, help='File the results are written to as JSON')
+    parser.add_argument('--benchmark_out_format', choices=['json'], default='json', help='Only JSON is supported')
+    parser.add_argument('--benchmark_filter', default=None, help='Regex searched for in phase names')
+    parser.add_argument('--benchmark_report_aggregates_only', default=None, help='Ignored')
+    parser.add_argument('--benchmark_repetitions', type=int, default=None, help='Overrides --repetitions')
+    parser.add_argument('--benchmark_min_time', default=None, help='Ignored, every repetition runs each phase once')
+    parser.add_argument('--benchmark_list_tests', nargs='?', const='true', default='false', help='Print the phase names and exit')
+    args, unknown_args = parser.parse_known_args()
+    if len(unknown_args) != 0:
+        print(f"Ignored arguments: {' '.join(unknown_args)}", file=sys.stderr)
+
+    if args.worker:
+        benchmark_filter = re.compile(args.benchmark_filter) if args.benchmark_filter is not None else None
+        print(json.dumps(run_phases(args.workspace, benchmark_filter)))
+        return 0
+
+    repetitions = args.benchmark_repetitions if args.benchmark_repetitions is not None else args.repetitions
+    # The filter sees the names in the results, workers match phase names exactly.
+    phase_filter = None
+    phase_names = PHASE_NAMES
+    if args.benchmark_filter is not None:
+        regex = re.compile(args.benchmark_filter)
+        phase_names = [name for name in PHASE_NAMES if regex.search(get_run_name(name, repetitions)) is not None]
+        phase_filter = f"^({'|'.join(re.escape(name) for name in phase_names)})$"
+    if args.benchmark_list_tests.lower() in {'true', '1'}:
+        for name in phase_names:
+            print(get_run_name(name, repetitions))
+        return 0
+
+    workspace = args.workspace if args.workspace is not None else _default_workspace()
+    repetition_results = measure_phases(workspace, repetitions, phase_filter)
+
+    for name in repetition_results[0]:
+        if name == 'peak_rss':
+            continue
+        times = [result[name]*1e3 for result in repetition_results]
+        print(f'{name:<24} {statistics.median(times):10.2f} ms  (min {min(times):.2f} ms, max {max(times):.2f} ms)')
+    peak_rss_mb = statistics.median(result['peak_rss'] for result in repetition_results)/1e6
+    print(f'{"peak_rss":<24} {peak_rss_mb:10.1f} MB')
+
+    if args.benchmark_out is not None:
+        with open(args.benchmark_out, 'w', encoding='utf-8') as file:
+            json.dump(to_google_benchmark_json(repetition_results, workspace), file, indent=1)
+
+    if args.rss_budget is not None and peak_rss_mb > args.rss_budget:
+        print(f'Peak RSS {peak_rss_mb:.1f} MB is over the budget of {args.rss_budget:.1f} MB')
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,116 @@
+/// Histograms of several sample sets over the same `bin_count` bins, so they can be compared side by side.
+/// NaN samples are ignored. Returns (bin edges, counts per sample set), the `bin_count + 1` edges
+/// span every sample. Edges are empty, and counts are all zero, if there are no samples.
+pub fn histograms(sample_sets: &[&[f64]], bin_count: usize) -> (Vec<f64>, Vec<Vec<usize>>) {
+    let mut low = f64::INFINITY;
+    let mut high = f64::NEG_INFINITY;
+    for sample in sample_sets.iter().flat_map(|samples| samples.iter()).filter(|sample| !sample.is_nan()) {
+        low = low.min(*sample);
+        high = high.max(*sample);
+    }
+    if bin_count == 0 || low > high {
+        return (Vec::new(), vec![vec![0; bin_count]; sample_sets.len()]);
+    }
+    if low == high {
+        // Every sample is the same, they go in the middle bin of a range around them.
+        let padding = if low == 0.0 { 0.5 } else { low.abs()*0.05 };
+        low -= padding;
+        high += padding;
+    }
+
+    let bin_width = (high - low) / bin_count as f64;
+    let edges: Vec<f64> = (0..=bin_count).map(|edge_index| low + bin_width*edge_index as f64).collect();
+    let counts = sample_sets.iter().map(|samples| {
+        let mut counts = vec![0; bin_count];
+        for sample in samples.iter().filter(|sample| !sample.is_nan()) {
+            let bin_index = (((sample - low) / bin_width) as usize).min(bin_count - 1);
+            counts[bin_index] += 1;
+        }
+        counts
+    }).collect();
+    (edges, counts)
+}
+
+/// Largest number of samples per side for which `mann_whitney_greater` computes the exact distribution.
+const EXACT_SAMPLE_LIMIT: usize = 20;
+
+/// Complementary error function, with a fractional error below 1.2e-7 (Numerical Recipes `erfcc`).
+fn erfc(x: f64) -> f64 {
+    let z = x.abs();
+    let t = 1.0/(1.0 + 0.5*z);
+    let polynomial = -z*z - 1.26551223 + t*(1.00002368 + t*(0.37409196 + t*(0.09678418 + t*(-0.18628806
+        + t*(0.27886807 + t*(-1.13520398 + t*(1.48851587 + t*(-0.82215223 + t*0.17087277))))))));
+    let value = t*polynomial.exp();
+    if x >= 0.0 { value } else { 2.0 - value }
+}
+
+/// Probability that the Mann-Whitney U statistic of `m` against `n` samples is at least `u`, without ties.
+fn exact_u_tail(m: usize, n: usize, u: f64) -> f64 {
+    // counts[i][j][k]: orderings of i candidate and j baseline samples where k pairs have the candidate larger.
+    let max_u = m*n;
+    let mut counts = vec![vec![vec![0.0_f64; max_u + 1]; n + 1]; m + 1];
+    for i in 0..=m {
+        for j in 0..=n {
+            if i == 0 || j == 0 {
+                counts[i][j][0] = 1.0;
+                continue
+            }
+            for k in 0..=i*j {
+                // The largest sample is either a candidate, larger than all j baseline samples, or a baseline sample.
+                let candidate_largest = if k >= j { counts[i - 1][j][k - j] } else { 0.0 };
+                counts[i][j][k] = candidate_largest + counts[i][j - 1][k];
+            }
+        }
+    }
+    let total: f64 = counts[m][n].iter().sum();
+    let first = u.ceil() as usize;
+    counts[m][n].iter().skip(first).sum::<f64>()/total
+}
+
+/// One-sided p-value of the Mann-Whitney U test that `candidate` samples tend to be larger than `baseline` samples.
+/// Exact for up to `EXACT_SAMPLE_LIMIT` samples per side without ties, otherwise the normal approximation
+/// with tie and continuity correction. NaN samples are ignored, NaN if either side has no samples.
+pub fn mann_whitney_greater(baseline: &[f64], candidate: &[f64]) -> f64 {
+    let baseline: Vec<f64> = baseline.iter().copied().filter(|value| !value.is_nan()).collect();
+    let candidate: Vec<f64> = candidate.iter().copied().filter(|value| !value.is_nan()).collect();
+    let (m, n) = (candidate.len(), baseline.len());
+    if m == 0 || n == 0 {
+        return f64::NAN
+    }
+    let mut u = 0.0;
+    for candidate_value in candidate.iter() {
+        for baseline_value in baseline.iter() {
+            if candidate_value > baseline_value {
+                u += 1.0;
+            } else if candidate_value == baseline_value {
+                u += 0.5;
+            }
+        }
+    }
+
+    let mut combined: Vec<f64> = baseline.iter().chain(candidate.iter()).copied().collect();
+    combined.sort_by(|left, right| left.total_cmp(right));
+    let mut tie_term = 0.0;
+    let mut start = 0;
+    while start < combined.len() {
+        let mut end = start + 1;
+        while end < combined.len() && combined[end] == combined[start] {
+            end += 1;
+        }
+        let tied = (end - start) as f64;
+        tie_term += tied*tied*tied - tied;
+        start = end;
+    }
+
+    if tie_term == 0.0 && m <= EXACT_SAMPLE_LIMIT && n <= EXACT_SAMPLE_LIMIT {
+        return exact_u_tail(m, n, u)
+    }
+    let (mf, nf) = (m as f64, n as f64);
+    let total = mf + nf;
+    let variance = mf*nf/12.0*((total + 1.0) - tie_term/(total*(total - 1.0)));
+    if variance <= 0.0 {
+        return 1.0
+    }
+    let z = (u - mf*nf/2.0 - 0.5)/variance.sqrt();
+    0.5*erfc(z/std::f64::consts::SQRT_2)
+}
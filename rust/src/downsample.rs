@@ -0,0 +1,43 @@
+/// Largest-Triangle-Three-Buckets downsampling of the line through (`xs`, `ys`).
+/// Keeps the first and last points, and from each of `threshold - 2` buckets in between
+/// the point forming the largest triangle with the previously kept point and the average
+/// of the next bucket, so peaks and steps survive.
+/// Returns indices of the kept points in order, every index if `threshold` is below 3 or not below `xs.len()`.
+pub fn lttb(xs: &[f64], ys: &[f64], threshold: usize) -> Vec<usize> {
+    debug_assert!(xs.len() == ys.len());
+    let point_count = xs.len();
+    if threshold < 3 || threshold >= point_count {
+        return (0..point_count).collect();
+    }
+
+    let bucket_size = (point_count - 2) as f64 / (threshold - 2) as f64;
+    let bucket_start = |bucket_index: usize| ((bucket_index as f64 * bucket_size) as usize + 1).min(point_count - 1);
+
+    let mut sampled: Vec<usize> = Vec::with_capacity(threshold);
+    sampled.push(0);
+    let mut previous = 0;
+    for bucket_index in 0..threshold - 2 {
+        let start = bucket_start(bucket_index);
+        let end = bucket_start(bucket_index + 1);
+        let next_end = if bucket_index + 2 < threshold - 1 { bucket_start(bucket_index + 2) } else { point_count };
+
+        let next_count = (next_end - end) as f64;
+        let average_x = xs[end..next_end].iter().sum::<f64>() / next_count;
+        let average_y = ys[end..next_end].iter().sum::<f64>() / next_count;
+
+        let (previous_x, previous_y) = (xs[previous], ys[previous]);
+        let mut max_area = -1.0;
+        let mut max_index = start;
+        for index in start..end {
+            let area = ((previous_x - average_x)*(ys[index] - previous_y) - (previous_x - xs[index])*(average_y - previous_y)).abs();
+            if area > max_area {
+                max_area = area;
+                max_index = index;
+            }
+        }
+        sampled.push(max_index);
+        previous = max_index;
+    }
+    sampled.push(point_count - 1);
+    sampled
+}
@@ -25,7 +25,7 @@ impl Grid {
     }
 
     pub fn set_column(&mut self, col_index: usize, other: &[f64], unit: Unit) -> &mut Self {
-        let translation_scaler = self.unit.as_scaler()/unit.as_scaler();
+        let translation_scaler = unit.as_scaler()/self.unit.as_scaler();
         let translated_values: Vec<f64> = (0..other.len()).map(|i| other[i]*translation_scaler).collect();
 
         let from = col_index*self.column_length;
@@ -40,7 +40,7 @@ impl Grid {
     }
 
     pub fn set(&mut self, col_index: usize, index: usize, value: f64, unit: Unit) -> &mut Self {
-        let translation_scaler = self.unit.as_scaler()/unit.as_scaler();
+        let translation_scaler = unit.as_scaler()/self.unit.as_scaler();
         let translated_value = value*translation_scaler;
         self.entries[col_index*self.column_length + index] = translated_value;
         self
@@ -74,6 +74,24 @@ impl Grid {
         Some(new_grid)
     }
 
+    /// True for every column with at least one value that is not NaN.
+    pub fn valid_columns(&self) -> Vec<bool> {
+        (0..self.column_count).map(|col_index| {
+            self.column(col_index).iter().any(|value| !value.is_nan())
+        }).collect()
+    }
+
+    /// True for every row (index within a column) with at least one value that is not NaN.
+    pub fn valid_rows(&self) -> Vec<bool> {
+        let mut valid = vec![false; self.column_length];
+        for col_index in 0..self.column_count {
+            for (row_index, value) in self.column(col_index).iter().enumerate() {
+                valid[row_index] |= !value.is_nan();
+            }
+        }
+        valid
+    }
+
     pub fn front_col_index(&self) -> Option<usize> {
         for front_index in 0..self.column_length {
             for i in 0..self.column_count {
@@ -0,0 +1,44 @@
+/// Blends two 0xAARRGGBB colors, `t` of 0.0 is `from` and 1.0 is `to`.
+pub fn lerp_color(t: f64, from: u32, to: u32) -> u32 {
+    let t = t.clamp(0.0, 1.0);
+    let mut color: u32 = 0;
+    for shift in [0, 8, 16, 24] {
+        let from_channel = ((from >> shift) & 0xff) as f64;
+        let to_channel = ((to >> shift) & 0xff) as f64;
+        let channel = ((1.0 - t)*from_channel + t*to_channel).round() as u32;
+        color |= channel.min(0xff) << shift;
+    }
+    color
+}
+
+/// Color of a Δ in percent, the same scheme the table uses for its Δ columns:
+/// `default_color` at 0, blending to `red_color` for slowdowns and `green_color` for speedups
+/// until `peak_delta`. NaN is `empty_color`.
+pub fn delta_color(delta: f64, peak_delta: f64, default_color: u32, red_color: u32, green_color: u32, empty_color: u32) -> u32 {
+    if delta.is_nan() {
+        return empty_color
+    }
+    let t = delta / peak_delta;
+    if t < 0.0 {
+        lerp_color(-t, default_color, green_color)
+    }
+    else {
+        lerp_color(t, default_color, red_color)
+    }
+}
+
+/// Δ in percent of every value of `values` against the value before it that is not NaN.
+/// The first value, and values without one before them, are NaN.
+pub fn neighbor_deltas<CompareF>(values: &[f64], compare_func: CompareF) -> Vec<f64> where
+    CompareF: Fn(f64, f64) -> f64 {
+    let mut deltas = vec![f64::NAN; values.len()];
+    let mut previous = f64::NAN;
+    for (index, value) in values.iter().enumerate() {
+        if value.is_nan() {
+            continue
+        }
+        deltas[index] = compare_func(previous, *value);
+        previous = *value;
+    }
+    deltas
+}
@@ -1,13 +1,31 @@
 #[path="grid.rs"]
 pub mod grid;
 pub use grid::*;
+#[path="scaling.rs"]
+pub mod scaling;
+pub use scaling::*;
+#[path="downsample.rs"]
+pub mod downsample;
+pub use downsample::*;
+#[path="distribution.rs"]
+pub mod distribution;
+pub use distribution::*;
+#[path="heatmap.rs"]
+pub mod heatmap;
+pub use heatmap::*;
+use std::borrow::Cow;
+use std::collections::HashMap;
 use pyo3::{prelude::*};
 
 #[pyclass(module = "rust_ccbenchmark")]
 pub struct Manager {
     base_value_grids: Vec<Grid>,
     output_grid: Grid,
-    comparison_grid: Grid
+    comparison_grid: Grid,
+    valid_rows: Vec<bool>,
+    valid_columns: Vec<bool>,
+    /// Raw samples (e.g., every repetition) by (benchmark index, iteration index), in the unit of the benchmark's grid.
+    samples: HashMap<(usize, usize), Vec<f64>>
 }
 
 #[pyclass(module = "rust_ccbenchmark", get_all, set_all)]
@@ -31,7 +49,10 @@ impl Manager {
         Self { 
             base_value_grids: Vec::new(), 
             output_grid: Grid::new(Unit::PureUnit(PureUnit::NoUnit), 0, 0), 
-            comparison_grid: Grid::new(Unit::PureUnit(PureUnit::NoUnit), 0, 0) 
+            comparison_grid: Grid::new(Unit::PureUnit(PureUnit::NoUnit), 0, 0),
+            valid_rows: Vec::new(),
+            valid_columns: Vec::new(),
+            samples: HashMap::new()
         }
     }
     pub fn emplace(&mut self, metric_count: usize, iteration_count: usize, unit_str: String) {
@@ -40,10 +61,7 @@ impl Manager {
     }
 
     fn update_unit_comparison_grid(&mut self, profile: &Profile) {
-        let compare_func = |base: f64, other: f64| {
-            let div = other / base;
-            (div - 1.0) * 100.0
-        };
+        let compare_func = percent_change;
         if profile.selected_indicies.len() == 1 {
             let index: usize = profile.selected_indicies[0];
             debug_assert!(index < self.base_value_grids.len());
@@ -73,6 +91,17 @@ impl Manager {
             let compare_index = 0;
             self.comparison_grid = self.output_grid.clone_compare_index(compare_func, Unit::PureUnit(PureUnit::Percentage), compare_index);
         }
+        self.update_valid_masks();
+    }
+    fn update_valid_masks(&mut self) {
+        let output_columns = self.output_grid.valid_columns();
+        let comparison_columns = self.comparison_grid.valid_columns();
+        self.valid_columns = output_columns.iter().zip(comparison_columns.iter())
+            .flat_map(|(output_valid, comparison_valid)| [*output_valid, *comparison_valid])
+            .collect();
+        self.valid_rows = self.output_grid.valid_rows().iter().zip(self.comparison_grid.valid_rows().iter())
+            .map(|(output_valid, comparison_valid)| *output_valid || *comparison_valid)
+            .collect();
     }
     fn get_matrix_as_str(&mut self) -> Vec<Vec<String>> {
         let col_count = self.output_grid.column_count();
@@ -110,12 +139,335 @@ impl Manager {
         self.update_unit_comparison_grid(profile);
         self.get_matrix_as_str()
     }
+
+    /// Runs the comparison of a profile without formatting it, cells are read with `get_cell`.
+    pub fn update_profile(&mut self, profile: &Profile) {
+        self.update_unit_comparison_grid(profile);
+    }
+
+    /// (column count, row count) of the last profile, each metric has a value and a Δ column.
+    pub fn dimensions(&self) -> (usize, usize) {
+        (self.output_grid.column_count()*2, self.output_grid.column_length())
+    }
+
+    /// Value of a cell of the last profile, NaN if it is empty or out of bounds.
+    pub fn get_cell(&self, column_index: usize, row_index: usize) -> f64 {
+        let grid = if column_index % 2 == 0 { &self.output_grid } else { &self.comparison_grid };
+        let metric_index = column_index / 2;
+        if metric_index >= grid.column_count() || row_index >= grid.column_length() {
+            return f64::NAN
+        }
+        grid.get(metric_index, row_index)
+    }
+
+    /// True for every row of the last profile with at least one value.
+    pub fn get_valid_rows(&self) -> Vec<bool> {
+        self.valid_rows.clone()
+    }
+
+    /// True for every column of the last profile with at least one value, in the order of `get_cell`.
+    pub fn get_valid_columns(&self) -> Vec<bool> {
+        self.valid_columns.clone()
+    }
+
+    /// (value unit, Δ unit) of the last profile.
+    pub fn get_units(&self) -> (String, String) {
+        (self.output_grid.unit().as_str().to_string(), self.comparison_grid.unit().as_str().to_string())
+    }
     
     pub fn set(&mut self, benchmark_index: usize, metric_index: usize, iteration_index: usize, value: f64, unit_str: String) {
         let unit = Unit::from_str(&unit_str);
         self.base_value_grids[benchmark_index]
             .set(metric_index, iteration_index, value, unit);
     }
+
+    pub fn get_values(&self, benchmark_index: usize, metric_index: usize, unit_str: String) -> Vec<f64> {
+        let unit = Unit::from_str(&unit_str);
+        let grid = &self.base_value_grids[benchmark_index];
+        let translation_scaler = grid.unit().as_scaler()/unit.as_scaler();
+        grid.column(metric_index).iter().map(|value| value*translation_scaler).collect()
+    }
+
+    /// Stores raw samples of an iteration of a benchmark, replacing any stored before.
+    pub fn set_samples(&mut self, benchmark_index: usize, iteration_index: usize, values: Vec<f64>, unit_str: String) {
+        let unit = Unit::from_str(&unit_str);
+        let translation_scaler = unit.as_scaler()/self.base_value_grids[benchmark_index].unit().as_scaler();
+        let values = values.iter().map(|value| value*translation_scaler).collect();
+        self.samples.insert((benchmark_index, iteration_index), values);
+    }
+
+    /// Raw samples of an iteration of a benchmark, empty if there are none.
+    pub fn get_samples(&self, benchmark_index: usize, iteration_index: usize, unit_str: String) -> Vec<f64> {
+        let unit = Unit::from_str(&unit_str);
+        let translation_scaler = self.base_value_grids[benchmark_index].unit().as_scaler()/unit.as_scaler();
+        self.samples.get(&(benchmark_index, iteration_index))
+            .map_or(Vec::new(), |values| values.iter().map(|value| value*translation_scaler).collect())
+    }
+
+    /// Iterations of a benchmark that have raw samples, in order.
+    pub fn get_sampled_iterations(&self, benchmark_index: usize) -> Vec<usize> {
+        let mut iteration_indices: Vec<usize> = self.samples.keys()
+            .filter(|(sampled_index, _)| *sampled_index == benchmark_index)
+            .map(|(_, iteration_index)| *iteration_index)
+            .collect();
+        iteration_indices.sort();
+        iteration_indices
+    }
+
+    /// Histograms of the raw samples of several iterations of a benchmark over the same bins.
+    /// Returns (bin edges, counts per iteration), see `histograms`.
+    pub fn get_histograms(&self, benchmark_index: usize, iteration_indices: Vec<usize>, bin_count: usize, unit_str: String) -> (Vec<f64>, Vec<Vec<usize>>) {
+        let unit = Unit::from_str(&unit_str);
+        let translation_scaler = self.base_value_grids[benchmark_index].unit().as_scaler()/unit.as_scaler();
+        let sample_sets: Vec<&[f64]> = iteration_indices.iter()
+            .map(|iteration_index| self.samples.get(&(benchmark_index, *iteration_index)).map_or(&[][..], |values| values.as_slice()))
+            .collect();
+        let (edges, counts) = histograms(&sample_sets, bin_count);
+        (edges.iter().map(|edge| edge*translation_scaler).collect(), counts)
+    }
+
+    /// Every value of every benchmark as one contiguous buffer of native-endian f64,
+    /// laid out as [benchmark][metric][iteration] like the grids, so it can be wrapped
+    /// (e.g., by `numpy.frombuffer`) without converting each value to a Python float.
+    pub fn get_values_buffer(&self, unit_str: String) -> Cow<'static, [u8]> {
+        let unit = Unit::from_str(&unit_str);
+        let value_count: usize = self.base_value_grids.iter().map(|grid| grid.len()).sum();
+        let mut buffer: Vec<u8> = Vec::with_capacity(value_count*size_of::<f64>());
+        for grid in self.base_value_grids.iter() {
+            let translation_scaler = grid.unit().as_scaler()/unit.as_scaler();
+            for column_index in 0..grid.column_count() {
+                for value in grid.column(column_index) {
+                    buffer.extend_from_slice(&(value*translation_scaler).to_ne_bytes());
+                }
+            }
+        }
+        Cow::Owned(buffer)
+    }
+
+    /// Values of a metric over iterations `start..stop`, downsampled to at most `threshold` points with LTTB.
+    /// Empty iterations are left out before downsampling.
+    /// Returns (iteration indices, values).
+    pub fn get_series(&self, benchmark_index: usize, metric_index: usize, unit_str: String, start: usize, stop: usize, threshold: usize) -> (Vec<usize>, Vec<f64>) {
+        let unit = Unit::from_str(&unit_str);
+        let grid = &self.base_value_grids[benchmark_index];
+        let translation_scaler = grid.unit().as_scaler()/unit.as_scaler();
+        let column = grid.column(metric_index);
+        let stop = stop.min(column.len());
+        let start = start.min(stop);
+
+        let mut xs: Vec<f64> = Vec::with_capacity(stop - start);
+        let mut ys: Vec<f64> = Vec::with_capacity(stop - start);
+        for (iteration_index, value) in column[start..stop].iter().enumerate() {
+            if !value.is_nan() {
+                xs.push((start + iteration_index) as f64);
+                ys.push(*value);
+            }
+        }
+        let sampled = lttb(&xs, &ys, threshold);
+        (
+            sampled.iter().map(|index| xs[*index] as usize).collect(),
+            sampled.iter().map(|index| ys[*index]*translation_scaler).collect()
+        )
+    }
+
+    /// Renders the Δ of every benchmark against its previous iteration as an ARGB32 image,
+    /// one pixel per iteration, one row per benchmark in the order of `benchmark_indices`.
+    /// Each benchmark uses the first metric in `metric_indices` with a value, colored with `delta_color`.
+    /// Returns (pixels row by row in native byte order, metric index used per row or `usize::MAX` if none).
+    pub fn render_heatmap(
+        &self, benchmark_indices: Vec<usize>, metric_indices: Vec<usize>, peak_delta: f64,
+        default_color: u32, red_color: u32, green_color: u32, empty_color: u32
+    ) -> (Cow<'static, [u8]>, Vec<usize>) {
+        let width = self.iteration_count();
+        let mut pixels: Vec<u8> = Vec::with_capacity(width*benchmark_indices.len()*4);
+        let mut row_metrics: Vec<usize> = Vec::with_capacity(benchmark_indices.len());
+        for benchmark_index in benchmark_indices.iter() {
+            let grid = &self.base_value_grids[*benchmark_index];
+            let metric_index = metric_indices.iter()
+                .find(|metric_index| **metric_index < grid.column_count() && grid.column(**metric_index).iter().any(|value| !value.is_nan()));
+            let row: Vec<u32> = match metric_index {
+                Some(metric_index) => {
+                    row_metrics.push(*metric_index);
+                    neighbor_deltas(grid.column(*metric_index), percent_change).iter()
+                        .map(|delta| delta_color(*delta, peak_delta, default_color, red_color, green_color, empty_color))
+                        .collect()
+                }
+                None => {
+                    row_metrics.push(usize::MAX);
+                    vec![empty_color; grid.column_length()]
+                }
+            };
+            for column_index in 0..width {
+                let color = row.get(column_index).copied().unwrap_or(empty_color);
+                pixels.extend_from_slice(&color.to_ne_bytes());
+            }
+        }
+        (Cow::Owned(pixels), row_metrics)
+    }
+
+    /// Compares two iterations of every benchmark.
+    /// For each benchmark the first metric in `metric_indices` with a value in both iterations is used.
+    /// Returns (benchmark_index, metric_index, baseline, candidate, Δ%) sorted from the largest Δ to the smallest,
+    /// benchmarks without a comparable metric are left out.
+    pub fn compare_iterations(&self, baseline_index: usize, candidate_index: usize, metric_indices: Vec<usize>, unit_str: String) -> Vec<(usize, usize, f64, f64, f64)> {
+        let unit = Unit::from_str(&unit_str);
+        let mut comparisons: Vec<(usize, usize, f64, f64, f64)> = Vec::with_capacity(self.base_value_grids.len());
+        for (benchmark_index, grid) in self.base_value_grids.iter().enumerate() {
+            if baseline_index >= grid.column_length() || candidate_index >= grid.column_length() {
+                continue
+            }
+            let translation_scaler = grid.unit().as_scaler()/unit.as_scaler();
+            for metric_index in metric_indices.iter() {
+                if *metric_index >= grid.column_count() {
+                    continue
+                }
+                let baseline = grid.get(*metric_index, baseline_index);
+                let candidate = grid.get(*metric_index, candidate_index);
+                if baseline.is_nan() || candidate.is_nan() {
+                    continue
+                }
+                comparisons.push((
+                    benchmark_index, *metric_index, 
+                    baseline*translation_scaler, candidate*translation_scaler, 
+                    percent_change(baseline, candidate)
+                ));
+                break
+            }
+        }
+        comparisons.sort_by(|left, right| right.4.total_cmp(&left.4));
+        comparisons
+    }
+
+    /// Fits a complexity curve per iteration over a benchmark family.
+    /// Returns (big_o, coefficient in ns, normalized rms, exponent) for every iteration.
+    pub fn fit_scaling(&self, benchmark_indices: Vec<usize>, ns: Vec<f64>, metric_index: usize) -> Vec<(String, f64, f64, f64)> {
+        debug_assert!(benchmark_indices.len() == ns.len());
+        (0..self.iteration_count()).map(|iteration_index| {
+            let times = self.family_times(&benchmark_indices, metric_index, iteration_index);
+            let exponent = fit_exponent(&ns, &times).unwrap_or(f64::NAN);
+            match fit_complexity(&ns, &times) {
+                Some(fit) => (fit.complexity.as_str().to_string(), fit.coefficient, fit.rms, exponent),
+                None => ("".to_string(), f64::NAN, f64::NAN, exponent)
+            }
+        }).collect()
+    }
+
+    /// Parallel efficiency per iteration over benchmarks that only differ in thread count.
+    pub fn fit_thread_scaling(&self, benchmark_indices: Vec<usize>, threads: Vec<f64>, metric_index: usize) -> Vec<Vec<f64>> {
+        debug_assert!(benchmark_indices.len() == threads.len());
+        (0..self.iteration_count()).map(|iteration_index| {
+            let times = self.family_times(&benchmark_indices, metric_index, iteration_index);
+            thread_efficiency(&threads, &times)
+        }).collect()
+    }
+
+    /// Noise floor of every benchmark, estimated from its history.
+    /// For each benchmark the first metric in `metric_indices` with at least `min_pairs` pairs of consecutive
+    /// values in `iteration_indices` is used, see `noise_floor`.
+    /// Returns (noise floor Δ%, pairs used, median of `cv_metric_index`) per benchmark, NaN when unknown.
+    pub fn noise_floors(&self, iteration_indices: Vec<usize>, metric_indices: Vec<usize>, cv_metric_index: usize, min_pairs: usize) -> Vec<(f64, usize, f64)> {
+        self.base_value_grids.iter().map(|grid| {
+            let column_values = |metric_index: usize| -> Vec<f64> {
+                if metric_index >= grid.column_count() {
+                    return Vec::new()
+                }
+                iteration_indices.iter()
+                    .filter(|iteration_index| **iteration_index < grid.column_length())
+                    .map(|iteration_index| grid.get(metric_index, *iteration_index))
+                    .filter(|value| !value.is_nan())
+                    .collect()
+            };
+            let mut floor = (f64::NAN, 0);
+            for metric_index in metric_indices.iter() {
+                let values = column_values(*metric_index);
+                if values.len() > min_pairs {
+                    floor = (noise_floor(&values), values.len() - 1);
+                    break
+                }
+            }
+            let mut cvs = column_values(cv_metric_index);
+            (floor.0, floor.1, median(&mut cvs))
+        }).collect()
+    }
+
+    /// Compares the raw samples of two sets of iterations of every benchmark, e.g. interleaved re-runs of a
+    /// baseline and a candidate, pooling the samples of each set.
+    /// Returns (Δ% between the medians, one-sided Mann-Whitney p-value that the candidate is slower,
+    /// baseline samples, candidate samples) per benchmark, NaN when either set has no samples.
+    pub fn compare_samples(&self, baseline_indices: Vec<usize>, candidate_indices: Vec<usize>) -> Vec<(f64, f64, usize, usize)> {
+        (0..self.base_value_grids.len()).map(|benchmark_index| {
+            let pooled = |iteration_indices: &[usize]| -> Vec<f64> {
+                iteration_indices.iter()
+                    .filter_map(|iteration_index| self.samples.get(&(benchmark_index, *iteration_index)))
+                    .flat_map(|values| values.iter().copied())
+                    .filter(|value| !value.is_nan())
+                    .collect()
+            };
+            let mut baseline = pooled(&baseline_indices);
+            let mut candidate = pooled(&candidate_indices);
+            let p_value = mann_whitney_greater(&baseline, &candidate);
+            let (baseline_count, candidate_count) = (baseline.len(), candidate.len());
+            let delta = percent_change(median(&mut baseline), median(&mut candidate));
+            (delta, p_value, baseline_count, candidate_count)
+        }).collect()
+    }
+
+    /// History of every benchmark over `iteration_indices`, oldest first, used to schedule time-budgeted runs.
+    /// For each benchmark the first metric in `metric_indices` with a value in any of the iterations is used.
+    /// Returns (noise floor Δ%, |Δ%| between its last two values, values, iterations since its last value) per benchmark,
+    /// NaN when fewer than two values are known.
+    pub fn history_summaries(&self, iteration_indices: Vec<usize>, metric_indices: Vec<usize>) -> Vec<(f64, f64, usize, usize)> {
+        self.base_value_grids.iter().map(|grid| {
+            for metric_index in metric_indices.iter() {
+                if *metric_index >= grid.column_count() {
+                    continue
+                }
+                let column: Vec<f64> = iteration_indices.iter()
+                    .map(|iteration_index| if *iteration_index < grid.column_length() { grid.get(*metric_index, *iteration_index) } else { f64::NAN })
+                    .collect();
+                let Some(last_index) = column.iter().rposition(|value| !value.is_nan()) else {
+                    continue
+                };
+                let values: Vec<f64> = column.iter().copied().filter(|value| !value.is_nan()).collect();
+                let last_delta = match values.len() {
+                    0 | 1 => f64::NAN,
+                    length => percent_change(values[length - 2], values[length - 1]).abs()
+                };
+                let floor = if values.len() > 1 { noise_floor(&values) } else { f64::NAN };
+                return (floor, last_delta, values.len(), column.len() - 1 - last_index)
+            }
+            (f64::NAN, f64::NAN, 0, iteration_indices.len())
+        }).collect()
+    }
+}
+
+/// Change from `base` to `other` in percent, positive when `other` is larger.
+pub fn percent_change(base: f64, other: f64) -> f64 {
+    let div = other / base;
+    (div - 1.0) * 100.0
+}
+
+/// Median of `values`, which are reordered. NaN if empty.
+pub fn median(values: &mut [f64]) -> f64 {
+    if values.is_empty() {
+        return f64::NAN
+    }
+    values.sort_by(|left, right| left.total_cmp(right));
+    let middle = values.len()/2;
+    if values.len() % 2 == 0 { (values[middle - 1] + values[middle])/2.0 } else { values[middle] }
+}
+
+/// Ratio of the 97.5th percentile to the median of |x| for normally distributed x.
+const NOISE_FLOOR_SCALE: f64 = 1.959964/0.674490;
+
+/// Δ% between two consecutive results that noise alone stays under about 95% of the time.
+/// Estimated from the median |Δ%| of consecutive `values`, so a few real changes in the history barely move it.
+pub fn noise_floor(values: &[f64]) -> f64 {
+    let mut deltas: Vec<f64> = values.windows(2)
+        .map(|pair| percent_change(pair[0], pair[1]).abs())
+        .filter(|delta| delta.is_finite())
+        .collect();
+    median(&mut deltas)*NOISE_FLOOR_SCALE
 }
 
 impl Manager {
@@ -125,4 +477,16 @@ impl Manager {
     pub fn set_grid(&mut self, index: usize, grid: Grid) {
         self.base_value_grids[index] = grid
     }
+
+    fn iteration_count(&self) -> usize {
+        self.base_value_grids.first().map_or(0, |grid| grid.column_length())
+    }
+
+    fn family_times(&self, benchmark_indices: &[usize], metric_index: usize, iteration_index: usize) -> Vec<f64> {
+        let unit = Unit::TimeUnit(TimeUnit::NS);
+        benchmark_indices.iter().map(|benchmark_index| {
+            let grid = &self.base_value_grids[*benchmark_index];
+            grid.get(metric_index, iteration_index)*grid.unit().as_scaler()/unit.as_scaler()
+        }).collect()
+    }
 }
\ No newline at end of file
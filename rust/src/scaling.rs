@@ -0,0 +1,142 @@
+#[derive(Clone, Copy, PartialEq, Debug)]
+#[allow(dead_code)]
+pub enum Complexity {O1, OLogN, ON, ONLogN, ONSquared, ONCubed}
+
+#[derive(Clone, Debug)]
+pub struct ComplexityFit {
+    pub complexity: Complexity,
+    pub coefficient: f64,
+    pub rms: f64
+}
+
+#[allow(dead_code)]
+impl Complexity {
+    pub const ALL: [Complexity; 6] = [
+        Complexity::O1, Complexity::OLogN, Complexity::ON,
+        Complexity::ONLogN, Complexity::ONSquared, Complexity::ONCubed
+    ];
+
+    /// Uses the same notation as Google Benchmark's `big_o` field.
+    pub fn as_str(&self) -> &'static str {
+        match self {
+            Complexity::O1        => "(1)",
+            Complexity::OLogN     => "lgN",
+            Complexity::ON        => "N",
+            Complexity::ONLogN    => "NlgN",
+            Complexity::ONSquared => "N^2",
+            Complexity::ONCubed   => "N^3",
+        }
+    }
+
+    pub fn eval(&self, n: f64) -> f64 {
+        match self {
+            Complexity::O1        => 1.0,
+            Complexity::OLogN     => n.log2(),
+            Complexity::ON        => n,
+            Complexity::ONLogN    => n*n.log2(),
+            Complexity::ONSquared => n*n,
+            Complexity::ONCubed   => n*n*n,
+        }
+    }
+}
+
+fn valid_points(ns: &[f64], times: &[f64]) -> Vec<(f64, f64)> {
+    ns.iter().zip(times.iter())
+        .filter(|(n, time)| !n.is_nan() && !time.is_nan() && **n > 0.0 && **time > 0.0)
+        .map(|(n, time)| (*n, *time))
+        .collect()
+}
+
+/// Least squares fit of `time = coefficient*f(n)` for a single complexity.
+/// The rms is normalized by the mean time, matching Google Benchmark's `RMS` aggregate.
+pub fn fit_single_complexity(ns: &[f64], times: &[f64], complexity: Complexity) -> Option<ComplexityFit> {
+    let points = valid_points(ns, times);
+    if points.len() < 2 {
+        return None
+    }
+    let mut sigma_gn_squared = 0.0;
+    let mut sigma_time_gn = 0.0;
+    let mut sigma_time = 0.0;
+    for (n, time) in points.iter() {
+        let gn = complexity.eval(*n);
+        sigma_gn_squared += gn*gn;
+        sigma_time_gn += time*gn;
+        sigma_time += time;
+    }
+    if sigma_gn_squared == 0.0 {
+        return None
+    }
+    let coefficient = sigma_time_gn / sigma_gn_squared;
+
+    let mut rms = 0.0;
+    for (n, time) in points.iter() {
+        let fit = coefficient*complexity.eval(*n);
+        rms += (time - fit)*(time - fit);
+    }
+    let count = points.len() as f64;
+    let mean = sigma_time / count;
+    rms = (rms / count).sqrt() / mean;
+
+    Some(ComplexityFit { complexity, coefficient, rms })
+}
+
+/// Fits every complexity and returns the one with the lowest normalized rms.
+pub fn fit_complexity(ns: &[f64], times: &[f64]) -> Option<ComplexityFit> {
+    let mut best: Option<ComplexityFit> = None;
+    for complexity in Complexity::ALL {
+        if let Some(fit) = fit_single_complexity(ns, times, complexity) {
+            let is_better = match &best {
+                Some(best_fit) => fit.rms < best_fit.rms,
+                None => true
+            };
+            if is_better {
+                best = Some(fit);
+            }
+        }
+    }
+    best
+}
+
+/// Slope of `log(time)` against `log(n)`, the `k` in `time = a*n^k`.
+pub fn fit_exponent(ns: &[f64], times: &[f64]) -> Option<f64> {
+    let points = valid_points(ns, times);
+    if points.len() < 2 {
+        return None
+    }
+    let count = points.len() as f64;
+    let log_points: Vec<(f64, f64)> = points.iter().map(|(n, time)| (n.ln(), time.ln())).collect();
+    let mean_x = log_points.iter().map(|(x, _)| x).sum::<f64>() / count;
+    let mean_y = log_points.iter().map(|(_, y)| y).sum::<f64>() / count;
+
+    let mut covariance = 0.0;
+    let mut variance = 0.0;
+    for (x, y) in log_points.iter() {
+        covariance += (x - mean_x)*(y - mean_y);
+        variance += (x - mean_x)*(x - mean_x);
+    }
+    if variance == 0.0 {
+        return None
+    }
+    Some(covariance / variance)
+}
+
+/// Parallel efficiency of each entry relative to the entry with the fewest threads.
+/// `1.0` means doubling the threads halved the time per iteration.
+pub fn thread_efficiency(threads: &[f64], times: &[f64]) -> Vec<f64> {
+    let points = valid_points(threads, times);
+    let base = points.iter().fold(None, |base: Option<(f64, f64)>, point| {
+        match base {
+            Some(base_point) if base_point.0 <= point.0 => Some(base_point),
+            _ => Some(*point)
+        }
+    });
+    threads.iter().zip(times.iter()).map(|(thread_count, time)| {
+        match base {
+            Some((base_threads, base_time)) if !time.is_nan() && *time > 0.0 => {
+                let speedup = base_time / time;
+                speedup / (thread_count / base_threads)
+            },
+            _ => f64::NAN
+        }
+    }).collect()
+}
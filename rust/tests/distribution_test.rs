@@ -0,0 +1,50 @@
+#[path="../src/lib.rs"]
+mod ccbenchmark;
+use ccbenchmark::manager::distribution::{histograms, mann_whitney_greater};
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn histograms_empty() {
+        let (edges, counts) = histograms(&[&[], &[f64::NAN]], 4);
+        assert!(edges.is_empty());
+        assert_eq!(counts, vec![vec![0; 4], vec![0; 4]]);
+    }
+    #[test]
+    fn histograms_shared_bins() {
+        let baseline = [1.0, 1.5, 2.0, 2.5];
+        let candidate = [4.0, 5.0, 5.0, f64::NAN];
+        let (edges, counts) = histograms(&[&baseline, &candidate], 4);
+        assert_eq!(edges, vec![1.0, 2.0, 3.0, 4.0, 5.0]);
+        assert_eq!(counts[0], vec![2, 2, 0, 0]);
+        assert_eq!(counts[1], vec![0, 0, 0, 3]);
+    }
+    #[test]
+    fn histograms_single_value() {
+        let (edges, counts) = histograms(&[&[10.0, 10.0]], 3);
+        assert_eq!(edges.len(), 4);
+        assert!(edges[0] < 10.0 && 10.0 < edges[3]);
+        assert_eq!(counts[0], vec![0, 2, 0]);
+    }
+    #[test]
+    fn mann_whitney_exact() {
+        // Every candidate sample is larger: 1 of C(6, 3) = 20 orderings.
+        let p_value = mann_whitney_greater(&[1.0, 2.0, 3.0], &[4.0, 5.0, 6.0]);
+        assert!((p_value - 0.05).abs() < 1e-12);
+        // Every candidate sample is smaller, every ordering is at least as extreme.
+        assert!((mann_whitney_greater(&[4.0, 5.0, 6.0], &[1.0, 2.0, 3.0]) - 1.0).abs() < 1e-12);
+        assert!(mann_whitney_greater(&[], &[1.0]).is_nan());
+        assert!(mann_whitney_greater(&[f64::NAN], &[1.0]).is_nan());
+    }
+    #[test]
+    fn mann_whitney_approximation() {
+        let baseline: Vec<f64> = (0..30).map(|value| value as f64).collect();
+        let shifted: Vec<f64> = (0..30).map(|value| value as f64 + 20.0).collect();
+        assert!(mann_whitney_greater(&baseline, &shifted) < 1e-4);
+        // Ties use the normal approximation, identical samples are not significant.
+        let p_value = mann_whitney_greater(&[1.0, 1.0, 2.0, 2.0], &[1.0, 1.0, 2.0, 2.0]);
+        assert!(p_value > 0.4 && p_value < 0.7);
+    }
+}
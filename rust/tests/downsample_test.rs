@@ -0,0 +1,35 @@
+#[path="../src/lib.rs"]
+mod ccbenchmark;
+use ccbenchmark::manager::downsample::lttb;
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn lttb_small_input() {
+        let xs = [0.0, 1.0, 2.0];
+        let ys = [1.0, 5.0, 2.0];
+        assert_eq!(lttb(&xs, &ys, 10), vec![0, 1, 2]);
+        assert_eq!(lttb(&xs, &ys, 2), vec![0, 1, 2]);
+        assert!(lttb(&[], &[], 3).is_empty());
+    }
+    #[test]
+    fn lttb_keeps_ends_and_count() {
+        let xs: Vec<f64> = (0..1000).map(|x| x as f64).collect();
+        let ys: Vec<f64> = xs.iter().map(|x| (x/50.0).sin()).collect();
+        let sampled = lttb(&xs, &ys, 100);
+        assert_eq!(sampled.len(), 100);
+        assert_eq!(sampled[0], 0);
+        assert_eq!(sampled[99], 999);
+        assert!(sampled.windows(2).all(|pair| pair[0] < pair[1]));
+    }
+    #[test]
+    fn lttb_keeps_spike() {
+        let xs: Vec<f64> = (0..500).map(|x| x as f64).collect();
+        let mut ys = vec![1.0; 500];
+        ys[317] = 40.0;
+        let sampled = lttb(&xs, &ys, 20);
+        assert!(sampled.contains(&317));
+    }
+}
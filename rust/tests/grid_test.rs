@@ -143,4 +143,21 @@ mod tests {
         assert_eq!(compare.column(1), &[2.0, 1.0, 0.0]);
         assert_eq!(compare.column(2), &[2.0, 1.0, 0.0]);
     }
-}
\ No newline at end of file
+    #[test]
+    fn valid_masks() {
+        let mut grid = Grid::new(Unit::TimeUnit(TimeUnit::S), 3, 3);
+        grid.set_column(0, &[f64::NAN, 2.0, f64::NAN], Unit::TimeUnit(TimeUnit::S));
+        grid.set_column(2, &[7.0, f64::NAN, f64::NAN], Unit::TimeUnit(TimeUnit::S));
+
+        assert_eq!(grid.valid_columns(), vec![true, false, true]);
+        assert_eq!(grid.valid_rows(), vec![true, true, false]);
+    }
+    #[test]
+    fn set_converts_to_grid_unit() {
+        let mut grid = Grid::new(Unit::TimeUnit(TimeUnit::NS), 2, 2);
+        grid.set(0, 0, 2.0, Unit::TimeUnit(TimeUnit::US));
+        grid.set_column(1, &[1.0, 3.0], Unit::TimeUnit(TimeUnit::MS));
+        assert_eq!(grid.get(0, 0), 2e3);
+        assert_eq!(grid.column(1), &[1e6, 3e6]);
+    }
+}
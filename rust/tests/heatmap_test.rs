@@ -0,0 +1,50 @@
+#[path="../src/lib.rs"]
+mod ccbenchmark;
+use ccbenchmark::manager::{Manager, percent_change, heatmap::{lerp_color, delta_color, neighbor_deltas}, unit::{Unit, TimeUnit}, grid::Grid};
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    const BLACK: u32 = 0xff000000;
+    const RED: u32 = 0xffff5555;
+    const GREEN: u32 = 0xff00ff80;
+    const EMPTY: u32 = 0xffffffff;
+
+    #[test]
+    fn lerp_color_ends() {
+        assert_eq!(lerp_color(0.0, BLACK, RED), BLACK);
+        assert_eq!(lerp_color(1.0, BLACK, RED), RED);
+        assert_eq!(lerp_color(2.0, BLACK, RED), RED);
+        assert_eq!(lerp_color(0.5, 0xff000000, 0xff0000ff), 0xff000080);
+    }
+    #[test]
+    fn delta_color_scheme() {
+        assert_eq!(delta_color(f64::NAN, 20.0, BLACK, RED, GREEN, EMPTY), EMPTY);
+        assert_eq!(delta_color(0.0, 20.0, BLACK, RED, GREEN, EMPTY), BLACK);
+        assert_eq!(delta_color(40.0, 20.0, BLACK, RED, GREEN, EMPTY), RED);
+        assert_eq!(delta_color(-20.0, 20.0, BLACK, RED, GREEN, EMPTY), GREEN);
+    }
+    #[test]
+    fn neighbor_deltas_skip_empty() {
+        let deltas = neighbor_deltas(&[1.0, f64::NAN, 2.0, 1.0], percent_change);
+        assert!(deltas[0].is_nan());
+        assert!(deltas[1].is_nan());
+        assert_eq!(deltas[2], 100.0);
+        assert_eq!(deltas[3], -50.0);
+    }
+    #[test]
+    fn render_heatmap_rows() {
+        let mut manager = Manager::new();
+        let mut grid = Grid::new(Unit::TimeUnit(TimeUnit::NS), 3, 2);
+        grid.set_column(1, &[1.0, 2.0, 1.0], Unit::TimeUnit(TimeUnit::NS));
+        manager.push(grid);
+        manager.push(Grid::new(Unit::TimeUnit(TimeUnit::NS), 3, 2));
+
+        let (pixels, row_metrics) = manager.render_heatmap(vec![1, 0], vec![0, 1], 20.0, BLACK, RED, GREEN, EMPTY);
+        assert_eq!(row_metrics, vec![usize::MAX, 1]);
+        assert_eq!(pixels.len(), 2*3*4);
+        let colors: Vec<u32> = pixels.chunks(4).map(|chunk| u32::from_ne_bytes(chunk.try_into().unwrap())).collect();
+        assert_eq!(colors, vec![EMPTY, EMPTY, EMPTY, EMPTY, RED, GREEN]);
+    }
+}
@@ -65,4 +65,215 @@ mod tests {
         assert_eq!(output[3], &["0.00 %", "8.33 %", "3.33 %"]);
         assert_eq!(output[5], &["0.00 %", "5.56 %", "2.22 %"]);
     }
-}
\ No newline at end of file
+
+    #[test]
+    fn get_cell_test() {
+        let mut manager = Manager::new();
+
+        let mut grid = Grid::new(Unit::TimeUnit(TimeUnit::S), 3, 2);
+        grid.set_column(0, &[1.0, 2.0, 3.0], Unit::TimeUnit(TimeUnit::S));
+        manager.push(grid);
+
+        let profile = Profile { 
+            selected_indicies: vec![0], 
+            unit: "ms".to_string()
+        };
+        manager.update_profile(&profile);
+
+        assert_eq!(manager.dimensions(), (4, 3));
+        assert_eq!(manager.get_units(), ("ms".to_string(), "%".to_string()));
+        assert_eq!(manager.get_cell(0, 1), 2000.0);
+        assert_eq!(manager.get_cell(1, 1), 100.0);
+        assert_eq!(manager.get_cell(1, 2), 50.0);
+        assert!(manager.get_cell(2, 0).is_nan());
+        assert!(manager.get_cell(0, 3).is_nan());
+        assert!(manager.get_cell(4, 0).is_nan());
+    }
+
+    #[test]
+    fn valid_masks_test() {
+        let mut manager = Manager::new();
+
+        let mut grid = Grid::new(Unit::TimeUnit(TimeUnit::NS), 3, 3);
+        grid.set_column(0, &[f64::NAN, 2.0, 3.0], Unit::TimeUnit(TimeUnit::NS));
+        grid.set_column(2, &[f64::NAN, f64::NAN, 1.0], Unit::TimeUnit(TimeUnit::NS));
+        manager.push(grid);
+
+        let profile = Profile { 
+            selected_indicies: vec![0], 
+            unit: "ns".to_string()
+        };
+        manager.update_profile(&profile);
+
+        assert_eq!(manager.get_valid_columns(), vec![true, true, false, false, true, false]);
+        assert_eq!(manager.get_valid_rows(), vec![false, true, true]);
+    }
+
+    #[test]
+    fn compare_iterations_test() {
+        let mut manager = Manager::new();
+
+        let mut grid = Grid::new(Unit::TimeUnit(TimeUnit::NS), 3, 2);
+        grid.set_column(0, &[1.0, 2.0, 1.5], Unit::TimeUnit(TimeUnit::NS));
+        manager.push(grid);
+        grid = Grid::new(Unit::TimeUnit(TimeUnit::NS), 3, 2);
+        grid.set_column(1, &[4.0, 5.0, 2.0], Unit::TimeUnit(TimeUnit::NS));
+        manager.push(grid);
+        grid = Grid::new(Unit::TimeUnit(TimeUnit::NS), 3, 2);
+        grid.set_column(0, &[f64::NAN, 5.0, 2.0], Unit::TimeUnit(TimeUnit::NS));
+        manager.push(grid);
+
+        let comparisons = manager.compare_iterations(0, 2, vec![0, 1], "us".to_string());
+
+        assert_eq!(comparisons.len(), 2);
+        assert_eq!(comparisons[0].0, 0);
+        assert_eq!(comparisons[0].1, 0);
+        assert_eq!(comparisons[0].2, 1e-3);
+        assert_eq!(comparisons[0].3, 1.5e-3);
+        assert_eq!(comparisons[0].4, 50.0);
+
+        assert_eq!(comparisons[1].0, 1);
+        assert_eq!(comparisons[1].1, 1);
+        assert_eq!(comparisons[1].4, -50.0);
+    }
+
+    #[test]
+    fn noise_floors_test() {
+        let mut manager = Manager::new();
+
+        let mut grid = Grid::new(Unit::TimeUnit(TimeUnit::NS), 5, 8);
+        grid.set_column(0, &[100.0, 101.0, 100.0, 101.0, f64::NAN], Unit::TimeUnit(TimeUnit::NS));
+        grid.set_column(7, &[2.0, 4.0, 3.0, f64::NAN, f64::NAN], Unit::TimeUnit(TimeUnit::NS));
+        manager.push(grid);
+        grid = Grid::new(Unit::TimeUnit(TimeUnit::NS), 5, 8);
+        grid.set_column(1, &[10.0, 10.0, f64::NAN, 10.0, 50.0], Unit::TimeUnit(TimeUnit::NS));
+        manager.push(grid);
+        grid = Grid::new(Unit::TimeUnit(TimeUnit::NS), 5, 8);
+        grid.set_column(0, &[1.0, f64::NAN, f64::NAN, f64::NAN, f64::NAN], Unit::TimeUnit(TimeUnit::NS));
+        manager.push(grid);
+
+        let floors = manager.noise_floors(vec![0, 1, 2, 3, 4], vec![0, 1], 7, 2);
+
+        assert_eq!(floors.len(), 3);
+        // |Δ| of 1 %, 0.99 % and 1 %.
+        assert!((floors[0].0 - 1.0*1.959964/0.674490).abs() < 1e-9);
+        assert_eq!(floors[0].1, 3);
+        assert_eq!(floors[0].2, 3.0);
+        // A single jump of 400 % does not move the median.
+        assert_eq!(floors[1].0, 0.0);
+        assert_eq!(floors[1].1, 3);
+        assert!(floors[1].2.is_nan());
+        assert!(floors[2].0.is_nan());
+        assert_eq!(floors[2].1, 0);
+
+        let floors = manager.noise_floors(vec![0, 1], vec![0, 1], 7, 2);
+        assert!(floors[0].0.is_nan());
+    }
+
+    #[test]
+    fn compare_samples_test() {
+        let mut manager = Manager::new();
+        manager.push(Grid::new(Unit::TimeUnit(TimeUnit::NS), 4, 1));
+        manager.push(Grid::new(Unit::TimeUnit(TimeUnit::NS), 4, 1));
+        // Rounds interleave the baseline (0, 2) and the candidate (1, 3).
+        manager.set_samples(0, 0, vec![100.0, 101.0, 102.0], "ns".to_string());
+        manager.set_samples(0, 1, vec![110.0, 111.0, 112.0], "ns".to_string());
+        manager.set_samples(0, 2, vec![100.5, 101.5], "ns".to_string());
+        manager.set_samples(0, 3, vec![0.1105, 0.1115], "us".to_string());
+        manager.set_samples(1, 0, vec![100.0], "ns".to_string());
+
+        let comparisons = manager.compare_samples(vec![0, 2], vec![1, 3]);
+
+        assert_eq!(comparisons.len(), 2);
+        assert!((comparisons[0].0 - (111.0/101.0 - 1.0)*100.0).abs() < 1e-9);
+        assert!(comparisons[0].1 < 0.01);
+        assert_eq!((comparisons[0].2, comparisons[0].3), (5, 5));
+        assert!(comparisons[1].0.is_nan());
+        assert!(comparisons[1].1.is_nan());
+        assert_eq!((comparisons[1].2, comparisons[1].3), (1, 0));
+    }
+
+    #[test]
+    fn history_summaries_test() {
+        let mut manager = Manager::new();
+
+        let mut grid = Grid::new(Unit::TimeUnit(TimeUnit::NS), 5, 2);
+        grid.set_column(1, &[100.0, 101.0, 100.0, 110.0, f64::NAN], Unit::TimeUnit(TimeUnit::NS));
+        manager.push(grid);
+        grid = Grid::new(Unit::TimeUnit(TimeUnit::NS), 5, 2);
+        grid.set_column(0, &[f64::NAN, f64::NAN, 5.0, f64::NAN, f64::NAN], Unit::TimeUnit(TimeUnit::NS));
+        manager.push(grid);
+        grid = Grid::new(Unit::TimeUnit(TimeUnit::NS), 5, 2);
+        manager.push(grid);
+
+        let summaries = manager.history_summaries(vec![0, 1, 2, 3, 4], vec![0, 1]);
+
+        assert_eq!(summaries.len(), 3);
+        assert!(summaries[0].0 > 0.0);
+        assert!((summaries[0].1 - 10.0).abs() < 1e-9);
+        assert_eq!(summaries[0].2, 4);
+        assert_eq!(summaries[0].3, 1);
+        assert!(summaries[1].0.is_nan());
+        assert!(summaries[1].1.is_nan());
+        assert_eq!(summaries[1].2, 1);
+        assert_eq!(summaries[1].3, 2);
+        assert!(summaries[2].0.is_nan());
+        assert_eq!((summaries[2].2, summaries[2].3), (0, 5));
+
+        // Iterations are used in the given order.
+        let summaries = manager.history_summaries(vec![3, 2], vec![0, 1]);
+        assert!((summaries[0].1 - (100.0_f64/110.0 - 1.0).abs()*100.0).abs() < 1e-9);
+    }
+
+    #[test]
+    fn get_series_test() {
+        let mut manager = Manager::new();
+
+        let mut grid = Grid::new(Unit::TimeUnit(TimeUnit::NS), 6, 1);
+        grid.set_column(0, &[1.0, f64::NAN, 3.0, 9.0, 2.0, 4.0], Unit::TimeUnit(TimeUnit::NS));
+        manager.push(grid);
+
+        let (iterations, values) = manager.get_series(0, 0, "ns".to_string(), 0, 6, 100);
+        assert_eq!(iterations, vec![0, 2, 3, 4, 5]);
+        assert_eq!(values, vec![1.0, 3.0, 9.0, 2.0, 4.0]);
+
+        let (iterations, values) = manager.get_series(0, 0, "us".to_string(), 2, 10, 3);
+        assert_eq!(iterations, vec![2, 3, 5]);
+        assert_eq!(values[0], 3e-3);
+    }
+
+    #[test]
+    fn samples_test() {
+        let mut manager = Manager::new();
+        manager.push(Grid::new(Unit::TimeUnit(TimeUnit::NS), 3, 1));
+
+        manager.set_samples(0, 2, vec![1.0, 2.0, 4.0], "us".to_string());
+        manager.set_samples(0, 0, vec![3000.0], "ns".to_string());
+
+        assert_eq!(manager.get_samples(0, 2, "ns".to_string()), vec![1000.0, 2000.0, 4000.0]);
+        assert!(manager.get_samples(0, 1, "ns".to_string()).is_empty());
+        assert_eq!(manager.get_sampled_iterations(0), vec![0, 2]);
+
+        let (edges, counts) = manager.get_histograms(0, vec![0, 1, 2], 3, "us".to_string());
+        assert_eq!(edges, vec![1.0, 2.0, 3.0, 4.0]);
+        assert_eq!(counts, vec![vec![0, 0, 1], vec![0, 0, 0], vec![1, 1, 1]]);
+    }
+
+    #[test]
+    fn get_values_buffer_test() {
+        let mut manager = Manager::new();
+        let mut grid = Grid::new(Unit::TimeUnit(TimeUnit::NS), 2, 2);
+        grid.set_column(0, &[1000.0, 2000.0], Unit::TimeUnit(TimeUnit::NS));
+        manager.push(grid);
+        grid = Grid::new(Unit::TimeUnit(TimeUnit::NS), 2, 2);
+        grid.set_column(1, &[3000.0, 4000.0], Unit::TimeUnit(TimeUnit::NS));
+        manager.push(grid);
+
+        let buffer = manager.get_values_buffer("us".to_string());
+        let values: Vec<f64> = buffer.chunks(8).map(|chunk| f64::from_ne_bytes(chunk.try_into().unwrap())).collect();
+        assert_eq!(values.len(), 8);
+        assert_eq!(values[0..2], [1.0, 2.0]);
+        assert!(values[2].is_nan() && values[4].is_nan());
+        assert_eq!(values[6..8], [3.0, 4.0]);
+    }
+}
@@ -0,0 +1,91 @@
+#[path="../src/lib.rs"]
+mod ccbenchmark;
+use ccbenchmark::manager::{Manager, scaling::{Complexity, fit_complexity, fit_exponent, thread_efficiency}, unit::{Unit, TimeUnit}, grid::Grid};
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn assert_close(left: f64, right: f64) {
+        assert!((left - right).abs() < 1e-6, "{} != {}", left, right);
+    }
+
+    #[test]
+    fn fit_complexity_empty() {
+        assert!(fit_complexity(&[], &[]).is_none());
+        assert!(fit_complexity(&[8.0], &[1.0]).is_none());
+    }
+    #[test]
+    fn fit_complexity_linear() {
+        let ns = [8.0, 64.0, 512.0, 4096.0];
+        let times: Vec<f64> = ns.iter().map(|n| 3.0*n).collect();
+        let fit = fit_complexity(&ns, &times).unwrap();
+
+        assert_eq!(fit.complexity, Complexity::ON);
+        assert_close(fit.coefficient, 3.0);
+        assert_close(fit.rms, 0.0);
+    }
+    #[test]
+    fn fit_complexity_n_log_n() {
+        let ns = [8.0, 64.0, 512.0, 4096.0];
+        let times: Vec<f64> = ns.iter().map(|n: &f64| 2.0*n*n.log2()).collect();
+        let fit = fit_complexity(&ns, &times).unwrap();
+
+        assert_eq!(fit.complexity, Complexity::ONLogN);
+        assert_eq!(fit.complexity.as_str(), "NlgN");
+        assert_close(fit.coefficient, 2.0);
+    }
+    #[test]
+    fn fit_complexity_ignores_nan() {
+        let ns = [8.0, 64.0, 512.0, 4096.0];
+        let times = [64.0, f64::NAN, 262144.0, 16777216.0];
+        let fit = fit_complexity(&ns, &times).unwrap();
+
+        assert_eq!(fit.complexity, Complexity::ONSquared);
+    }
+
+    #[test]
+    fn fit_exponent_quadratic() {
+        let ns = [10.0, 100.0, 1000.0];
+        let times = [100.0, 10000.0, 1000000.0];
+
+        assert_close(fit_exponent(&ns, &times).unwrap(), 2.0);
+        assert!(fit_exponent(&[10.0, 10.0], &[1.0, 2.0]).is_none());
+    }
+
+    #[test]
+    fn thread_efficiency_test() {
+        let threads = [1.0, 2.0, 4.0];
+        let times = [8.0, 4.0, 4.0];
+
+        let efficiency = thread_efficiency(&threads, &times);
+        assert_close(efficiency[0], 1.0);
+        assert_close(efficiency[1], 1.0);
+        assert_close(efficiency[2], 0.5);
+    }
+    #[test]
+    fn thread_efficiency_missing_base() {
+        let efficiency = thread_efficiency(&[2.0, 4.0], &[f64::NAN, 1.0]);
+        assert!(efficiency[0].is_nan());
+        assert_close(efficiency[1], 1.0);
+    }
+
+    #[test]
+    fn fit_scaling_per_iteration() {
+        let mut manager = Manager::new();
+        let ns = [8.0, 64.0, 512.0];
+
+        for n in ns.iter() {
+            let mut grid = Grid::new(Unit::TimeUnit(TimeUnit::NS), 2, 1);
+            grid.set_column(0, &[n*1.0, n*n], Unit::TimeUnit(TimeUnit::NS));
+            manager.push(grid);
+        }
+
+        let fits = manager.fit_scaling(vec![0, 1, 2], ns.to_vec(), 0);
+        assert_eq!(fits.len(), 2);
+        assert_eq!(fits[0].0, "N");
+        assert_close(fits[0].3, 1.0);
+        assert_eq!(fits[1].0, "N^2");
+        assert_close(fits[1].3, 2.0);
+    }
+}
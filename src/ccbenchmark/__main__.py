@@ -12,23 +12,55 @@ Exit codes:
     3: NO_BENCHMARKS_FOUND
     4: INVALID_REGEX
     5: NO_LOCAL_SETTINGS
+    6: INVALID_ITERATION
+    7: REGRESSION_DETECTED
+    8: EXPORT_FAILED
+    9: INVALID_PROFILE
+    10: UNSTABLE_SYSTEM
+    11: INVALID_BUDGET
+    12: BISECT_FAILED
+    13: INVALID_TIMEOUT
+    14: INVALID_WORKERS
+    15: WORKER_FAILED
+
+Only the standard library is imported at module level. Settings, frameworks,
+the Rust extension and Qt are imported by the action that needs them, since
+the CLI is started far more often than any single action needs all of them.
 """
 
 import logging
+import os
 import textwrap
 from enum import IntEnum
 import sys
 import argparse
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ccbenchmark.benchmark_settings import LocalSettings
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger()
 
-from ccbenchmark.benchmark_helpers import run_benchmarks, compare_benchmarks
-from ccbenchmark.benchmark_settings import load_local_settings
-from ccbenchmark.benchmark_framework import import_framework
-
 RUN_ACTIONS = {'run', 'r', 'run_and_compare', 'rac'}
 COMPARE_ACTIONS = {'compare', 'c', 'run_and_compare', 'rac'}
+REPORT_ACTIONS = {'report'}
+CHECK_ACTIONS = {'check'}
+EXPORT_ACTIONS = {'export'}
+CALIBRATE_ACTIONS = {'calibrate'}
+CONFIRM_ACTIONS = {'confirm'}
+BISECT_ACTIONS = {'bisect'}
+WORKER_ACTIONS = {'worker'}
+# Actions whose thresholds and colors use the noise floors of `calibrate`.
+NOISE_FLOOR_ACTIONS = COMPARE_ACTIONS | REPORT_ACTIONS | CHECK_ACTIONS | CONFIRM_ACTIONS
+# Values of `ccbenchmark.report.ReportFormat` and `ccbenchmark.export.ExportFormat`, listed here so parsing arguments does not
+# import them (tests/test_main.py checks they match). Numeric defaults are left None and taken from the module of the action.
+REPORT_FORMATS = ['md', 'html', 'json']
+EXPORT_FORMATS = ['csv', 'ndjson', 'parquet']
+# Environment variable holding the token of workers, so it is not visible in the process list.
+WORKER_TOKEN_ENV = 'CCBENCHMARK_WORKER_TOKEN'
 BENCHMARK_FILE = 'benchmarks.txt'
 
 class ExitResult(IntEnum):
@@ -39,6 +71,16 @@ class ExitResult(IntEnum):
     NO_BENCHMARKS_FOUND = 3
     INVALID_REGEX = 4
     NO_LOCAL_SETTINGS = 5
+    INVALID_ITERATION = 6
+    REGRESSION_DETECTED = 7
+    EXPORT_FAILED = 8
+    INVALID_PROFILE = 9
+    UNSTABLE_SYSTEM = 10
+    INVALID_BUDGET = 11
+    BISECT_FAILED = 12
+    INVALID_TIMEOUT = 13
+    INVALID_WORKERS = 14
+    WORKER_FAILED = 15
 
     def __str__(self):
         return self.name
@@ -57,40 +99,356 @@ def main(args: argparse.Namespace, parser: argparse.ArgumentParser) -> ExitResul
         logger.error("Error: No action specified.\n")
         parser.print_help()
         return ExitResult.NO_ACTION
-    
-    local_settings = load_local_settings()
+
+    if args.action in WORKER_ACTIONS:
+        return run_worker(args)
+
+    from ccbenchmark.benchmark_settings import load_local_settings
+    from ccbenchmark.benchmark_framework import import_framework
+    from ccbenchmark.name_index import BenchmarkFilter
+    from ccbenchmark.trace import span
+
+    benchmark_filter = None
+    if getattr(args, 'filter', None) is not None:
+        try:
+            benchmark_filter = BenchmarkFilter(args.filter, args.glob)
+        except re.error as e:
+            logger.error(f"Error: Invalid filter '{args.filter}': {e}")
+            return ExitResult.INVALID_REGEX
+
+    with span('load_local_settings'):
+        local_settings = load_local_settings()
     if local_settings is None:
         logger.error(f"Error: No local settings found!")
         return ExitResult.NO_LOCAL_SETTINGS
     
-    frameworks = [
-        import_framework(framework, output_format)
-        for framework, output_format in zip(local_settings.framework_name_list, local_settings.output_format_list)
-    ]
+    with span('import_framework', frameworks=len(local_settings.framework_name_list)):
+        frameworks = [
+            import_framework(framework, output_format)
+            for framework, output_format in zip(local_settings.framework_name_list, local_settings.output_format_list)
+        ]
 
     if args.action in RUN_ACTIONS:
+        from ccbenchmark.benchmark_helpers import run_benchmarks
+
+        if args.profile is not None and all(args.profile not in run_profiles for run_profiles in local_settings.run_profiles_list):
+            logger.error(f"Error: No framework in settings.yaml has a run profile named '{args.profile}'.")
+            return ExitResult.INVALID_PROFILE
+
+        run_profiles = []
+        for framework_name, framework_run_profiles in zip(local_settings.framework_name_list, local_settings.run_profiles_list):
+            run_profile = None
+            if args.profile is not None:
+                run_profile = framework_run_profiles.get(args.profile)
+                if run_profile is None:
+                    logger.warning(f"{framework_name}: No run profile named '{args.profile}', running with the framework's defaults.")
+            run_profiles.append(run_profile)
+
+        worker_pool = None
+        if args.workers is not None:
+            from ccbenchmark.distributed import WorkerPool, parse_address
+
+            if args.budget is not None or args.stable is not None:
+                logger.error('Error: --budget and --stable apply to the host that runs, start workers with --stable instead.')
+                return ExitResult.INVALID_WORKERS
+            try:
+                addresses = [parse_address(address) for address in args.workers.split(',') if address.strip() != '']
+            except ValueError as e:
+                logger.error(f'Error: {e}')
+                return ExitResult.INVALID_WORKERS
+            worker_pool = WorkerPool(addresses, os.environ.get(WORKER_TOKEN_ENV))
+
+        timeout = None
+        if args.timeout is not None:
+            from ccbenchmark.schedule import parse_duration
+
+            try:
+                timeout = parse_duration(args.timeout)
+            except ValueError as e:
+                logger.error(f'Error: {e}')
+                return ExitResult.INVALID_TIMEOUT
+
+        schedule = None
+        if args.budget is not None:
+            from ccbenchmark.benchmark_helpers import plan_budget_run
+            from ccbenchmark.schedule import parse_duration
+
+            try:
+                budget_seconds = parse_duration(args.budget)
+            except ValueError as e:
+                logger.error(f'Error: {e}')
+                return ExitResult.INVALID_BUDGET
+            schedule = plan_budget_run(
+                local_settings.benchmark_runnables_list, 
+                local_settings.output_dir_list, 
+                frameworks, 
+                run_profiles, 
+                budget_seconds, 
+                benchmark_filter
+            )
+
         zipped_inputs = zip(
             local_settings.benchmark_runnables_list, 
             local_settings.output_dir_list, 
             frameworks, 
-            local_settings.output_format_list
+            local_settings.output_format_list, 
+            run_profiles
         )
-        for runnables, output_dir, framework, output_format in zipped_inputs:
-            run_benchmarks(runnables, output_dir, framework, output_format, args.iteration_name)
+        stable_run = None
+        if args.stable is not None:
+            from ccbenchmark.stable_run import StableRunMode, start_stable_run
+
+            stable_run = start_stable_run(StableRunMode(args.stable), args.disable_aslr)
+            if stable_run is None:
+                return ExitResult.UNSTABLE_SYSTEM
+        elif args.disable_aslr:
+            logger.warning('--disable_aslr only applies with --stable, ASLR stays enabled.')
+
+        from ccbenchmark.runner import RunJournal
+
+        journal_options = {
+            'profile': args.profile, 'filter': args.filter, 'glob': args.glob, 'budget': args.budget, 'timeout': args.timeout,
+            'workers': args.workers
+        }
+        journal = RunJournal.start(args.iteration_name, journal_options, args.resume)
+        try:
+            for runnables, output_dir, framework, output_format, run_profile in zipped_inputs:
+                run_benchmarks(
+                    runnables, output_dir, framework, output_format, args.iteration_name, 
+                    benchmark_filter, run_profile, stable_run, not args.no_telemetry, schedule,
+                    timeout=timeout, journal=journal, worker_pool=worker_pool
+                )
+            journal.finish()
+        finally:
+            if stable_run is not None:
+                stable_run.restore()
+
+    noise_floors = None
+    if args.action in NOISE_FLOOR_ACTIONS:
+        from ccbenchmark.calibration import load_noise_floors
+
+        noise_floors = load_noise_floors()
+        if noise_floors is not None:
+            logger.debug(f'Using noise floors of {noise_floors.host}.')
 
     if args.action in COMPARE_ACTIONS:
-        compare_benchmarks(local_settings.output_dir_list, frameworks)
+        from ccbenchmark.benchmark_helpers import compare_benchmarks
+
+        compare_benchmarks(local_settings.output_dir_list, frameworks, benchmark_filter, noise_floors)
+
+    if args.action in REPORT_ACTIONS:
+        from ccbenchmark.benchmark_helpers import report_benchmarks
+        from ccbenchmark.benchmark_data import TimeType
+        from ccbenchmark.report import ReportFormat
+
+        found = report_benchmarks(
+            local_settings.output_dir_list, 
+            frameworks, 
+            args.baseline, 
+            args.candidate, 
+            ReportFormat(args.format), 
+            args.output, 
+            TimeType[args.time_type.upper()], 
+            benchmark_filter, 
+            noise_floors
+        )
+        if not found:
+            return ExitResult.INVALID_ITERATION
+
+    if args.action in CHECK_ACTIONS:
+        from ccbenchmark.benchmark_helpers import check_benchmarks
+        from ccbenchmark.benchmark_data import TimeType
+
+        baseline = args.baseline or local_settings.check_settings.baseline
+        if baseline is None:
+            logger.error("Error: No baseline given, and no 'baseline' set under 'check' in settings.yaml.")
+            return ExitResult.INVALID_ITERATION
+        check_settings = local_settings.check_settings
+        uses_noise = check_settings.thresholds.noise is not None or any(
+            thresholds.noise is not None for thresholds in check_settings.benchmark_thresholds.values()
+        )
+        if uses_noise and noise_floors is None:
+            logger.warning("The 'noise' threshold is ignored, this host has no noise floors. Run: ccbenchmark calibrate")
+        regression_count = check_benchmarks(
+            local_settings.output_dir_list, 
+            frameworks, 
+            baseline, 
+            args.candidate, 
+            local_settings.check_settings, 
+            args.junit, 
+            TimeType[args.time_type.upper()], 
+            benchmark_filter, 
+            noise_floors
+        )
+        if regression_count is None:
+            return ExitResult.INVALID_ITERATION
+        if regression_count != 0:
+            return ExitResult.REGRESSION_DETECTED
+
+    if args.action in EXPORT_ACTIONS:
+        from ccbenchmark.benchmark_helpers import export_benchmarks
+        from ccbenchmark.export import ExportFormat
+
+        exported = export_benchmarks(
+            local_settings.output_dir_list, 
+            frameworks, 
+            ExportFormat(args.format), 
+            args.output, 
+            benchmark_filter
+        )
+        if not exported:
+            return ExitResult.EXPORT_FAILED
+
+    if args.action in CALIBRATE_ACTIONS:
+        from ccbenchmark.benchmark_helpers import calibrate_benchmarks
+        from ccbenchmark.benchmark_data import TimeType
+        from ccbenchmark.calibration import REFERENCE_REPETITIONS, get_noise_floors_path
+
+        calibrate_benchmarks(
+            local_settings.output_dir_list, 
+            frameworks, 
+            get_noise_floors_path(), 
+            args.repetitions if args.repetitions is not None else REFERENCE_REPETITIONS, 
+            TimeType[args.time_type.upper()], 
+            benchmark_filter
+        )
+
+    if args.action in CONFIRM_ACTIONS:
+        from ccbenchmark.benchmark_helpers import confirm_benchmarks, report_benchmarks
+        from ccbenchmark.benchmark_data import TimeType
+        from ccbenchmark.confirm import CONFIRM_REPETITIONS, CONFIRM_ROUNDS, Verdict
+        from ccbenchmark.report import ReportFormat
+
+        baseline = args.baseline or local_settings.check_settings.baseline
+        if baseline is None:
+            logger.error("Error: No baseline given, and no 'baseline' set under 'check' in settings.yaml.")
+            return ExitResult.INVALID_ITERATION
+        percent = get_percent(args, local_settings)
+        time_type = TimeType[args.time_type.upper()]
+        confirmations = confirm_benchmarks(
+            local_settings.benchmark_runnables_list, 
+            local_settings.output_dir_list, 
+            frameworks, 
+            local_settings.output_format_list, 
+            baseline, 
+            args.candidate, 
+            args.baseline_root, 
+            percent, 
+            args.rounds if args.rounds is not None else CONFIRM_ROUNDS, 
+            args.repetitions if args.repetitions is not None else CONFIRM_REPETITIONS, 
+            time_type, 
+            benchmark_filter
+        )
+        if confirmations is None:
+            return ExitResult.INVALID_ITERATION
+        if args.output is not None:
+            report_benchmarks(
+                local_settings.output_dir_list, frameworks, baseline, args.candidate, 
+                ReportFormat(args.format), args.output, time_type, benchmark_filter, noise_floors
+            )
+        if any(confirmation.verdict == Verdict.CONFIRMED for confirmation in confirmations):
+            return ExitResult.REGRESSION_DETECTED
+
+    if args.action in BISECT_ACTIONS:
+        from ccbenchmark.benchmark_helpers import bisect_benchmarks
+        from ccbenchmark.benchmark_data import TimeType
+
+        bisect_settings = local_settings.bisect_settings
+        if args.build is not None:
+            bisect_settings.build = args.build
+        if args.repetitions is not None:
+            bisect_settings.repetitions = args.repetitions
+        percent = get_percent(args, local_settings)
+        culprits = bisect_benchmarks(
+            local_settings.benchmark_runnables_list, 
+            local_settings.output_dir_list, 
+            frameworks, 
+            local_settings.output_format_list, 
+            bisect_settings, 
+            args.good, 
+            args.bad, 
+            percent, 
+            TimeType[args.time_type.upper()], 
+            benchmark_filter
+        )
+        if culprits is None:
+            return ExitResult.BISECT_FAILED
 
     return ExitResult.SUCCESS
 
+def get_percent(args: argparse.Namespace, local_settings: 'LocalSettings') -> float:
+    """Slowdown in percent `confirm` re-runs and `bisect` bisects past: --percent, the 'percent' under 'check', or the default."""
+    from ccbenchmark.confirm import CONFIRM_PERCENT
+
+    if args.percent is not None:
+        return args.percent
+    if local_settings.check_settings.thresholds.percent is not None:
+        return local_settings.check_settings.thresholds.percent
+    return CONFIRM_PERCENT
+
+def run_worker(args: argparse.Namespace) -> ExitResult:
+    """Serves runnables to coordinators until interrupted, for `ccbenchmark worker`."""
+    import signal
+    from ccbenchmark.distributed import DEFAULT_PORT, Worker, is_loopback
+
+    def stop(*_) -> None:
+        raise KeyboardInterrupt()
+    # Stopped as a service with SIGTERM, restoring what --stable changed.
+    signal.signal(signal.SIGTERM, stop)
+
+    port = args.port if args.port is not None else DEFAULT_PORT
+    token = os.environ.get(WORKER_TOKEN_ENV) or None
+    if token is None and not is_loopback(args.bind):
+        logger.error(f'Error: Set {WORKER_TOKEN_ENV} to listen on {args.bind}, otherwise any host that can reach the port can run the runnables under {args.root}.')
+        return ExitResult.WORKER_FAILED
+
+    stable_run = None
+    if args.stable is not None:
+        from ccbenchmark.stable_run import StableRunMode, start_stable_run
+
+        stable_run = start_stable_run(StableRunMode(args.stable), args.disable_aslr)
+        if stable_run is None:
+            return ExitResult.UNSTABLE_SYSTEM
+    try:
+        try:
+            worker = Worker((args.bind, port), args.root, token, stable_run, set(args.allow_env), set(args.allow_arg))
+        except OSError as e:
+            logger.error(f'Error: Could not listen on {args.bind}:{port}: {e}')
+            return ExitResult.WORKER_FAILED
+        with worker:
+            logger.info(f'Worker {worker.host_name} listening on {args.bind}:{worker.server_address[1]}, running runnables under {worker.root}')
+            try:
+                worker.serve_forever()
+            except KeyboardInterrupt:
+                logger.info('Worker stopped.')
+    finally:
+        if stable_run is not None:
+            stable_run.restore()
+    return ExitResult.SUCCESS
+
 def entrypoint() -> None:
     """Entrypoint for ccbenchmark. Creates parser to take in CLI args."""
     epilog = textwrap.dedent("""\
     Examples:
        benchmark run
        benchmark run switched_to_array
+       benchmark run --profile quick
+       benchmark run --stable strict --disable_aslr
+       benchmark run nightly --budget 30m
+       benchmark run nightly --timeout 20m --resume
+       benchmark worker --bind 0.0.0.0
+       benchmark run nightly --workers bench-1,bench-2:7302
        benchmark compare
+       benchmark compare --filter 'BM_Sort'
+       benchmark run --glob --filter 'cpp/**/BM_Sort/*'
        benchmark run_and_compare switched_to_array
+       benchmark report main switched_to_array --format html -o report.html
+       benchmark check main recent --junit benchmarks.xml
+       benchmark export --format parquet -o history.parquet
+       benchmark calibrate
+       benchmark confirm main recent --baseline_root ../main-build
+       benchmark bisect v1.2 main --bench 'BM_Sort'
+       benchmark --trace trace.json compare
     """)
     
     parser = argparse.ArgumentParser(
@@ -103,19 +461,83 @@ def entrypoint() -> None:
     parser.add_argument('--version', action='version', version='benchmark 0.0.1')
     # parser.add_argument('-w', '--working_directory', nargs='?', default='.', help='Directory where benchmark data is located')
 
+    filter_parser = argparse.ArgumentParser(add_help=False)
+    filter_parser.add_argument('--filter', default=None, help='Regex searched for in benchmark ids (<runnable path>/<benchmark name>, with the runnable path as on compare)')
+    filter_parser.add_argument('--glob', action='store_true', help="Match --filter as a glob against the whole id, '**' matches any number of parts")
+
+    # Options of every action that runs runnables.
+    run_options_parser = argparse.ArgumentParser(add_help=False)
+    run_options_parser.add_argument('iteration_name', nargs='?', default='recent', help='Name of iteration')
+    run_options_parser.add_argument('-p', '--profile', default=None, help="Run profile from 'profiles' in settings.yaml (e.g., quick, full)")
+    run_options_parser.add_argument('--stable', nargs='?', const='warn', default=None, choices=['warn', 'strict'], help="Pin to isolated cores and raise priority, 'strict' refuses to run unless the cpufreq governor is performance")
+    run_options_parser.add_argument('--disable_aslr', action='store_true', help='Disable ASLR for runnables, with --stable')
+    run_options_parser.add_argument('--no_telemetry', action='store_true', help='Do not sample load, cpufreq and temperatures while runnables run')
+    run_options_parser.add_argument('--budget', default=None, help='Fit the run in a time budget (e.g., 30m, 1h30m), running the noisiest and most recently changed benchmarks first')
+    run_options_parser.add_argument('--timeout', default=None, help='Stop each runnable after this long (e.g., 10m, 90s), overridden by the run profile')
+    run_options_parser.add_argument('--resume', action='store_true', help='Skip the runnables that finished before the last run of this iteration was interrupted')
+    run_options_parser.add_argument('--workers', default=None, help=f"Comma-separated <host>[:<port>] of 'benchmark worker' agents to run the runnables on in parallel, with the token in {WORKER_TOKEN_ENV}")
+
     subparsers = parser.add_subparsers(dest='action', help='Action to perform')
 
-    run_parser = subparsers.add_parser('run', aliases=['r'], help='Run benchmarks')
-    run_parser.add_argument('iteration_name', nargs='?', default='recent', help='Name of iteration')
+    run_parser = subparsers.add_parser('run', aliases=['r'], parents=[filter_parser, run_options_parser], help='Run benchmarks')
 
-    compare_parser = subparsers.add_parser('compare', aliases=['c'], help='Compare iterations of benchmarks')
-    # compare_parser.add_argument('compare_name', nargs='?', default='.*', help='Regex pattern for benchmark names to be compared')
+    compare_parser = subparsers.add_parser('compare', aliases=['c'], parents=[filter_parser], help='Compare iterations of benchmarks')
 
-    run_and_compare_parser = subparsers.add_parser('run_and_compare', aliases=['rac'], help='Run and compare benchmarks')
-    run_and_compare_parser.add_argument('iteration_name', nargs='?', default='recent', help='Name of iteration')
-    # run_and_compare_parser.add_argument('compare_name', nargs='?', default='.*', help='Regex pattern for benchmark names to be compared')
+    run_and_compare_parser = subparsers.add_parser('run_and_compare', aliases=['rac'], parents=[filter_parser, run_options_parser], help='Run and compare benchmarks')
+
+    report_parser = subparsers.add_parser('report', parents=[filter_parser], help='Write a comparison report of two iterations without the GUI')
+    report_parser.add_argument('baseline', help='Name of iteration compared against')
+    report_parser.add_argument('candidate', nargs='?', default='recent', help='Name of iteration being checked')
+    report_parser.add_argument('-f', '--format', choices=REPORT_FORMATS, default='md', help='Report format')
+    report_parser.add_argument('-o', '--output', type=Path, default=None, help='File the report is written to, stdout if not given')
+    report_parser.add_argument('-t', '--time_type', choices=['real', 'cpu'], default='real', help='Time type compared')
+
+    check_parser = subparsers.add_parser('check', parents=[filter_parser], help='Exit with REGRESSION_DETECTED if an iteration regressed past the thresholds in settings.yaml')
+    check_parser.add_argument('baseline', nargs='?', default=None, help="Name of iteration compared against, defaults to 'baseline' under 'check' in settings.yaml")
+    check_parser.add_argument('candidate', nargs='?', default='recent', help='Name of iteration being checked')
+    check_parser.add_argument('--junit', type=Path, default=None, help='File JUnit XML is written to')
+    check_parser.add_argument('-t', '--time_type', choices=['real', 'cpu'], default='real', help='Time type compared')
+
+    export_parser = subparsers.add_parser('export', parents=[filter_parser], help='Write every result of every iteration as CSV, NDJSON or Parquet')
+    export_parser.add_argument('-f', '--format', choices=EXPORT_FORMATS, default='csv', help='Export format, parquet requires pyarrow')
+    export_parser.add_argument('-o', '--output', type=Path, default=None, help='File the export is written to, stdout if not given')
+
+    calibrate_parser = subparsers.add_parser('calibrate', parents=[filter_parser], help='Measure the noise floors of this host and of every benchmark, used by coloring and the noise threshold of check')
+    calibrate_parser.add_argument('--repetitions', type=int, default=None, help='Times each reference micro-benchmark is repeated')
+    calibrate_parser.add_argument('-t', '--time_type', choices=['real', 'cpu'], default='real', help='Time type the history noise is measured from')
+
+    confirm_parser = subparsers.add_parser('confirm', parents=[filter_parser], help='Re-run benchmarks that are slower than the baseline, interleaved with the baseline build, and label them confirmed or refuted')
+    confirm_parser.add_argument('baseline', nargs='?', default=None, help="Name of iteration compared against, defaults to 'baseline' under 'check' in settings.yaml")
+    confirm_parser.add_argument('candidate', nargs='?', default='recent', help='Name of iteration being checked')
+    confirm_parser.add_argument('--baseline_root', type=Path, default=None, help="Directory with the baseline's runnables at the same relative paths (e.g., a worktree of the baseline), the stored baseline results are used if not given")
+    confirm_parser.add_argument('--percent', type=float, default=None, help="Slowdown in percent past which a benchmark is re-run, defaults to 'percent' under 'check' in settings.yaml, or a built-in default")
+    confirm_parser.add_argument('--rounds', type=int, default=None, help='Rounds of baseline and candidate runs, alternating which runs first')
+    confirm_parser.add_argument('--repetitions', type=int, default=None, help='Repetitions of each benchmark in every run')
+    confirm_parser.add_argument('-f', '--format', choices=REPORT_FORMATS, default='md', help='Format of the report written with --output')
+    confirm_parser.add_argument('-o', '--output', type=Path, default=None, help='File a report labeling re-run benchmarks is written to')
+    confirm_parser.add_argument('-t', '--time_type', choices=['real', 'cpu'], default='real', help='Time type compared')
+
+    bisect_parser = subparsers.add_parser('bisect', help="Build and run commits from good to bad in a git worktree to find the one that regressed, see 'bisect' in settings.yaml")
+    bisect_parser.add_argument('good', help='Revision without the regression (e.g., a tag or hash)')
+    bisect_parser.add_argument('bad', nargs='?', default='HEAD', help='Revision with the regression')
+    bisect_parser.add_argument('--bench', '--filter', dest='filter', required=True, help='Regex searched for in benchmark ids (<runnable path>/<benchmark name>, with the runnable path as on compare), only matching benchmarks are run at each commit')
+    bisect_parser.add_argument('--glob', action='store_true', help="Match --bench as a glob against the whole id, '**' matches any number of parts")
+    bisect_parser.add_argument('--build', default=None, help="Shell command building the runnables at the root of the worktree, overrides 'build' under 'bisect' in settings.yaml")
+    bisect_parser.add_argument('--repetitions', type=int, default=None, help="Times each benchmark is repeated at every commit, overrides 'repetitions' under 'bisect' in settings.yaml")
+    bisect_parser.add_argument('--percent', type=float, default=None, help="Slowdown in percent from good to bad a benchmark must exceed to be bisected, defaults to 'percent' under 'check' in settings.yaml, or a built-in default")
+    bisect_parser.add_argument('-t', '--time_type', choices=['real', 'cpu'], default='real', help='Time type compared')
+
+    worker_parser = subparsers.add_parser('worker', help="Run runnables sent by 'benchmark run --workers' on other hosts, until interrupted")
+    worker_parser.add_argument('--bind', default='127.0.0.1', help='Address to listen on, e.g. 0.0.0.0 for every interface')
+    worker_parser.add_argument('--port', type=int, default=None, help='Port to listen on')
+    worker_parser.add_argument('--root', type=Path, default=Path('.'), help='Workspace of this host, runnable paths are relative to it')
+    worker_parser.add_argument('--stable', nargs='?', const='warn', default=None, choices=['warn', 'strict'], help="Pin to isolated cores and raise priority, 'strict' refuses to run unless the cpufreq governor is performance")
+    worker_parser.add_argument('--disable_aslr', action='store_true', help='Disable ASLR for runnables, with --stable')
+    worker_parser.add_argument('--allow_env', action='append', default=[], metavar='NAME', help="Environment variable a coordinator's run profile may set, repeatable (never LD_*, DYLD_*, PYTHON* or PATH)")
+    worker_parser.add_argument('--allow_arg', action='append', default=[], metavar='OPTION', help="Option a coordinator's run profile may append to command lines (e.g., --allow_arg=--benchmark_enable_random_interleaving), repeatable")
 
     parser.add_argument('-v', '--verbose', action='store_true', help='Enable verbose output')
+    parser.add_argument('--trace', type=Path, default=None, help='Write a Chrome trace of ccbenchmark itself to this file, open it in Perfetto')
 
     if len(sys.argv) == 1:
         parser.print_help()
@@ -127,7 +549,19 @@ def entrypoint() -> None:
         logger.setLevel(logging.DEBUG)
         logger.debug("Verbose mode enabled.")
 
-    sys.exit(main(args, parser))
+    if args.trace is None:
+        sys.exit(main(args, parser))
+
+    from ccbenchmark.trace import span, start_tracing, stop_tracing
+
+    start_tracing(args.trace)
+    try:
+        with span('main', action=args.action):
+            exit_result = main(args, parser)
+    finally:
+        span_count = stop_tracing()
+        logger.info(f'{span_count} spans traced to: {args.trace}')
+    sys.exit(exit_result)
 
 if __name__ == '__main__':
     entrypoint()
\ No newline at end of file
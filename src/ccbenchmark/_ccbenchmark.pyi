@@ -10,4 +10,24 @@ class Manager:
     def __init__(self) -> None: ...
     def emplace(self, metric_count: int, iteration_count: int, unit_str: str) -> None: ...
     def run_profile(self, profile: Profile) -> list[list[str]]: ...
-    def set(self, benchmark_index: int, metric_index: int, iteration_index: int, value: float, unit_str: str) -> None: ...
\ No newline at end of file
+    def update_profile(self, profile: Profile) -> None: ...
+    def dimensions(self) -> tuple[int, int]: ...
+    def get_cell(self, column_index: int, row_index: int) -> float: ...
+    def get_units(self) -> tuple[str, str]: ...
+    def get_valid_rows(self) -> list[bool]: ...
+    def get_valid_columns(self) -> list[bool]: ...
+    def set(self, benchmark_index: int, metric_index: int, iteration_index: int, value: float, unit_str: str) -> None: ...
+    def get_values(self, benchmark_index: int, metric_index: int, unit_str: str) -> list[float]: ...
+    def get_values_buffer(self, unit_str: str) -> bytes: ...
+    def set_samples(self, benchmark_index: int, iteration_index: int, values: list[float], unit_str: str) -> None: ...
+    def get_samples(self, benchmark_index: int, iteration_index: int, unit_str: str) -> list[float]: ...
+    def get_sampled_iterations(self, benchmark_index: int) -> list[int]: ...
+    def get_histograms(self, benchmark_index: int, iteration_indices: list[int], bin_count: int, unit_str: str) -> tuple[list[float], list[list[int]]]: ...
+    def get_series(self, benchmark_index: int, metric_index: int, unit_str: str, start: int, stop: int, threshold: int) -> tuple[list[int], list[float]]: ...
+    def render_heatmap(self, benchmark_indices: list[int], metric_indices: list[int], peak_delta: float, default_color: int, red_color: int, green_color: int, empty_color: int) -> tuple[bytes, list[int]]: ...
+    def compare_iterations(self, baseline_index: int, candidate_index: int, metric_indices: list[int], unit_str: str) -> list[tuple[int, int, float, float, float]]: ...
+    def fit_scaling(self, benchmark_indices: list[int], ns: list[float], metric_index: int) -> list[tuple[str, float, float, float]]: ...
+    def fit_thread_scaling(self, benchmark_indices: list[int], threads: list[float], metric_index: int) -> list[list[float]]: ...
+    def noise_floors(self, iteration_indices: list[int], metric_indices: list[int], cv_metric_index: int, min_pairs: int) -> list[tuple[float, int, float]]: ...
+    def compare_samples(self, baseline_indices: list[int], candidate_indices: list[int]) -> list[tuple[float, float, int, int]]: ...
+    def history_summaries(self, iteration_indices: list[int], metric_indices: list[int]) -> list[tuple[float, float, int, int]]: ...
\ No newline at end of file
@@ -0,0 +1,185 @@
+"""Python API for reading benchmark history.
+
+Loads every iteration of a workspace, like the `compare` and `export` actions, and
+returns it as NumPy arrays or a pandas DataFrame for notebooks and scripts. Values
+are copied out of the Rust Manager as one buffer per time type, which NumPy wraps
+without converting each value to a Python float. Qt is never imported.
+
+Requires numpy, and pandas for `BenchmarkHistory.to_dataframe()`
+(`pip install ccbenchmark[api]`).
+
+Example:
+    >>> from ccbenchmark import api
+    >>> history = api.load('path/to/workspace', filter='^cpp/sort')
+    >>> history.real_time.shape  # (benchmarks, metrics, iterations)
+    >>> df = history.to_dataframe()
+
+Defines:
+    - BenchmarkHistory: Values of every benchmark, metric and iteration.
+    - from_benchmark_data(): Reads a BenchmarkHistory from loaded BenchmarkData.
+    - load(): Loads the history of a workspace.
+"""
+
+from dataclasses import dataclass
+from os import PathLike
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ccbenchmark.benchmark_data import BenchmarkData, TimeType
+from ccbenchmark.export import PERCENT_METRICS
+from ccbenchmark.frameworks.util.metrics import METRICS
+from ccbenchmark.trace import span
+
+if TYPE_CHECKING:
+    import numpy
+    import pandas
+
+UNIT = 'ns'
+
+@dataclass(slots=True)
+class BenchmarkHistory:
+    """Values of every benchmark, metric and iteration.
+
+    `real_time` and `cpu_time` are read-only float64 arrays shaped
+    (benchmarks, metrics, iterations), in ns except for the percent metrics
+    (CV and RMS). Missing values are NaN.
+
+    Attributes:
+        benchmark_paths: Path of the runnable of each benchmark.
+        benchmark_names: Name of each benchmark.
+        iteration_names: Names of the iterations, oldest first.
+        metric_names: Names of the metrics (e.g., 'Time', 'μ'), see `METRICS`.
+        real_time: Real time values.
+        cpu_time: CPU time values.
+    """
+    benchmark_paths: list[str]
+    benchmark_names: list[str]
+    iteration_names: list[str]
+    metric_names: list[str]
+    real_time: 'numpy.ndarray'
+    cpu_time: 'numpy.ndarray'
+
+    @property
+    def benchmark_ids(self) -> list[str]:
+        """Benchmark ids (`<runnable path>/<benchmark name>`), as matched by filters."""
+        return [f'{path}/{name}' for path, name in zip(self.benchmark_paths, self.benchmark_names)]
+
+    def get(self, benchmark_id: str, metric: str = 'Time', time_type: TimeType = TimeType.REAL) -> 'numpy.ndarray':
+        """Values of one benchmark and metric over iterations, as a view.
+
+        Args:
+            benchmark_id: `<runnable path>/<benchmark name>`.
+            metric: Name of the metric, see `METRICS`.
+            time_type: Real or CPU time.
+
+        Raises:
+            ValueError: The benchmark or the metric does not exist.
+        """
+        values = self.real_time if time_type == TimeType.REAL else self.cpu_time
+        return values[self.benchmark_ids.index(benchmark_id), self.metric_names.index(metric)]
+
+    def to_dataframe(self) -> 'pandas.DataFrame':
+        """One row per benchmark, metric and iteration with a real or CPU time.
+
+        Columns are path, benchmark, iteration, metric and unit (categorical) and
+        real_time and cpu_time (float64, NaN if missing). Rows are ordered by
+        benchmark, then metric, then iteration, like `ccbenchmark export`.
+
+        Raises:
+            ImportError: pandas is not installed.
+        """
+        import numpy as np
+        import pandas as pd
+
+        benchmark_count, metric_count, iteration_count = self.real_time.shape
+        real_time = self.real_time.reshape(-1)
+        cpu_time = self.cpu_time.reshape(-1)
+        kept = ~(np.isnan(real_time) & np.isnan(cpu_time))
+
+        benchmark_codes = np.repeat(np.arange(benchmark_count), metric_count*iteration_count)[kept]
+        metric_codes = np.tile(np.repeat(np.arange(metric_count), iteration_count), benchmark_count)[kept]
+        iteration_codes = np.tile(np.arange(iteration_count), benchmark_count*metric_count)[kept]
+        units = ['%' if metric_index in PERCENT_METRICS else UNIT for metric_index in range(metric_count)]
+
+        return pd.DataFrame({
+            'path': _to_categorical(self.benchmark_paths, benchmark_codes),
+            'benchmark': _to_categorical(self.benchmark_names, benchmark_codes),
+            'iteration': _to_categorical(self.iteration_names, iteration_codes),
+            'metric': _to_categorical(self.metric_names, metric_codes),
+            'unit': _to_categorical(units, metric_codes),
+            'real_time': real_time[kept],
+            'cpu_time': cpu_time[kept],
+        })
+
+def _to_categorical(labels: list[str], codes: 'numpy.ndarray') -> 'pandas.Categorical':
+    """Categorical of `labels[codes]`, labels may repeat."""
+    import numpy as np
+    import pandas as pd
+
+    label_to_code: dict[str, int] = {}
+    label_codes = np.array([label_to_code.setdefault(label, len(label_to_code)) for label in labels], dtype=np.int64)
+    return pd.Categorical.from_codes(label_codes[codes], list(label_to_code))
+
+def from_benchmark_data(benchmark_data: BenchmarkData) -> BenchmarkHistory:
+    """Reads every value of `benchmark_data`.
+
+    Args:
+        benchmark_data: Loaded benchmark data.
+
+    Returns:
+        BenchmarkHistory: Values of every benchmark, metric and iteration.
+
+    Raises:
+        ImportError: numpy is not installed.
+    """
+    import numpy as np
+
+    shape = (len(benchmark_data.benchmark_names), len(METRICS), len(benchmark_data.iteration_names))
+    with span('Manager.get_values_buffer', category='rust', benchmarks=shape[0], iterations=shape[2]):
+        real_time, cpu_time = (
+            np.frombuffer(benchmark_data.benchmark_types[time_type].get_values_buffer(UNIT), dtype=np.float64).reshape(shape)
+            for time_type in (TimeType.REAL, TimeType.CPU)
+        )
+    return BenchmarkHistory(
+        benchmark_paths=[path.as_posix() for path in benchmark_data.benchmark_paths],
+        benchmark_names=list(benchmark_data.benchmark_names),
+        iteration_names=list(benchmark_data.iteration_names),
+        metric_names=list(METRICS),
+        real_time=real_time,
+        cpu_time=cpu_time,
+    )
+
+def load(workspace: str | PathLike = '.', filter: str | None = None, glob: bool = False) -> BenchmarkHistory:
+    """Loads every iteration of a workspace.
+
+    Args:
+        workspace: Directory containing `.ccbenchmark/settings.yaml`.
+        filter: Regex (or glob if `glob`) matched against benchmark ids, every benchmark if None.
+        glob: True if `filter` is a glob.
+
+    Returns:
+        BenchmarkHistory: Values of every matching benchmark, metric and iteration.
+
+    Raises:
+        FileNotFoundError: The workspace has no local settings.
+        re.error: `filter` is not a valid regex.
+        ImportError: numpy is not installed.
+    """
+    from ccbenchmark.benchmark_settings import load_local_settings
+    from ccbenchmark.benchmark_framework import import_framework
+    from ccbenchmark.benchmark_helpers import load_iterations
+    from ccbenchmark.name_index import BenchmarkFilter
+
+    benchmark_filter = BenchmarkFilter(filter, glob) if filter is not None else None
+
+    workspace = Path(workspace)
+    local_settings = load_local_settings(workspace)
+    if local_settings is None:
+        raise FileNotFoundError(f'No local settings found in: {workspace}')
+
+    frameworks = [
+        import_framework(framework, output_format)
+        for framework, output_format in zip(local_settings.framework_name_list, local_settings.output_format_list)
+    ]
+    benchmark_data = load_iterations(local_settings.output_dir_list, frameworks, benchmark_filter)
+    return from_benchmark_data(benchmark_data)
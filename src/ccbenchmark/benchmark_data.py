@@ -6,19 +6,36 @@ Defines:
     - BenchmarkTime: Contains float and time unit.
     - MetricName: Contains metric base name and its comparisons.
     - BenchmarkData: Contains data, row names, and column names.
+    - LoadProgress: Progress of loading result files.
+    - get_result_files(): Lists result files of iterations, skipping run metadata.
+    - iter_load_benchmark_data(): Loads benchmarks from files, reporting progress.
     - load_benchmark_data(): Loads benchmark from files.
+
+The Rust extension is imported when `BenchmarkData` is first created, so modules
+that only need `BenchmarkTime` or `TimeType` (e.g., the frameworks while running
+benchmarks) do not load it.
 """
 
+from __future__ import annotations
 from enum import IntEnum, StrEnum
 from dataclasses import dataclass, field
 import logging
 from pathlib import Path
-from ccbenchmark.util import strip_common_paths
+from ccbenchmark.util import get_common_part_count
 import math
 from io import TextIOWrapper
+from typing import TYPE_CHECKING, Generator, Iterable
 
 from ccbenchmark.benchmark_framework import Framework
-from ccbenchmark._ccbenchmark import *
+from ccbenchmark.confirm import Confirmation, read_confirmations
+from ccbenchmark.frameworks.util.metrics import METRICS
+from ccbenchmark.name_index import BenchmarkFilter, NameIndex
+from ccbenchmark.telemetry import TelemetrySummary, read_telemetry_summary
+from ccbenchmark.trace import is_tracing, span
+
+if TYPE_CHECKING:
+    from ccbenchmark._ccbenchmark import Manager
+    from ccbenchmark.frameworks.util.parse_result import ParseResult
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger()
@@ -89,6 +106,19 @@ class MetricName:
     name: str
     name_comparisons: list[str] = field(default_factory=lambda: [])
 
+def _filter_results(
+    parse_results: Iterable[ParseResult], benchmark_path: Path, benchmark_filter: BenchmarkFilter
+) -> Generator[ParseResult, None, None]:
+    """Parse results of the benchmarks matching the filter, in the order they are parsed."""
+    # A benchmark has one parse result per metric, the filter is checked once per name.
+    name_matches: dict[str, bool] = {}
+    for parse_result in parse_results:
+        matches = name_matches.get(parse_result.name)
+        if matches is None:
+            matches = name_matches[parse_result.name] = benchmark_filter.matches(benchmark_path, parse_result.name)
+        if matches:
+            yield parse_result
+
 @dataclass(init=False, slots=True)
 class BenchmarkData:
     """Stores names, paths, metric_names, and data."""
@@ -97,7 +127,10 @@ class BenchmarkData:
     iteration_names: list[str]
     benchmark_types: list[Manager]
     metric_names: list[MetricName]
-    benchmark_name_to_index: dict[(Path, str), int]
+    benchmark_name_to_index: NameIndex
+    benchmark_complexities: dict[int, str]
+    runnable_telemetry: dict[tuple[int, Path], TelemetrySummary]
+    benchmark_confirmations: dict[tuple[int, int], Confirmation]
 
     def __init__(self, iteration_names: list[str]):
         """
@@ -105,16 +138,30 @@ class BenchmarkData:
             iteration_names:
                 List of iteration names with no repeated names. Corresponds to name inputted when running ccbenchmark.
         """
+        from ccbenchmark._ccbenchmark import Manager
+
         self.benchmark_names: list[str] = []
         self.benchmark_paths: list[Path] = []
         self.iteration_names: list[str] = iteration_names
         self.benchmark_types: list[Manager] = [Manager(), Manager()]
-        self.benchmark_name_to_index: dict[(Path, str), int] = {}
+        self.benchmark_name_to_index: NameIndex = NameIndex()
+        self.benchmark_complexities: dict[int, str] = {}
+        # Telemetry of each (iteration index, runnable path) that recorded it.
+        self.runnable_telemetry: dict[tuple[int, Path], TelemetrySummary] = {}
+        # Confirmation of each (iteration index, benchmark index) re-run by `ccbenchmark confirm`.
+        self.benchmark_confirmations: dict[tuple[int, int], Confirmation] = {}
 
-        metric_names = ['Time', 'μ', 'Stddev', 'Med', 'Mad', 'Min', 'Max', 'CV']
-        self.metric_names: list[MetricName] = [MetricName(metric_name) for metric_name in metric_names]
+        self.metric_names: list[MetricName] = [MetricName(metric_name) for metric_name in METRICS]
     
-    def add_file(self, iteration_index: int, file_stream: TextIOWrapper, file_path: Path, benchmark_path: Path, framework: Framework) -> None:
+    def add_file(
+        self, 
+        iteration_index: int, 
+        file_stream: TextIOWrapper, 
+        file_path: Path, 
+        benchmark_path: Path, 
+        framework: Framework, 
+        benchmark_filter: BenchmarkFilter | None = None
+    ) -> None:
         """Adds file to BenchmarkData
         Args:
             iteration_index:
@@ -127,13 +174,76 @@ class BenchmarkData:
                 Path to executable that created result file.
             framework:
                 Framework being used to parse file.
+            benchmark_filter:
+                Only benchmarks matching the filter are added, every benchmark if None.
+        """
+        self.benchmark_name_to_index.add_path(benchmark_path)
+
+        parse_results = framework.parse(file_stream, file_path)
+        if benchmark_filter is not None:
+            parse_results = _filter_results(parse_results, benchmark_path, benchmark_filter)
+
+        if not is_tracing():
+            # Results are set as they are parsed, without holding every result of the file.
+            self._add_results(parse_results, iteration_index, benchmark_path)
+            return
+
+        # Parsed before any value is set so the two phases are traced separately.
+        with span('parse', file=file_path.name) as parse_span:
+            parse_results = list(parse_results)
+            parse_span.set(results=len(parse_results))
+
+        # Mostly calls of Manager.emplace and Manager.set.
+        with span('Manager.set', category='rust', results=len(parse_results)) as add_span:
+            benchmark_count = len(self.benchmark_names)
+            self._add_results(parse_results, iteration_index, benchmark_path)
+            add_span.set(new_benchmarks=len(self.benchmark_names) - benchmark_count)
+
+    def get_telemetry(self, iteration_index: int, benchmark_index: int) -> TelemetrySummary | None:
+        """Gets the telemetry of the runnable a benchmark belongs to.
+        Args:
+            iteration_index:
+                Iteration the runnable ran in.
+            benchmark_index:
+                Benchmark of the runnable.
+        Returns:
+            Telemetry summary, None if none was recorded.
+        """
+        return self.runnable_telemetry.get((iteration_index, self.benchmark_paths[benchmark_index]))
+
+    def get_load_warning(self, iteration_index: int, benchmark_index: int) -> str:
+        """Why a benchmark's result in an iteration was taken under load, '' if it was not."""
+        telemetry = self.get_telemetry(iteration_index, benchmark_index)
+        if telemetry is None or not telemetry.under_load:
+            return ''
+        return telemetry.describe()
+
+    def get_confirmation(self, iteration_index: int, benchmark_index: int, baseline_name: str) -> Confirmation | None:
+        """Gets the confirmation of a benchmark's result in an iteration.
+        Args:
+            iteration_index:
+                Iteration whose result was confirmed.
+            benchmark_index:
+                Benchmark that was re-run.
+            baseline_name:
+                Iteration the result must have been confirmed against.
+        Returns:
+            Confirmation, None if the result was not confirmed against `baseline_name`.
         """
+        confirmation = self.benchmark_confirmations.get((iteration_index, benchmark_index))
+        if confirmation is None or confirmation.baseline_name != baseline_name:
+            return None
+        return confirmation
+
+    def _add_results(self, parse_results: Iterable[ParseResult], iteration_index: int, benchmark_path: Path) -> None:
+        """Sets the values of parse results of one file in the Managers, see `add_file`."""
         metric_count = len(self.metric_names)
         iteration_count = len(self.iteration_names)
 
-        for parse_result in framework.parse(file_stream, file_path):
+        for parse_result in parse_results:
             benchmark_id = (benchmark_path, parse_result.name)
-            if benchmark_id not in self.benchmark_name_to_index:
+            benchmark_index = self.benchmark_name_to_index.get(benchmark_id)
+            if benchmark_index is None:
                 benchmark_index = len(self.benchmark_paths)
                 self.benchmark_name_to_index[benchmark_id] = benchmark_index
 
@@ -142,8 +252,9 @@ class BenchmarkData:
 
                 self.benchmark_paths.append(benchmark_path)
                 self.benchmark_names.append(parse_result.name)
-            else:
-                benchmark_index = self.benchmark_name_to_index[benchmark_id]
+
+            if parse_result.complexity is not None:
+                self.benchmark_complexities[benchmark_index] = parse_result.complexity
 
             self.benchmark_types[TimeType.CPU].set(
                 benchmark_index, parse_result.metric_index, iteration_index, 
@@ -153,13 +264,14 @@ class BenchmarkData:
                 benchmark_index, parse_result.metric_index, iteration_index, 
                 parse_result.real_time.time_value or float("nan"), parse_result.real_time.time_unit or "")
 
-    def strip_common_paths(self) -> None:
-        """Removes common paths.
-        Example:
-            stip_common_paths(['a/b/c', 'a/d/e']) -> ['b/c', 'd/e']
-        """
-        self.benchmark_paths = strip_common_paths(self.benchmark_paths)
-    
+            if parse_result.cpu_samples is not None:
+                self.benchmark_types[TimeType.CPU].set_samples(
+                    benchmark_index, iteration_index, parse_result.cpu_samples, parse_result.cpu_time.time_unit or "")
+
+            if parse_result.real_samples is not None:
+                self.benchmark_types[TimeType.REAL].set_samples(
+                    benchmark_index, iteration_index, parse_result.real_samples, parse_result.real_time.time_unit or "")
+
     def update_metric_names(self, time_units: list[TimeUnit]) -> None:
         """Updates units, prefixes, and postfixes used.
         Args:
@@ -180,6 +292,15 @@ class BenchmarkData:
                 metric_name.name_comparisons.append(f'{prefix}{metric_name.name} ({time_unit if time_unit is not None else ''})')
                 i += 1
 
+    @staticmethod
+    def _create_profile(selected_column_indices: list[int]):
+        from ccbenchmark._ccbenchmark import Profile
+
+        profile = Profile()
+        profile.selected_indicies = selected_column_indices
+        profile.unit = "ns"
+        return profile
+
     def get_str_matrix(self, selected_column_indices: list[int], time_type: TimeType) -> list[list[str]]:
         """Gets data as a matrix of strings.
         Args:
@@ -190,11 +311,25 @@ class BenchmarkData:
         Returns:
             Matrix of strings.
         """
-        profile = Profile()
-        profile.selected_indicies = selected_column_indices
-        profile.unit = "ns"
+        return self.benchmark_types[time_type].run_profile(self._create_profile(selected_column_indices))
 
-        return self.benchmark_types[time_type].run_profile(profile)
+    def update_profile(self, selected_column_indices: list[int], time_type: TimeType) -> Manager:
+        """Compares the selected benchmarks without formatting the result.
+
+        Cells are then read one at a time with `Manager.get_cell`, so only the
+        cells that are shown are ever converted to text.
+        Args:
+            selected_column_indices:
+                Selected benchmarks by user.
+            time_type:
+                Real or CPU time.
+        Returns:
+            Manager holding the comparison.
+        """
+        manager = self.benchmark_types[time_type]
+        with span('Manager.update_profile', category='rust', benchmarks=len(selected_column_indices)):
+            manager.update_profile(self._create_profile(selected_column_indices))
+        return manager
     
     def get_columns(self, selected_column_indices: list[int]) -> list[str]:
         """Gets column name strings.
@@ -207,7 +342,7 @@ class BenchmarkData:
         if len(selected_column_indices) == 0:
             return []
 
-        units = ['ns', '%', 'ns', '%', 'ns', '%', 'ns', '%', 'ns', '%', 'ns', '%', 'ns', '%', '%', '%']
+        units = ['ns', '%', 'ns', '%', 'ns', '%', 'ns', '%', 'ns', '%', 'ns', '%', 'ns', '%', '%', '%', 'ns', '%', '%', '%']
         self.update_metric_names(units)
         columns = []
         for i, _ in enumerate(self.metric_names):
@@ -229,13 +364,19 @@ class BenchmarkData:
             return self.iteration_names
         return [self.benchmark_names[i] for i in selected_column_indices]
     
-    def get_paths(self) -> dict:
+    def get_paths(self, benchmark_indices: list[int] | None = None) -> dict:
         """Gets paths as a dictionary.
+        Args:
+            benchmark_indices:
+                Benchmarks included, every benchmark if None.
         Returns:
             Paths as a dictionary.
         """
+        if benchmark_indices is None:
+            benchmark_indices = range(len(self.benchmark_names))
         data_dict = {}
-        for i, (path, benchmark_name) in enumerate(zip(self.benchmark_paths, self.benchmark_names)):
+        for i in benchmark_indices:
+            path = self.benchmark_paths[i]
             current_dict = data_dict
             assert path is not None
             for part in path.parts:
@@ -244,30 +385,133 @@ class BenchmarkData:
                     current_dict[part] = {}
                     next_dict = current_dict[part]
                 current_dict = next_dict
-            current_dict[benchmark_name] = i
+            current_dict[self.benchmark_names[i]] = i
         return data_dict
     
-def load_benchmark_data(iteration_names_to_index: dict[str, int], iteration_paths_and_frameworks: list[tuple[Path, Framework]]) -> BenchmarkData:
-    """Creates BenchmarkData from result files.
+def get_result_files(iteration_names_to_index: dict[str, int], iteration_paths_and_frameworks: list[tuple[Path, Framework]]) -> list[tuple[int, Path, Path, Framework]]:
+    """Lists result files without opening them.
     Args:
         iteration_names_to_index:
             Maps iteration names to the index of the iteration in the data matrix.
         iteration_paths_and_frameworks:
             Contains paths to result files and the corresponding framework used.
     Returns:
-        BenchmarkData
+        (iteration index, result file path, benchmark path, framework) of every result file.
     """
-    benchmark_data = BenchmarkData(list(iteration_names_to_index.keys()))
-
+    result_files: list[tuple[int, Path, Path, Framework]] = []
     for iteration_path, framework in iteration_paths_and_frameworks:
         name = iteration_path.name[len('_iter_'):]
         iteration_index = iteration_names_to_index[name]
         assert iteration_path.is_dir(), f'{iteration_path} is not a directory.'
         for file_path in iteration_path.iterdir():
+            # Dot entries hold metadata of the run (e.g., `.ccbenchmark/` of --stable), not results.
+            if file_path.name.startswith('.'):
+                continue
+            benchmark_path = iteration_path.parent / file_path.name.split('.')[0]
+            result_files.append((iteration_index, file_path, benchmark_path, framework))
+    return result_files
+
+@dataclass(slots=True)
+class LoadProgress:
+    """Progress of loading result files into BenchmarkData.
+
+    Attributes:
+        benchmark_data: Data being loaded, shared by every progress of one load.
+        files_loaded: Result files loaded so far.
+        file_count: Result files that will be loaded.
+        benchmark_count: Benchmarks in `benchmark_data` when the progress was made,
+            benchmarks are only ever appended.
+        iteration_name: Iteration of the last loaded file, '' before the first file.
+    """
+    benchmark_data: BenchmarkData
+    files_loaded: int
+    file_count: int
+    benchmark_count: int
+    iteration_name: str = ''
+
+def iter_load_benchmark_data(
+    iteration_names_to_index: dict[str, int], 
+    iteration_paths_and_frameworks: list[tuple[Path, Framework]], 
+    benchmark_filter: BenchmarkFilter | None = None
+) -> Generator[LoadProgress, None, None]:
+    """Loads result files into BenchmarkData one file at a time.
+
+    Benchmark paths have their common leading parts stripped before the filter
+    is applied, so the filter sees the same paths as the GUI. Result files of
+    runnables the filter can not match are never opened. Files are loaded in
+    the order of `iteration_paths_and_frameworks`, one iteration after another.
+
+    Args:
+        iteration_names_to_index:
+            Maps iteration names to the index of the iteration in the data matrix.
+        iteration_paths_and_frameworks:
+            Contains paths to result files and the corresponding framework used.
+        benchmark_filter:
+            Only benchmarks matching the filter are loaded, every benchmark if None.
+    Returns:
+        Generator[LoadProgress]: Progress before the first file and after every file.
+    """
+    benchmark_data = BenchmarkData(list(iteration_names_to_index.keys()))
+
+    with span('get_result_files', iterations=len(iteration_paths_and_frameworks)) as files_span:
+        result_files = get_result_files(iteration_names_to_index, iteration_paths_and_frameworks)
+        files_span.set(files=len(result_files))
+
+    with span('strip_common_paths', files=len(result_files)) as strip_span:
+        common_part_count = get_common_part_count(list({benchmark_path for _, _, benchmark_path, _ in result_files}))
+
+        # Index of every runnable path, walked once with the filter instead of matching each file.
+        path_index = NameIndex()
+        for _, _, benchmark_path, _ in result_files:
+            path_index.add_path(Path(*benchmark_path.parts[common_part_count:]))
+        matched_paths = set(path_index.match_paths(benchmark_filter))
+
+        stripped_files = [
+            (iteration_index, file_path, Path(*benchmark_path.parts[common_part_count:]), framework)
+            for iteration_index, file_path, benchmark_path, framework in result_files
+        ]
+        stripped_files = [result_file for result_file in stripped_files if result_file[2] in matched_paths]
+        # Stable, so files of an iteration keep their order.
+        stripped_files.sort(key=lambda result_file: result_file[0])
+        strip_span.set(matched_files=len(stripped_files))
+
+    yield LoadProgress(benchmark_data, 0, len(stripped_files), 0)
+    for files_loaded, (iteration_index, file_path, benchmark_path, framework) in enumerate(stripped_files, 1):
+        with span('load_file', file=file_path.as_posix(), iteration=benchmark_data.iteration_names[iteration_index]):
             with open(file_path, 'r', encoding='locale') as file_stream:
-                benchmark_path = iteration_path.parent / file_path.name.split('.')[0]
-                benchmark_data.add_file(iteration_index, file_stream, file_path, benchmark_path, framework)
-    
-    benchmark_data.strip_common_paths()
-    
-    return benchmark_data
\ No newline at end of file
+                benchmark_data.add_file(iteration_index, file_stream, file_path, benchmark_path, framework, benchmark_filter)
+            telemetry = read_telemetry_summary(file_path)
+            if telemetry is not None:
+                benchmark_data.runnable_telemetry[(iteration_index, benchmark_path)] = telemetry
+            for name, confirmation in read_confirmations(file_path).items():
+                benchmark_index = benchmark_data.benchmark_name_to_index.get((benchmark_path, name))
+                if benchmark_index is not None:
+                    benchmark_data.benchmark_confirmations[(iteration_index, benchmark_index)] = confirmation
+        yield LoadProgress(
+            benchmark_data, files_loaded, len(stripped_files), 
+            len(benchmark_data.benchmark_names), benchmark_data.iteration_names[iteration_index]
+        )
+
+    if benchmark_filter is not None:
+        logger.info(f"{len(benchmark_data.benchmark_names)} benchmarks match '{benchmark_filter.pattern}'.")
+
+def load_benchmark_data(
+    iteration_names_to_index: dict[str, int], 
+    iteration_paths_and_frameworks: list[tuple[Path, Framework]], 
+    benchmark_filter: BenchmarkFilter | None = None
+) -> BenchmarkData:
+    """Creates BenchmarkData from result files, see `iter_load_benchmark_data`.
+    Args:
+        iteration_names_to_index:
+            Maps iteration names to the index of the iteration in the data matrix.
+        iteration_paths_and_frameworks:
+            Contains paths to result files and the corresponding framework used.
+        benchmark_filter:
+            Only benchmarks matching the filter are loaded, every benchmark if None.
+    Returns:
+        BenchmarkData
+    """
+    benchmark_data = None
+    for progress in iter_load_benchmark_data(iteration_names_to_index, iteration_paths_and_frameworks, benchmark_filter):
+        benchmark_data = progress.benchmark_data
+    return benchmark_data
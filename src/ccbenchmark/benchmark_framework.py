@@ -4,15 +4,47 @@ Utilities for importing and handling benchmark framework modules.
 This module defines a Protocol (`Framework`) that specifies the required 
 interface for any benchmark framework used by ccbenchmark, and provides 
 `import_framework()` to dynamically load a framework module and validate 
-that it implements the expected interface.
+that it implements the expected interface. `RunOptions` carries the options
+of an action that frameworks apply when running a benchmark.
 """
 
 import importlib
-from ccbenchmark.frameworks.util.parse_result import ParseResult
-from typing import cast, Protocol, Generator, Callable
+import os
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, cast, Protocol, Generator, Callable
 from pathlib import Path
 from io import TextIOWrapper
 
+if TYPE_CHECKING:
+    # parse_result imports benchmark_data, which imports this module.
+    from ccbenchmark.frameworks.util.parse_result import ParseResult
+
+@dataclass(slots=True)
+class RunOptions:
+    """Options applied when running a single benchmark runnable.
+
+    Attributes:
+        benchmark_filter: Regex benchmark names must match to be run, every
+            benchmark is run if None.
+        repetitions: Times each benchmark is repeated, the framework's default if None.
+        min_time: Minimum time each benchmark runs for in seconds, the framework's default if None.
+        extra_args: Arguments appended to the command line.
+        env: Environment variables set for the runnable, on top of the current environment.
+        timeout: Seconds the runnable may run for before it is stopped, unlimited if None.
+    """
+    benchmark_filter: str | None = None
+    repetitions: int | None = None
+    min_time: float | None = None
+    extra_args: list[str] = field(default_factory=lambda: [])
+    env: dict[str, str] = field(default_factory=lambda: {})
+    timeout: float | None = None
+
+    def get_environment(self) -> dict[str, str] | None:
+        """Environment passed to `subprocess`, None (inherit the current one) if `env` is empty."""
+        if len(self.env) == 0:
+            return None
+        return {**os.environ, **self.env}
+
 class Framework(Protocol):
     """Protocol defining the interface of a benchmark framework.
 
@@ -20,18 +52,37 @@ class Framework(Protocol):
         - SUPPORTED_FORMATS: set of output formats it can generate.
         - run_single_benchmark(): run a single benchmark and write results.
         - parse(): parse benchmark output files into structured results.
+
+    It may provide DEFAULT_REPETITIONS, the repetitions it runs with when
+    `RunOptions.repetitions` is None (1 if not provided), and DEFAULT_MIN_TIME,
+    the seconds it runs each benchmark for when `RunOptions.min_time` is None.
+
+    To be run by `ccbenchmark.runner`, which captures output, shows progress and
+    enforces timeouts, it may also provide:
+        - get_command(): arguments `run_single_benchmark` would start.
+        - finish_run(): post-processing of the output once the runnable exited.
+        - parse_progress_line(): result of a line of stdout, None for other lines.
+    Runnables of frameworks without `get_command` are run with `run_single_benchmark`.
+
+    To run part of a runnable's benchmarks without losing the results of the rest,
+    it may provide:
+        - list_benchmarks(): names of the benchmarks a runnable has, None if it can not list them.
+        - merge_results(): drops the benchmarks a filter rejects from a result, and
+          adds those of a previous result the run did not run.
+    Without `merge_results`, a filtered run replaces the previous result.
     """
     SUPPORTED_FORMATS: set[str]
 
     def run_single_benchmark(
         runnable_path: Path, 
         output_location: Path, 
-        output_format: str
+        output_format: str,
+        run_options: RunOptions
     ) -> int: ...
     def parse(
         file_stream: TextIOWrapper, 
         path_to_file_opened: Path
-    ) -> Generator[ParseResult, None, None]: ...
+    ) -> Generator['ParseResult', None, None]: ...
 
 def import_framework(framework_name: str, output_format: str) -> Framework:
     """Import a benchmark framework for running and parsing benchmarks.
@@ -5,31 +5,66 @@ This module provides functions for running and comparing benchmarks,
 managing iteration directories, and preparing results for GUI display. 
 It is used by `__main__.py` to implement the following actions:
 
-- run: execute benchmarks and save results (`run_benchmarks`)
+- run: execute benchmarks and save results (`run_benchmarks`), within a time budget (`plan_budget_run`) or on workers
 - compare: load benchmark results and launch the GUI (`compare_benchmarks`)
+- report: write a comparison of two iterations without the GUI (`report_benchmarks`)
+- check: fail when an iteration regressed past the configured thresholds (`check_benchmarks`)
+- export: write every loaded result as CSV, NDJSON or Parquet (`export_benchmarks`)
+- calibrate: measure the noise floors of the host and every benchmark (`calibrate_benchmarks`)
+- confirm: re-run suspected regressions interleaved with the baseline (`confirm_benchmarks`)
+- bisect: find the commit that regressed benchmarks by building and running commits (`bisect_benchmarks`)
 
 Other utility functions included:
 
 - get_latest_mtime_in_dir(): get the most recent modification time in a directory
 - get_iteration_paths(): collect iteration directories sorted by modification time
 - get_iteration_names_to_index(): map iteration names to their index
+- load_iterations(): load every iteration into `BenchmarkData`
+- plan_budget_run(): plan which benchmarks run within a time budget
+- iter_load_iterations(): load every iteration, reporting progress after each file
 - get_runnable_paths(): find all benchmark executable files
 - remove_similiar_files(): clean up duplicate result files in an iteration directory
 - copy_result_to_recent(): copy iteration results to the "recent" folder
+- merge_filtered_result(): keep the results of benchmarks a filtered run did not run
 """
 
+import math
+import os
 import shutil
+import statistics
+import sys
+import time
 from pathlib import Path
 import logging
+from functools import partial
 from glob import glob
+from typing import TYPE_CHECKING, Callable, Generator
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger()
 
-from ccbenchmark.benchmark_data import load_benchmark_data
-from ccbenchmark.gui import show_gui
-from ccbenchmark.util import strip_common_paths
-from ccbenchmark.benchmark_framework import Framework
+from ccbenchmark.benchmark_data import BenchmarkData, LoadProgress, TimeType, iter_load_benchmark_data, load_benchmark_data
+from ccbenchmark.util import METADATA_DIR, is_history_iteration, strip_common_paths
+from ccbenchmark.benchmark_framework import Framework, RunOptions
+from ccbenchmark.name_index import BenchmarkFilter, get_names_pattern
+from ccbenchmark.telemetry import TelemetrySampler
+from ccbenchmark.trace import span
+
+if TYPE_CHECKING:
+    from ccbenchmark.report import ReportFormat
+    from ccbenchmark.export import ExportFormat
+    from ccbenchmark.stable_run import StableRun
+    from ccbenchmark.calibration import NoiseFloors
+    from ccbenchmark.runner import RunJournal, RunOutcome
+    from ccbenchmark.distributed import RemoteJob, WorkerPool
+    from ccbenchmark.schedule import RunSchedule
+    from ccbenchmark.confirm import Confirmation
+from ccbenchmark.benchmark_settings import BisectSettings, CheckSettings, RunProfile
+
+"""Metadata written by workers that is copied to the "recent" iteration with the result."""
+REMOTE_METADATA_SUFFIXES = ('.telemetry.json', '.stable.json', '.worker.json')
+"""Suffix of a result set aside in the metadata directory while a filtered run replaces it."""
+PREVIOUS_RESULT_SUFFIX = '.previous'
 
 def get_latest_mtime_in_dir(path_and_framework: tuple[Path, Framework]) -> float:
     """Return the latest modification time of files in a directory.
@@ -41,10 +76,14 @@ def get_latest_mtime_in_dir(path_and_framework: tuple[Path, Framework]) -> float
 
     Returns:
         float: UNIX timestamp of the most recently modified file in the directory,
-        or the directory's own modification time if empty.
+        or the directory's own modification time if empty. Run metadata is
+        ignored, so confirming an iteration later does not reorder it.
     """
     path = path_and_framework[0]
-    mtimes = [f.stat().st_mtime for f in path.rglob('*') if f.is_file()]
+    mtimes = [
+        f.stat().st_mtime for f in path.rglob('*')
+        if f.is_file() and METADATA_DIR not in f.relative_to(path).parts
+    ]
     return max(mtimes, default=path.stat().st_mtime)
 
 def get_iteration_paths(output_directories: list[Path], frameworks: list[Framework]) -> list[tuple[Path, Framework]]:
@@ -67,19 +106,21 @@ def get_iteration_paths(output_directories: list[Path], frameworks: list[Framewo
     """
     in_iterations = set()
     iteration_paths: list[Path] = []
-    for output_directory, framework in zip(output_directories, frameworks):
-        for f in output_directory.rglob('*'):
-            if not (f.is_file() and f.parent is not None and f.parent not in in_iterations):
-                continue
-            if not (len(str(f.parent.name)) >= len('_iter_') and str(f.parent.name)[0:len('_iter_')] == '_iter_'):
-                continue
-            iteration_paths.append((f.parent, framework))
-            in_iterations.add(f.parent)
+    with span('get_iteration_paths', output_directories=len(output_directories)) as search_span:
+        for output_directory, framework in zip(output_directories, frameworks):
+            for f in output_directory.rglob('*'):
+                if not (f.is_file() and f.parent is not None and f.parent not in in_iterations):
+                    continue
+                if not (len(str(f.parent.name)) >= len('_iter_') and str(f.parent.name)[0:len('_iter_')] == '_iter_'):
+                    continue
+                iteration_paths.append((f.parent, framework))
+                in_iterations.add(f.parent)
 
-    return sorted(
-        iteration_paths,
-        key=get_latest_mtime_in_dir
-    )
+        search_span.set(iterations=len(iteration_paths))
+        return sorted(
+            iteration_paths,
+            key=get_latest_mtime_in_dir
+        )
 
 def get_iteration_names_to_index(iteration_paths: list[tuple[Path, Framework]]) -> dict[str, int]:
     """Return a mapping of iteration names to their index.
@@ -106,11 +147,12 @@ def get_iteration_names_to_index(iteration_paths: list[tuple[Path, Framework]])
         iteration_names_to_index[name] = len(iteration_names_to_index)
     return iteration_names_to_index
 
-def compare_benchmarks(output_directories: list[Path], frameworks: list[Framework]) -> None:
-    """Compare benchmark results and launch the GUI.
-
-    Collects iteration paths and their name-to-index mapping, then loads
-    benchmark data and displays it in an interactive GUI.
+def load_iterations(
+    output_directories: list[Path], 
+    frameworks: list[Framework], 
+    benchmark_filter: BenchmarkFilter | None = None
+) -> BenchmarkData:
+    """Load every iteration found in the output directories.
 
     Args:
         output_directories (list[Path]): 
@@ -119,13 +161,591 @@ def compare_benchmarks(output_directories: list[Path], frameworks: list[Framewor
         frameworks (list[Framework]): 
             Benchmark frameworks that produced the results. 
             Must align 1:1 with `output_directories` by order.
+        benchmark_filter (BenchmarkFilter | None): 
+            Only matching benchmarks are loaded, every benchmark if None.
+
+    Returns:
+        BenchmarkData: Results of every iteration.
     """
+    iteration_paths_and_frameworks = get_iteration_paths(output_directories, frameworks)
+    iteration_names_to_index = get_iteration_names_to_index(iteration_paths_and_frameworks)
+
+    with span('load_benchmark_data', iterations=len(iteration_names_to_index)) as load_span:
+        benchmark_data = load_benchmark_data(iteration_names_to_index, iteration_paths_and_frameworks, benchmark_filter)
+        load_span.set(benchmarks=len(benchmark_data.benchmark_names))
+    return benchmark_data
 
+def iter_load_iterations(
+    output_directories: list[Path], 
+    frameworks: list[Framework], 
+    benchmark_filter: BenchmarkFilter | None = None
+) -> Generator[LoadProgress, None, None]:
+    """Load every iteration found in the output directories, reporting progress.
+
+    Nothing is read until the generator is first advanced, so it can be handed
+    to a worker thread before the output directories are searched.
+
+    Args:
+        output_directories (list[Path]): 
+            Output directories containing benchmark results.
+        frameworks (list[Framework]): 
+            Benchmark frameworks that produced the results. 
+            Must align 1:1 with `output_directories` by order.
+        benchmark_filter (BenchmarkFilter | None): 
+            Only matching benchmarks are loaded, every benchmark if None.
+
+    Returns:
+        Generator[LoadProgress]: Progress before the first file and after every file.
+    """
     iteration_paths_and_frameworks = get_iteration_paths(output_directories, frameworks)
     iteration_names_to_index = get_iteration_names_to_index(iteration_paths_and_frameworks)
 
-    benchmark_data = load_benchmark_data(iteration_names_to_index, iteration_paths_and_frameworks)
-    show_gui(benchmark_data)
+    yield from iter_load_benchmark_data(iteration_names_to_index, iteration_paths_and_frameworks, benchmark_filter)
+
+def compare_benchmarks(
+    output_directories: list[Path], 
+    frameworks: list[Framework], 
+    benchmark_filter: BenchmarkFilter | None = None,
+    noise_floors: 'NoiseFloors | None' = None
+) -> None:
+    """Compare benchmark results and launch the GUI.
+
+    The window opens immediately, and iterations are loaded on a worker thread
+    while the GUI fills in as they arrive.
+
+    Args:
+        output_directories (list[Path]): 
+            Output directories containing benchmark results. 
+            Each corresponds to the `output_dir` field of a framework's configuration.
+        frameworks (list[Framework]): 
+            Benchmark frameworks that produced the results. 
+            Must align 1:1 with `output_directories` by order.
+        benchmark_filter (BenchmarkFilter | None): 
+            Only matching benchmarks are loaded and shown, every benchmark if None.
+        noise_floors (NoiseFloors | None): 
+            Noise floors from ``ccbenchmark calibrate``, fixed thresholds if None.
+    """
+    # Imported here so only this action loads Qt.
+    from ccbenchmark.gui import show_gui
+
+    show_gui(loader=iter_load_iterations(output_directories, frameworks, benchmark_filter), noise_floors=noise_floors)
+
+def report_benchmarks(
+    output_directories: list[Path], 
+    frameworks: list[Framework], 
+    baseline_name: str, 
+    candidate_name: str, 
+    report_format: 'ReportFormat', 
+    output_path: Path | None, 
+    time_type: TimeType, 
+    benchmark_filter: BenchmarkFilter | None = None,
+    noise_floors: 'NoiseFloors | None' = None
+) -> bool:
+    """Write a comparison report of two iterations without launching the GUI.
+
+    Args:
+        output_directories (list[Path]): 
+            Output directories containing benchmark results.
+        frameworks (list[Framework]): 
+            Benchmark frameworks that produced the results. 
+            Must align 1:1 with `output_directories` by order.
+        baseline_name (str): 
+            Iteration compared against.
+        candidate_name (str): 
+            Iteration being checked.
+        report_format (ReportFormat): 
+            Markdown, HTML or JSON.
+        output_path (Path | None): 
+            File the report is written to, stdout if None.
+        time_type (TimeType): 
+            Real or CPU time.
+        benchmark_filter (BenchmarkFilter | None): 
+            Only matching benchmarks are reported, every benchmark if None.
+        noise_floors (NoiseFloors | None): 
+            Noise floors from ``ccbenchmark calibrate``, fixed thresholds if None.
+
+    Returns:
+        bool: False if either iteration does not exist.
+    """
+    from ccbenchmark.report import compare_iterations, write_report
+
+    benchmark_data = load_iterations(output_directories, frameworks, benchmark_filter)
+    for iteration_name in (baseline_name, candidate_name):
+        if iteration_name not in benchmark_data.iteration_names:
+            logger.error(f"Iteration '{iteration_name}' not found. Found: {', '.join(benchmark_data.iteration_names)}")
+            return False
+
+    comparisons = compare_iterations(benchmark_data, baseline_name, candidate_name, time_type)
+    if output_path is None:
+        with span('write_report', format=str(report_format)):
+            write_report(sys.stdout, comparisons, report_format, baseline_name, candidate_name, time_type, noise_floors)
+        return True
+
+    with span('write_report', format=str(report_format)), open(output_path, 'w', encoding='utf-8') as stream:
+        write_report(stream, comparisons, report_format, baseline_name, candidate_name, time_type, noise_floors)
+    logger.info(f'Report written to: {output_path}')
+    return True
+
+def check_benchmarks(
+    output_directories: list[Path], 
+    frameworks: list[Framework], 
+    baseline_name: str, 
+    candidate_name: str, 
+    check_settings: CheckSettings, 
+    junit_path: Path | None, 
+    time_type: TimeType, 
+    benchmark_filter: BenchmarkFilter | None = None,
+    noise_floors: 'NoiseFloors | None' = None
+) -> int | None:
+    """Check the candidate iteration for regressions against the baseline.
+
+    Every regression is logged, and if ``junit_path`` is given all benchmarks are
+    written to it as JUnit test cases.
+
+    Args:
+        output_directories (list[Path]): 
+            Output directories containing benchmark results.
+        frameworks (list[Framework]): 
+            Benchmark frameworks that produced the results. 
+            Must align 1:1 with `output_directories` by order.
+        baseline_name (str): 
+            Iteration compared against.
+        candidate_name (str): 
+            Iteration being checked.
+        check_settings (CheckSettings): 
+            Thresholds loaded from ``settings.yaml``.
+        junit_path (Path | None): 
+            File the JUnit XML is written to, not written if None.
+        time_type (TimeType): 
+            Real or CPU time.
+        benchmark_filter (BenchmarkFilter | None): 
+            Only matching benchmarks are checked, every benchmark if None.
+        noise_floors (NoiseFloors | None): 
+            Noise floors from ``ccbenchmark calibrate``, fixed thresholds if None.
+
+    Returns:
+        int | None: Number of regressed benchmarks, None if either iteration does not exist.
+    """
+    from ccbenchmark.check import check_iterations, write_junit
+
+    benchmark_data = load_iterations(output_directories, frameworks, benchmark_filter)
+    for iteration_name in (baseline_name, candidate_name):
+        if iteration_name not in benchmark_data.iteration_names:
+            logger.error(f"Iteration '{iteration_name}' not found. Found: {', '.join(benchmark_data.iteration_names)}")
+            return None
+
+    with span('check_iterations', benchmarks=len(benchmark_data.benchmark_names)):
+        results = list(check_iterations(benchmark_data, baseline_name, candidate_name, time_type, check_settings, noise_floors))
+    regressions = [result for result in results if result.regressed]
+    for result in regressions:
+        logger.error(f'Regression: {result.comparison.path.as_posix()}/{result.comparison.name}: {result.reason()}')
+    discarded = [result for result in results if result.discarded]
+    for result in discarded:
+        logger.warning(f'Discarded: {result.comparison.path.as_posix()}/{result.comparison.name}: Taken under load, {result.comparison.load_warning}')
+    logger.info(f'{len(results) - len(discarded)} benchmarks checked, {len(regressions)} regressed, {len(discarded)} discarded.')
+
+    if junit_path is not None:
+        with open(junit_path, 'w', encoding='utf-8') as stream:
+            write_junit(stream, results, baseline_name, candidate_name)
+        logger.info(f'JUnit report written to: {junit_path}')
+
+    return len(regressions)
+
+def calibrate_benchmarks(
+    output_directories: list[Path], 
+    frameworks: list[Framework], 
+    noise_floors_path: Path, 
+    repetitions: int, 
+    time_type: TimeType, 
+    benchmark_filter: BenchmarkFilter | None = None
+) -> 'NoiseFloors':
+    """Measure the noise floors of this host and of every benchmark, and save them.
+
+    Args:
+        output_directories (list[Path]): 
+            Output directories containing benchmark results.
+        frameworks (list[Framework]): 
+            Benchmark frameworks that produced the results. 
+            Must align 1:1 with `output_directories` by order.
+        noise_floors_path (Path): 
+            File the noise floors are written to.
+        repetitions (int): 
+            Times each reference benchmark is repeated.
+        time_type (TimeType): 
+            Real or CPU time the history noise is measured from.
+        benchmark_filter (BenchmarkFilter | None): 
+            Only matching benchmarks are calibrated, every benchmark if None.
+
+    Floors of benchmarks that are not calibrated again (e.g., filtered out) are
+    kept from the previous calibration of this host.
+
+    Returns:
+        NoiseFloors: Noise floors that were saved.
+    """
+    import platform
+    from ccbenchmark.calibration import NoiseFloors, get_history_noise, run_reference_benchmarks
+
+    noise_floors = NoiseFloors(platform.node() or 'localhost', time.time())
+    with span('run_reference_benchmarks', repetitions=repetitions):
+        run_reference_benchmarks(noise_floors, repetitions)
+    for name, noise in noise_floors.references.items():
+        logger.info(f'{name}: noise floor {noise.delta_percent:.2f} %, CV {noise.cv_percent:.2f} %')
+    logger.info(f'Host noise floor: {noise_floors.host_delta_percent:.2f} %, timer resolution: {noise_floors.timer_resolution_ns:.0f} ns')
+
+    benchmark_data = load_iterations(output_directories, frameworks, benchmark_filter)
+    with span('get_history_noise', benchmarks=len(benchmark_data.benchmark_names)):
+        history_noise = get_history_noise(benchmark_data, time_type)
+    try:
+        noise_floors.benchmarks = NoiseFloors.load(noise_floors_path).benchmarks
+    except (OSError, ValueError):
+        pass
+    noise_floors.benchmarks.update(history_noise)
+    logger.info(
+        f'{len(history_noise)} of {len(benchmark_data.benchmark_names)} benchmarks have enough history for a noise floor.'
+    )
+    if len(history_noise) != 0:
+        noisiest_id, noisiest = max(history_noise.items(), key=lambda item: item[1].delta_percent)
+        logger.info(f'Noisiest benchmark: {noisiest_id}: {noisiest.delta_percent:.2f} %')
+
+    noise_floors.save(noise_floors_path)
+    logger.info(f'Noise floors written to: {noise_floors_path}')
+    return noise_floors
+
+def confirm_benchmarks(
+    runnables_list: list[list[Path]], 
+    output_directories: list[Path], 
+    frameworks: list[Framework], 
+    output_formats: list[str], 
+    baseline_name: str, 
+    candidate_name: str, 
+    baseline_root: Path | None, 
+    percent: float, 
+    rounds: int, 
+    repetitions: int, 
+    time_type: TimeType, 
+    benchmark_filter: BenchmarkFilter | None = None
+) -> list['Confirmation'] | None:
+    """Re-run the benchmarks the candidate iteration is slower in by more than ``percent``, and label them.
+
+    Only suspected benchmarks are re-run, selected with the framework's filter.
+    Each runnable is re-run ``rounds`` times, alternating with the same runnable
+    under ``baseline_root``, and every benchmark is confirmed, refuted or left
+    inconclusive, see `ccbenchmark.confirm`. Verdicts are written next to the
+    candidate's results, where reports pick them up.
+
+    Args:
+        runnables_list (list[list[Path]]): 
+            `benchmark_runnables` of each framework.
+        output_directories (list[Path]): 
+            Output directory of each framework.
+        frameworks (list[Framework]): 
+            Benchmark frameworks, aligned 1:1 with `runnables_list`.
+        output_formats (list[str]): 
+            Output format of each framework.
+        baseline_name (str): 
+            Iteration compared against.
+        candidate_name (str): 
+            Iteration being checked.
+        baseline_root (Path | None): 
+            Directory with the baseline's runnables at the same relative paths (e.g., a
+            worktree of the baseline commit), the stored baseline results are used if None.
+        percent (float): 
+            Slowdown in percent past which a benchmark is re-run.
+        rounds (int): 
+            Rounds of baseline and candidate runs.
+        repetitions (int): 
+            Repetitions of each benchmark in every run.
+        time_type (TimeType): 
+            Real or CPU time.
+        benchmark_filter (BenchmarkFilter | None): 
+            Only matching benchmarks are considered, every benchmark if None.
+
+    Returns:
+        list[Confirmation] | None: Confirmation of every re-run benchmark, None if either iteration does not exist.
+    """
+    from ccbenchmark.confirm import Confirmation, Verdict, get_verdict, run_rounds, write_confirmations
+    from ccbenchmark.report import Comparison, compare_iterations
+
+    benchmark_data = load_iterations(output_directories, frameworks, benchmark_filter)
+    for iteration_name in (baseline_name, candidate_name):
+        if iteration_name not in benchmark_data.iteration_names:
+            logger.error(f"Iteration '{iteration_name}' not found. Found: {', '.join(benchmark_data.iteration_names)}")
+            return None
+
+    suspects: dict[Path, dict[str, Comparison]] = {}
+    for comparison in compare_iterations(benchmark_data, baseline_name, candidate_name, time_type):
+        if comparison.delta > percent:
+            suspects.setdefault(comparison.path, {})[comparison.name] = comparison
+    suspect_count = sum(len(names) for names in suspects.values())
+    if suspect_count == 0:
+        logger.info(f"No benchmark of '{candidate_name}' is more than {percent:g} % slower than '{baseline_name}'.")
+        return []
+    logger.info(f"{suspect_count} benchmarks of '{candidate_name}' are more than {percent:g} % slower than '{baseline_name}', re-running them.")
+    if baseline_root is None:
+        logger.warning(f"No --baseline_root given, only '{candidate_name}' is re-run, against the stored results of '{baseline_name}'.")
+
+    baseline_index = benchmark_data.iteration_names.index(baseline_name)
+    confirmations: list[Confirmation] = []
+    zipped_inputs = zip(runnables_list, output_directories, frameworks, output_formats)
+    for runnables, output_dir, framework, output_format in zipped_inputs:
+        runnable_paths = get_runnable_paths(runnables)
+        stripped_paths = strip_common_paths(runnable_paths)
+        for runnable_path, stripped_path in zip(runnable_paths, stripped_paths):
+            benchmark_name = runnable_path.with_suffix('').name
+            runnable_dir = output_dir / stripped_path.parent
+            result_path = _find_result_path(runnable_dir / benchmark_name, {path: [] for path in suspects})
+            if result_path is None:
+                continue
+            names = list(suspects[result_path])
+
+            baseline_runnable = None
+            if baseline_root is not None:
+                try:
+                    relative_path = runnable_path.resolve().relative_to(Path.cwd().resolve())
+                except ValueError:
+                    relative_path = stripped_path
+                baseline_runnable = baseline_root / relative_path
+                if not baseline_runnable.is_file():
+                    logger.error(f'{benchmark_name}: Skipped, the baseline runnable does not exist: {baseline_runnable}')
+                    continue
+
+            # Without a baseline runnable, its stored repetitions, or its single compared value.
+            stored_samples: dict[str, list[float]] = {}
+            for name, comparison in suspects[result_path].items():
+                samples = benchmark_data.benchmark_types[time_type].get_samples(comparison.benchmark_index, baseline_index, 'ns')
+                stored_samples[name] = samples if len(samples) != 0 else [comparison.baseline]
+
+            logger.info(f'Confirming benchmark: {benchmark_name} ({len(names)} benchmarks, {rounds} rounds)')
+            with span('confirm', runnable=benchmark_name, benchmarks=len(names), rounds=rounds):
+                results = run_rounds(
+                    framework, runnable_path, baseline_runnable, output_format, names, rounds, repetitions, time_type, stored_samples
+                )
+
+            runnable_confirmations: dict[str, Confirmation] = {}
+            for name, (delta, p_value, baseline_count, candidate_count) in results.items():
+                confirmation = Confirmation(
+                    baseline_name, get_verdict(delta, p_value, percent), delta, p_value,
+                    baseline_count, candidate_count, baseline_runnable is not None
+                )
+                runnable_confirmations[name] = confirmation
+                confirmations.append(confirmation)
+                message = f'{result_path.as_posix()}/{name}: {suspects[result_path][name].delta:+.2f} % → {confirmation.describe()}'
+                if confirmation.verdict == Verdict.CONFIRMED:
+                    logger.error(f'Regression {message}')
+                else:
+                    logger.info(f'Regression {message}')
+
+            candidate_result = runnable_dir / f'_iter_{candidate_name}' / f'{benchmark_name}.{output_format}'
+            write_confirmations(candidate_result, runnable_confirmations, rounds, repetitions)
+
+    verdicts = [confirmation.verdict for confirmation in confirmations]
+    logger.info(
+        f'{len(confirmations)} benchmarks re-run: '
+        + ', '.join(f'{verdicts.count(verdict)} {verdict}' for verdict in Verdict) + '.'
+    )
+    return confirmations
+
+def bisect_benchmarks(
+    runnables_list: list[list[Path]], 
+    output_directories: list[Path], 
+    frameworks: list[Framework], 
+    output_formats: list[str], 
+    bisect_settings: BisectSettings, 
+    good: str, 
+    bad: str, 
+    percent: float, 
+    time_type: TimeType, 
+    benchmark_filter: BenchmarkFilter | None = None
+) -> list[str] | None:
+    """Binary-search the commits from ``good`` to ``bad`` for the one that regressed the filtered benchmarks.
+
+    Every tested commit is checked out into a worktree, built, and its filtered
+    benchmarks are run and stored as iteration ``bisect_<commit>``, see
+    `ccbenchmark.bisection`. Commits with such an iteration are not run again,
+    so an interrupted bisection resumes where it stopped.
+
+    Args:
+        runnables_list (list[list[Path]]): 
+            `benchmark_runnables` of each framework, rebased into the worktree.
+        output_directories (list[Path]): 
+            Output directory of each framework.
+        frameworks (list[Framework]): 
+            Benchmark frameworks, aligned 1:1 with `runnables_list`.
+        output_formats (list[str]): 
+            Output format of each framework.
+        bisect_settings (BisectSettings): 
+            Repository, build command and repetitions from ``settings.yaml``.
+        good (str): 
+            Revision without the regression.
+        bad (str): 
+            Revision with the regression.
+        percent (float): 
+            Slowdown in percent from the good to the bad commit a benchmark must exceed to be bisected.
+        time_type (TimeType): 
+            Real or CPU time.
+        benchmark_filter (BenchmarkFilter | None): 
+            Only matching benchmarks are run, every benchmark if None.
+
+    Returns:
+        list[str] | None: Hash of the culprit, or of every commit it may be when
+        commits next to it were skipped. None if the bisection could not run.
+    """
+    import subprocess
+    from ccbenchmark.bisection import (
+        BisectVerdict, Worktree, describe_commit, get_commit_range, get_iteration_name, get_regressed_benchmarks, 
+        get_verdict, next_commit, rebase_runnables
+    )
+
+    repository = bisect_settings.repository
+    try:
+        good_commit, bad_commit, commits = get_commit_range(repository, good, bad)
+    except (OSError, ValueError) as e:
+        logger.error(f'Error: {e}')
+        return None
+    if len(commits) == 0:
+        logger.error(f"Error: No commits between '{good}' and '{bad}'.")
+        return None
+    logger.info(f'Bisecting {len(commits)} commits, about {math.ceil(math.log2(len(commits) + 1))} steps.')
+
+    run_profile = RunProfile(repetitions=bisect_settings.repetitions)
+    existing_iterations = set(get_iteration_names_to_index(get_iteration_paths(output_directories, frameworks)))
+    try:
+        with Worktree(repository) as worktree:
+            rebased_runnables = [rebase_runnables(runnables, repository, worktree.path) for runnables in runnables_list]
+
+            def run_commit(commit: str) -> bool:
+                iteration_name = get_iteration_name(commit)
+                if iteration_name in existing_iterations:
+                    logger.info(f'{describe_commit(repository, commit)}: Already run as {iteration_name}')
+                    return True
+                logger.info(f'Building: {describe_commit(repository, commit)}')
+                worktree.checkout(commit)
+                if not worktree.build(bisect_settings.build):
+                    return False
+                zipped_inputs = zip(rebased_runnables, output_directories, frameworks, output_formats)
+                for runnables, output_dir, framework, output_format in zipped_inputs:
+                    run_benchmarks(
+                        runnables, output_dir, framework, output_format, iteration_name, 
+                        benchmark_filter, run_profile, update_recent=False
+                    )
+                existing_iterations.add(iteration_name)
+                return True
+
+            def load_commits(*commit_list: str) -> tuple[BenchmarkData, list[str], list[int]] | None:
+                """Loaded data, the id of every benchmark and the iteration of each commit, None if one was not run."""
+                benchmark_data = load_iterations(output_directories, frameworks, benchmark_filter)
+                iteration_names = [get_iteration_name(commit) for commit in commit_list]
+                if any(iteration_name not in benchmark_data.iteration_names for iteration_name in iteration_names):
+                    return None
+                benchmark_ids = [
+                    f'{path.as_posix()}/{name}' for path, name in zip(benchmark_data.benchmark_paths, benchmark_data.benchmark_names)
+                ]
+                return benchmark_data, benchmark_ids, [benchmark_data.iteration_names.index(iteration_name) for iteration_name in iteration_names]
+
+            for commit in (good_commit, bad_commit):
+                if not run_commit(commit):
+                    logger.error(f'Error: {describe_commit(repository, commit)} must build to bisect.')
+                    return None
+            loaded = load_commits(good_commit, bad_commit)
+            if loaded is None:
+                logger.error('Error: No results at the good or the bad commit, check the runnables and the filter.')
+                return None
+            benchmark_data, benchmark_ids, (good_index, bad_index) = loaded
+            # By id, benchmark indices may change when iterations are loaded again.
+            regressed = {
+                benchmark_ids[benchmark_index]: delta for benchmark_index, delta 
+                in get_regressed_benchmarks(benchmark_data.benchmark_types[time_type], good_index, bad_index, percent).items()
+            }
+            if len(regressed) == 0:
+                logger.error(f"Error: No benchmark is significantly slower at '{bad}' than at '{good}' by more than {percent:g} %.")
+                return None
+            for benchmark_id, delta in regressed.items():
+                logger.info(f'Regressed: {benchmark_id}: {delta:+.2f} %')
+
+            last_good, first_bad = -1, len(commits) - 1
+            skipped: set[int] = set()
+            while (commit_index := next_commit(last_good, first_bad, skipped)) is not None:
+                commit = commits[commit_index]
+                verdict, detail = BisectVerdict.SKIPPED, 'no results'
+                if run_commit(commit):
+                    loaded = load_commits(good_commit, commit)
+                    if loaded is not None:
+                        benchmark_data, benchmark_ids, (good_index, iteration_index) = loaded
+                        benchmark_indices = {benchmark_id: benchmark_index for benchmark_index, benchmark_id in enumerate(benchmark_ids)}
+                        verdict, detail = get_verdict(
+                            benchmark_data.benchmark_types[time_type], good_index, iteration_index, 
+                            {benchmark_indices[benchmark_id]: delta for benchmark_id, delta in regressed.items() if benchmark_id in benchmark_indices}, 
+                            benchmark_ids
+                        )
+                else:
+                    detail = 'build failed'
+                logger.info(f'{describe_commit(repository, commit)}: {verdict} ({detail})')
+                if verdict == BisectVerdict.BAD:
+                    first_bad = commit_index
+                elif verdict == BisectVerdict.GOOD:
+                    last_good = commit_index
+                else:
+                    skipped.add(commit_index)
+    except subprocess.CalledProcessError as e:
+        logger.error(f"Error: {' '.join(e.cmd)} failed: {(e.stderr or '').strip()}")
+        return None
+    except ValueError as e:
+        logger.error(f'Error: {e}')
+        return None
+
+    culprits = commits[last_good + 1:first_bad + 1]
+    if len(culprits) == 1:
+        logger.info(f'Culprit: {describe_commit(repository, culprits[0])}')
+    else:
+        logger.warning(f'Culprit is one of {len(culprits)} commits, commits before the last could not be built or run:')
+        for commit in culprits:
+            logger.warning(f'  {describe_commit(repository, commit)}')
+    return culprits
+
+def export_benchmarks(
+    output_directories: list[Path], 
+    frameworks: list[Framework], 
+    export_format: 'ExportFormat', 
+    output_path: Path | None, 
+    benchmark_filter: BenchmarkFilter | None = None
+) -> bool:
+    """Export every iteration of every benchmark without launching the GUI.
+
+    Args:
+        output_directories (list[Path]): 
+            Output directories containing benchmark results.
+        frameworks (list[Framework]): 
+            Benchmark frameworks that produced the results. 
+            Must align 1:1 with `output_directories` by order.
+        export_format (ExportFormat): 
+            CSV, NDJSON or Parquet.
+        output_path (Path | None): 
+            File the export is written to, stdout if None.
+        benchmark_filter (BenchmarkFilter | None): 
+            Only matching benchmarks are exported, every benchmark if None.
+
+    Returns:
+        bool: False if the export could not be written.
+    """
+    from ccbenchmark.export import export_benchmark_data
+
+    benchmark_data = load_iterations(output_directories, frameworks, benchmark_filter)
+    row_count = 0
+    try:
+        with span('export_benchmark_data', format=str(export_format)) as export_span:
+            for row_count in export_benchmark_data(benchmark_data, output_path, export_format):
+                logger.debug(f'{row_count} rows exported.')
+            export_span.set(rows=row_count)
+    except ImportError as e:
+        logger.error(f"Error: Exporting {export_format} requires '{e.name}', install it with 'pip install ccbenchmark[export]'.")
+        return False
+    except (ValueError, OSError) as e:
+        logger.error(f'Error: {e}')
+        return False
+
+    if output_path is not None:
+        logger.info(f'{row_count} rows of {len(benchmark_data.benchmark_names)} benchmarks exported to: {output_path}')
+    return True
 
 def get_runnable_paths(benchmark_root_dirs: list[Path]) -> list[Path]:
     """Collect runnable benchmark file paths from root directories.
@@ -169,7 +789,7 @@ def remove_similiar_files(dir: Path, file_name: Path) -> None:
             continue
         path.unlink(missing_ok=True)
 
-def copy_result_to_recent(output_path: Path, file_name: Path) -> None:
+def copy_result_to_recent(output_path: Path, file_name: Path, merge_results: Callable | None = None) -> None:
     """Copies result file to recent folder.
 
     Initializes recent folder, and copies most recent output file to recent file.
@@ -178,28 +798,242 @@ def copy_result_to_recent(output_path: Path, file_name: Path) -> None:
         output_path:
             Path where ne
         file_name:
+        merge_results:
+            Framework's `merge_results` if the result is of a filtered run, the
+            benchmarks of the recent result it did not run are then kept.
     """
     recent_path = output_path.parent / '_iter_recent'
     recent_path.mkdir(parents=True, exist_ok=True)
     dest_path = recent_path / file_name
-    shutil.copy(output_path / file_name, dest_path)
+    if merge_results is not None and dest_path.is_file():
+        merged_path = recent_path / METADATA_DIR / f'{file_name}{PREVIOUS_RESULT_SUFFIX}'
+        merged_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(output_path / file_name, merged_path)
+        merge_results(merged_path, dest_path, None)
+        os.replace(merged_path, dest_path)
+    else:
+        shutil.copy(output_path / file_name, dest_path)
     remove_similiar_files(recent_path, file_name)
     # Updates mtime of file for freshness sorting.
     dest_path.touch()
     logger.debug(f"Copied result to recent: {dest_path}")
 
+def set_aside_result(output_path: Path, file_name: Path) -> Path | None:
+    """Moves a runnable's result into the metadata directory before a filtered run, None if it has none."""
+    result_path = output_path / file_name
+    if not result_path.is_file():
+        return None
+    previous_path = output_path / METADATA_DIR / f'{file_name}{PREVIOUS_RESULT_SUFFIX}'
+    previous_path.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(result_path, previous_path)
+    return previous_path
+
+def merge_filtered_result(
+    framework: Framework, 
+    output_path: Path, 
+    file_name: Path, 
+    previous_path: Path | None, 
+    keep: Callable[[str], bool] | None
+) -> None:
+    """Merges the result of a filtered run with the result set aside before it.
+
+    A filtered run only writes some benchmarks of a runnable, so the benchmarks
+    `keep` rejects are dropped (every benchmark may have run if the framework could
+    not select them), and those of the previous result that did not run are kept.
+    A runnable that wrote no result keeps its previous one.
+
+    Args:
+        framework (Framework): 
+            Framework of the runnable, results are not merged if it has no `merge_results`.
+        output_path (Path): 
+            Iteration directory of the result.
+        file_name (Path): 
+            Name of the result file.
+        previous_path (Path | None): 
+            Result set aside by `set_aside_result`, None if the runnable had none.
+        keep (Callable[[str], bool] | None): 
+            Returns True for the names of benchmarks the filter matches, None to keep every one.
+    """
+    result_path = output_path / file_name
+    if not result_path.is_file():
+        if previous_path is not None:
+            os.replace(previous_path, result_path)
+        return
+    merge_results = getattr(framework, 'merge_results', None)
+    if merge_results is not None:
+        merge_results(result_path, previous_path, keep)
+    if previous_path is not None:
+        previous_path.unlink(missing_ok=True)
+
+def _find_result_path(result_path: Path, benchmark_paths: dict[Path, list[int]]) -> Path | None:
+    """Longest trailing part of `result_path` that loaded benchmarks have as path, which has common leading parts stripped."""
+    for part_count in range(len(result_path.parts), 0, -1):
+        candidate = Path(*result_path.parts[-part_count:])
+        if candidate in benchmark_paths:
+            return candidate
+    return None
+
+def plan_budget_run(
+    runnables_list: list[list[Path]], 
+    output_directories: list[Path], 
+    frameworks: list[Framework], 
+    run_profiles: list[RunProfile | None], 
+    budget_seconds: float, 
+    benchmark_filter: BenchmarkFilter | None = None
+) -> 'RunSchedule':
+    """Plan a run of every framework's runnables that fits in a time budget.
+
+    Durations come from the telemetry (or schedule records) of the last
+    iterations, priorities from the history of every benchmark, see
+    `ccbenchmark.schedule`.
+
+    Args:
+        runnables_list (list[list[Path]]): 
+            `benchmark_runnables` of each framework.
+        output_directories (list[Path]): 
+            Output directory of each framework.
+        frameworks (list[Framework]): 
+            Benchmark frameworks, aligned 1:1 with `runnables_list`.
+        run_profiles (list[RunProfile | None]): 
+            Run profile of each framework, the framework's defaults if None.
+        budget_seconds (float): 
+            Time the run should fit in.
+        benchmark_filter (BenchmarkFilter | None): 
+            Only matching benchmarks are planned, every benchmark if None.
+
+    Returns:
+        RunSchedule: Plan passed to `run_benchmarks` of every framework.
+    """
+    from ccbenchmark.report import COMPARED_METRICS
+    from ccbenchmark.schedule import (
+        BenchmarkHistory, RunnableHistory, DURATION_HISTORY, STALE_PRIORITY, plan_budget, read_schedule_record, format_duration
+    )
+
+    benchmark_data = load_iterations(output_directories, frameworks, benchmark_filter)
+    iteration_indices = [
+        iteration_index for iteration_index, iteration_name in enumerate(benchmark_data.iteration_names)
+        if is_history_iteration(iteration_name)
+    ]
+    with span('Manager.history_summaries', category='rust', benchmarks=len(benchmark_data.benchmark_names)):
+        summaries = benchmark_data.benchmark_types[TimeType.REAL].history_summaries(iteration_indices, COMPARED_METRICS)
+    benchmark_paths: dict[Path, list[int]] = {}
+    for benchmark_index, benchmark_path in enumerate(benchmark_data.benchmark_paths):
+        benchmark_paths.setdefault(benchmark_path, []).append(benchmark_index)
+
+    histories: list[RunnableHistory] = []
+    for runnables, output_dir, framework, run_profile in zip(runnables_list, output_directories, frameworks, run_profiles):
+        runnable_paths = get_runnable_paths(runnables)
+        stripped_paths = strip_common_paths(runnable_paths)
+        for runnable_path, stripped_path in zip(runnable_paths, stripped_paths):
+            benchmark_name = runnable_path.with_suffix('').name
+            runnable_dir = output_dir / stripped_path.parent
+            if benchmark_filter is not None and benchmark_filter.get_name_pattern(stripped_path.with_suffix('')) is None:
+                continue
+            repetitions = None
+            min_time = None
+            if run_profile is not None:
+                runnable_profile = run_profile.for_runnable(stripped_path.with_suffix(''))
+                repetitions = runnable_profile.repetitions
+                min_time = runnable_profile.min_time
+            history = RunnableHistory(
+                runnable_path, repetitions or getattr(framework, 'DEFAULT_REPETITIONS', 1),
+                min_time=min_time or getattr(framework, 'DEFAULT_MIN_TIME', None)
+            )
+            histories.append(history)
+
+            result_path = _find_result_path(runnable_dir / benchmark_name, benchmark_paths)
+            if result_path is None:
+                continue
+            for benchmark_index in benchmark_paths[result_path]:
+                noise_floor, last_delta, value_count, iterations_since = summaries[benchmark_index]
+                priority = math.inf
+                if value_count >= 2:
+                    priority = max(0.0 if math.isnan(noise_floor) else noise_floor, 0.0 if math.isnan(last_delta) else last_delta)
+                    priority += STALE_PRIORITY*iterations_since
+                history.benchmarks.append(BenchmarkHistory(benchmark_data.benchmark_names[benchmark_index], priority))
+
+            repetition_seconds: list[float] = []
+            for iteration_index in iteration_indices[-DURATION_HISTORY:]:
+                iteration_name = benchmark_data.iteration_names[iteration_index]
+                record = read_schedule_record(runnable_dir / f'_iter_{iteration_name}' / benchmark_name)
+                telemetry = benchmark_data.runnable_telemetry.get((iteration_index, result_path))
+                seconds = telemetry.duration if telemetry is not None else (record or {}).get('actual_seconds')
+                if seconds is None or (record is not None and not record.get('ran', True)):
+                    continue
+                # Without a record, every benchmark ran with the repetitions it runs with now.
+                benchmark_count = len(history.benchmarks) - len((record or {}).get('skipped', []))
+                iteration_repetitions = (record or {}).get('repetitions') or history.repetitions
+                # A doubled minimum time takes as long as doubled repetitions.
+                if (record or {}).get('min_time') is not None:
+                    iteration_repetitions *= record.get('repetition_factor', 1)
+                repetition_seconds.append(seconds/(max(benchmark_count, 1)*iteration_repetitions))
+            if len(repetition_seconds) != 0:
+                history.repetition_seconds = statistics.median(repetition_seconds)
+
+    schedule = plan_budget(histories, budget_seconds)
+    runnable_count = sum(runnable.runs for runnable in schedule.runnables.values())
+    skipped_count = sum(len(runnable.skipped) for runnable in schedule.runnables.values())
+    benchmark_count = sum(len(history.benchmarks) for history in histories)
+    logger.info(
+        f'Budget {format_duration(budget_seconds)}: {runnable_count} of {len(histories)} runnables, '
+        f'{benchmark_count - skipped_count} of {benchmark_count} benchmarks run, '
+        f'estimated {format_duration(schedule.estimated_seconds)}.'
+    )
+    unknown = [
+        history.runnable_path.as_posix() for history in histories if history.repetition_seconds is None
+    ]
+    if len(unknown) != 0:
+        logger.warning(f"No duration recorded for {len(unknown)} runnables, they always run: {', '.join(unknown[:5])}")
+    if schedule.estimated_seconds > budget_seconds:
+        logger.warning('Runnables and benchmarks without history alone exceed the budget.')
+    return schedule
+
 def run_benchmarks(
     runnables_list: list[Path], 
     output_dir: Path, 
     framework: Framework, 
     output_format: str, 
-    iteration_name: str
+    iteration_name: str, 
+    benchmark_filter: BenchmarkFilter | None = None,
+    run_profile: RunProfile | None = None,
+    stable_run: 'StableRun | None' = None,
+    telemetry: bool = True,
+    schedule: 'RunSchedule | None' = None,
+    update_recent: bool = True,
+    timeout: float | None = None,
+    journal: 'RunJournal | None' = None,
+    worker_pool: 'WorkerPool | None' = None
 ) -> None:
     """Run all benchmarks and save results.
 
     Executes each benchmark in ``runnables_list``, stores its output in the 
     output directory, and manages duplicate result files. If ``iteration_name`` 
-    is not "recent", results are also copied to the "recent" iteration.
+    is not "recent", results are also copied to the "recent" iteration, unless
+    ``update_recent`` is False.
+
+    While each runnable runs, machine telemetry is sampled and written next to
+    its result, and runnables that ran under load are logged.
+
+    With a filter, runnables the filter can not match are skipped and the rest
+    only run the benchmarks whose ids match, with the runnable's path stripped of
+    the parts every runnable shares (as on `compare`). Their previous results in
+    the iteration and in "recent" are merged with the new ones, see
+    `merge_filtered_result`.
+
+    With a schedule, runnables only run the benchmarks and repetitions it
+    planned, the ETA is logged before each runnable, and the plan is written
+    next to each result.
+
+    Runnables run through `ccbenchmark.runner`: their output is written to
+    `.ccbenchmark/<runnable>.log` next to each result, their progress is shown
+    while they run, and they are stopped after the timeout. With a journal,
+    runnables that finished before an interrupted run are skipped and every
+    runnable that finishes is recorded.
+
+    With a worker pool, this process coordinates: runnables are sent to the
+    workers, run in parallel across them, and their results and metadata are
+    written here as they finish, with the host each ran on. A stable-run mode
+    and a schedule are not used, they apply to the host that runs.
 
     Args:
         runnables_list (list[Path]): 
@@ -212,28 +1046,183 @@ def run_benchmarks(
             Output file format (e.g., "json").
         iteration_name (str): 
             Name of the iteration.
+        benchmark_filter (BenchmarkFilter | None): 
+            Only matching benchmarks are run, every benchmark if None.
+        run_profile (RunProfile | None): 
+            Options of the selected run profile, the framework's defaults if None.
+        stable_run (StableRun | None): 
+            Stable-run mode already applied to this process, which also writes
+            what it did next to each result.
+        telemetry (bool): 
+            Sample machine telemetry while each runnable runs.
+        schedule (RunSchedule | None): 
+            Plan of a time-budgeted run from `plan_budget_run`, shared by every framework.
+        update_recent (bool): 
+            Copy results to the "recent" iteration, False for runs of other builds (e.g., bisecting).
+        timeout (float | None): 
+            Seconds after which a runnable is stopped, overridden by the run profile, no limit if None.
+        journal (RunJournal | None): 
+            Journal of the run, shared by every framework.
+        worker_pool (WorkerPool | None): 
+            Workers the runnables are sent to, run here if None.
     """
+    from ccbenchmark.runner import run_runnable
+
+    if worker_pool is not None:
+        from ccbenchmark.distributed import RemoteJob
+
+        stable_run = None
+        schedule = None
+    remote_jobs: list['RemoteJob'] = []
+    # Result set aside and the filter's test of names, of each runnable that only runs some benchmarks.
+    filtered_runs: dict[Path, tuple[Path | None, Callable[[str], bool] | None]] = {}
+    merge_results = getattr(framework, 'merge_results', None)
+
+    copy_to_recent = update_recent and iteration_name != 'recent'
     runnable_paths = get_runnable_paths(runnables_list)
     stripped_paths = strip_common_paths(runnable_paths)
     output_paths = [output_dir / stripped_path.parent / f'_iter_{iteration_name}' 
                     for stripped_path in stripped_paths]
 
-    for runnable_path, output_path in zip(runnable_paths, output_paths):
+    for runnable_path, stripped_path, output_path in zip(runnable_paths, stripped_paths, output_paths):
         benchmark_name = runnable_path.with_suffix('').name
+        if journal is not None and journal.is_completed(runnable_path):
+            logger.info(f'{benchmark_name}: Skipped, finished before the run was interrupted')
+            continue
+        run_options = RunOptions(timeout=timeout)
+        if run_profile is not None:
+            runnable_profile = run_profile.for_runnable(stripped_path.with_suffix(''))
+            run_options.repetitions = runnable_profile.repetitions
+            run_options.min_time = runnable_profile.min_time
+            run_options.extra_args = runnable_profile.args
+            run_options.env = runnable_profile.env
+            if runnable_profile.timeout is not None:
+                run_options.timeout = runnable_profile.timeout
+        keep = None
+        list_benchmarks = getattr(framework, 'list_benchmarks', None)
+        names = None
+        if benchmark_filter is not None:
+            runnable_id = stripped_path.with_suffix('')
+            if not benchmark_filter.is_glob and list_benchmarks is not None and benchmark_filter.could_match_under(runnable_id):
+                names = list_benchmarks(runnable_path, run_options)
+            name_pattern = benchmark_filter.get_name_pattern(runnable_id, names)
+            if name_pattern is None:
+                logger.debug(f"{benchmark_name}: Skipped, no benchmark can match '{benchmark_filter.pattern}'")
+                continue
+            run_options.benchmark_filter = name_pattern or None
+            keep = partial(benchmark_filter.matches, runnable_id)
+        scheduled = schedule.get(runnable_path) if schedule is not None else None
+        if scheduled is not None:
+            if scheduled.min_time is not None:
+                run_options.min_time = scheduled.min_time
+            elif scheduled.repetition_factor != 1:
+                run_options.repetitions = scheduled.repetitions
+            if scheduled.runs and len(scheduled.skipped) != 0:
+                if names is None and list_benchmarks is not None:
+                    names = list_benchmarks(runnable_path, run_options)
+                selected_names = scheduled.get_selected_names(run_options.benchmark_filter, names)
+                run_options.benchmark_filter = get_names_pattern(selected_names)
+                if len(selected_names) == 0:
+                    scheduled.selected = []
+            if not scheduled.runs:
+                logger.info(f'{benchmark_name}: Skipped, does not fit in the budget')
+                schedule.write_record(output_path, benchmark_name, scheduled)
+                continue
         output_path.mkdir(parents=True, exist_ok=True)
 
-        logger.info(f'Running benchmark: {benchmark_name}')
-
         file_name = Path(f'{benchmark_name}.{output_format}')
+        filtered = benchmark_filter is not None or scheduled is not None
+        if filtered:
+            filtered_runs[runnable_path] = (set_aside_result(output_path, file_name), keep)
+
+        if worker_pool is not None:
+            remote_jobs.append(RemoteJob(runnable_path, output_path, run_options))
+            continue
+        if scheduled is not None:
+            logger.info(f'Running benchmark: {benchmark_name} ({schedule.describe_progress(runnable_path)})')
+        else:
+            logger.info(f'Running benchmark: {benchmark_name}')
+
         output_location = output_path / file_name
 
-        result = framework.run_single_benchmark(runnable_path, output_location, output_format)
+        stable_record = stable_run.before_runnable() if stable_run is not None else None
+        sampler = TelemetrySampler() if telemetry else None
+        if sampler is not None:
+            sampler.start()
+        start_time = time.perf_counter()
+        try:
+            outcome = run_runnable(
+                framework, runnable_path, output_location, output_format, run_options,
+                output_path / METADATA_DIR / f'{benchmark_name}.log'
+            )
+        finally:
+            if sampler is not None:
+                sampler.stop()
+            if schedule is not None:
+                schedule.finish(runnable_path, time.perf_counter() - start_time)
         remove_similiar_files(output_path, file_name)
+        if filtered:
+            merge_filtered_result(framework, output_path, file_name, *filtered_runs[runnable_path])
         
-        if result != 0:
-            logger.warning(f'{benchmark_name}: Exited with code: {result}')
-        else:
-            logger.info(f'{benchmark_name}: OK')
+        _log_outcome(benchmark_name, outcome, run_options.timeout)
+        if sampler is not None and sampler.summary.under_load:
+            logger.warning(f'{benchmark_name}: Ran under load, {sampler.summary.describe()}')
         
-        if iteration_name != 'recent':
-            copy_result_to_recent(output_path, file_name)
+        # A runnable that failed or timed out may not have written a result.
+        if copy_to_recent and output_location.is_file():
+            copy_result_to_recent(output_path, file_name, merge_results if filtered else None)
+        if sampler is not None:
+            sampler.write(output_path, benchmark_name)
+            if copy_to_recent:
+                sampler.write(output_path.parent / '_iter_recent', benchmark_name)
+        if stable_run is not None:
+            stable_run.write_metadata(output_path, benchmark_name, stable_record)
+            if copy_to_recent:
+                stable_run.write_metadata(output_path.parent / '_iter_recent', benchmark_name, stable_record)
+        if scheduled is not None:
+            schedule.write_record(output_path, benchmark_name, scheduled)
+            if copy_to_recent:
+                schedule.write_record(output_path.parent / '_iter_recent', benchmark_name, scheduled)
+        if journal is not None:
+            journal.record(runnable_path, outcome)
+
+    if len(remote_jobs) > 0:
+        logger.info(f'Running {len(remote_jobs)} runnables on {len(worker_pool.addresses)} workers')
+        for job, remote_outcome in worker_pool.run(framework, output_format, remote_jobs, telemetry):
+            benchmark_name = job.runnable_path.with_suffix('').name
+            file_name = Path(f'{benchmark_name}.{output_format}')
+            filtered = job.runnable_path in filtered_runs
+            if filtered:
+                remove_similiar_files(job.output_path, file_name)
+                merge_filtered_result(framework, job.output_path, file_name, *filtered_runs[job.runnable_path])
+            if remote_outcome is None:
+                # Not journaled, so --resume runs it again.
+                logger.error(f"{benchmark_name}: Could not run on any worker: {'; '.join(job.errors)}")
+                continue
+            remove_similiar_files(job.output_path, file_name)
+            _log_outcome(benchmark_name, remote_outcome.outcome, job.run_options.timeout, remote_outcome.host)
+            if remote_outcome.under_load is not None:
+                logger.warning(f'{benchmark_name}: Ran under load on {remote_outcome.host}, {remote_outcome.under_load}')
+            if copy_to_recent and (job.output_path / file_name).is_file():
+                copy_result_to_recent(job.output_path, file_name, merge_results if filtered else None)
+            if copy_to_recent:
+                recent_metadata_path = job.output_path.parent / '_iter_recent' / METADATA_DIR
+                for suffix in REMOTE_METADATA_SUFFIXES:
+                    metadata_path = job.output_path / METADATA_DIR / f'{benchmark_name}{suffix}'
+                    if metadata_path.is_file():
+                        recent_metadata_path.mkdir(parents=True, exist_ok=True)
+                        shutil.copy(metadata_path, recent_metadata_path / metadata_path.name)
+            if journal is not None:
+                journal.record(job.runnable_path, remote_outcome.outcome)
+
+def _log_outcome(benchmark_name: str, outcome: 'RunOutcome', timeout: float | None, host: str | None = None) -> None:
+    """Logs how a runnable exited, with the end of its stderr if it failed."""
+    on_host = f' on {host}' if host is not None else ''
+    if outcome.timed_out:
+        logger.warning(f'{benchmark_name}: Stopped{on_host} after the timeout of {timeout:g} s, {outcome.result_count} benchmarks finished')
+    elif outcome.exit_code != 0:
+        logger.warning(f'{benchmark_name}: Exited{on_host} with code: {outcome.exit_code}')
+        for line in outcome.stderr_tail:
+            logger.warning(f'{benchmark_name}: {line}')
+    else:
+        logger.info(f'{benchmark_name}: OK{on_host} ({outcome.seconds:.1f} s)')
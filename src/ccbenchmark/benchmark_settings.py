@@ -5,13 +5,209 @@ This module defines `LocalSettings`, a container for storing framework names,
 benchmark runnables, output directories, and output formats loaded from 
 `.ccbenchmark/settings.yaml`. It also provides `load_local_settings()` to parse 
 the YAML file and return a `LocalSettings` object.
+
+Top level keys are framework names, except for the following reserved keys:
+    - check: Regression thresholds used by `ccbenchmark check` (`CheckSettings`).
+    - bisect: Repository and build command used by `ccbenchmark bisect` (`BisectSettings`).
+
+Frameworks may define named run profiles under `profiles` (`RunProfile`).
 """
 
 from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
 from pathlib import Path
-import yaml
 
 _LOCAL_SETTINGS_FILE = Path('./.ccbenchmark/settings.yaml')
+_CHECK_KEY = 'check'
+_BISECT_KEY = 'bisect'
+_RESERVED_KEYS = {_CHECK_KEY, _BISECT_KEY}
+
+@dataclass
+class Thresholds:
+    """Limits a benchmark may change by before it is considered regressed.
+
+    A benchmark regresses when it exceeds every threshold that is set.
+
+    Attributes:
+        percent (float | None):
+            Maximum slowdown in percent.
+        absolute (float | None):
+            Maximum slowdown in ns.
+        significance (float | None):
+            Maximum slowdown in combined standard deviations of both iterations.
+            Ignored when either iteration has no standard deviation.
+        noise (float | None):
+            Maximum slowdown in multiples of the benchmark's noise floor from
+            `ccbenchmark calibrate`. Ignored when the host was not calibrated.
+    """
+    percent: float | None = None
+    absolute: float | None = None
+    significance: float | None = None
+    noise: float | None = None
+
+    def merged(self, other: 'Thresholds') -> 'Thresholds':
+        """Returns thresholds where values set in `other` replace the ones in `self`."""
+        return Thresholds(
+            other.percent if other.percent is not None else self.percent,
+            other.absolute if other.absolute is not None else self.absolute,
+            other.significance if other.significance is not None else self.significance,
+            other.noise if other.noise is not None else self.noise
+        )
+
+@dataclass
+class CheckSettings:
+    """Regression gate settings loaded from the `check` key of `settings.yaml`.
+
+    Example:
+        check:
+          baseline: main
+          percent: 5.0
+          absolute: 50.0
+          significance: 2.0
+          noise: 1.0
+          discard_under_load: true
+          benchmarks:
+            "cpp/*/BM_Noisy*":
+              percent: 15.0
+
+    Attributes:
+        baseline (str | None):
+            Iteration compared against when none is given on the command line.
+        thresholds (Thresholds):
+            Thresholds used by every benchmark.
+        benchmark_thresholds (dict[str, Thresholds]):
+            Glob pattern matched against `<path>/<benchmark name>` mapped to
+            thresholds that override the global ones.
+        discard_under_load (bool):
+            Results taken under load in either iteration are skipped instead of checked.
+    """
+    baseline: str | None = None
+    thresholds: Thresholds = field(default_factory=lambda: Thresholds(percent=5.0))
+    benchmark_thresholds: dict[str, Thresholds] = field(default_factory=lambda: {})
+    discard_under_load: bool = False
+
+@dataclass
+class BisectSettings:
+    """Settings of `ccbenchmark bisect` loaded from the `bisect` key of `settings.yaml`.
+
+    Example:
+        bisect:
+          repository: ..
+          build: cmake -S . -B build -DCMAKE_BUILD_TYPE=Release && cmake --build build -j
+          repetitions: 10
+
+    Attributes:
+        repository (Path):
+            Git repository the commits are checked out from, relative to the workspace.
+        build (str | None):
+            Shell command building the runnables, run at the root of the worktree. Nothing is built if None.
+        repetitions (int):
+            Times each benchmark is repeated at every commit.
+    """
+    repository: Path = Path('.')
+    build: str | None = None
+    repetitions: int = 5
+
+@dataclass
+class RunProfile:
+    """Options used when running a framework's benchmarks with `ccbenchmark run --profile <name>`.
+
+    Example:
+        cpp.google_benchmark:
+          profiles:
+            quick:
+              min_time: 0.05
+            full:
+              repetitions: 10
+              args: [--benchmark_enable_random_interleaving=true]
+              env:
+                OMP_NUM_THREADS: "1"
+              timeout: 1800
+              runnables:
+                "slow/*":
+                  repetitions: 3
+
+    Attributes:
+        repetitions (int | None):
+            Times each benchmark is repeated, the framework's default if None.
+        min_time (float | None):
+            Minimum time each benchmark runs for in seconds, the framework's default if None.
+        args (list[str]):
+            Extra arguments passed to each runnable.
+        env (dict[str, str]):
+            Environment variables set for each runnable.
+        timeout (float | None):
+            Seconds after which a runnable is stopped, no limit if None.
+        runnable_profiles (dict[str, RunProfile]):
+            Glob pattern matched against the runnable path (common leading
+            directories removed, without suffix) or its name, mapped to options
+            that override the ones of the profile.
+    """
+    repetitions: int | None = None
+    min_time: float | None = None
+    args: list[str] = field(default_factory=lambda: [])
+    env: dict[str, str] = field(default_factory=lambda: {})
+    timeout: float | None = None
+    runnable_profiles: dict[str, 'RunProfile'] = field(default_factory=lambda: {})
+
+    def merged(self, other: 'RunProfile') -> 'RunProfile':
+        """Returns options where values set in `other` replace the ones in `self`, args are appended."""
+        return RunProfile(
+            other.repetitions if other.repetitions is not None else self.repetitions,
+            other.min_time if other.min_time is not None else self.min_time,
+            self.args + other.args,
+            {**self.env, **other.env},
+            other.timeout if other.timeout is not None else self.timeout
+        )
+
+    def for_runnable(self, runnable_path: Path) -> 'RunProfile':
+        """Returns the options of the profile overridden by every matching runnable pattern.
+
+        Args:
+            runnable_path: Runnable path with common leading directories removed, without suffix.
+        """
+        run_profile = self.merged(RunProfile())
+        for pattern, runnable_profile in self.runnable_profiles.items():
+            if fnmatchcase(runnable_path.as_posix(), pattern) or fnmatchcase(runnable_path.name, pattern):
+                run_profile = run_profile.merged(runnable_profile)
+        return run_profile
+
+def _load_thresholds(value: dict) -> Thresholds:
+    def get_float(key: str) -> float | None:
+        entry = value.get(key)
+        return float(entry) if entry is not None else None
+    return Thresholds(get_float('percent'), get_float('absolute'), get_float('significance'), get_float('noise'))
+
+def _load_check_settings(value: dict) -> CheckSettings:
+    check_settings = CheckSettings()
+    check_settings.baseline = value.get('baseline')
+    check_settings.discard_under_load = bool(value.get('discard_under_load', False))
+    check_settings.thresholds = check_settings.thresholds.merged(_load_thresholds(value))
+    for pattern, benchmark_value in value.get('benchmarks', {}).items():
+        check_settings.benchmark_thresholds[pattern] = _load_thresholds(benchmark_value)
+    return check_settings
+
+def _load_bisect_settings(value: dict, workspace: Path) -> BisectSettings:
+    bisect_settings = BisectSettings(workspace / str(value.get('repository', '.')))
+    build = value.get('build')
+    bisect_settings.build = str(build) if build is not None else None
+    bisect_settings.repetitions = int(value.get('repetitions', bisect_settings.repetitions))
+    return bisect_settings
+
+def _load_run_profile(value: dict) -> RunProfile:
+    repetitions = value.get('repetitions')
+    min_time = value.get('min_time')
+    timeout = value.get('timeout')
+    run_profile = RunProfile(
+        int(repetitions) if repetitions is not None else None,
+        float(min_time) if min_time is not None else None,
+        [str(arg) for arg in value.get('args', [])],
+        {str(name): str(env_value) for name, env_value in value.get('env', {}).items()},
+        float(timeout) if timeout is not None else None
+    )
+    for pattern, runnable_value in value.get('runnables', {}).items():
+        run_profile.runnable_profiles[pattern] = _load_run_profile(runnable_value)
+    return run_profile
 
 @dataclass
 class LocalSettings:
@@ -26,25 +222,41 @@ class LocalSettings:
             List of framework names.
         output_format_list (list[str]): 
             List of output formats (e.g., 'json', 'csv') for each framework.
+        run_profiles_list (list[dict[str, RunProfile]]):
+            Run profiles of each framework by name.
+        check_settings (CheckSettings):
+            Regression thresholds used by `ccbenchmark check`.
+        bisect_settings (BisectSettings):
+            Repository and build command used by `ccbenchmark bisect`.
     """
     benchmark_runnables_list: list[list[Path]] = field(default_factory=lambda: [])
     output_dir_list: list[Path] = field(default_factory=lambda: [])
     framework_name_list: list[str] = field(default_factory=lambda: [])
     output_format_list: list[str] = field(default_factory=lambda: [])
+    run_profiles_list: list[dict[str, RunProfile]] = field(default_factory=lambda: [])
+    check_settings: CheckSettings = field(default_factory=CheckSettings)
+    bisect_settings: BisectSettings = field(default_factory=BisectSettings)
 
-def load_local_settings() -> LocalSettings | None:
+def load_local_settings(workspace: Path = Path('.')) -> LocalSettings | None:
     """Load local benchmark settings from `.ccbenchmark/settings.yaml`.
 
     Parses the YAML file and constructs a `LocalSettings` object containing
     framework names, benchmark runnable paths, output directories, and output 
     formats. If the file does not exist, returns None.
 
+    Args:
+        workspace (Path): 
+            Directory containing `.ccbenchmark`, relative paths in the settings are relative to it.
+
     Returns:
         LocalSettings | None: 
             A `LocalSettings` object if the YAML file exists, otherwise `None`.
     """
+    # Imported here so the CLI does not pay for yaml until settings are needed.
+    import yaml
+
     try:
-        with open(_LOCAL_SETTINGS_FILE, 'r') as file:
+        with open(workspace / _LOCAL_SETTINGS_FILE, 'r') as file:
             local_settings_yaml: dict[str, dict] = yaml.safe_load(file)
             local_settings = LocalSettings()
 
@@ -52,18 +264,32 @@ def load_local_settings() -> LocalSettings | None:
             default_output_dir = None
             default_output_format = None
 
+            check_value = local_settings_yaml.get(_CHECK_KEY)
+            if check_value is not None:
+                local_settings.check_settings = _load_check_settings(check_value)
+            bisect_value = local_settings_yaml.get(_BISECT_KEY)
+            if bisect_value is not None:
+                local_settings.bisect_settings = _load_bisect_settings(bisect_value, workspace)
+
             for framework_name, value in local_settings_yaml.items():
+                if framework_name in _RESERVED_KEYS:
+                    continue
                 benchmark_runnables = [
-                    Path(bin_dir) 
+                    workspace / bin_dir 
                     for bin_dir in value.get('benchmark_runnables', default_benchmark_runnables)
                 ]
-                output_dir = Path(value.get('output_dir', default_output_dir))
+                output_dir = workspace / value.get('output_dir', default_output_dir)
                 output_format = value.get('output_format', default_output_format)
+                run_profiles = {
+                    profile_name: _load_run_profile(profile_value or {})
+                    for profile_name, profile_value in value.get('profiles', {}).items()
+                }
 
                 local_settings.benchmark_runnables_list.append(benchmark_runnables)
                 local_settings.output_dir_list.append(output_dir)
                 local_settings.framework_name_list.append(framework_name)
                 local_settings.output_format_list.append(output_format)
+                local_settings.run_profiles_list.append(run_profiles)
 
         return local_settings
 
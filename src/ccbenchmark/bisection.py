@@ -0,0 +1,235 @@
+"""Performance bisection of `ccbenchmark bisect` over a range of git commits.
+
+The commits from a good commit to a bad one (first parents only) are checked
+out one at a time into a git worktree of the repository, built with the
+`build` command under `bisect` in settings.yaml, and their filtered benchmarks
+are run and stored as iteration `bisect_<commit>`. Commits that were already
+run (an iteration with their name exists) are not run again.
+
+The good and bad commits are run first. Benchmarks that are slower at the
+bad commit by more than a threshold, and significantly so (one-sided
+Mann-Whitney test of their repetitions, p < `SIGNIFICANCE`, by the Rust
+Manager), are the regressed benchmarks. A
+commit in between is bad if any regressed benchmark is significantly slower
+than at the good commit by at least `BAD_FRACTION` of its whole regression,
+so the search finds the first commit that regressed any of them. Commits that
+fail to build are skipped, like `git bisect skip`.
+
+Defines:
+    - BisectVerdict: Outcome of testing a commit.
+    - Worktree: Temporary git worktree commits are checked out into.
+    - git(): Runs git in a repository.
+    - get_commit_range(): Commits from a good commit to a bad one.
+    - describe_commit(): Short hash and subject of a commit.
+    - get_iteration_name(): Iteration the results of a commit are stored as.
+    - rebase_runnables(): Runnable patterns of the workspace inside a worktree.
+    - next_commit(): Next commit to test.
+    - get_regressed_benchmarks(): Benchmarks significantly slower at the bad commit.
+    - get_verdict(): Whether a commit is good or bad.
+"""
+
+from enum import StrEnum
+from pathlib import Path
+import logging
+import math
+import os
+import shutil
+import subprocess
+import tempfile
+from typing import TYPE_CHECKING
+
+from ccbenchmark.util import BISECT_ITERATION_PREFIX
+
+if TYPE_CHECKING:
+    from ccbenchmark._ccbenchmark import Manager
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger()
+
+"""p-value below which a benchmark is significantly slower."""
+SIGNIFICANCE = 0.05
+"""Fraction of a benchmark's regression from the good to the bad commit a commit must reach to be bad."""
+BAD_FRACTION = 0.5
+
+class BisectVerdict(StrEnum):
+    """Outcome of testing a commit."""
+    GOOD = 'good'
+    BAD = 'bad'
+    SKIPPED = 'skipped'
+
+def git(repository: Path, *args: str) -> str:
+    """Runs git in `repository` and returns its stripped output.
+
+    Raises:
+        subprocess.CalledProcessError: git failed.
+    """
+    process = subprocess.run(['git', '-C', str(repository), *args], capture_output=True, text=True, check=True)
+    return process.stdout.strip()
+
+def get_commit_range(repository: Path, good: str, bad: str) -> tuple[str, str, list[str]]:
+    """Commits from a good commit to a bad one.
+
+    Args:
+        repository: Git repository.
+        good: Revision (e.g., a tag or hash) without the regression.
+        bad: Revision with the regression.
+
+    Returns:
+        tuple[str, str, list[str]]: (good hash, bad hash, hashes after the good
+        commit up to the bad one, oldest first, following first parents).
+
+    Raises:
+        ValueError: A revision does not exist or `good` is not an ancestor of `bad`.
+    """
+    try:
+        good_commit = git(repository, 'rev-parse', '--verify', f'{good}^{{commit}}')
+        bad_commit = git(repository, 'rev-parse', '--verify', f'{bad}^{{commit}}')
+    except subprocess.CalledProcessError as error:
+        raise ValueError(error.stderr.strip() or f"Unknown revision in '{good}..{bad}'") from error
+    try:
+        git(repository, 'merge-base', '--is-ancestor', good_commit, bad_commit)
+    except subprocess.CalledProcessError as error:
+        raise ValueError(f"'{good}' is not an ancestor of '{bad}'") from error
+    commits = git(repository, 'rev-list', '--reverse', '--first-parent', '--ancestry-path', f'{good_commit}..{bad_commit}').split()
+    return good_commit, bad_commit, commits
+
+def describe_commit(repository: Path, commit: str) -> str:
+    """Short hash and subject of a commit (e.g., '1a2b3c4 Use a hash map')."""
+    try:
+        return git(repository, 'log', '-1', '--format=%h %s', commit)
+    except subprocess.CalledProcessError:
+        return commit[:12]
+
+def get_iteration_name(commit: str) -> str:
+    """Iteration the results of a commit are stored as."""
+    return f'{BISECT_ITERATION_PREFIX}{commit[:12]}'
+
+def rebase_runnables(runnables: list[Path], repository: Path, worktree_path: Path) -> list[Path]:
+    """Runnable patterns of the workspace at the same place inside a worktree.
+
+    Args:
+        runnables: `benchmark_runnables` of a framework, globs relative to the current directory or absolute.
+        repository: Repository the worktree was created from.
+        worktree_path: Root of the worktree.
+
+    Raises:
+        ValueError: A pattern is outside of the repository.
+    """
+    repository_root = Path(os.path.realpath(repository))
+    rebased = []
+    for runnable in runnables:
+        absolute = Path(os.path.realpath(os.path.abspath(runnable)))
+        try:
+            rebased.append(worktree_path / absolute.relative_to(repository_root))
+        except ValueError as error:
+            raise ValueError(f'Runnables {runnable} are outside of the repository {repository_root}') from error
+    return rebased
+
+class Worktree:
+    """Temporary detached git worktree of a repository, removed on exit.
+
+    The same worktree is reused for every commit, so builds are incremental.
+
+    Example:
+        >>> with Worktree(Path('.')) as worktree:
+        ...     worktree.checkout(commit)
+        ...     worktree.build('make -j')
+    """
+    def __init__(self, repository: Path):
+        self.repository = repository
+        self.path = Path()
+
+    def __enter__(self) -> 'Worktree':
+        self.path = Path(tempfile.mkdtemp(prefix='ccbenchmark_bisect_'))
+        git(self.repository, 'worktree', 'add', '--detach', str(self.path), 'HEAD')
+        return self
+
+    def __exit__(self, *_) -> None:
+        try:
+            git(self.repository, 'worktree', 'remove', '--force', str(self.path))
+        except subprocess.CalledProcessError:
+            shutil.rmtree(self.path, ignore_errors=True)
+            git(self.repository, 'worktree', 'prune')
+
+    def checkout(self, commit: str) -> None:
+        """Checks out a commit, discarding changes to tracked files but keeping build outputs."""
+        git(self.path, 'checkout', '--detach', '--force', commit)
+
+    def build(self, command: str | None) -> bool:
+        """Runs the build command at the root of the worktree, output is shown as it is written.
+
+        Returns:
+            bool: True if the build succeeded or there is nothing to build.
+        """
+        if command is None:
+            return True
+        return subprocess.run(command, shell=True, cwd=self.path).returncode == 0
+
+def next_commit(last_good: int, first_bad: int, skipped: set[int]) -> int | None:
+    """Next commit to test, between the last good and the first bad commit.
+
+    Args:
+        last_good: Index of the last good commit in the commit range, -1 for the good commit itself.
+        first_bad: Index of the first bad commit in the commit range.
+        skipped: Indices of commits that could not be tested.
+
+    Returns:
+        int | None: Index of the middle untested commit, None once the culprit
+        is known (or only skipped commits are left before it).
+    """
+    untested = [commit_index for commit_index in range(last_good + 1, first_bad) if commit_index not in skipped]
+    if len(untested) == 0:
+        return None
+    return untested[len(untested) // 2]
+
+def get_regressed_benchmarks(manager: 'Manager', good_index: int, bad_index: int, percent: float) -> dict[int, float]:
+    """Benchmarks significantly slower at the bad commit than at the good one, by more than `percent`.
+
+    Args:
+        manager: Manager of the compared time type, with the repetitions of both iterations.
+        good_index: Iteration of the good commit.
+        bad_index: Iteration of the bad commit.
+        percent: Slowdown in percent a benchmark must exceed.
+
+    Returns:
+        dict[int, float]: Δ (%) of each regressed benchmark by benchmark index.
+    """
+    comparisons = manager.compare_samples([good_index], [bad_index])
+    return {
+        benchmark_index: delta for benchmark_index, (delta, p_value, _, _) in enumerate(comparisons)
+        if p_value < SIGNIFICANCE and delta > percent
+    }
+
+def get_verdict(
+    manager: 'Manager', good_index: int, commit_index: int, regressed: dict[int, float], benchmark_ids: list[str]
+) -> tuple[BisectVerdict, str]:
+    """Whether a commit is bad, i.e., any regressed benchmark already regressed at it.
+
+    Args:
+        manager: Manager of the compared time type.
+        good_index: Iteration of the good commit.
+        commit_index: Iteration of the tested commit.
+        regressed: Δ (%) of each regressed benchmark from `get_regressed_benchmarks`.
+        benchmark_ids: `<runnable path>/<benchmark name>` of every benchmark, used in the description.
+
+    Returns:
+        tuple[BisectVerdict, str]: Verdict and the Δ of the benchmark that decided it,
+        skipped if no regressed benchmark has results at the commit.
+    """
+    comparisons = manager.compare_samples([good_index], [commit_index])
+    largest_fraction = -math.inf
+    detail = ''
+    for benchmark_index, total_delta in regressed.items():
+        delta, p_value, _, candidate_count = comparisons[benchmark_index]
+        if candidate_count == 0:
+            continue
+        fraction = delta/total_delta
+        description = f'{benchmark_ids[benchmark_index]}: {delta:+.2f} % of {total_delta:+.2f} %, p = {p_value:.2g}'
+        if p_value < SIGNIFICANCE and fraction >= BAD_FRACTION:
+            return BisectVerdict.BAD, description
+        if fraction > largest_fraction:
+            largest_fraction = fraction
+            detail = description
+    if detail == '':
+        return BisectVerdict.SKIPPED, 'no results'
+    return BisectVerdict.GOOD, detail
@@ -0,0 +1,280 @@
+"""Noise floors of a machine and of every benchmark.
+
+`ccbenchmark calibrate` measures how much results change without any code
+change, so coloring and regression gates can use thresholds matched to the
+hardware running the benchmarks instead of fixed percentages:
+
+- Host noise: reference micro-benchmarks (timer, integer loop, memory copy and
+  allocation) are run repeatedly in this process.
+- Benchmark noise: the Δ between consecutive iterations in the stored history
+  of every benchmark, estimated by the Rust Manager from the median |Δ| so a
+  few real changes barely move it, and the median CV of its repetitions.
+
+A noise floor is the Δ% between two results that noise alone stays under about
+95% of the time. Floors are saved per host as `.ccbenchmark/noise/<host>.json`.
+
+Defines:
+    - BenchmarkNoise: Noise floor of one benchmark or reference.
+    - NoiseFloors: Noise floors of a host and its benchmarks.
+    - get_reference_benchmarks(): Micro-benchmarks measuring the noise of the host.
+    - run_reference_benchmarks(): Measures the noise of the host.
+    - get_history_noise(): Measures the noise of every benchmark from its history.
+    - get_noise_floors_path(): File the noise floors of a host are saved to.
+    - load_noise_floors(): Loads the noise floors of a host.
+"""
+
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Callable
+import json
+import math
+import platform
+import re
+import statistics
+import time
+
+from ccbenchmark.benchmark_data import BenchmarkData, TimeType
+from ccbenchmark.frameworks.util.metrics import MetricIndices
+from ccbenchmark.report import COMPARED_METRICS
+from ccbenchmark.util import is_history_iteration
+
+"""Times each reference benchmark is repeated."""
+REFERENCE_REPETITIONS = 30
+"""Minimum pairs of consecutive iterations a benchmark needs for a noise floor."""
+MIN_HISTORY_PAIRS = 4
+"""Δ (%) colored fully red or green, in multiples of the noise floor."""
+DELTA_PEAK_MULTIPLE = 4.0
+"""CV (%) colored red, in multiples of the typical CV."""
+CV_POOR_MULTIPLE = 2.0
+"""Color limits used without noise floors."""
+DEFAULT_PEAK_DELTA = 20.0
+DEFAULT_POOR_CV = 10.0
+NOISE_DIR = 'noise'
+
+@dataclass(slots=True)
+class BenchmarkNoise:
+    """Noise floor of one benchmark or reference benchmark.
+
+    Attributes:
+        delta_percent: Δ (%) between two results that noise alone stays under about 95% of the time.
+        pairs: Pairs of consecutive results the floor was estimated from.
+        cv_percent: Median CV (%) of its repetitions, NaN if unknown.
+    """
+    delta_percent: float
+    pairs: int
+    cv_percent: float = math.nan
+
+@dataclass(slots=True)
+class NoiseFloors:
+    """Noise floors of a host and of the benchmarks that ran on it.
+
+    Attributes:
+        host: Name of the host that was calibrated.
+        created: Time of the calibration, in seconds since the epoch.
+        timer_resolution_ns: Median time between two reads of the performance counter.
+        host_delta_percent: Largest noise floor of the reference benchmarks.
+        host_cv_percent: Largest CV of the reference benchmarks.
+        references: Noise of each reference benchmark.
+        benchmarks: Noise of each benchmark by id (`<runnable path>/<benchmark name>`).
+    """
+    host: str
+    created: float = 0.0
+    timer_resolution_ns: float = math.nan
+    host_delta_percent: float = math.nan
+    host_cv_percent: float = math.nan
+    references: dict[str, BenchmarkNoise] = field(default_factory=lambda: {})
+    benchmarks: dict[str, BenchmarkNoise] = field(default_factory=lambda: {})
+
+    def get_delta_floor(self, path: Path, name: str) -> float:
+        """Noise floor of a benchmark in Δ%, the host's if its history is too short."""
+        benchmark_noise = self.benchmarks.get(f'{path.as_posix()}/{name}')
+        if benchmark_noise is not None and math.isfinite(benchmark_noise.delta_percent):
+            return benchmark_noise.delta_percent
+        return self.host_delta_percent
+
+    def get_cv_floor(self, path: Path, name: str) -> float:
+        """Typical CV of a benchmark in %, the host's if it has no CV history."""
+        benchmark_noise = self.benchmarks.get(f'{path.as_posix()}/{name}')
+        if benchmark_noise is not None and math.isfinite(benchmark_noise.cv_percent):
+            return benchmark_noise.cv_percent
+        return self.host_cv_percent
+
+    def get_color_limits(self, path: Path, name: str) -> tuple[float, float]:
+        """Δ (%) colored fully red or green and CV (%) colored red for a benchmark.
+
+        Returns:
+            tuple[float, float]: (peak delta, poor CV), the defaults where no floor is known.
+        """
+        delta_floor = self.get_delta_floor(path, name)
+        cv_floor = self.get_cv_floor(path, name)
+        # A floor of 0 (e.g., identical results) would color every change fully.
+        peak_delta = DELTA_PEAK_MULTIPLE*delta_floor if math.isfinite(delta_floor) and delta_floor > 0.0 else DEFAULT_PEAK_DELTA
+        poor_cv = CV_POOR_MULTIPLE*cv_floor if math.isfinite(cv_floor) and cv_floor > 0.0 else DEFAULT_POOR_CV
+        return peak_delta, poor_cv
+
+    def save(self, path: Path) -> None:
+        """Writes the noise floors as JSON, NaN is written as null."""
+        def to_json(value):
+            if isinstance(value, float) and not math.isfinite(value):
+                return None
+            if isinstance(value, dict):
+                return {key: to_json(entry) for key, entry in value.items()}
+            return value
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(to_json(asdict(self)), file, indent=1, ensure_ascii=False)
+
+    @staticmethod
+    def load(path: Path) -> 'NoiseFloors':
+        """Reads noise floors written by `save`.
+
+        Raises:
+            OSError: The file can not be read.
+            ValueError: The file is not valid noise floors.
+        """
+        with open(path, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+
+        def to_float(value) -> float:
+            return math.nan if value is None else float(value)
+
+        def to_noise(entries: dict) -> dict[str, BenchmarkNoise]:
+            return {
+                benchmark_id: BenchmarkNoise(to_float(entry['delta_percent']), int(entry['pairs']), to_float(entry.get('cv_percent')))
+                for benchmark_id, entry in entries.items()
+            }
+        try:
+            return NoiseFloors(
+                str(data['host']), float(data.get('created', 0.0)), to_float(data.get('timer_resolution_ns')),
+                to_float(data.get('host_delta_percent')), to_float(data.get('host_cv_percent')),
+                to_noise(data.get('references', {})), to_noise(data.get('benchmarks', {}))
+            )
+        except (KeyError, TypeError) as error:
+            raise ValueError(f'Invalid noise floors: {path}') from error
+
+def _timer_resolution_ns(repetitions: int = 1000) -> float:
+    differences = []
+    for _ in range(repetitions):
+        start = time.perf_counter_ns()
+        end = time.perf_counter_ns()
+        while end == start:
+            end = time.perf_counter_ns()
+        differences.append(end - start)
+    return statistics.median(differences)
+
+def _robust_cv_percent(times: list[float]) -> float:
+    """CV (%) from the median absolute deviation, so a few outliers (e.g., page faults) barely move it."""
+    if len(times) < 2:
+        return math.nan
+    median = statistics.median(times)
+    # 1.4826 scales the MAD of normally distributed values to their standard deviation.
+    deviation = 1.4826*statistics.median(abs(value - median) for value in times)
+    return deviation/median*100.0 if median != 0.0 else math.nan
+
+def _integer_loop() -> None:
+    total = 0
+    for value in range(200_000):
+        total += value ^ (value >> 3)
+
+def _allocation() -> None:
+    [{'index': index} for index in range(50_000)]
+
+def get_reference_benchmarks() -> dict[str, Callable[[], None]]:
+    """Reference benchmarks by name, each takes a few ms."""
+    copy_buffer = bytearray(16*1024*1024)
+    return {
+        'integer_loop': _integer_loop,
+        'memory_copy': lambda: bytes(copy_buffer),
+        'allocation': _allocation,
+    }
+
+def run_reference_benchmarks(noise_floors: NoiseFloors, repetitions: int = REFERENCE_REPETITIONS) -> None:
+    """Measures the noise of the host with the reference benchmarks.
+
+    Sets `timer_resolution_ns`, `references`, `host_delta_percent` and `host_cv_percent`.
+
+    Args:
+        noise_floors: Noise floors being calibrated.
+        repetitions: Times each reference benchmark is repeated, one result per repetition.
+    """
+    from ccbenchmark._ccbenchmark import Manager
+
+    noise_floors.timer_resolution_ns = _timer_resolution_ns()
+
+    manager = Manager()
+    times_by_reference: dict[str, list[float]] = {}
+    for benchmark_index, (name, reference) in enumerate(get_reference_benchmarks().items()):
+        reference()  # Warm up caches and the allocator.
+        times = []
+        for _ in range(repetitions):
+            start = time.perf_counter_ns()
+            reference()
+            times.append(float(time.perf_counter_ns() - start))
+        times_by_reference[name] = times
+        manager.emplace(len(MetricIndices), repetitions, 'ns')
+        for iteration_index, value in enumerate(times):
+            manager.set(benchmark_index, MetricIndices.Time.value, iteration_index, value, 'ns')
+
+    floors = manager.noise_floors(list(range(repetitions)), [MetricIndices.Time.value], MetricIndices.CV.value, MIN_HISTORY_PAIRS)
+    for (name, times), (delta_percent, pairs, _) in zip(times_by_reference.items(), floors):
+        noise_floors.references[name] = BenchmarkNoise(delta_percent, pairs, _robust_cv_percent(times))
+
+    finite_floors = [noise.delta_percent for noise in noise_floors.references.values() if math.isfinite(noise.delta_percent)]
+    finite_cvs = [noise.cv_percent for noise in noise_floors.references.values() if math.isfinite(noise.cv_percent)]
+    noise_floors.host_delta_percent = max(finite_floors, default=math.nan)
+    noise_floors.host_cv_percent = max(finite_cvs, default=math.nan)
+
+def get_history_noise(benchmark_data: BenchmarkData, time_type: TimeType) -> dict[str, BenchmarkNoise]:
+    """Measures the noise of every benchmark from its stored iterations.
+
+    Iterations are used in the order they were written, without the 'recent'
+    and bisect iterations, see `is_history_iteration`.
+
+    Args:
+        benchmark_data: Loaded benchmark data.
+        time_type: Real or CPU time.
+
+    Returns:
+        dict[str, BenchmarkNoise]: Noise by benchmark id, benchmarks without
+        `MIN_HISTORY_PAIRS` pairs of iterations are left out.
+    """
+    iteration_indices = [
+        iteration_index for iteration_index, iteration_name in enumerate(benchmark_data.iteration_names)
+        if is_history_iteration(iteration_name)
+    ]
+    floors = benchmark_data.benchmark_types[time_type].noise_floors(
+        iteration_indices, COMPARED_METRICS, MetricIndices.CV.value, MIN_HISTORY_PAIRS
+    )
+    benchmark_noise: dict[str, BenchmarkNoise] = {}
+    for path, name, (delta_percent, pairs, cv_percent) in zip(benchmark_data.benchmark_paths, benchmark_data.benchmark_names, floors):
+        if math.isfinite(delta_percent):
+            benchmark_noise[f'{path.as_posix()}/{name}'] = BenchmarkNoise(delta_percent, pairs, cv_percent)
+    return benchmark_noise
+
+def get_noise_floors_path(workspace: Path = Path('.'), host: str | None = None) -> Path:
+    """File the noise floors of a host are saved to.
+
+    Args:
+        workspace: Directory containing `.ccbenchmark`.
+        host: Host name, this host if None.
+    """
+    host = host or platform.node() or 'localhost'
+    return workspace / '.ccbenchmark' / NOISE_DIR / f"{re.sub(r'[^A-Za-z0-9_.-]', '_', host)}.json"
+
+def load_noise_floors(workspace: Path = Path('.'), host: str | None = None) -> NoiseFloors | None:
+    """Loads the noise floors of a host saved by `ccbenchmark calibrate`.
+
+    Args:
+        workspace: Directory containing `.ccbenchmark`.
+        host: Host name, this host if None.
+
+    Returns:
+        NoiseFloors | None: None if the host was never calibrated or the file is invalid.
+    """
+    path = get_noise_floors_path(workspace, host)
+    if not path.is_file():
+        return None
+    try:
+        return NoiseFloors.load(path)
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,360 @@
+"""Chart of the selected benchmarks over iterations.
+
+Requires PyQtChart (``pip install ccbenchmark[chart]``), the GUI leaves the chart
+out when it is not installed.
+
+Series are downsampled in Rust with Largest-Triangle-Three-Buckets to about one
+point per pixel of the visible iterations, and again whenever the chart is panned
+or zoomed, so histories of thousands of iterations stay smooth.
+
+Defines:
+    - CHARTED_METRICS: Metrics that can be charted.
+    - ChartView: Chart pane with a metric selector, pannable and zoomable.
+    - DistributionView: Histograms of a benchmark's raw samples for two iterations.
+"""
+
+from dataclasses import dataclass
+import math
+
+from PyQt5.QtWidgets import QWidget, QComboBox, QVBoxLayout, QHBoxLayout, QToolTip, QDialog, QLabel
+from PyQt5.QtChart import (
+    QChart, QChartView, QLineSeries, QAreaSeries, QValueAxis, QBarSeries, QBarSet, QBarCategoryAxis
+)
+from PyQt5.QtCore import QTimer, QPointF
+from PyQt5 import QtCore, QtGui
+
+from ccbenchmark.benchmark_data import BenchmarkData, TimeType
+from ccbenchmark.frameworks.util.metrics import METRICS, MetricIndices
+from ccbenchmark.trace import span
+
+"""Metrics that can be charted, the first with values is charted by default."""
+CHARTED_METRICS = [
+    MetricIndices.Time.value, MetricIndices.Mean.value, MetricIndices.Median.value,
+    MetricIndices.Min.value, MetricIndices.Max.value
+]
+"""More series than this can not be told apart, only the first selected are charted."""
+MAX_SERIES = 8
+UNIT = 'ns'
+BIN_COUNT = 30
+
+@dataclass(slots=True)
+class _Series:
+    """Benchmark charted, with the Qt series drawing it."""
+    benchmark_index: int
+    line: QLineSeries
+    upper: QLineSeries
+    lower: QLineSeries
+    stddevs: list[float]
+    cvs: list[float]
+
+class _PanZoomChartView(QChartView):
+    """Pans horizontally when dragged and zooms horizontally on the mouse wheel."""
+    def __init__(self, chart: QChart):
+        super().__init__(chart)
+        self.setRenderHint(QtGui.QPainter.Antialiasing)
+        self.setRubberBand(QChartView.NoRubberBand)
+        self._last_x: float | None = None
+
+    def wheelEvent(self, event: QtGui.QWheelEvent):
+        factor = 1.25 if event.angleDelta().y() > 0 else 0.8
+        plot_area = self.chart().plotArea()
+        center_x = min(max(event.pos().x(), plot_area.left()), plot_area.right())
+        zoomed = QtCore.QRectF(plot_area)
+        zoomed.setWidth(plot_area.width() / factor)
+        zoomed.moveLeft(center_x - (center_x - plot_area.left()) / factor)
+        self.chart().zoomIn(zoomed)
+        event.accept()
+
+    def mousePressEvent(self, event: QtGui.QMouseEvent):
+        if event.button() == QtCore.Qt.LeftButton:
+            self._last_x = event.pos().x()
+            event.accept()
+            return
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event: QtGui.QMouseEvent):
+        if self._last_x is not None:
+            self.chart().scroll(self._last_x - event.pos().x(), 0)
+            self._last_x = event.pos().x()
+            event.accept()
+            return
+        super().mouseMoveEvent(event)
+
+    def mouseReleaseEvent(self, event: QtGui.QMouseEvent):
+        self._last_x = None
+        super().mouseReleaseEvent(event)
+
+    def mouseDoubleClickEvent(self, event: QtGui.QMouseEvent):
+        self.chart().zoomReset()
+        event.accept()
+
+class ChartView(QWidget):
+    """Charts a metric of the selected benchmarks over iterations.
+
+    Each benchmark is a line with a band of ± one standard deviation around it,
+    or of its CV when it has no standard deviation. Dragging pans, the mouse
+    wheel zooms and double clicking shows every iteration again.
+    """
+    def __init__(self):
+        super().__init__()
+        self.metric_box = QComboBox()
+        for metric_index in CHARTED_METRICS:
+            self.metric_box.addItem(METRICS[metric_index], metric_index)
+        self.metric_box.currentIndexChanged.connect(self._metric_changed)
+
+        self.chart = QChart()
+        self.chart.legend().setAlignment(QtCore.Qt.AlignBottom)
+        self.axis_x = QValueAxis()
+        self.axis_x.setLabelFormat('%d')
+        self.axis_x.setTitleText('Iteration')
+        self.axis_y = QValueAxis()
+        self.axis_y.setTitleText(f'Time ({UNIT})')
+        self.chart.addAxis(self.axis_x, QtCore.Qt.AlignBottom)
+        self.chart.addAxis(self.axis_y, QtCore.Qt.AlignLeft)
+        self.chart_view = _PanZoomChartView(self.chart)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.metric_box)
+        layout.addWidget(self.chart_view)
+
+        self.benchmark_data: BenchmarkData | None = None
+        self.selected_indicies: list[int] = []
+        self.time_type = TimeType.REAL
+        self.series: list[_Series] = []
+
+        # Panning emits a range change per mouse move, the series are downsampled once they settle.
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(15)
+        self._redraw_timer.timeout.connect(self.redraw)
+        self.axis_x.rangeChanged.connect(self._redraw_timer.start)
+        self.chart.plotAreaChanged.connect(self._redraw_timer.start)
+
+    @property
+    def metric_index(self) -> int:
+        return self.metric_box.currentData()
+
+    def _has_values(self, metric_index: int) -> bool:
+        manager = self.benchmark_data.benchmark_types[self.time_type]
+        for benchmark_index in self.selected_indicies[:MAX_SERIES]:
+            values = manager.get_values(benchmark_index, metric_index, UNIT)
+            if any(value == value for value in values):
+                return True
+        return False
+
+    def set_benchmarks(self, benchmark_data: BenchmarkData, selected_indicies: list[int], time_type: TimeType):
+        """Charts the selected benchmarks over every iteration.
+
+        Args:
+            benchmark_data:
+                Loaded benchmark data.
+            selected_indicies:
+                Benchmarks charted, only the first `MAX_SERIES`.
+            time_type:
+                Real or CPU time.
+        """
+        self.benchmark_data = benchmark_data
+        self.selected_indicies = list(selected_indicies)
+        self.time_type = time_type
+
+        if len(self.selected_indicies) != 0 and not self._has_values(self.metric_index):
+            for row, metric_index in enumerate(CHARTED_METRICS):
+                if self._has_values(metric_index):
+                    self.metric_box.blockSignals(True)
+                    self.metric_box.setCurrentIndex(row)
+                    self.metric_box.blockSignals(False)
+                    break
+        self._create_series()
+
+    def _metric_changed(self):
+        if self.benchmark_data is not None:
+            self._create_series()
+
+    def _create_series(self):
+        self.chart.removeAllSeries()
+        self.series = []
+        manager = self.benchmark_data.benchmark_types[self.time_type]
+        palette = [QtGui.QColor(QtCore.Qt.GlobalColor(color)) for color in (
+            QtCore.Qt.blue, QtCore.Qt.red, QtCore.Qt.darkGreen, QtCore.Qt.magenta,
+            QtCore.Qt.darkCyan, QtCore.Qt.darkYellow, QtCore.Qt.darkRed, QtCore.Qt.darkBlue
+        )]
+        for i, benchmark_index in enumerate(self.selected_indicies[:MAX_SERIES]):
+            color = palette[i % len(palette)]
+            line = QLineSeries()
+            line.setName(self.benchmark_data.benchmark_names[benchmark_index])
+            line.setPen(QtGui.QPen(color, 2))
+            line.hovered.connect(self._show_tooltip)
+            upper = QLineSeries()
+            lower = QLineSeries()
+            band = QAreaSeries(upper, lower)
+            band_color = QtGui.QColor(color)
+            band_color.setAlpha(50)
+            band.setBrush(band_color)
+            band.setPen(QtGui.QPen(QtCore.Qt.NoPen))
+
+            for series in (band, line):
+                self.chart.addSeries(series)
+                series.attachAxis(self.axis_x)
+                series.attachAxis(self.axis_y)
+            self.chart.legend().markers(band)[0].setVisible(False)
+
+            self.series.append(_Series(
+                benchmark_index, line, upper, lower,
+                manager.get_values(benchmark_index, MetricIndices.Stddev.value, UNIT),
+                manager.get_values(benchmark_index, MetricIndices.CV.value, UNIT)
+            ))
+
+        self.axis_y.setTitleText(f'{METRICS[self.metric_index]} ({UNIT})')
+        last_iteration = max(len(self.benchmark_data.iteration_names) - 1, 1)
+        self.axis_x.setRange(0, last_iteration)
+        self.redraw()
+
+    def _error(self, series: _Series, iteration_index: int, value: float) -> float:
+        stddev = series.stddevs[iteration_index]
+        if stddev == stddev:
+            return stddev
+        cv = series.cvs[iteration_index]
+        if cv == cv:
+            return value * cv / 100.0
+        return 0.0
+
+    def redraw(self):
+        """Downsamples every series to the visible iterations."""
+        if self.benchmark_data is None:
+            return
+        manager = self.benchmark_data.benchmark_types[self.time_type]
+        start = max(math.floor(self.axis_x.min()), 0)
+        stop = math.ceil(self.axis_x.max()) + 1
+        threshold = max(int(self.chart.plotArea().width()), 3)
+
+        low = math.inf
+        high = -math.inf
+        for series in self.series:
+            with span('Manager.get_series', category='rust', iterations=stop - start, threshold=threshold):
+                iterations, values = manager.get_series(
+                    series.benchmark_index, self.metric_index, UNIT, start, stop, threshold
+                )
+            line_points: list[QPointF] = []
+            upper_points: list[QPointF] = []
+            lower_points: list[QPointF] = []
+            for iteration_index, value in zip(iterations, values):
+                error = self._error(series, iteration_index, value)
+                line_points.append(QPointF(iteration_index, value))
+                upper_points.append(QPointF(iteration_index, value + error))
+                lower_points.append(QPointF(iteration_index, value - error))
+                low = min(low, value - error)
+                high = max(high, value + error)
+            series.line.replace(line_points)
+            series.upper.replace(upper_points)
+            series.lower.replace(lower_points)
+
+        if low <= high:
+            padding = (high - low) * 0.05 or abs(high) * 0.05 or 1.0
+            self.axis_y.setRange(low - padding, high + padding)
+
+    def _show_tooltip(self, point: QPointF, state: bool):
+        if not state:
+            QToolTip.hideText()
+            return
+        iteration_index = round(point.x())
+        if not 0 <= iteration_index < len(self.benchmark_data.iteration_names):
+            return
+        series: QLineSeries = self.sender()
+        QToolTip.showText(
+            QtGui.QCursor.pos(),
+            f'{series.name()}\n{self.benchmark_data.iteration_names[iteration_index]}: {point.y():.2f} {UNIT}'
+        )
+
+class DistributionView(QDialog):
+    """Histograms of the raw samples of a benchmark for two iterations, side by side.
+
+    Both histograms share their bins, so bimodal runs (e.g., cache hits and misses)
+    and shifts between iterations show up where a mean or median would hide them.
+    Only iterations with samples are offered, such as Google Benchmark runs with
+    repetitions and every pyperf run.
+    """
+    def __init__(self, parent: QWidget, benchmark_data: BenchmarkData, selected_indicies: list[int], time_type: TimeType):
+        super().__init__(parent)
+        self.setWindowTitle('Distribution')
+        self.benchmark_data = benchmark_data
+        self.time_type = time_type
+
+        self.benchmark_box = QComboBox()
+        for benchmark_index in selected_indicies:
+            self.benchmark_box.addItem(benchmark_data.benchmark_names[benchmark_index], benchmark_index)
+        self.baseline_box = QComboBox()
+        self.candidate_box = QComboBox()
+
+        self.chart = QChart()
+        self.chart.legend().setAlignment(QtCore.Qt.AlignBottom)
+        self.chart_view = QChartView(self.chart)
+        self.chart_view.setRenderHint(QtGui.QPainter.Antialiasing)
+
+        selectors = QHBoxLayout()
+        selectors.addWidget(self.benchmark_box, 2)
+        selectors.addWidget(QLabel('Baseline'))
+        selectors.addWidget(self.baseline_box, 1)
+        selectors.addWidget(QLabel('Candidate'))
+        selectors.addWidget(self.candidate_box, 1)
+        layout = QVBoxLayout(self)
+        layout.addLayout(selectors)
+        layout.addWidget(self.chart_view)
+
+        self.benchmark_box.currentIndexChanged.connect(self._benchmark_changed)
+        self.baseline_box.currentIndexChanged.connect(self.redraw)
+        self.candidate_box.currentIndexChanged.connect(self.redraw)
+        self._benchmark_changed()
+        self.resize(900, 500)
+
+    def _benchmark_changed(self):
+        manager = self.benchmark_data.benchmark_types[self.time_type]
+        benchmark_index: int | None = self.benchmark_box.currentData()
+        sampled = manager.get_sampled_iterations(benchmark_index) if benchmark_index is not None else []
+        for box in (self.baseline_box, self.candidate_box):
+            box.blockSignals(True)
+            box.clear()
+            for iteration_index in sampled:
+                box.addItem(self.benchmark_data.iteration_names[iteration_index], iteration_index)
+            box.blockSignals(False)
+        # Compares the two latest iterations by default.
+        self.baseline_box.setCurrentIndex(max(len(sampled) - 2, 0))
+        self.candidate_box.setCurrentIndex(len(sampled) - 1)
+        self.redraw()
+
+    def redraw(self):
+        self.chart.removeAllSeries()
+        for axis in self.chart.axes():
+            self.chart.removeAxis(axis)
+
+        benchmark_index: int | None = self.benchmark_box.currentData()
+        iteration_indices = [box.currentData() for box in (self.baseline_box, self.candidate_box)]
+        if benchmark_index is None or None in iteration_indices:
+            self.chart.setTitle('No samples, run with repetitions to record them.')
+            return
+        self.chart.setTitle('')
+
+        manager = self.benchmark_data.benchmark_types[self.time_type]
+        with span('Manager.get_histograms', category='rust', iterations=len(iteration_indices)):
+            edges, counts = manager.get_histograms(benchmark_index, iteration_indices, BIN_COUNT, UNIT)
+        if len(edges) == 0:
+            return
+
+        series = QBarSeries()
+        for iteration_index, iteration_counts in zip(iteration_indices, counts):
+            bar_set = QBarSet(self.benchmark_data.iteration_names[iteration_index])
+            bar_set.append([float(count) for count in iteration_counts])
+            series.append(bar_set)
+        self.chart.addSeries(series)
+
+        axis_x = QBarCategoryAxis()
+        axis_x.append([f'{(low + high) / 2:.4g}' for low, high in zip(edges, edges[1:])])
+        axis_x.setTitleText(f'{METRICS[MetricIndices.Time.value]} ({UNIT})')
+        axis_y = QValueAxis()
+        axis_y.setLabelFormat('%d')
+        axis_y.setTitleText('Samples')
+        axis_y.setRange(0, max(max(iteration_counts, default=0) for iteration_counts in counts) or 1)
+        self.chart.addAxis(axis_x, QtCore.Qt.AlignBottom)
+        self.chart.addAxis(axis_y, QtCore.Qt.AlignLeft)
+        series.attachAxis(axis_x)
+        series.attachAxis(axis_y)
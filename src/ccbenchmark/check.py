@@ -0,0 +1,186 @@
+"""Regression gate for continuous integration.
+
+Compares a candidate iteration against a baseline, applies the thresholds from
+the `check` key of `settings.yaml`, and writes the outcome as JUnit XML so CI
+shows every regression as a failing test. With `discard_under_load`, results
+taken under load are written as skipped tests instead of being checked. The
+`noise` threshold is relative to the noise floors of `ccbenchmark calibrate`.
+
+Defines:
+    - CheckResult: Outcome of checking one benchmark.
+    - get_thresholds(): Thresholds that apply to a benchmark.
+    - check_iterations(): Checks every benchmark of two iterations.
+    - write_junit(): Writes check results as JUnit XML.
+"""
+
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import TYPE_CHECKING, Generator, TextIO
+from xml.sax.saxutils import escape, quoteattr
+import math
+
+from ccbenchmark.benchmark_data import BenchmarkData, TimeType
+from ccbenchmark.benchmark_settings import CheckSettings, Thresholds
+from ccbenchmark.frameworks.util.metrics import MetricIndices
+from ccbenchmark.report import Comparison, compare_iterations
+
+if TYPE_CHECKING:
+    from ccbenchmark.calibration import NoiseFloors
+
+@dataclass(slots=True)
+class CheckResult:
+    """Outcome of checking one benchmark.
+
+    Attributes:
+        comparison: Comparison between the baseline and candidate.
+        thresholds: Thresholds the comparison was checked against.
+        z_score: Slowdown in combined standard deviations, NaN if unknown.
+        noise_floor: Noise floor of the benchmark in Δ%, NaN if unknown.
+        regressed: True if every threshold that is set was exceeded.
+        discarded: True if the result was taken under load and not checked.
+    """
+    comparison: Comparison
+    thresholds: Thresholds
+    z_score: float
+    regressed: bool
+    discarded: bool = False
+    noise_floor: float = math.nan
+
+    def reason(self) -> str:
+        """Describes the slowdown and the thresholds it was checked against."""
+        comparison = self.comparison
+        text = (f'{comparison.metric_name}: {comparison.baseline:.2f} ns -> {comparison.candidate:.2f} ns '
+                f'({comparison.delta:+.2f} %)')
+        limits = []
+        if self.thresholds.percent is not None:
+            limits.append(f'percent > {self.thresholds.percent:g} %')
+        if self.thresholds.absolute is not None:
+            limits.append(f'absolute > {self.thresholds.absolute:g} ns')
+        if self.thresholds.significance is not None and self.z_score == self.z_score:
+            limits.append(f'significance {self.z_score:.2f} > {self.thresholds.significance:g} σ')
+        if self.thresholds.noise is not None and self.noise_floor == self.noise_floor:
+            limits.append(f'noise > {self.thresholds.noise:g} × {self.noise_floor:.2f} %')
+        if len(limits) != 0:
+            text += f', limits: {", ".join(limits)}'
+        return text
+
+def get_thresholds(check_settings: CheckSettings, path: Path, name: str) -> Thresholds:
+    """Returns the global thresholds overridden by every matching benchmark pattern.
+
+    Args:
+        check_settings: Settings loaded from `settings.yaml`.
+        path: Path of the runnable the benchmark belongs to.
+        name: Name of the benchmark.
+
+    Returns:
+        Thresholds: Thresholds that apply to the benchmark.
+    """
+    thresholds = check_settings.thresholds
+    benchmark_id = f'{path.as_posix()}/{name}'
+    for pattern, benchmark_thresholds in check_settings.benchmark_thresholds.items():
+        if fnmatchcase(benchmark_id, pattern) or fnmatchcase(name, pattern):
+            thresholds = thresholds.merged(benchmark_thresholds)
+    return thresholds
+
+def _z_score(benchmark_data: BenchmarkData, benchmark_index: int, baseline_index: int,
+             candidate_index: int, time_type: TimeType, slowdown: float) -> float:
+    stddevs = benchmark_data.benchmark_types[time_type].get_values(benchmark_index, MetricIndices.Stddev.value, 'ns')
+    baseline_stddev = stddevs[baseline_index]
+    candidate_stddev = stddevs[candidate_index]
+    combined_stddev = math.sqrt(baseline_stddev**2 + candidate_stddev**2)
+    if combined_stddev != combined_stddev or combined_stddev == 0.0:
+        return float('nan')
+    return slowdown / combined_stddev
+
+def _exceeds(result_value: float, threshold: float | None) -> bool:
+    if threshold is None or result_value != result_value:
+        return True
+    return result_value > threshold
+
+def check_iterations(
+    benchmark_data: BenchmarkData,
+    baseline_name: str,
+    candidate_name: str,
+    time_type: TimeType,
+    check_settings: CheckSettings,
+    noise_floors: 'NoiseFloors | None' = None
+) -> Generator[CheckResult, None, None]:
+    """Checks every benchmark of the candidate iteration against the baseline.
+
+    Args:
+        benchmark_data: Loaded benchmark data.
+        baseline_name: Name of the iteration compared against.
+        candidate_name: Name of the iteration being checked.
+        time_type: Real or CPU time.
+        check_settings: Global and per benchmark thresholds.
+        noise_floors: Noise floors the `noise` threshold is relative to, it is ignored if None.
+
+    Returns:
+        Generator[CheckResult]: Results sorted from the largest Δ to the smallest.
+    """
+    baseline_index = benchmark_data.iteration_names.index(baseline_name)
+    candidate_index = benchmark_data.iteration_names.index(candidate_name)
+
+    for comparison in compare_iterations(benchmark_data, baseline_name, candidate_name, time_type):
+        thresholds = get_thresholds(check_settings, comparison.path, comparison.name)
+        slowdown = comparison.candidate - comparison.baseline
+
+        if check_settings.discard_under_load and comparison.load_warning != '':
+            yield CheckResult(comparison, thresholds, float('nan'), False, True)
+            continue
+
+        if comparison.delta <= 0.0:
+            yield CheckResult(comparison, thresholds, float('nan'), False)
+            continue
+
+        z_score = float('nan')
+        if thresholds.significance is not None:
+            z_score = _z_score(benchmark_data, comparison.benchmark_index, baseline_index, candidate_index, time_type, slowdown)
+
+        noise_floor = float('nan')
+        noise_limit = None
+        if thresholds.noise is not None and noise_floors is not None:
+            noise_floor = noise_floors.get_delta_floor(comparison.path, comparison.name)
+            if noise_floor == noise_floor:
+                noise_limit = thresholds.noise*noise_floor
+
+        regressed = (
+            _exceeds(comparison.delta, thresholds.percent) and
+            _exceeds(slowdown, thresholds.absolute) and
+            _exceeds(z_score, thresholds.significance) and
+            _exceeds(comparison.delta, noise_limit)
+        )
+        yield CheckResult(comparison, thresholds, z_score, regressed, noise_floor=noise_floor)
+
+def write_junit(stream: TextIO, results: list[CheckResult], baseline_name: str, candidate_name: str) -> None:
+    """Writes check results as JUnit XML, one test case per benchmark.
+
+    Args:
+        stream: Text stream the XML is written to.
+        results: Results from `check_iterations`.
+        baseline_name: Name of the baseline iteration.
+        candidate_name: Name of the candidate iteration.
+    """
+    failures = sum(1 for result in results if result.regressed)
+    skipped = sum(1 for result in results if result.discarded)
+    suite_name = f'ccbenchmark {baseline_name} -> {candidate_name}'
+    stream.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    stream.write(f'<testsuites tests="{len(results)}" failures="{failures}">\n')
+    stream.write(f'<testsuite name={quoteattr(suite_name)} tests="{len(results)}" failures="{failures}" errors="0" skipped="{skipped}">\n')
+    for result in results:
+        comparison = result.comparison
+        stream.write(f'<testcase classname={quoteattr(comparison.path.as_posix())} name={quoteattr(comparison.name)}')
+        if result.discarded:
+            stream.write('>\n')
+            stream.write(f'<skipped message={quoteattr(f"Taken under load, {comparison.load_warning}")}/>\n')
+            stream.write('</testcase>\n')
+            continue
+        if not result.regressed:
+            stream.write('/>\n')
+            continue
+        stream.write('>\n')
+        message = f'Regression of {comparison.delta:+.2f} %'
+        stream.write(f'<failure message={quoteattr(message)} type="PerformanceRegression">{escape(result.reason())}</failure>\n')
+        stream.write('</testcase>\n')
+    stream.write('</testsuite>\n</testsuites>\n')
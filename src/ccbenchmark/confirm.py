@@ -0,0 +1,258 @@
+"""Confirmation re-runs of `ccbenchmark confirm`.
+
+A Δ past the threshold on one benchmark is often noise. `confirm` re-runs only
+the benchmarks of a candidate iteration that are slower than a baseline by more
+than the threshold, selected with the framework's filter. Rounds alternate the
+baseline runnable (the same runnable under `--baseline_root`, e.g. a worktree
+of the baseline) and the candidate runnable, in ABBA order so drift affects
+both alike. The samples of every round are pooled per side and compared by the
+Rust Manager: Δ between the medians and a one-sided Mann-Whitney test.
+
+- confirmed: the candidate is significantly slower (p < `SIGNIFICANCE`), by at
+  least `CONFIRM_FRACTION` of the threshold.
+- refuted: the re-runs are slower by less than `CONFIRM_FRACTION` of the threshold.
+- inconclusive: slower by more, but not significantly (e.g., too few rounds).
+
+Without a baseline root only the candidate is re-run, against the stored samples
+of the baseline iteration. Verdicts are written next to the candidate's result
+as `_iter_<name>/.ccbenchmark/<runnable>.confirm.json` and shown by reports
+until the result is replaced.
+
+Defines:
+    - Verdict: Outcome of confirming a benchmark.
+    - Confirmation: Outcome and statistics of confirming one benchmark.
+    - get_verdict(): Verdict for a Δ and p-value.
+    - get_name_pattern(): Regex selecting benchmarks by name.
+    - run_rounds(): Re-runs benchmarks interleaved with the baseline.
+    - write_confirmations(): Writes confirmations next to a result.
+    - read_confirmations(): Reads the confirmations of a result.
+"""
+
+from enum import StrEnum
+from dataclasses import dataclass, asdict
+from pathlib import Path
+import json
+import logging
+import math
+import tempfile
+
+from ccbenchmark.benchmark_framework import Framework, RunOptions
+from ccbenchmark.frameworks.util.metrics import MetricIndices
+from ccbenchmark.name_index import get_names_pattern
+from ccbenchmark.util import METADATA_DIR
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger()
+
+"""p-value of the Mann-Whitney test below which the candidate is significantly slower."""
+SIGNIFICANCE = 0.05
+"""Fraction of the threshold the re-runs must still be slower by to confirm a regression."""
+CONFIRM_FRACTION = 0.5
+"""Rounds of baseline and candidate runs."""
+CONFIRM_ROUNDS = 5
+"""Repetitions of each benchmark in every run of a round."""
+CONFIRM_REPETITIONS = 3
+"""Slowdown in percent past which `confirm` re-runs and `bisect` bisects a benchmark, without a 'percent' under 'check' in settings.yaml."""
+CONFIRM_PERCENT = 5.0
+CONFIRMATION_VERSION = 1
+
+class Verdict(StrEnum):
+    """Outcome of confirming a benchmark."""
+    CONFIRMED = 'confirmed'
+    REFUTED = 'refuted'
+    INCONCLUSIVE = 'inconclusive'
+
+@dataclass(slots=True)
+class Confirmation:
+    """Outcome of confirming one benchmark.
+
+    Attributes:
+        baseline_name: Iteration the candidate was confirmed against.
+        verdict: Confirmed, refuted or inconclusive.
+        delta: Δ (%) between the medians of the re-runs, positive is slower.
+        p_value: One-sided Mann-Whitney p-value that the candidate is slower, NaN if unknown.
+        baseline_samples: Samples of the baseline.
+        candidate_samples: Samples of the candidate.
+        interleaved: True if the baseline was re-run, False if its stored samples were used.
+    """
+    baseline_name: str
+    verdict: Verdict
+    delta: float
+    p_value: float
+    baseline_samples: int
+    candidate_samples: int
+    interleaved: bool = True
+
+    def describe(self) -> str:
+        """Verdict and statistics, e.g. 'confirmed: +6.12 % (p = 0.0042, 15/15 samples)'."""
+        statistics = f'{self.baseline_samples}/{self.candidate_samples} samples'
+        if self.p_value == self.p_value:
+            statistics = f'p = {self.p_value:.2g}, {statistics}'
+        if not self.interleaved:
+            statistics += ', stored baseline'
+        return f'{self.verdict}: {self.delta:+.2f} % ({statistics})'
+
+def get_verdict(delta: float, p_value: float, percent: float) -> Verdict:
+    """Verdict for the re-runs of a benchmark that was slower by more than `percent`.
+
+    Args:
+        delta: Δ (%) between the medians of the re-runs.
+        p_value: One-sided p-value that the candidate is slower.
+        percent: Threshold the benchmark exceeded.
+    """
+    if delta != delta:
+        return Verdict.INCONCLUSIVE
+    if delta < CONFIRM_FRACTION*percent:
+        return Verdict.REFUTED
+    if p_value < SIGNIFICANCE:
+        return Verdict.CONFIRMED
+    return Verdict.INCONCLUSIVE
+
+def get_name_pattern(names: list[str]) -> str:
+    """Regex matching exactly `names`, passed to the framework's filter."""
+    return get_names_pattern(names)
+
+def _get_samples(parse_result, time_type: int) -> list[float] | None:
+    """Samples of a parse result, every repetition or the single time of a benchmark run once."""
+    samples = parse_result.real_samples if time_type == 0 else parse_result.cpu_samples
+    if samples is not None:
+        return samples
+    if parse_result.metric_index == MetricIndices.Time.value:
+        time = parse_result.real_time if time_type == 0 else parse_result.cpu_time
+        if time.time_value is not None:
+            return [time.time_value]
+    return None
+
+def run_rounds(
+    framework: Framework,
+    candidate_runnable: Path,
+    baseline_runnable: Path | None,
+    output_format: str,
+    names: list[str],
+    rounds: int,
+    repetitions: int,
+    time_type: int,
+    stored_baseline_samples: dict[str, list[float]] | None = None
+) -> dict[str, tuple[float, float, int, int]]:
+    """Re-runs benchmarks of a runnable, interleaved with the baseline runnable.
+
+    Args:
+        framework: Framework that runs and parses the runnables.
+        candidate_runnable: Runnable of the candidate.
+        baseline_runnable: Same runnable built from the baseline, None to use `stored_baseline_samples`.
+        output_format: Format the framework writes.
+        names: Benchmarks re-run.
+        rounds: Rounds of baseline and candidate runs.
+        repetitions: Repetitions of each benchmark in every run.
+        time_type: `TimeType` of the samples.
+        stored_baseline_samples: Samples of the baseline in ns by name, used without a baseline runnable.
+
+    Returns:
+        dict[str, tuple[float, float, int, int]]: (Δ%, p-value, baseline samples, candidate samples)
+        by name, see `Manager.compare_samples`.
+    """
+    from ccbenchmark._ccbenchmark import Manager
+
+    manager = Manager()
+    name_indices = {name: benchmark_index for benchmark_index, name in enumerate(names)}
+    # Iteration 2*round is the baseline of a round, 2*round + 1 the candidate.
+    for _ in names:
+        manager.emplace(len(MetricIndices), 2*rounds, 'ns')
+    if baseline_runnable is None:
+        for name, samples in (stored_baseline_samples or {}).items():
+            if name in name_indices:
+                manager.set_samples(name_indices[name], 0, samples, 'ns')
+
+    run_options = RunOptions(get_name_pattern(names), repetitions)
+    with tempfile.TemporaryDirectory(prefix='ccbenchmark_confirm_') as output_dir:
+        for round_index in range(rounds):
+            sides = [(0, baseline_runnable), (1, candidate_runnable)]
+            if round_index % 2 == 1:
+                sides.reverse()
+            for side, runnable in sides:
+                if runnable is None:
+                    continue
+                output_location = Path(output_dir) / f'{round_index}_{side}.{output_format}'
+                result = framework.run_single_benchmark(runnable, output_location, output_format, run_options)
+                if result != 0:
+                    logger.warning(f'{runnable}: Exited with code: {result}')
+                if not output_location.is_file():
+                    continue
+                with open(output_location, 'r', encoding='locale') as file_stream:
+                    for parse_result in framework.parse(file_stream, output_location):
+                        benchmark_index = name_indices.get(parse_result.name)
+                        samples = _get_samples(parse_result, time_type)
+                        if benchmark_index is None or samples is None:
+                            continue
+                        time = parse_result.real_time if time_type == 0 else parse_result.cpu_time
+                        manager.set_samples(benchmark_index, 2*round_index + side, samples, time.time_unit or 'ns')
+
+    baseline_indices = [2*round_index for round_index in range(rounds)]
+    candidate_indices = [2*round_index + 1 for round_index in range(rounds)]
+    comparisons = manager.compare_samples(baseline_indices, candidate_indices)
+    return dict(zip(names, comparisons))
+
+def get_confirmation_path(result_path: Path) -> Path:
+    """Confirmation file of a result file, which may not exist."""
+    return result_path.parent / METADATA_DIR / f"{result_path.name.split('.')[0]}.confirm.json"
+
+def write_confirmations(result_path: Path, confirmations: dict[str, Confirmation], rounds: int, repetitions: int) -> Path:
+    """Writes confirmations next to a result, keeping the ones of other benchmarks against the same baseline.
+
+    Args:
+        result_path: Result file of the candidate.
+        confirmations: Confirmation by benchmark name.
+        rounds: Rounds that were run.
+        repetitions: Repetitions of each run.
+
+    Returns:
+        Path: File written.
+    """
+    benchmarks = {name: confirmation for name, confirmation in read_confirmations(result_path).items()}
+    baseline_names = {confirmation.baseline_name for confirmation in confirmations.values()}
+    benchmarks = {
+        name: confirmation for name, confirmation in benchmarks.items() if confirmation.baseline_name in baseline_names
+    }
+    benchmarks.update(confirmations)
+
+    def to_json(confirmation: Confirmation) -> dict:
+        entry = asdict(confirmation)
+        entry['p_value'] = confirmation.p_value if math.isfinite(confirmation.p_value) else None
+        entry['delta'] = confirmation.delta if math.isfinite(confirmation.delta) else None
+        return entry
+    record = {
+        'version': CONFIRMATION_VERSION,
+        'result_mtime': result_path.stat().st_mtime if result_path.is_file() else None,
+        'rounds': rounds,
+        'repetitions': repetitions,
+        'benchmarks': {name: to_json(confirmation) for name, confirmation in benchmarks.items()}
+    }
+    confirmation_path = get_confirmation_path(result_path)
+    confirmation_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(confirmation_path, 'w', encoding='utf-8') as file:
+        json.dump(record, file, indent=1, ensure_ascii=False)
+    return confirmation_path
+
+def read_confirmations(result_path: Path) -> dict[str, Confirmation]:
+    """Reads the confirmations of a result file.
+
+    Returns:
+        dict[str, Confirmation]: Confirmation by benchmark name, empty if none were
+        written, they can not be read, or the result was replaced since.
+    """
+    try:
+        with open(get_confirmation_path(result_path), 'r', encoding='utf-8') as file:
+            record = json.load(file)
+        if record.get('result_mtime') != result_path.stat().st_mtime:
+            return {}
+        return {
+            name: Confirmation(
+                str(entry['baseline_name']), Verdict(entry['verdict']),
+                math.nan if entry['delta'] is None else float(entry['delta']),
+                math.nan if entry['p_value'] is None else float(entry['p_value']),
+                int(entry['baseline_samples']), int(entry['candidate_samples']), bool(entry.get('interleaved', True))
+            )
+            for name, entry in record['benchmarks'].items()
+        }
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return {}
@@ -0,0 +1,641 @@
+"""Runs runnables on other hosts with `ccbenchmark worker`.
+
+A worker serves one runnable at a time on a TCP port. A coordinator
+(`ccbenchmark run --workers`) connects to every worker and sends each the next
+runnable of a shared queue, so identical hosts run the runnables of a run in
+parallel. Runnables are found on the worker by their path relative to the
+workspace, under the worker's root, so every host needs the same build.
+
+Every message is a 4-byte big-endian length followed by a UTF-8 JSON object:
+
+- coordinator: `{'type': 'hello', 'version', 'token'}`, then per runnable
+  `{'type': 'run', 'framework', 'output_format', 'runnable', 'options', 'telemetry'}`.
+- worker: `{'type': 'hello', 'version', 'host'}`, then per runnable
+  `{'type': 'heartbeat'}` every `HEARTBEAT_INTERVAL` seconds while it runs and
+  `{'type': 'result', 'exit_code', 'seconds', 'timed_out', 'result_count',
+  'stderr_tail', 'under_load', 'files'}`, or `{'type': 'error', 'message'}`.
+
+`files` holds every file the runnable wrote (its result and its
+`.ccbenchmark` log, telemetry and stable-run metadata) by relative path,
+base64-encoded. The coordinator writes them into the `_iter_<name>` directory
+of the runnable, together with `.ccbenchmark/<runnable>.worker.json` recording
+the host it ran on.
+
+A worker only listens on a non-loopback address with a token, and reads at
+most `HELLO_MESSAGE_SIZE` bytes of a coordinator before checking it. It runs
+runnables with the environment variables and arguments of a coordinator's run
+profile only if it was started allowing them, and never with variables that
+choose what it loads or executes (`LD_*`, `DYLD_*`, `PYTHON*`, `PATH`).
+
+A worker that disconnects, stops sending heartbeats or can not run a runnable
+has the runnable re-queued, for any worker, up to `MAX_ATTEMPTS` times. The
+coordinator reconnects to it up to `RECONNECT_ATTEMPTS` times before it stops
+using it.
+
+Defines:
+    - RemoteJob: Runnable sent to a worker.
+    - RemoteOutcome: How a runnable exited on a worker.
+    - Worker: TCP server running runnables for coordinators.
+    - WorkerPool: Sends runnables to workers and collects their results.
+    - parse_address(): Parses a worker address.
+    - is_loopback(): Whether a worker address is only reachable from its host.
+    - send_message(): Sends a message.
+    - receive_message(): Receives a message.
+    - read_worker_record(): Reads the host a result ran on.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Generator
+import base64
+import hmac
+import ipaddress
+import json
+import logging
+import os
+import platform
+import queue
+import socket
+import socketserver
+import struct
+import tempfile
+import threading
+import time
+
+from ccbenchmark.benchmark_framework import Framework, RunOptions, import_framework
+from ccbenchmark.runner import RunOutcome, run_runnable
+from ccbenchmark.util import METADATA_DIR
+
+if TYPE_CHECKING:
+    from ccbenchmark.stable_run import StableRun
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger()
+
+PROTOCOL_VERSION = 1
+DEFAULT_PORT = 7301
+"""Seconds between heartbeats of a worker running a runnable."""
+HEARTBEAT_INTERVAL = 5.0
+"""Seconds without a message after which a worker is considered lost."""
+RECEIVE_TIMEOUT = 4*HEARTBEAT_INTERVAL
+"""Seconds to wait for a connection to a worker."""
+CONNECT_TIMEOUT = 10.0
+"""Times a runnable is sent to a worker before it is given up on."""
+MAX_ATTEMPTS = 3
+"""Times the coordinator tries to connect to a worker before it stops using it."""
+RECONNECT_ATTEMPTS = 3
+"""Largest message accepted, results are sent in one message."""
+MAX_MESSAGE_SIZE = 1024*1024*1024
+"""Largest hello accepted, before the token is checked anyone can send one."""
+HELLO_MESSAGE_SIZE = 4*1024
+WORKER_RECORD_VERSION = 1
+"""Prefixes of environment variables coordinators can never set, they choose what the runnable loads."""
+DENIED_ENV_PREFIXES = ('LD_', 'DYLD_', 'PYTHON')
+"""Environment variables coordinators can never set, they choose what the runnable executes."""
+DENIED_ENV_NAMES = {'PATH', 'BASH_ENV', 'ENV'}
+
+def parse_address(text: str) -> tuple[str, int]:
+    """Parses a worker address, e.g. 'bench-2:7301', 'bench-2' (default port) or '[::1]:7301'.
+
+    Raises:
+        ValueError: The port is not a number.
+    """
+    text = text.strip()
+    if text.startswith('['):
+        host, _, port = text[1:].partition(']')
+        port = port.removeprefix(':')
+    elif text.count(':') == 1:
+        host, _, port = text.partition(':')
+    else:
+        host, port = text, ''
+    try:
+        return host, int(port) if port != '' else DEFAULT_PORT
+    except ValueError:
+        raise ValueError(f"Invalid worker address '{text}', expected <host>[:<port>]") from None
+
+def send_message(connection: socket.socket, message: dict) -> None:
+    """Sends a message, a 4-byte big-endian length followed by JSON."""
+    data = json.dumps(message, ensure_ascii=False).encode('utf-8')
+    connection.sendall(struct.pack('>I', len(data)) + data)
+
+def _receive_exactly(connection: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size > 0:
+        chunk = connection.recv(min(size, 1024*1024))
+        if len(chunk) == 0:
+            raise ConnectionError('Connection closed')
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+def receive_message(connection: socket.socket, max_size: int = MAX_MESSAGE_SIZE) -> dict:
+    """Receives a message sent by `send_message`.
+
+    Args:
+        connection: Connected socket.
+        max_size: Largest message in bytes, larger ones are refused before they are read.
+
+    Raises:
+        ConnectionError: The connection was closed or the message is invalid.
+        TimeoutError: The socket timeout passed without a message.
+    """
+    (size,) = struct.unpack('>I', _receive_exactly(connection, 4))
+    if size > max_size:
+        raise ConnectionError(f'Message of {size} bytes is too large')
+    try:
+        message = json.loads(_receive_exactly(connection, size).decode('utf-8'))
+    except ValueError as error:
+        raise ConnectionError(f'Invalid message: {error}') from error
+    if not isinstance(message, dict):
+        raise ConnectionError('Invalid message: not an object')
+    return message
+
+def is_loopback(host: str) -> bool:
+    """True if a worker listening on `host` can only be reached from its own host."""
+    if host == 'localhost':
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+def _options_to_json(run_options: RunOptions) -> dict:
+    return asdict(run_options)
+
+def _get_optional(value: dict, key: str, value_type: type | tuple[type, ...]):
+    option = value.get(key)
+    if option is not None and (not isinstance(option, value_type) or isinstance(option, bool)):
+        raise ValueError(f"Invalid option '{key}': {option!r}")
+    return option
+
+def _options_from_json(value: dict, allowed_env: set[str], allowed_args: set[str]) -> RunOptions:
+    """Options of a run message, refusing what the worker does not allow.
+
+    Args:
+        value: Options sent by the coordinator.
+        allowed_env: Environment variables the runnable may be given.
+        allowed_args: Options (e.g., '--benchmark_enable_random_interleaving') that may be
+            appended to its command line, as `--name` or `--name=value`.
+
+    Raises:
+        ValueError: An option has the wrong type, or sets an environment variable or
+            an argument that is not allowed.
+    """
+    env = value.get('env') or {}
+    extra_args = value.get('extra_args') or []
+    if not isinstance(env, dict) or not isinstance(extra_args, list):
+        raise ValueError('Invalid options')
+    for name, env_value in env.items():
+        if not isinstance(env_value, str):
+            raise ValueError(f"Invalid value of environment variable '{name}'")
+        if name.startswith(DENIED_ENV_PREFIXES) or name in DENIED_ENV_NAMES:
+            raise ValueError(f"Environment variable '{name}' can not be set by coordinators")
+        if name not in allowed_env:
+            raise ValueError(f"Environment variable '{name}' is not allowed, start the worker with --allow_env {name}")
+    for arg in extra_args:
+        if not isinstance(arg, str) or not arg.startswith('-'):
+            raise ValueError(f'Invalid argument {arg!r}, only options are allowed')
+        name = arg.split('=', 1)[0]
+        if name not in allowed_args:
+            raise ValueError(f"Argument '{name}' is not allowed, start the worker with --allow_arg={name}")
+    return RunOptions(
+        _get_optional(value, 'benchmark_filter', str), _get_optional(value, 'repetitions', int),
+        _get_optional(value, 'min_time', (int, float)), list(extra_args), dict(env),
+        _get_optional(value, 'timeout', (int, float))
+    )
+
+def _get_workspace_path(runnable_path: Path) -> str:
+    """Path of a runnable sent to workers, relative to the workspace if it is inside it."""
+    if runnable_path.is_absolute():
+        try:
+            return runnable_path.relative_to(Path.cwd()).as_posix()
+        except ValueError:
+            return runnable_path.as_posix()
+    return runnable_path.as_posix()
+
+def _is_relative_inside(relative_path: str) -> bool:
+    """True if a relative path sent over the network stays inside the directory it is joined to."""
+    path = Path(relative_path)
+    return not path.is_absolute() and '..' not in path.parts and relative_path != ''
+
+class _WorkerHandler(socketserver.BaseRequestHandler):
+    server: 'Worker'
+
+    def handle(self) -> None:
+        address = f'{self.client_address[0]}:{self.client_address[1]}'
+        self.request.settimeout(RECEIVE_TIMEOUT)
+        try:
+            hello = receive_message(self.request, HELLO_MESSAGE_SIZE)
+            if hello.get('type') != 'hello' or hello.get('version') != PROTOCOL_VERSION:
+                send_message(self.request, {'type': 'error', 'message': f'Expected protocol version {PROTOCOL_VERSION}'})
+                return
+            # compare_digest only takes ASCII strings, a token sent by anyone may not be.
+            token = str(hello.get('token') or '').encode('utf-8')
+            if self.server.token is not None and not hmac.compare_digest(token, self.server.token.encode('utf-8')):
+                logger.warning(f'{address}: Rejected, invalid token')
+                send_message(self.request, {'type': 'error', 'message': 'Invalid token'})
+                return
+            send_message(self.request, {'type': 'hello', 'version': PROTOCOL_VERSION, 'host': self.server.host_name})
+            logger.info(f'{address}: Connected')
+            # Coordinators may wait for runnables of other workers for long, only runs time out.
+            self.request.settimeout(None)
+            while True:
+                message = receive_message(self.request)
+                if message.get('type') != 'run':
+                    send_message(self.request, {'type': 'error', 'message': f"Unexpected message '{message.get('type')}'"})
+                    continue
+                send_message(self.request, self.server.run_with_heartbeats(self.request, message))
+        except (ConnectionError, TimeoutError, OSError) as error:
+            logger.info(f'{address}: Disconnected ({error})')
+
+class Worker(socketserver.ThreadingTCPServer):
+    """TCP server running runnables for coordinators, one runnable at a time.
+
+    Example:
+        >>> with Worker(('127.0.0.1', 7301), Path('.')) as worker:
+        ...     worker.serve_forever()
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(
+        self, address: tuple[str, int], root: Path, token: str | None = None, stable_run: 'StableRun | None' = None,
+        allowed_env: set[str] | None = None, allowed_args: set[str] | None = None
+    ):
+        """
+        Args:
+            address: Host and port to listen on, port 0 picks a free port.
+            root: Directory runnable paths are relative to, runnables outside of it are refused.
+            token: Token coordinators must send, any coordinator is accepted if None,
+                which is only allowed on a loopback address.
+            stable_run: Stable-run mode applied to this process, recorded next to each result.
+            allowed_env: Environment variables coordinators may set, none if None.
+            allowed_args: Options coordinators may append to command lines, none if None.
+
+        Raises:
+            ValueError: No token was given for a non-loopback address.
+        """
+        if token is None and not is_loopback(address[0]):
+            raise ValueError(f'A token is required to listen on {address[0]}, which other hosts can reach')
+        super().__init__(address, _WorkerHandler)
+        self.root = Path(os.path.realpath(root))
+        self.token = token
+        self.allowed_env = allowed_env or set()
+        self.allowed_args = allowed_args or set()
+        self.stable_run = stable_run
+        self.host_name = platform.node() or 'localhost'
+        # Runnables of concurrent coordinators would disturb each other's timings.
+        self._run_lock = threading.Lock()
+
+    def run_with_heartbeats(self, connection: socket.socket, message: dict) -> dict:
+        """Runs a runnable, sending heartbeats while it waits for its turn and runs.
+
+        Returns:
+            dict: Result message, or an error message if it could not be run.
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self._run_locked, message)
+            while True:
+                try:
+                    return future.result(timeout=HEARTBEAT_INTERVAL)
+                except FutureTimeoutError:
+                    send_message(connection, {'type': 'heartbeat'})
+
+    def _run_locked(self, message: dict) -> dict:
+        with self._run_lock:
+            try:
+                return self.run(message)
+            except Exception as error:
+                logger.error(f"{message.get('runnable')}: Could not run: {error}")
+                return {'type': 'error', 'message': f'{type(error).__name__}: {error}'}
+
+    def resolve_runnable(self, runnable: str) -> Path:
+        """Path of a runnable sent by a coordinator.
+
+        Raises:
+            ValueError: The runnable is outside of the root or does not exist.
+        """
+        runnable_path = Path(os.path.realpath(self.root / runnable))
+        if not runnable_path.is_relative_to(self.root):
+            raise ValueError(f'{runnable} is outside of {self.root}')
+        if not runnable_path.is_file():
+            raise ValueError(f'{runnable} does not exist in {self.root}')
+        return self.root / runnable
+
+    def run(self, message: dict) -> dict:
+        """Runs the runnable of a run message, in a temporary directory.
+
+        Returns:
+            dict: Result message with every file the runnable wrote.
+        """
+        from ccbenchmark.telemetry import TelemetrySampler
+
+        runnable_path = self.resolve_runnable(str(message['runnable']))
+        output_format = str(message['output_format'])
+        framework = import_framework(str(message['framework']), output_format)
+        run_options = _options_from_json(message.get('options') or {}, self.allowed_env, self.allowed_args)
+        benchmark_name = runnable_path.with_suffix('').name
+        logger.info(f'Running benchmark: {benchmark_name}')
+
+        with tempfile.TemporaryDirectory(prefix='ccbenchmark_worker_') as output_dir:
+            output_path = Path(output_dir)
+            output_location = output_path / f'{benchmark_name}.{output_format}'
+            stable_record = self.stable_run.before_runnable() if self.stable_run is not None else None
+            sampler = TelemetrySampler() if message.get('telemetry', True) else None
+            if sampler is not None:
+                sampler.start()
+            try:
+                outcome = run_runnable(
+                    framework, runnable_path, output_location, output_format, run_options,
+                    output_path / METADATA_DIR / f'{benchmark_name}.log'
+                )
+            finally:
+                if sampler is not None:
+                    sampler.stop()
+            under_load = None
+            if sampler is not None:
+                sampler.write(output_path, benchmark_name)
+                if sampler.summary.under_load:
+                    under_load = sampler.summary.describe()
+            if self.stable_run is not None:
+                self.stable_run.write_metadata(output_path, benchmark_name, stable_record)
+
+            files = {
+                file_path.relative_to(output_path).as_posix(): base64.b64encode(file_path.read_bytes()).decode('ascii')
+                for file_path in output_path.rglob('*') if file_path.is_file()
+            }
+        logger.info(f'{benchmark_name}: Exited with code {outcome.exit_code} ({outcome.seconds:.1f} s)')
+        return {
+            'type': 'result',
+            'exit_code': outcome.exit_code,
+            'seconds': outcome.seconds,
+            'timed_out': outcome.timed_out,
+            'result_count': outcome.result_count,
+            'stderr_tail': outcome.stderr_tail,
+            'under_load': under_load,
+            'files': files
+        }
+
+@dataclass(slots=True)
+class RemoteJob:
+    """Runnable sent to a worker.
+
+    Attributes:
+        runnable_path: Runnable, as found in the workspace.
+        output_path: Iteration directory its result is written to.
+        run_options: Options it runs with.
+        attempts: Times it was sent to a worker.
+        errors: Why earlier attempts failed.
+    """
+    runnable_path: Path
+    output_path: Path
+    run_options: RunOptions
+    attempts: int = 0
+    errors: list[str] = field(default_factory=lambda: [])
+
+@dataclass(slots=True)
+class RemoteOutcome:
+    """How a runnable exited on a worker.
+
+    Attributes:
+        outcome: Exit code, time and stderr of the runnable.
+        host: Host name the worker reported.
+        address: Address the worker was reached at.
+        under_load: Description of the load on the worker, None if it was not under load.
+    """
+    outcome: RunOutcome
+    host: str
+    address: str
+    under_load: str | None = None
+
+def get_worker_record_path(output_path: Path, benchmark_name: str) -> Path:
+    """File recording the worker a result ran on, which may not exist."""
+    return output_path / METADATA_DIR / f'{benchmark_name}.worker.json'
+
+def read_worker_record(output_path: Path, benchmark_name: str) -> dict | None:
+    """Reads the worker record of a result, None if it ran locally or the record is invalid."""
+    try:
+        with open(get_worker_record_path(output_path, benchmark_name), 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+class _WorkerConnection:
+    """Connection of the coordinator to one worker."""
+    def __init__(self, address: tuple[str, int], token: str | None):
+        self.address = address
+        self.name = f'{address[0]}:{address[1]}'
+        self.token = token
+        self.host = self.name
+        self.connection: socket.socket | None = None
+
+    def connect(self) -> None:
+        """Connects and exchanges hellos.
+
+        Raises:
+            OSError: The worker can not be reached or refused the connection.
+        """
+        self.close()
+        connection = socket.create_connection(self.address, timeout=CONNECT_TIMEOUT)
+        try:
+            connection.settimeout(RECEIVE_TIMEOUT)
+            send_message(connection, {'type': 'hello', 'version': PROTOCOL_VERSION, 'token': self.token})
+            hello = receive_message(connection, HELLO_MESSAGE_SIZE)
+            if hello.get('type') != 'hello':
+                raise ConnectionRefusedError(hello.get('message', 'Unexpected reply'))
+        except BaseException:
+            connection.close()
+            raise
+        self.host = str(hello.get('host') or self.name)
+        self.connection = connection
+
+    def close(self) -> None:
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def run(self, framework_name: str, output_format: str, job: RemoteJob, telemetry: bool) -> dict:
+        """Sends a runnable and waits for its result, heartbeats reset the timeout.
+
+        Raises:
+            OSError: The connection was lost or the worker stopped sending heartbeats.
+        """
+        send_message(self.connection, {
+            'type': 'run',
+            'framework': framework_name,
+            'output_format': output_format,
+            'runnable': _get_workspace_path(job.runnable_path),
+            'options': _options_to_json(job.run_options),
+            'telemetry': telemetry
+        })
+        while True:
+            message = receive_message(self.connection)
+            if message.get('type') != 'heartbeat':
+                return message
+
+class WorkerPool:
+    """Sends runnables to workers and collects their results.
+
+    Example:
+        >>> pool = WorkerPool([('bench-1', 7301), ('bench-2', 7301)], token='secret')
+        >>> for job, remote_outcome in pool.run(framework, 'json', jobs):
+        ...     print(job.runnable_path, remote_outcome.host if remote_outcome else 'failed')
+    """
+    def __init__(self, addresses: list[tuple[str, int]], token: str | None = None, max_attempts: int = MAX_ATTEMPTS):
+        self.addresses = addresses
+        self.token = token
+        self.max_attempts = max_attempts
+
+    def run(
+        self, framework: Framework, output_format: str, jobs: list[RemoteJob], telemetry: bool = True
+    ) -> Generator[tuple[RemoteJob, RemoteOutcome | None], None, None]:
+        """Runs runnables on the workers in parallel, writing their files into their output paths.
+
+        Args:
+            framework: Framework of the runnables, which workers import by name.
+            output_format: Format of the results.
+            jobs: Runnables to run, found on the workers by their path relative to the workspace.
+            telemetry: Sample telemetry on the workers while runnables run.
+
+        Yields:
+            tuple[RemoteJob, RemoteOutcome | None]: Each runnable as it finishes, with
+            None if it failed on every attempt or no worker was left to run it.
+        """
+        framework_name = framework.__name__.removeprefix('ccbenchmark.frameworks.')
+        pending: queue.Queue[RemoteJob] = queue.Queue()
+        for job in jobs:
+            pending.put(job)
+        finished: queue.Queue[tuple[RemoteJob, dict | None, _WorkerConnection | None]] = queue.Queue()
+        remaining = len(jobs)
+        lock = threading.Lock()
+        # Runnables not yet finished or given up on, and workers still in use.
+        state = {'remaining': remaining, 'live': len(self.addresses)}
+
+        def serve(worker: _WorkerConnection) -> None:
+            try:
+                self._serve(worker, framework_name, output_format, telemetry, pending, finished, lock, state)
+            finally:
+                worker.close()
+                with lock:
+                    state['live'] -= 1
+
+        threads = [
+            threading.Thread(target=serve, args=(_WorkerConnection(address, self.token),), daemon=True)
+            for address in self.addresses
+        ]
+        for thread in threads:
+            thread.start()
+
+        while remaining > 0:
+            try:
+                job, message, worker = finished.get(timeout=1.0)
+            except queue.Empty:
+                with lock:
+                    live = state['live']
+                if live > 0 or not finished.empty():
+                    continue
+                # Every worker was lost, the runnables left can not run.
+                while remaining > 0:
+                    try:
+                        job = pending.get_nowait()
+                    except queue.Empty:
+                        break
+                    job.errors.append('No worker left')
+                    remaining -= 1
+                    yield job, None
+                break
+            remaining -= 1
+            if message is None:
+                yield job, None
+                continue
+            yield job, self._write_result(job, message, worker)
+        for thread in threads:
+            thread.join(timeout=1.0)
+
+    def _serve(
+        self, worker: _WorkerConnection, framework_name: str, output_format: str, telemetry: bool,
+        pending: 'queue.Queue[RemoteJob]', finished: queue.Queue, lock: threading.Lock, state: dict
+    ) -> None:
+        """Runs runnables from `pending` on one worker until none are left or it is lost."""
+        failed_connects = 0
+        while True:
+            with lock:
+                if state['remaining'] == 0:
+                    return
+            if worker.connection is None:
+                try:
+                    worker.connect()
+                    failed_connects = 0
+                    logger.info(f'{worker.name}: Connected to worker {worker.host}')
+                except OSError as error:
+                    failed_connects += 1
+                    if failed_connects >= RECONNECT_ATTEMPTS:
+                        logger.error(f'{worker.name}: Could not connect to worker, no longer using it ({error})')
+                        return
+                    logger.warning(f'{worker.name}: Could not connect to worker, retrying ({error})')
+                    time.sleep(failed_connects*1.0)
+                    continue
+            try:
+                job = pending.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            job.attempts += 1
+            try:
+                message = worker.run(framework_name, output_format, job, telemetry)
+            except OSError as error:
+                worker.close()
+                self._retry(job, f'{worker.name}: Connection lost ({error})', pending, finished, lock, state)
+                continue
+            if message.get('type') == 'error':
+                self._retry(job, f"{worker.host}: {message.get('message')}", pending, finished, lock, state)
+                continue
+            with lock:
+                state['remaining'] -= 1
+            finished.put((job, message, worker))
+
+    def _retry(
+        self, job: RemoteJob, error: str, pending: 'queue.Queue[RemoteJob]', finished: queue.Queue,
+        lock: threading.Lock, state: dict
+    ) -> None:
+        job.errors.append(error)
+        if job.attempts < self.max_attempts:
+            logger.warning(f'{job.runnable_path}: {error}, retrying ({job.attempts}/{self.max_attempts})')
+            pending.put(job)
+            return
+        logger.error(f'{job.runnable_path}: {error}, giving up after {job.attempts} attempts')
+        with lock:
+            state['remaining'] -= 1
+        finished.put((job, None, None))
+
+    def _write_result(self, job: RemoteJob, message: dict, worker: _WorkerConnection) -> RemoteOutcome:
+        """Writes the files of a result message into the job's output path, with the worker record."""
+        benchmark_name = job.runnable_path.with_suffix('').name
+        job.output_path.mkdir(parents=True, exist_ok=True)
+        for relative_path, data in message.get('files', {}).items():
+            if not _is_relative_inside(relative_path):
+                logger.warning(f'{worker.name}: Ignored file outside of the iteration: {relative_path}')
+                continue
+            file_path = job.output_path / relative_path
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_bytes(base64.b64decode(data))
+
+        outcome = RunOutcome(
+            int(message.get('exit_code', -1)), float(message.get('seconds', 0.0)), bool(message.get('timed_out', False)),
+            int(message.get('result_count', 0)), [str(line) for line in message.get('stderr_tail', [])]
+        )
+        record = {
+            'version': WORKER_RECORD_VERSION,
+            'host': worker.host,
+            'address': worker.name,
+            'attempts': job.attempts,
+            'errors': job.errors,
+            'exit_code': outcome.exit_code,
+            'seconds': round(outcome.seconds, 3),
+            'timed_out': outcome.timed_out
+        }
+        record_path = get_worker_record_path(job.output_path, benchmark_name)
+        record_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(record_path, 'w', encoding='utf-8') as file:
+            json.dump(record, file, indent=1, ensure_ascii=False)
+        return RemoteOutcome(outcome, worker.host, worker.name, message.get('under_load'))
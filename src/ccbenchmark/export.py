@@ -0,0 +1,205 @@
+"""Export of every loaded result.
+
+Streams one row per benchmark, iteration and metric, with its real and CPU time,
+as CSV, NDJSON or Parquet. Values are read from the Rust Manager one benchmark at
+a time and written in batches, so memory does not grow with the size of the export.
+
+Defines:
+    - ExportFormat: Supported export formats.
+    - ExportRow: Values of one benchmark, iteration and metric.
+    - iter_rows(): Reads rows from BenchmarkData.
+    - export_benchmark_data(): Writes rows to a file, reporting progress.
+"""
+
+from enum import StrEnum
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Generator, TextIO
+import csv
+import json
+import sys
+
+from ccbenchmark.benchmark_data import BenchmarkData, TimeType
+from ccbenchmark.frameworks.util.metrics import METRICS, MetricIndices
+
+"""Metrics stored in percent, the rest are in ns."""
+PERCENT_METRICS = {MetricIndices.CV.value, MetricIndices.RMS.value}
+COLUMNS = ['path', 'benchmark', 'iteration', 'metric', 'unit', 'real_time', 'cpu_time']
+
+class ExportFormat(StrEnum):
+    """Export formats supported by ccbenchmark"""
+    CSV = 'csv'
+    NDJSON = 'ndjson'
+    PARQUET = 'parquet'
+
+@dataclass(slots=True)
+class ExportRow:
+    """Values of one benchmark, iteration and metric.
+
+    Attributes:
+        path: Path of the runnable the benchmark belongs to.
+        benchmark: Name of the benchmark.
+        iteration: Name of the iteration.
+        metric: Name of the metric (e.g., 'Time', 'μ').
+        unit: 'ns', or '%' for CV and RMS.
+        real_time: Real time value, NaN if the iteration has none.
+        cpu_time: CPU time value, NaN if the iteration has none.
+    """
+    path: str
+    benchmark: str
+    iteration: str
+    metric: str
+    unit: str
+    real_time: float
+    cpu_time: float
+
+def iter_rows(benchmark_data: BenchmarkData, benchmark_indices: list[int] | None = None) -> Generator[ExportRow, None, None]:
+    """Reads every cell that has a real or CPU time.
+
+    Args:
+        benchmark_data: Loaded benchmark data.
+        benchmark_indices: Benchmarks exported, every benchmark if None.
+
+    Returns:
+        Generator[ExportRow]: Rows by benchmark, then metric, then iteration.
+    """
+    if benchmark_indices is None:
+        benchmark_indices = range(len(benchmark_data.benchmark_names))
+    real_manager = benchmark_data.benchmark_types[TimeType.REAL]
+    cpu_manager = benchmark_data.benchmark_types[TimeType.CPU]
+    for benchmark_index in benchmark_indices:
+        path = benchmark_data.benchmark_paths[benchmark_index].as_posix()
+        name = benchmark_data.benchmark_names[benchmark_index]
+        for metric_index, metric_name in enumerate(METRICS):
+            unit = '%' if metric_index in PERCENT_METRICS else 'ns'
+            real_times = real_manager.get_values(benchmark_index, metric_index, 'ns')
+            cpu_times = cpu_manager.get_values(benchmark_index, metric_index, 'ns')
+            for iteration_name, real_time, cpu_time in zip(benchmark_data.iteration_names, real_times, cpu_times):
+                if real_time != real_time and cpu_time != cpu_time:
+                    continue
+                yield ExportRow(path, name, iteration_name, metric_name, unit, real_time, cpu_time)
+
+def _finite_or_none(value: float) -> float | None:
+    return value if value == value else None
+
+class _ExportWriter:
+    """Writes batches of rows to a file."""
+    def __init__(self, output_path: Path | None):
+        self.output_path = output_path
+
+    def write_rows(self, rows: list[ExportRow]) -> None: ...
+    def close(self) -> None: ...
+
+class _TextExportWriter(_ExportWriter):
+    def __init__(self, output_path: Path | None):
+        super().__init__(output_path)
+        self.stream: TextIO = sys.stdout if output_path is None else open(output_path, 'w', encoding='utf-8', newline='')
+
+    def close(self) -> None:
+        if self.stream is not sys.stdout:
+            self.stream.close()
+        else:
+            self.stream.flush()
+
+class _CsvWriter(_TextExportWriter):
+    def __init__(self, output_path: Path | None):
+        super().__init__(output_path)
+        self.writer = csv.writer(self.stream, lineterminator='\n')
+        self.writer.writerow(COLUMNS)
+
+    def write_rows(self, rows: list[ExportRow]) -> None:
+        self.writer.writerows(
+            (row.path, row.benchmark, row.iteration, row.metric, row.unit,
+             '' if row.real_time != row.real_time else row.real_time,
+             '' if row.cpu_time != row.cpu_time else row.cpu_time)
+            for row in rows
+        )
+
+class _NdjsonWriter(_TextExportWriter):
+    def write_rows(self, rows: list[ExportRow]) -> None:
+        self.stream.writelines(
+            json.dumps({
+                'path': row.path, 'benchmark': row.benchmark, 'iteration': row.iteration,
+                'metric': row.metric, 'unit': row.unit,
+                'real_time': _finite_or_none(row.real_time), 'cpu_time': _finite_or_none(row.cpu_time)
+            }, ensure_ascii=False) + '\n'
+            for row in rows
+        )
+
+class _ParquetWriter(_ExportWriter):
+    """Writes each batch as a row group, requires pyarrow."""
+    def __init__(self, output_path: Path | None):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if output_path is None:
+            raise ValueError('Parquet can not be written to stdout, an output file is required.')
+        super().__init__(output_path)
+        self.pa = pa
+        self.schema = pa.schema([(column, pa.string()) for column in COLUMNS[:5]] + [
+            ('real_time', pa.float64()), ('cpu_time', pa.float64())
+        ])
+        self.writer = pq.ParquetWriter(output_path, self.schema)
+
+    def write_rows(self, rows: list[ExportRow]) -> None:
+        columns = [
+            [row.path for row in rows],
+            [row.benchmark for row in rows],
+            [row.iteration for row in rows],
+            [row.metric for row in rows],
+            [row.unit for row in rows],
+            [_finite_or_none(row.real_time) for row in rows],
+            [_finite_or_none(row.cpu_time) for row in rows],
+        ]
+        self.writer.write_batch(self.pa.record_batch(columns, schema=self.schema))
+
+    def close(self) -> None:
+        self.writer.close()
+
+_WRITERS: dict[ExportFormat, type[_ExportWriter]] = {
+    ExportFormat.CSV: _CsvWriter,
+    ExportFormat.NDJSON: _NdjsonWriter,
+    ExportFormat.PARQUET: _ParquetWriter,
+}
+
+def export_benchmark_data(
+    benchmark_data: BenchmarkData,
+    output_path: Path | None,
+    export_format: ExportFormat,
+    benchmark_indices: list[int] | None = None,
+    batch_size: int = 65536
+) -> Generator[int, None, None]:
+    """Writes every cell with a real or CPU time, `batch_size` rows at a time.
+
+    Args:
+        benchmark_data: Loaded benchmark data.
+        output_path: File written to, stdout if None (CSV and NDJSON only).
+        export_format: CSV, NDJSON or Parquet.
+        benchmark_indices: Benchmarks exported, every benchmark if None.
+        batch_size: Rows held in memory before they are written.
+
+    Returns:
+        Generator[int]: Rows written so far, after each batch. The file is only
+        complete once the generator is exhausted, closing it early stops the export.
+
+    Raises:
+        ImportError: Parquet was requested and pyarrow is not installed.
+        ValueError: Parquet was requested without an output file.
+    """
+    writer = _WRITERS[export_format](output_path)
+    row_count = 0
+    try:
+        batch: list[ExportRow] = []
+        for row in iter_rows(benchmark_data, benchmark_indices):
+            batch.append(row)
+            if len(batch) >= batch_size:
+                writer.write_rows(batch)
+                row_count += len(batch)
+                batch = []
+                yield row_count
+        if len(batch) != 0:
+            writer.write_rows(batch)
+            row_count += len(batch)
+        yield row_count
+    finally:
+        writer.close()
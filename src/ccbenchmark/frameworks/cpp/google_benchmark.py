@@ -1,4 +1,4 @@
-from typing import Generator
+from typing import Callable, Generator
 from io import TextIOWrapper
 from pathlib import Path
 from collections.abc import Iterable
@@ -9,24 +9,157 @@ import json
 import csv
 
 from ccbenchmark.benchmark_data import BenchmarkTime, TimeUnit
+from ccbenchmark.benchmark_framework import RunOptions
 from ccbenchmark.frameworks.util.metrics import MetricIndices
 from ccbenchmark.frameworks.util.parse_result import ParseResult
+from ccbenchmark.frameworks.util.benchmark_name import parse_benchmark_name
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger()
 
 SUPPORTED_FORMATS = {'json', 'csv', 'console'}
+"""Repetitions of `--benchmark_repetitions` when none are given."""
+DEFAULT_REPETITIONS = 1
+"""Seconds of `--benchmark_min_time` when none are given."""
+DEFAULT_MIN_TIME = 0.5
+COMPLEXITY_AGGREGATES = {'BigO', 'RMS'}
+"""Seconds a binary may take to list its benchmarks."""
+LIST_TIMEOUT = 60
 
-def run_single_benchmark(binary_path: Path, output_path: Path, output_format: str) -> int:
-    """Runs a single benchmark binary and writes output to the given path."""
+def get_command(binary_path: Path, output_path: Path, output_format: str, run_options: RunOptions) -> list[str]:
+    """Command running a benchmark binary, which writes results to `output_path` and a console table to stdout."""
     cmd = [
         binary_path, 
         f'--benchmark_out={output_path}', 
         f'--benchmark_out_format={output_format}', 
         '--benchmark_report_aggregates_only=false'
     ]
+    if run_options.benchmark_filter is not None:
+        cmd.append(f'--benchmark_filter={run_options.benchmark_filter}')
+    if run_options.repetitions is not None:
+        cmd.append(f'--benchmark_repetitions={run_options.repetitions}')
+    if run_options.min_time is not None:
+        cmd.append(f'--benchmark_min_time={run_options.min_time}s')
+    cmd += run_options.extra_args
+    return cmd
+
+def run_single_benchmark(binary_path: Path, output_path: Path, output_format: str, run_options: RunOptions) -> int:
+    """Runs a single benchmark binary and writes output to the given path."""
+    cmd = get_command(binary_path, output_path, output_format, run_options)
+    return subprocess.call(cmd, stdin=None, stdout=None, stderr=None, shell=False, env=run_options.get_environment())
+
+def list_benchmarks(binary_path: Path, run_options: RunOptions) -> list[str] | None:
+    """Names of the benchmarks the binary runs, None if it could not list them."""
+    try:
+        completed = subprocess.run(
+            [binary_path, '--benchmark_list_tests=true'], capture_output=True, text=True,
+            env=run_options.get_environment(), timeout=LIST_TIMEOUT
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug(f'Could not list the benchmarks of {binary_path}: {e}')
+        return None
+    if completed.returncode != 0:
+        return None
+    return [line.strip() for line in completed.stdout.splitlines() if line.strip() != '']
+
+def get_run_name(raw_name: str) -> str:
+    """Name of the benchmark a row of the csv or console output belongs to, without its aggregate."""
+    complexity_name = split_complexity_name(raw_name)
+    if complexity_name is not None:
+        return complexity_name[0]
+    name, _, aggregate_name = raw_name.rpartition('_')
+    if aggregate_name in {'mean', 'median', 'stddev', 'cv'} and get_repeats(raw_name) > 1:
+        return name
+    return raw_name
+
+def merge_results(output_path: Path, previous_path: Path | None, keep: Callable[[str], bool] | None) -> None:
+    """Rewrites the result of a filtered run.
+
+    Benchmarks whose name `keep` rejects are dropped from the result at
+    `output_path`, then the benchmarks of the result at `previous_path` it does not
+    have are added, with their repetitions and aggregates.
+    """
+    if output_path.suffix == '.json':
+        with open(output_path, 'r', encoding='utf-8') as file_stream:
+            json_contents: dict = json.load(file_stream)
+        previous_benchmarks: list[dict] = []
+        if previous_path is not None:
+            with open(previous_path, 'r', encoding='utf-8') as file_stream:
+                previous_benchmarks = json.load(file_stream).get('benchmarks') or []
+
+        def get_name(benchmark: dict) -> str:
+            return benchmark.get('run_name') or benchmark.get('name') or ''
+
+        benchmarks = [
+            benchmark for benchmark in json_contents.get('benchmarks') or []
+            if keep is None or keep(get_name(benchmark))
+        ]
+        names = {get_name(benchmark) for benchmark in benchmarks}
+        json_contents['benchmarks'] = benchmarks + [
+            benchmark for benchmark in previous_benchmarks if get_name(benchmark) not in names
+        ]
+        with open(output_path, 'w', encoding='utf-8') as file_stream:
+            json.dump(json_contents, file_stream, indent=2)
+        return
 
-    return subprocess.call(cmd, stdin=None, stdout=None, stderr=None, shell=False)
+    if output_path.suffix == '.csv':
+        def read_rows(path: Path) -> tuple[list[list[str]], list[list[str]]]:
+            """Rows before the header row, and the header and benchmark rows."""
+            with open(path, 'r', encoding='utf-8', newline='') as file_stream:
+                rows = list(csv.reader(file_stream))
+            for i, row in enumerate(rows):
+                if len(row) >= 10:
+                    return (rows[:i], rows[i:])
+            return (rows, [])
+
+        def get_name(row: list[str]) -> str:
+            return get_run_name(row[0])
+
+        preamble, rows = read_rows(output_path)
+        header, rows = rows[:1], rows[1:]
+        rows = [row for row in rows if keep is None or keep(get_name(row))]
+        if previous_path is not None:
+            names = {get_name(row) for row in rows}
+            _, previous_rows = read_rows(previous_path)
+            rows += [row for row in previous_rows[1:] if get_name(row) not in names]
+        with open(output_path, 'w', encoding='utf-8', newline='') as file_stream:
+            csv.writer(file_stream).writerows(preamble + header + rows)
+        return
+
+    def read_lines(path: Path) -> tuple[list[str], list[str]]:
+        """Lines up to the second dashed line, which end the table header, and the rows."""
+        with open(path, 'r', encoding='utf-8') as file_stream:
+            lines = file_stream.readlines()
+        dashed_lines = 0
+        for i, line in enumerate(lines):
+            if line.startswith('-'):
+                dashed_lines += 1
+                if dashed_lines == 2:
+                    return (lines[:i + 1], lines[i + 1:])
+        return (lines, [])
+
+    def get_line_name(line: str) -> str:
+        split_line = line.split()
+        return get_run_name(split_line[0]) if len(split_line) != 0 else ''
+
+    header, lines = read_lines(output_path)
+    lines = [line for line in lines if keep is None or keep(get_line_name(line))]
+    if previous_path is not None:
+        names = {get_line_name(line) for line in lines}
+        _, previous_lines = read_lines(previous_path)
+        lines += [line for line in previous_lines if get_line_name(line) not in names]
+    with open(output_path, 'w', encoding='utf-8') as file_stream:
+        file_stream.writelines(header + lines)
+
+def parse_progress_line(line: str) -> ParseResult | None:
+    """Parses a line the binary writes to stdout while it runs, None if it is not a result row."""
+    # The context and the table header are not rows, skipped before parse_console_line warns about them.
+    if line.startswith('-') or len(line.split()) < 4:
+        return None
+    try:
+        return parse_console_line(line)
+    except (SkipBenchmark, ValueError):
+        return None
 
 def parse(file_stream: TextIOWrapper, file_path: Path) -> Generator[ParseResult, None, None]:
     if file_path.suffix == '.json':
@@ -54,6 +187,8 @@ def parse_json(json_contents: dict) -> Generator[ParseResult, None, None]:
         logger.warning(f"Missing 'benchmarks' in JSON file. Failed to add JSON file.")
         return
 
+    # Real and cpu times of each repetition by name, attached to the benchmark's mean.
+    samples: dict[str, tuple[list[float], list[float]]] = {}
     for benchmark in benchmarks:
         def get_value(key: str) -> any:
             try:
@@ -63,6 +198,16 @@ def parse_json(json_contents: dict) -> Generator[ParseResult, None, None]:
                 raise SkipBenchmark()
             return value
         
+        aggregate_name = benchmark.get('aggregate_name')
+
+        if aggregate_name in COMPLEXITY_AGGREGATES:
+            try:
+                result = parse_json_complexity(benchmark, aggregate_name)
+            except SkipBenchmark:
+                continue
+            yield result
+            continue
+
         try:
             name: str = get_value('run_name')
             real_time_value: float = get_value('real_time')
@@ -73,9 +218,10 @@ def parse_json(json_contents: dict) -> Generator[ParseResult, None, None]:
         except SkipBenchmark:
             continue
 
-        aggregate_name = benchmark.get('aggregate_name')
-
         if repetitions > 1 and run_type == 'iteration':
+            real_samples, cpu_samples = samples.setdefault(name, ([], []))
+            real_samples.append(real_time_value)
+            cpu_samples.append(cpu_time_value)
             continue
         if aggregate_name is not None and aggregate_name == 'cv':
             cpu_time_value *= 100.0
@@ -83,8 +229,57 @@ def parse_json(json_contents: dict) -> Generator[ParseResult, None, None]:
         result = create_parse_result(name, real_time_value, cpu_time_value, time_unit, aggregate_name)
         if result is None:
             continue
+        if aggregate_name == 'mean' and name in samples:
+            result.real_samples, result.cpu_samples = samples.pop(name)
         yield result
 
+def parse_json_complexity(benchmark: dict, aggregate_name: str) -> ParseResult:
+    """Creates ParseResult from a `BigO` or `RMS` entry, which have no real_time or cpu_time."""
+    def get_value(key: str) -> any:
+        try:
+            value = benchmark[key]
+        except KeyError:
+            logger.warning(f"Missing '{key}' in JSON file. Failed to add entry.")
+            raise SkipBenchmark()
+        return value
+
+    name: str = get_value('run_name')
+    if aggregate_name == 'BigO':
+        real_coefficient: float = get_value('real_coefficient')
+        cpu_coefficient: float = get_value('cpu_coefficient')
+        time_unit: str = get_value('time_unit')
+        big_o: str = get_value('big_o')
+        return create_parse_result(name, real_coefficient, cpu_coefficient, time_unit, aggregate_name, big_o)
+
+    rms: float = get_value('rms')*100.0
+    return create_parse_result(name, rms, rms, TimeUnit.PERCENTAGE, aggregate_name)
+
+def get_repeats(raw_name: str) -> int:
+    """Gets repetition count from the `repeats:` segment of a benchmark name."""
+    repeats = parse_benchmark_name(raw_name).options.get('repeats')
+    if repeats is None:
+        return 1
+    return int(repeats.split('_')[0])
+
+def split_complexity_name(raw_name: str) -> tuple[str, str] | None:
+    """Splits `BM_Sort_BigO` into ('BM_Sort', 'BigO'), returns None for other names."""
+    name, _, aggregate_name = raw_name.rpartition('_')
+    if aggregate_name not in COMPLEXITY_AGGREGATES or name == '':
+        return None
+    return (name, aggregate_name)
+
+def parse_text_complexity(name: str, aggregate_name: str, real_time_value: float, 
+                          cpu_time_value: float, unit_text: str) -> ParseResult | None:
+    """Creates ParseResult from a `BigO` or `RMS` row of the csv or console output.
+
+    These rows put the complexity (e.g., 'NlgN') or '%' where the time unit normally is.
+    The coefficient is reported in the benchmark's time unit, which the rows omit,
+    so nanoseconds are assumed.
+    """
+    if aggregate_name == 'BigO':
+        return create_parse_result(name, real_time_value, cpu_time_value, TimeUnit.NS, aggregate_name, unit_text)
+    return create_parse_result(name, real_time_value, cpu_time_value, TimeUnit.PERCENTAGE, aggregate_name)
+
 def parse_csv(csv_reader: Iterable[list[str]]) -> Generator[ParseResult, None, None]:
     name_to_index: dict[str, int] = {}
     for row in csv_reader:
@@ -117,15 +312,18 @@ def parse_csv(csv_reader: Iterable[list[str]]) -> Generator[ParseResult, None, N
         except SkipBenchmark:
             continue
 
-        repeats = 1
-        for segment in raw_name.split('/'):
-            key_value_pair = segment.split(':')
-            if len(key_value_pair) <= 1:
-                continue
-            if key_value_pair[0] == 'repeats':
-                repeats = int(key_value_pair[1].split('_')[0])
-                break
-        aggregated = repeats > 1
+        complexity_name = split_complexity_name(raw_name)
+        if complexity_name is not None:
+            name, aggregate_name = complexity_name
+            if aggregate_name == 'RMS':
+                real_time_value *= 100.0
+                cpu_time_value *= 100.0
+            result = parse_text_complexity(name, aggregate_name, real_time_value, cpu_time_value, time_unit)
+            if result is not None:
+                yield result
+            continue
+
+        aggregated = get_repeats(raw_name) > 1
         
         split_raw_name = raw_name.split('_')
         if aggregated and split_raw_name[-1] in {'mean', 'median', 'stddev', 'cv'}:
@@ -147,63 +345,68 @@ def parse_csv(csv_reader: Iterable[list[str]]) -> Generator[ParseResult, None, N
 
 def parse_console(console_contents: TextIOWrapper) -> Generator[ParseResult, None, None]:
     dashed_lines = 0
-    name_to_index: dict[str, int] = {'name': 0, 'real_time': 1, 'time_unit': 2, 'cpu_time': 3}
     for line in console_contents:
         if dashed_lines < 2:
             if len(line) > 0 and line[0] == '-':
                 dashed_lines += 1
             continue
-        split_line = list(filter(None, line.split(' ')))
-        
-        def get_value(key: str) -> any:
-            try:
-                index = name_to_index[key]
-            except KeyError:
-                logger.warning(f"Missing '{key}' in CSV file. Failed to add entry.")
-                raise SkipBenchmark()
-            
-            try:
-                value = split_line[index]
-            except IndexError:
-                logger.warning(f"Index '{index}' from key '{key}' is out of bounds. Failed to add entry.")
-                raise SkipBenchmark()
-            return value
         try:
-            raw_name: str = get_value('name')
-            real_time_value = float(get_value('real_time'))
-            cpu_time_value = float(get_value('cpu_time'))
-            time_unit: str = get_value('time_unit')
+            result = parse_console_line(line)
         except SkipBenchmark:
             continue
-
-        repeats = 1
-        for segment in raw_name.split('/'):
-            key_value_pair = segment.split(':')
-            if len(key_value_pair) <= 1:
-                continue
-            if key_value_pair[0] == 'repeats':
-                repeats = int(key_value_pair[1].split('_')[0])
-                break
-        aggregated = repeats > 1
-        
-        split_raw_name = raw_name.split('_')
-        if aggregated and split_raw_name[-1] in {'mean', 'median', 'stddev', 'cv'}:
-            aggregate_name = split_raw_name[-1]
-            name = '_'.join([segment for segment in split_raw_name[:-1]])
-        elif not aggregated:
-            aggregate_name = None
-            name = raw_name
-        else:
-            continue
-
-        result = create_parse_result(name, real_time_value, cpu_time_value, time_unit, aggregate_name)
         if result is None:
             continue
         yield result
+
+def parse_console_line(line: str) -> ParseResult | None:
+    """Parses one row of the console table, None for rows that are not added (e.g., repetitions).
+
+    Raises:
+        SkipBenchmark: The row is missing columns.
+        ValueError: A time column is not a number (e.g., a header row).
+    """
+    name_to_index: dict[str, int] = {'name': 0, 'real_time': 1, 'time_unit': 2, 'cpu_time': 3}
+    split_line = list(filter(None, line.split(' ')))
+
+    def get_value(key: str) -> any:
+        try:
+            index = name_to_index[key]
+        except KeyError:
+            logger.warning(f"Missing '{key}' in CSV file. Failed to add entry.")
+            raise SkipBenchmark()
         
+        try:
+            value = split_line[index]
+        except IndexError:
+            logger.warning(f"Index '{index}' from key '{key}' is out of bounds. Failed to add entry.")
+            raise SkipBenchmark()
+        return value
+    raw_name: str = get_value('name')
+    real_time_value = float(get_value('real_time'))
+    cpu_time_value = float(get_value('cpu_time'))
+    time_unit: str = get_value('time_unit')
+
+    complexity_name = split_complexity_name(raw_name)
+    if complexity_name is not None:
+        name, aggregate_name = complexity_name
+        return parse_text_complexity(name, aggregate_name, real_time_value, cpu_time_value, time_unit)
+
+    aggregated = get_repeats(raw_name) > 1
+    
+    split_raw_name = raw_name.split('_')
+    if aggregated and split_raw_name[-1] in {'mean', 'median', 'stddev', 'cv'}:
+        aggregate_name = split_raw_name[-1]
+        name = '_'.join([segment for segment in split_raw_name[:-1]])
+    elif not aggregated:
+        aggregate_name = None
+        name = raw_name
+    else:
+        return None
+
+    return create_parse_result(name, real_time_value, cpu_time_value, time_unit, aggregate_name)
 
 def create_parse_result(name: str, real_time_value: float, cpu_time_value: float, 
-                        time_unit: str, aggregate_name: str | None) -> ParseResult | None:
+                        time_unit: str, aggregate_name: str | None, complexity: str | None = None) -> ParseResult | None:
     
     real_time = BenchmarkTime(real_time_value, time_unit)
     cpu_time = BenchmarkTime(cpu_time_value, time_unit)
@@ -222,6 +425,10 @@ def create_parse_result(name: str, real_time_value: float, cpu_time_value: float
         cpu_time.time_unit = TimeUnit.PERCENTAGE
 
         return ParseResult(real_time, cpu_time, name, MetricIndices.CV.value)
+    elif aggregate_name == 'BigO':
+        return ParseResult(real_time, cpu_time, name, MetricIndices.BigO.value, complexity)
+    elif aggregate_name == 'RMS':
+        return ParseResult(real_time, cpu_time, name, MetricIndices.RMS.value)
     else:
         logger.warning(f"Unknown aggregate_name: {aggregate_name}")
         return None
\ No newline at end of file
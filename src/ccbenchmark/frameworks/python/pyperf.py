@@ -1,29 +1,87 @@
 from pathlib import Path
 from ccbenchmark.frameworks.util.parse_result import ParseResult
 from ccbenchmark.benchmark_data import BenchmarkTime, TimeUnit
+from ccbenchmark.benchmark_framework import RunOptions
 from io import TextIOWrapper
-from typing import Generator
+from typing import Callable, Generator
 
 import json
 import math
+import re
 
 import subprocess
 
 from ccbenchmark.frameworks.util.metrics import MetricIndices
 
 SUPPORTED_FORMATS = {'json'}
+"""Processes pyperf's Runner spawns when `--processes` is not given."""
+DEFAULT_REPETITIONS = 20
 
-def run_single_benchmark(binary_path: Path, output_path: Path, output_format: str) -> int:
-    output_path.unlink(missing_ok=True)
-
+def get_command(binary_path: Path, output_path: Path, output_format: str, run_options: RunOptions) -> list[str]:
+    """Command running a pyperf script, pyperf refuses to write to an existing `output_path`."""
     cmd = [
         'python3',
         binary_path, 
         f'-o={output_path}', 
         f'--quiet'
     ]
+    if run_options.repetitions is not None:
+        cmd.append(f'--processes={run_options.repetitions}')
+    if run_options.min_time is not None:
+        cmd.append(f'--min-time={run_options.min_time}')
+    cmd += run_options.extra_args
+    return cmd
+
+def finish_run(output_path: Path, run_options: RunOptions) -> None:
+    """Applies the filter to the output once the script exited, see `filter_output`."""
+    if run_options.benchmark_filter is not None and output_path.is_file():
+        filter_output(output_path, run_options.benchmark_filter)
+
+def run_single_benchmark(binary_path: Path, output_path: Path, output_format: str, run_options: RunOptions) -> int:
+    output_path.unlink(missing_ok=True)
+
+    cmd = get_command(binary_path, output_path, output_format, run_options)
+    result = subprocess.call(cmd, stdin=None, stdout=None, stderr=None, shell=False, env=run_options.get_environment())
+    finish_run(output_path, run_options)
+    return result
 
-    return subprocess.call(cmd, stdin=None, stdout=None, stderr=None, shell=False)
+def filter_output(output_path: Path, benchmark_filter: str) -> None:
+    """Removes benchmarks whose name does not match the filter from a pyperf JSON file.
+
+    pyperf's Runner has no option to select benchmarks by name, every benchmark of
+    the script is run and the rest are dropped here.
+    """
+    regex = re.compile(benchmark_filter)
+    with open(output_path, 'r', encoding='utf-8') as file_stream:
+        json_contents: dict = json.load(file_stream)
+    benchmarks: list[dict] = json_contents.get('benchmarks') or []
+    json_contents['benchmarks'] = [
+        benchmark for benchmark in benchmarks
+        if regex.search((benchmark.get('metadata') or {}).get('name') or '') is not None
+    ]
+    with open(output_path, 'w', encoding='utf-8') as file_stream:
+        json.dump(json_contents, file_stream)
+
+def merge_results(output_path: Path, previous_path: Path | None, keep: Callable[[str], bool] | None) -> None:
+    """Drops benchmarks whose name `keep` rejects from a pyperf JSON file, then adds
+    the benchmarks of the result at `previous_path` it does not have."""
+    def get_name(benchmark: dict) -> str:
+        return (benchmark.get('metadata') or {}).get('name') or ''
+
+    with open(output_path, 'r', encoding='utf-8') as file_stream:
+        json_contents: dict = json.load(file_stream)
+    benchmarks = [
+        benchmark for benchmark in json_contents.get('benchmarks') or []
+        if keep is None or keep(get_name(benchmark))
+    ]
+    if previous_path is not None:
+        with open(previous_path, 'r', encoding='utf-8') as file_stream:
+            previous_benchmarks: list[dict] = json.load(file_stream).get('benchmarks') or []
+        names = {get_name(benchmark) for benchmark in benchmarks}
+        benchmarks += [benchmark for benchmark in previous_benchmarks if get_name(benchmark) not in names]
+    json_contents['benchmarks'] = benchmarks
+    with open(output_path, 'w', encoding='utf-8') as file_stream:
+        json.dump(json_contents, file_stream)
 
 def parse(file_stream: TextIOWrapper, file_path: Path) -> Generator[ParseResult, None, None]:
     if file_path.suffix != '.json':
@@ -51,7 +109,7 @@ def parse(file_stream: TextIOWrapper, file_path: Path) -> Generator[ParseResult,
         n = len(all_values)
         median_value = sorted(all_values)[n // 2]
         median = BenchmarkTime(median_value, TimeUnit.S)
-        yield ParseResult(median, BenchmarkTime(None, None), name, MetricIndices.Median.value)
+        yield ParseResult(median, BenchmarkTime(None, None), name, MetricIndices.Median.value, real_samples=all_values)
         mean_value = 0.0
         for value in all_values:
             mean_value += value / n
@@ -0,0 +1,87 @@
+"""Splits parameterized benchmark names into their parts.
+
+Google Benchmark names encode their arguments in the name itself, for example
+``BM_Sort/1024/threads:8`` or ``BM_Copy/n:64/m:8/real_time``. `parse_benchmark_name`
+breaks these names into a family name, numeric arguments, and a thread count so
+benchmarks of the same family can be compared against each other.
+"""
+
+from dataclasses import dataclass, field
+
+"""Name segments that configure how a benchmark is run rather than what it runs."""
+RUN_OPTION_KEYS = {'threads', 'repeats', 'iterations', 'min_time', 'min_warmup_time'}
+RUN_OPTION_FLAGS = {'real_time', 'manual_time', 'process_time'}
+
+@dataclass(slots=True)
+class BenchmarkName:
+    """Parts of a parameterized benchmark name.
+
+    Attributes:
+        family: Name the benchmark was registered with (e.g., "BM_Sort").
+        args: Numeric arguments in the order they appear in the name.
+        arg_names: Name of each argument, empty string if it is unnamed.
+        threads: Number of threads the benchmark ran with.
+        options: Run options found in the name (e.g., repeats, real_time).
+    """
+    family: str
+    args: list[float] = field(default_factory=lambda: [])
+    arg_names: list[str] = field(default_factory=lambda: [])
+    threads: int = 1
+    options: dict[str, str] = field(default_factory=lambda: {})
+
+def _to_number(text: str) -> float | None:
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+def parse_benchmark_name(name: str) -> BenchmarkName:
+    """Parse a benchmark name into its family, arguments, and thread count.
+
+    Example:
+        parse_benchmark_name('BM_Sort/1024/threads:8')
+            -> BenchmarkName('BM_Sort', [1024.0], [''], 8, {'threads': '8'})
+
+    Segments that are not numeric and not a known run option are kept as part
+    of the family, so names such as ``BM_Template<int>/fast/8`` stay grouped.
+
+    Args:
+        name: Benchmark name as reported by the framework.
+
+    Returns:
+        BenchmarkName: Parsed name.
+    """
+    segments = name.split('/')
+    family_segments = [segments[0]]
+    benchmark_name = BenchmarkName(segments[0])
+
+    for segment in segments[1:]:
+        if segment in RUN_OPTION_FLAGS:
+            benchmark_name.options[segment] = ''
+            continue
+
+        key, separator, value = segment.partition(':')
+        if separator == '':
+            number = _to_number(segment)
+            if number is None:
+                family_segments.append(segment)
+                continue
+            benchmark_name.args.append(number)
+            benchmark_name.arg_names.append('')
+            continue
+
+        if key in RUN_OPTION_KEYS:
+            benchmark_name.options[key] = value
+            if key == 'threads' and value.isdigit():
+                benchmark_name.threads = int(value)
+            continue
+
+        number = _to_number(value)
+        if number is None:
+            family_segments.append(segment)
+            continue
+        benchmark_name.args.append(number)
+        benchmark_name.arg_names.append(key)
+
+    benchmark_name.family = '/'.join(family_segments)
+    return benchmark_name
@@ -1,7 +1,7 @@
 from enum import IntEnum
 
 """Base names of metrics."""
-METRICS = ['Time', 'μ', 'Stddev', 'Med', 'Mad', 'Min', 'Max', 'CV']
+METRICS = ['Time', 'μ', 'Stddev', 'Med', 'Mad', 'Min', 'Max', 'CV', 'BigO', 'RMS']
 
 class MetricIndices(IntEnum):
     """Corresponds a metric type to its column indice."""
@@ -12,4 +12,6 @@ class MetricIndices(IntEnum):
     Mad    = 4
     Min    = 5
     Max    = 6
-    CV     = 7
\ No newline at end of file
+    CV     = 7
+    BigO   = 8
+    RMS    = 9
\ No newline at end of file
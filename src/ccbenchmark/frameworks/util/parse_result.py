@@ -15,9 +15,15 @@ class ParseResult:
 
         name: The name of the benchmark that was run.
         metric_index: The column that this result belongs to.
+        complexity: Fitted complexity (e.g., 'NlgN'), only set for BigO results.
+        real_samples: Real time of every repetition in the unit of real_time, set on one result per benchmark.
+        cpu_samples: CPU time of every repetition in the unit of cpu_time, set on one result per benchmark.
     """
     real_time: bd.BenchmarkTime
     cpu_time: bd.BenchmarkTime
 
     name: str
-    metric_index: int
\ No newline at end of file
+    metric_index: int
+    complexity: str | None = None
+    real_samples: list[float] | None = None
+    cpu_samples: list[float] | None = None
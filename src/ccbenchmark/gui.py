@@ -1,9 +1,35 @@
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import QTimer
 from PyQt5 import QtCore, QtGui
+from typing import TYPE_CHECKING, Iterator
+from pathlib import Path
+import csv
+import io
+import itertools
+import logging
 import sys
+import threading
+import time
 
-from ccbenchmark.benchmark_data import BenchmarkData, TimeType
+from ccbenchmark.benchmark_data import BenchmarkData, LoadProgress, TimeType
+from ccbenchmark.name_index import SearchIndex
+from ccbenchmark._ccbenchmark import Manager
+from ccbenchmark.scaling import FamilyKind, get_benchmark_families, analyze_complexity, analyze_thread_scaling
+from ccbenchmark.frameworks.util.metrics import METRICS, MetricIndices
+from ccbenchmark.trace import span, traced
+
+if TYPE_CHECKING:
+    from ccbenchmark.calibration import NoiseFloors
+
+try:
+    from ccbenchmark.chart import ChartView, DistributionView
+except ImportError:
+    # PyQtChart is optional, without it there is no chart pane or distribution view.
+    ChartView = None
+    DistributionView = None
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger()
 
 class StickyMenu(QMenu):
     """Menu that does not go away when option is clicked within."""
@@ -66,20 +92,128 @@ class DropdownSelect(QToolButton):
             action.triggered.connect(func)
         return self
 
-def get_csv(matrix: list[list[str | float]], deliminator=b',') -> bytes:
-    data = b''
-    for row in matrix:
-        data_row = ''
-        for entry in row:
-            text = f'"{entry}"' if type(entry) is str else f'{entry}'
-            data_row += f'{text}' if data_row == '' else f'{deliminator}{text}'
-            
-        data += f'{data_row}'.encode() if data == b'' else f'\n{data_row}'.encode()
-    return data
+def get_csv(matrix: list[list[str | float]], delimiter: str = ',') -> bytes:
+    """Formats a matrix as CSV, strings are quoted and numbers are not."""
+    stream = io.StringIO()
+    writer = csv.writer(stream, delimiter=delimiter, quoting=csv.QUOTE_NONNUMERIC, lineterminator='\n')
+    writer.writerows(matrix)
+    return stream.getvalue().encode()
 
-class BenchmarkDataTableView(QTableWidget):
-    def __init__(self, benchmark_data: BenchmarkData, selected_indicies: list[int], time_type: TimeType):
+class BenchmarkDataTableModel(QtCore.QAbstractTableModel):
+    """Table model that reads cells of the current profile straight from the Rust Manager.
+
+    The comparison is run once per profile change, cells are only formatted and
+    colored when Qt asks for them, which is for the visible ones. With noise
+    floors, each row is colored relative to the noise floor of its benchmark.
+    """
+    def __init__(self, default_color: QtGui.QColor, noise_floors: 'NoiseFloors | None' = None):
+        super().__init__()
+        self.noise_floors = noise_floors
+        # (peak Δ, poor CV) of each row, the defaults of `get_text_color` if empty.
+        self.row_color_limits: list[tuple[float, float]] = []
+        self.manager: Manager | None = None
+        self.column_names: list[str] = []
+        self.row_names: list[str] = []
+        # Why each row was taken under load, rows are iterations when one benchmark is selected.
+        self.row_load_warnings: list[str] = []
+        self.units: tuple[str, str] = ('', '')
+        # Rows and columns with at least one value, computed by the Manager with the comparison.
+        self.valid_rows: list[bool] = []
+        self.valid_columns: list[bool] = []
+        self.default_color = default_color
+        self._column_count = 0
+        self._row_count = 0
+
+    def set_profile(self, benchmark_data: BenchmarkData, selected_indicies: list[int], time_type: TimeType):
+        self.beginResetModel()
+        self.column_names = benchmark_data.get_columns(selected_indicies)
+        self.row_names = benchmark_data.get_rows(selected_indicies)
+        self.row_load_warnings = []
+        self.row_color_limits = []
+        if self.noise_floors is not None and len(selected_indicies) != 0:
+            self.row_color_limits = [
+                self.noise_floors.get_color_limits(benchmark_data.benchmark_paths[benchmark_index], benchmark_data.benchmark_names[benchmark_index])
+                for benchmark_index in selected_indicies
+            ]
+            if len(selected_indicies) == 1:
+                self.row_color_limits *= len(self.row_names)
+        if len(selected_indicies) == 1:
+            self.row_load_warnings = [
+                benchmark_data.get_load_warning(iteration_index, selected_indicies[0])
+                for iteration_index in range(len(self.row_names))
+            ]
+        if len(selected_indicies) == 0:
+            self.manager = None
+            self._column_count = 0
+            self._row_count = 0
+            self.valid_rows = []
+            self.valid_columns = []
+        else:
+            self.manager = benchmark_data.update_profile(selected_indicies, time_type)
+            self.units = self.manager.get_units()
+            column_count, row_count = self.manager.dimensions()
+            self._column_count = min(column_count, len(self.column_names))
+            self._row_count = min(row_count, len(self.row_names))
+            self.valid_rows = self.manager.get_valid_rows()
+            self.valid_columns = self.manager.get_valid_columns()
+        self.endResetModel()
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._column_count
+
+    def value(self, row: int, column: int) -> float:
+        return self.manager.get_cell(column, row)
+
+    def cell_text(self, row: int, column: int) -> str:
+        value = self.value(row, column)
+        if value != value:
+            return 'N/A'
+        return f'{value:.2f} {self.units[column % 2]}'
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole):
+        if not index.isValid() or self.manager is None:
+            return None
+        if role == QtCore.Qt.DisplayRole:
+            return self.cell_text(index.row(), index.column())
+        if role == QtCore.Qt.ForegroundRole:
+            value = self.value(index.row(), index.column())
+            if index.row() < len(self.row_color_limits):
+                peak_delta_value, poor_cv_percentage_value = self.row_color_limits[index.row()]
+                return QtGui.QBrush(get_text_color(
+                    value, self.column_names[index.column()], self.default_color,
+                    peak_delta_value=peak_delta_value, poor_cv_percentage_value=poor_cv_percentage_value
+                ))
+            return QtGui.QBrush(get_text_color(value, self.column_names[index.column()], self.default_color))
+        return None
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = QtCore.Qt.DisplayRole):
+        load_warning = ''
+        if orientation == QtCore.Qt.Vertical and section < len(self.row_load_warnings):
+            load_warning = self.row_load_warnings[section]
+        if role == QtCore.Qt.ToolTipRole:
+            return f'Taken under load, {load_warning}' if load_warning != '' else None
+        if role != QtCore.Qt.DisplayRole:
+            return None
+        names = self.column_names if orientation == QtCore.Qt.Horizontal else self.row_names
+        if section >= len(names):
+            return None
+        return f'{names[section]} ⚠' if load_warning != '' else names[section]
+
+class BenchmarkDataTableView(QTableView):
+    def __init__(self, benchmark_data: BenchmarkData, selected_indicies: list[int], time_type: TimeType, noise_floors: 'NoiseFloors | None' = None):
         super().__init__()
+        self.table_model = BenchmarkDataTableModel(self.palette().color(QtGui.QPalette.Text), noise_floors)
+        self.setModel(self.table_model)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+
+        self.horizontalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        # Sizes columns from the visible rows only.
+        self.horizontalHeader().setResizeContentsPrecision(0)
+
         self.modify_table(benchmark_data, selected_indicies, time_type)
 
     def keyPressEvent(self, event):
@@ -89,107 +223,43 @@ class BenchmarkDataTableView(QTableWidget):
             super().keyPressEvent(event)
 
     def copy(self) -> None:
-        data = get_csv(self.get_selected_matrix(), deliminator='\t').decode()
+        matrix = self.get_selected_matrix()
+        if matrix is None:
+            return
+        data = get_csv(matrix, delimiter='\t').decode()
         QApplication.clipboard().setText(data)
 
     def preserve_max_vertical_header_width(self):
-        vertical_header = self.verticalHeader()
-        font_metrics = QtGui.QFontMetrics(vertical_header.font())
-
-        max_label_width = 0
-        for row_index in range(self.rowCount()):
-            item = self.verticalHeaderItem(row_index)
-            if item is None:
-                continue
-            width = font_metrics.width(item.text())
-            max_label_width = max(max_label_width, width)
-        
+        font_metrics = QtGui.QFontMetrics(self.verticalHeader().font())
+        max_label_width = max((font_metrics.width(name) for name in self.table_model.row_names), default=0)
         self.verticalHeader().setMinimumWidth(max_label_width)
 
-    def hide_empty_columns(self) -> int:
-        for col_index in range(self.columnCount()):
-            toggle_row = False
-            for row_index in range(self.rowCount()):
-                item = self.item(row_index, col_index)
-                if item is None:
-                    continue
-                text = item.text().strip()
-                if text == 'N/A':
-                    toggle_row = True
-                elif text != '':
-                    toggle_row = False
-                    break
-            if toggle_row:
-                self.hideColumn(col_index)
-            else:
-                self.showColumn(col_index)
+    def hide_empty_columns(self) -> None:
+        for col_index in range(self.table_model.columnCount()):
+            self.setColumnHidden(col_index, not self.table_model.valid_columns[col_index])
     
-    def hide_empty_rows(self):
-        for row_index in range(self.rowCount()):
-            toggle_row = False
-            for col_index in range(self.columnCount()):
-                item = self.item(row_index, col_index)
-                if item is None:
-                    continue
-                text = item.text().strip()
-                if text == 'N/A':
-                    toggle_row = True
-                elif text != '':
-                    toggle_row = False
-                    break
-            if toggle_row:
-                self.hideRow(row_index)
-            else:
-                self.showRow(row_index)
-
-    def get_selected_matrix(self) -> list[list[str | float]]:
-        selected_ranges = self.selectedRanges()
-        if not selected_ranges or len(selected_ranges) == 0:
-            return
-        selected_range = selected_ranges[0]
-        matrix = []
-        row_text = ["Label"]
-        for col in range(selected_range.leftColumn(), selected_range.rightColumn() + 1):
-            if self.isColumnHidden(col):
+    def hide_empty_rows(self) -> None:
+        for row_index in range(self.table_model.rowCount()):
+            self.setRowHidden(row_index, not self.table_model.valid_rows[row_index])
+
+    def _get_matrix(self, rows: range, columns: range) -> list[list[str | float]]:
+        shown_columns = [col for col in columns if not self.isColumnHidden(col)]
+        matrix = [['Label'] + [self.table_model.column_names[col] for col in shown_columns]]
+        for row in rows:
+            if self.isRowHidden(row):
                 continue
-            item = self.horizontalHeaderItem(col)
-            row_text.append(item.text())
-        matrix.append(row_text)
-
-        for row in range(selected_range.topRow(), selected_range.bottomRow() + 1):
-            item = self.verticalHeaderItem(row)
-            row_text = [item.text()]
-            for col in range(selected_range.leftColumn(), selected_range.rightColumn() + 1):
-                if self.isColumnHidden(col):
-                    continue
-                item = self.item(row, col)
-                row_text.append(item.text())
-            matrix.append(row_text)
+            matrix.append([self.table_model.row_names[row]] + [self.table_model.cell_text(row, col) for col in shown_columns])
         return matrix
-    
-    def _update_table_rows_and_cols(self, benchmark_data: BenchmarkData, selected_indicies: list[int], min_column_count=30, min_row_count=50) -> tuple[int, int]:
-        columns_names = benchmark_data.get_columns(selected_indicies)
-        row_names = benchmark_data.get_rows(selected_indicies)
-
-        input_column_count = len(columns_names)
-        input_row_count = len(row_names)
-
-        column_count = max(input_column_count, min_column_count)
-        row_count = max(input_row_count, min_row_count)
-
-        additional_column_names = [''] * max(min_column_count - input_column_count, 0)
-        additional_row_names = [''] * max(min_row_count - input_row_count, 0)
 
-        self.setColumnCount(column_count)
-        self.setRowCount(row_count)
-        
-        self.setHorizontalHeaderLabels(columns_names + additional_column_names)
-        self.setVerticalHeaderLabels(row_names + additional_row_names)
-
-        self.horizontalHeader().setSectionResizeMode(QHeaderView.Fixed)
-        self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
-
-        return (column_count, row_count)
+    def get_selected_matrix(self) -> list[list[str | float]] | None:
+        selection = self.selectionModel().selection()
+        if len(selection) == 0:
+            return None
+        selected_range = selection[0]
+        return self._get_matrix(
+            range(selected_range.top(), selected_range.bottom() + 1),
+            range(selected_range.left(), selected_range.right() + 1)
+        )
 
     def _resize_columns(self):
         default_width = self.horizontalHeader().defaultSectionSize()
@@ -197,69 +267,15 @@ class BenchmarkDataTableView(QTableWidget):
         self.horizontalHeader().setMinimumSectionSize(default_width)
         self.preserve_max_vertical_header_width()
 
-    def _set_item(self, text: str, item_color: QtGui.QColor, row: int, column: int):
-        item = QTableWidgetItem(text)
-        item.setForeground(QtGui.QBrush(item_color))
-        item.setFlags(item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable)
-        self.setItem(row, column, item)
-
     def modify_table(self, benchmark_data: BenchmarkData, selected_indicies: list[int], time_type: TimeType):
-        columns_names = benchmark_data.get_columns(selected_indicies)
-        table_data = benchmark_data.get_str_matrix(selected_indicies, time_type)
-        column_count, row_count = self._update_table_rows_and_cols(benchmark_data, selected_indicies, time_type)
-        default_color = self.palette().color(QtGui.QPalette.Text)
-
-        for i in range(column_count):
-            self.showColumn(column_count)
-            for j in range(row_count):
-                if len(table_data) != 0 and j < len(table_data[0]) and i < len(table_data):
-                    text = table_data[i][j]
-                    assert type(text) is str, f'text is {type(text).__name__}, at table_data[{i}][{j}]'
-                    assert len(columns_names) == len(table_data), f'len({len(columns_names)}) != len({len(table_data)})'
-                    
-                    value = cell_text_to_float(text)
-                    item_color = get_text_color(value, columns_names[i], default_color)
-                    self._set_item(text, item_color, j, i)
-                else:
-                    self._set_item('', default_color, j, i)
-
-        self._resize_columns()
-        self.hide_empty_columns()
-        self.hide_empty_rows()
+        with span('modify_table', benchmarks=len(selected_indicies)):
+            self.table_model.set_profile(benchmark_data, selected_indicies, time_type)
+            self._resize_columns()
+            self.hide_empty_columns()
+            self.hide_empty_rows()
 
     def to_matrix(self) -> list[list[str | float]]:
-        data = []
-        data_row = ['Label']
-        for col in range(self.columnCount()):
-            text = self.horizontalHeaderItem(col).text()
-            if text == '':
-                continue
-            data_row.append(text)
-        data.append(data_row)
-        for row in range(self.rowCount()):
-            if self.isRowHidden(row):
-                continue
-            header = self.verticalHeaderItem(row).text()
-            if header == '':
-                continue
-            data_row = [header]
-            for col in range(self.columnCount()):
-                if self.isColumnHidden(col):
-                    continue
-                item = self.item(row, col)
-                if item is None or item.text().strip() == '':
-                    continue
-                data_row.append(item.text())
-
-            data.append(data_row)
-        return data
-
-def cell_text_to_float(text: str) -> float:
-    split = text.split(' ')
-    if len(split) == 2:
-        return float(split[0])
-    else:
-        return float('NaN')
+        return self._get_matrix(range(self.table_model.rowCount()), range(self.table_model.columnCount()))
 
 def lerp(t: float, a: float, b: float) -> float:
     return (1.0 - t)*a + t*b
@@ -335,7 +351,7 @@ class ToolbarView(QToolBar):
         parent.addToolBar(self)
         self.modify_toolbar(column_names, selected_indicies, parent)
 
-    def modify_toolbar(self, columns: list[str], selected_benchmarks: list[str], parent: 'MainWindow'):
+    def modify_toolbar(self, columns: list[str], selected_benchmarks: list[str], parent: 'MainWindow', valid_columns: list[bool] | None = None):
         self.clear()
         show_stats_menu = DropdownChecks('Shown Stats', self, parent)
 
@@ -347,6 +363,7 @@ class ToolbarView(QToolBar):
                 self.time_type = TimeType.CPU
             
             parent.table.modify_table(parent.benchmark_data, parent.tree.selected_indicies, self.time_type)
+            parent.update_chart()
         
         def toggle_column():
             action: QAction = self.sender()
@@ -359,6 +376,9 @@ class ToolbarView(QToolBar):
                     parent.table.showColumn(i)
 
         for i, col in enumerate(columns):
+            # Metrics without any values are hidden by the table and not offered.
+            if valid_columns is not None and i < len(valid_columns) and not valid_columns[i]:
+                continue
             show_stats_menu.addAction(col, True, toggle_column, True, data={'column_index': i})
 
         actions = ['Real Time', 'CPU Time'] if self.time_type == TimeType.REAL else ['CPU Time', 'Real Time']
@@ -376,36 +396,456 @@ class ToolbarView(QToolBar):
         export_to_csv_button.clicked.connect(parent.export_to_csv)
         self.addWidget(export_to_csv_button)
 
-class ProfileSelectionTreeView(QTreeWidget):
-    def __init__(self, parent: 'MainWindow', paths: dict):
+        export_all_button = QToolButton()
+        export_all_button.setText('Export All')
+        export_all_button.clicked.connect(parent.export_all)
+        self.addWidget(export_all_button)
+
+        scaling_button = QToolButton()
+        scaling_button.setText('Scaling')
+        scaling_button.clicked.connect(parent.show_scaling)
+        self.addWidget(scaling_button)
+
+        heatmap_button = QToolButton()
+        heatmap_button.setText('Heatmap')
+        heatmap_button.clicked.connect(parent.show_heatmap)
+        self.addWidget(heatmap_button)
+
+        if parent.chart is not None:
+            chart_button = QToolButton()
+            chart_button.setText('Chart')
+            chart_button.setCheckable(True)
+            chart_button.setChecked(parent.chart.isVisible())
+            chart_button.toggled.connect(parent.toggle_chart)
+            self.addWidget(chart_button)
+
+            distribution_button = QToolButton()
+            distribution_button.setText('Distribution')
+            distribution_button.clicked.connect(parent.show_distribution)
+            self.addWidget(distribution_button)
+
+class ScalingView(QDialog):
+    """Shows complexity fits and thread scaling of the families of the selected benchmarks.
+
+    Iterations that made a family scale worse than the iteration before are shown in red.
+    """
+    COLUMNS = ['Family', 'Iteration', 'Big O', 'Coefficient (ns)', 'RMS (%)', 'Exponent', 'Efficiency']
+
+    def __init__(self, parent: QMainWindow, benchmark_data: BenchmarkData, selected_indicies: list[int], time_type: TimeType):
+        super().__init__(parent)
+        self.setWindowTitle('Scaling')
+        self.table = QTableWidget()
+        self.table.setColumnCount(len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.table)
+
+        self.modify_table(benchmark_data, selected_indicies, time_type)
+        self.resize(900, 500)
+
+    def _add_row(self, texts: list[str], regressed: bool):
+        row = self.table.rowCount()
+        self.table.insertRow(row)
+        color = QtGui.QColor(255, 85, 85) if regressed else self.palette().color(QtGui.QPalette.Text)
+        for column, text in enumerate(texts):
+            item = QTableWidgetItem(text)
+            item.setForeground(QtGui.QBrush(color))
+            self.table.setItem(row, column, item)
+
+    @traced()
+    def modify_table(self, benchmark_data: BenchmarkData, selected_indicies: list[int], time_type: TimeType):
+        self.table.setRowCount(0)
+        for family in get_benchmark_families(benchmark_data, selected_indicies):
+            label = f'{family.path}/{family.label}'
+            if family.kind == FamilyKind.COMPLEXITY:
+                for result in analyze_complexity(benchmark_data, family, time_type):
+                    self._add_row([
+                        label, result.iteration_name, result.complexity,
+                        f'{result.coefficient:.2f}', f'{result.rms:.2f}', f'{result.exponent:.2f}', ''
+                    ], result.regressed)
+            else:
+                for result in analyze_thread_scaling(benchmark_data, family, TimeType.REAL):
+                    efficiency = ', '.join(
+                        f'{threads}t: {value:.2f}' for threads, value in zip(result.threads, result.efficiency)
+                    )
+                    self._add_row([label, result.iteration_name, '', '', '', '', efficiency], result.regressed)
+        self.table.resizeColumnsToContents()
+
+class HeatmapWidget(QWidget):
+    """Draws the heatmap image scaled to the widget, with a tooltip for the cell under the mouse."""
+    def __init__(self, heatmap_view: 'HeatmapView'):
         super().__init__()
-        self.model().setHeaderData(0, QtCore.Qt.Horizontal, 'Benchmarks')
-        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
-        self.build_tree(self, paths)
+        self.heatmap_view = heatmap_view
+        self.image: QtGui.QImage | None = None
+        self._scaled: QtGui.QImage | None = None
+        self.setMouseTracking(True)
+        self.setMinimumSize(200, 200)
+
+    def set_image(self, image: QtGui.QImage):
+        self.image = image
+        self._scaled = None
+        self.update()
+
+    def paintEvent(self, event: QtGui.QPaintEvent):
+        if self.image is None or self.image.isNull():
+            return
+        # Smooth scaling averages rows that share a pixel, so a regression band stays visible.
+        if self._scaled is None or self._scaled.size() != self.size():
+            self._scaled = self.image.scaled(self.size(), QtCore.Qt.IgnoreAspectRatio, QtCore.Qt.SmoothTransformation)
+        painter = QtGui.QPainter(self)
+        painter.drawImage(0, 0, self._scaled)
+
+    def mouseMoveEvent(self, event: QtGui.QMouseEvent):
+        if self.image is None or self.image.isNull():
+            return
+        column = event.pos().x() * self.image.width() // max(self.width(), 1)
+        row = event.pos().y() * self.image.height() // max(self.height(), 1)
+        QToolTip.showText(event.globalPos(), self.heatmap_view.cell_text(row, column), self)
 
-        self.selected_indicies: list[int] = []
-        self.selected_names: list[str] = []
+class HeatmapView(QDialog):
+    """Shows every benchmark against every iteration as one image.
 
-        self.selmodel = self.selectionModel()
-        self.selmodel.selectionChanged.connect(parent.selection_change)
+    Each pixel is the Δ of a benchmark against its previous iteration, colored like
+    the Δ columns of the table. Benchmarks are sorted by path, so a change that
+    slowed down a subsystem shows up as a band of red.
+    """
+    PEAK_DELTA = 20.0
+    METRIC_INDICES = [MetricIndices.Time.value, MetricIndices.Mean.value, MetricIndices.Median.value]
+
+    def __init__(self, parent: QMainWindow, benchmark_data: BenchmarkData, time_type: TimeType):
+        super().__init__(parent)
+        self.setWindowTitle('Heatmap')
+        self.benchmark_data = benchmark_data
+        self.time_type = time_type
+        self.benchmark_indices = sorted(
+            range(len(benchmark_data.benchmark_names)),
+            key=lambda i: (benchmark_data.benchmark_paths[i].as_posix(), benchmark_data.benchmark_names[i])
+        )
+        self.row_metrics: list[int] = []
+
+        self.heatmap = HeatmapWidget(self)
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.heatmap)
+        self.render_heatmap()
+        self.resize(1000, 700)
+
+    @staticmethod
+    def _argb(color: QtGui.QColor) -> int:
+        return color.rgba() & 0xffffffff
+
+    def render_heatmap(self):
+        manager = self.benchmark_data.benchmark_types[self.time_type]
+        width = len(self.benchmark_data.iteration_names)
+        height = len(self.benchmark_indices)
+        if width == 0 or height == 0:
+            return
+        start_time = time.perf_counter()
+        with span('Manager.render_heatmap', category='rust', benchmarks=height, iterations=width):
+            pixels, self.row_metrics = manager.render_heatmap(
+                self.benchmark_indices, self.METRIC_INDICES, self.PEAK_DELTA,
+                self._argb(self.palette().color(QtGui.QPalette.Text)),
+                self._argb(QtGui.QColor(255, 85, 85)),
+                self._argb(QtGui.QColor(0, 255, 128)),
+                self._argb(self.palette().color(QtGui.QPalette.Base))
+            )
+        # copy() detaches the image from `pixels`, which Qt does not keep alive.
+        image = QtGui.QImage(pixels, width, height, width*4, QtGui.QImage.Format_ARGB32).copy()
+        self.heatmap.set_image(image)
+        logger.debug(f'Rendered {height}x{width} heatmap in {time.perf_counter() - start_time:.3f} s')
+
+    def cell_text(self, row: int, column: int) -> str:
+        """Tooltip of a pixel, the benchmark, iteration and Δ it shows."""
+        if not (0 <= row < len(self.benchmark_indices) and 0 <= column < len(self.benchmark_data.iteration_names)):
+            return ''
+        benchmark_index = self.benchmark_indices[row]
+        text = (
+            f'{self.benchmark_data.benchmark_paths[benchmark_index].as_posix()}/{self.benchmark_data.benchmark_names[benchmark_index]}\n'
+            f'{self.benchmark_data.iteration_names[column]}'
+        )
+        metric_index = self.row_metrics[row]
+        if metric_index >= len(METRICS):
+            return text
+        values = self.benchmark_data.benchmark_types[self.time_type].get_values(benchmark_index, metric_index, 'ns')
+        value = values[column]
+        if value != value:
+            return text
+        text += f': {METRICS[metric_index]} {value:.2f} ns'
+        previous = next((values[i] for i in range(column - 1, -1, -1) if values[i] == values[i]), None)
+        if previous is not None:
+            text += f', Δ {(value / previous - 1.0) * 100.0:.2f} %'
+        return text
+
+class _TreeNode:
+    __slots__ = ('text', 'parent', 'row', 'benchmark_index', 'entries', 'children', 'children_by_key')
+
+    def __init__(self, text: str, parent: '_TreeNode | None', row: int, benchmark_index: int | None = None, entries: dict | None = None):
+        self.text = text
+        self.parent = parent
+        self.row = row
+        self.benchmark_index = benchmark_index
+        # Subtree of the path dict, children are created from it as they are fetched.
+        self.entries = entries
+        self.children: list[_TreeNode] = []
+        self.children_by_key: dict[str, _TreeNode] = {}
+
+class BenchmarkTreeModel(QtCore.QAbstractItemModel):
+    """Lazy tree over the nested path dict from `BenchmarkData.get_paths`.
+
+    Items are created when the view asks for them, `batch_size` rows at a time
+    through `fetchMore`, so the cost of the tree depends on what was expanded and
+    scrolled to rather than on the number of benchmarks.
+    """
+    def __init__(self, paths: dict, batch_size: int = 256):
+        super().__init__()
+        self.batch_size = batch_size
+        self.collapse_paths = True
+        self._root = _TreeNode('', None, 0, entries=paths)
 
-    def build_tree(self, parent: QTreeWidget, data: dict):
-        for key, value in data.items():
-            item = QTreeWidgetItem(parent)
-            item.setText(0, key)
-            if isinstance(value, dict):
-                text = key
-                next_value = None
+    def set_paths(self, paths: dict, collapse_paths: bool = True):
+        """Replaces the tree.
+
+        Args:
+            paths:
+                Nested path dict, owned by the model from then on.
+            collapse_paths:
+                Shows chains of single directories as one item (e.g., 'cpp/sort').
+                Must be False if `add_benchmarks` will be called.
+        """
+        self.beginResetModel()
+        self.collapse_paths = collapse_paths
+        self._root = _TreeNode('', None, 0, entries=paths)
+        self.endResetModel()
+
+    def _node(self, index: QtCore.QModelIndex) -> _TreeNode:
+        return index.internalPointer() if index.isValid() else self._root
+
+    def _index_of(self, node: _TreeNode) -> QtCore.QModelIndex:
+        if node is self._root:
+            return QtCore.QModelIndex()
+        return self.createIndex(node.row, 0, node)
+
+    def _create_node(self, key: str, value: dict | int, parent: _TreeNode, row: int) -> _TreeNode:
+        if isinstance(value, dict):
+            text = key
+            if self.collapse_paths:
                 while len(value) == 1:
                     next_key, next_value = next(iter(value.items()))
                     if not isinstance(next_value, dict):
                         break
                     value = next_value
                     text += '/' + next_key
-                item.setText(0, text)
-                self.build_tree(item, value)
-            elif isinstance(value, int):
-                item.setData(0, QtCore.Qt.UserRole, value)
+            node = _TreeNode(text, parent, row, entries=value)
+        else:
+            node = _TreeNode(key, parent, row, benchmark_index=value)
+        parent.children_by_key[key] = node
+        return node
+
+    def index(self, row: int, column: int, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> QtCore.QModelIndex:
+        node = self._node(parent)
+        if column != 0 or row < 0 or row >= len(node.children):
+            return QtCore.QModelIndex()
+        return self.createIndex(row, 0, node.children[row])
+
+    def parent(self, index: QtCore.QModelIndex) -> QtCore.QModelIndex:
+        if not index.isValid():
+            return QtCore.QModelIndex()
+        parent_node = index.internalPointer().parent
+        if parent_node is None:
+            return QtCore.QModelIndex()
+        return self._index_of(parent_node)
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        return len(self._node(parent).children)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 1
+
+    def hasChildren(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> bool:
+        node = self._node(parent)
+        return node.entries is not None and len(node.entries) != 0
+
+    def canFetchMore(self, parent: QtCore.QModelIndex) -> bool:
+        node = self._node(parent)
+        return node.entries is not None and len(node.children) < len(node.entries)
+
+    def fetchMore(self, parent: QtCore.QModelIndex):
+        node = self._node(parent)
+        start = len(node.children)
+        stop = min(start + self.batch_size, len(node.entries))
+        if stop <= start:
+            return
+        self.beginInsertRows(parent, start, stop - 1)
+        for row, (key, value) in enumerate(itertools.islice(node.entries.items(), start, stop), start):
+            node.children.append(self._create_node(key, value, node, row))
+        self.endInsertRows()
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node: _TreeNode = index.internalPointer()
+        if role == QtCore.Qt.DisplayRole:
+            return node.text
+        if role == QtCore.Qt.UserRole:
+            return node.benchmark_index
+        return None
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = QtCore.Qt.DisplayRole):
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole and section == 0:
+            return 'Benchmarks'
+        return None
+
+    def add_benchmarks(self, benchmark_data: BenchmarkData, start: int, stop: int):
+        """Adds benchmarks `start` to `stop` while loading.
+
+        Nodes whose children were all shown get the new rows right away, others
+        show them when the view fetches more.
+        """
+        assert not self.collapse_paths
+        touched: dict[int, tuple[_TreeNode, bool]] = {}
+
+        def touch(node: _TreeNode):
+            if id(node) not in touched:
+                touched[id(node)] = (node, len(node.children) >= len(node.entries))
+
+        for i in range(start, stop):
+            node: _TreeNode | None = self._root
+            entries = self._root.entries
+            touch(node)
+            for part in benchmark_data.benchmark_paths[i].parts:
+                entries = entries.setdefault(part, {})
+                if node is not None:
+                    node = node.children_by_key.get(part)
+                    if node is not None:
+                        touch(node)
+            entries[benchmark_data.benchmark_names[i]] = i
+
+        for node, was_complete in touched.values():
+            if was_complete:
+                self.fetchMore(self._index_of(node))
+
+class ProfileSelectionTreeView(QWidget):
+    """Benchmark tree with a search box.
+
+    Attributes:
+        selected_indicies (list[int]): 
+            Selected benchmarks, in the order they were selected.
+        selected_names (list[str]): 
+            Names of the selected benchmarks.
+    """
+    def __init__(self, parent: 'MainWindow', benchmark_data: BenchmarkData):
+        super().__init__()
+        self.search_box = QLineEdit()
+        self.search_box.setPlaceholderText('Search benchmarks')
+        self.search_box.setClearButtonEnabled(True)
+        self.search_box.textChanged.connect(self.search)
+
+        self.tree_model = BenchmarkTreeModel({})
+        self.view = QTreeView()
+        self.view.setModel(self.tree_model)
+        self.view.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.view.setUniformRowHeights(True)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.search_box)
+        layout.addWidget(self.view)
+
+        self.benchmark_data = benchmark_data
+        self.search_index = SearchIndex()
+        self._benchmark_count = 0
+
+        self.selected_indicies: list[int] = []
+        self.selected_names: list[str] = []
+
+        self.selmodel = self.view.selectionModel()
+        self.selmodel.selectionChanged.connect(parent.selection_change)
+
+        self.add_benchmarks(benchmark_data, len(benchmark_data.benchmark_names))
+        self.show_benchmarks()
+
+    def _add_to_search_index(self, benchmark_data: BenchmarkData, benchmark_count: int):
+        for i in range(self._benchmark_count, benchmark_count):
+            self.search_index.add(i, f'{benchmark_data.benchmark_paths[i].as_posix()}/{benchmark_data.benchmark_names[i]}')
+        self._benchmark_count = max(self._benchmark_count, benchmark_count)
+
+    def start_loading(self):
+        """Prepares the tree for `add_benchmarks` calls while benchmark data loads."""
+        self.tree_model.set_paths({}, collapse_paths=False)
+        self.search_index = SearchIndex()
+        self._benchmark_count = 0
+
+    def add_benchmarks(self, benchmark_data: BenchmarkData, benchmark_count: int):
+        """Adds benchmarks loaded since the last call."""
+        self.benchmark_data = benchmark_data
+        start = self._benchmark_count
+        with span('add_benchmarks', benchmarks=benchmark_count - start):
+            self._add_to_search_index(benchmark_data, benchmark_count)
+            if self.search_box.text().strip() == '' and not self.tree_model.collapse_paths:
+                self.tree_model.add_benchmarks(benchmark_data, start, benchmark_count)
+
+    def show_benchmarks(self, benchmark_indices: list[int] | None = None):
+        """Shows the given benchmarks with collapsed paths, every benchmark if None."""
+        with span('build_tree', benchmarks=len(self.benchmark_data.benchmark_names) if benchmark_indices is None else len(benchmark_indices)):
+            self.tree_model.set_paths(self.benchmark_data.get_paths(benchmark_indices))
+        if benchmark_indices is not None and len(benchmark_indices) <= 100:
+            self.view.expandAll()
+
+    def loading_finished(self):
+        """Replaces the tree built while loading with one that collapses paths."""
+        if self.search_box.text().strip() != '':
+            self.search(self.search_box.text())
+        elif len(self.selected_indicies) == 0:
+            self.show_benchmarks()
+
+    def search(self, text: str):
+        if text.strip() == '':
+            self.show_benchmarks()
+            return
+        with span('search', text=text) as search_span:
+            benchmark_indices = self.search_index.search(text)
+            search_span.set(matches=len(benchmark_indices))
+        self.show_benchmarks(benchmark_indices)
+
+class LoaderWorker(QtCore.QObject):
+    """Runs a loader on a worker thread, reporting its progress to the GUI thread.
+
+    Progress is reported at most every `report_interval` seconds, since every
+    report makes the GUI update the tree and table.
+    """
+    progress = QtCore.pyqtSignal(object)
+    finished = QtCore.pyqtSignal(object, bool)
+
+    def __init__(self, loader: Iterator[LoadProgress], report_interval: float = 0.25):
+        super().__init__()
+        self.loader = loader
+        self.report_interval = report_interval
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def run(self):
+        last_progress: LoadProgress | None = None
+        last_report = 0.0
+        try:
+            with span('load_benchmark_data') as load_span:
+                for progress in self.loader:
+                    last_progress = progress
+                    if self._cancelled.is_set():
+                        break
+                    now = time.monotonic()
+                    if progress.files_loaded == 0 or now - last_report >= self.report_interval:
+                        last_report = now
+                        self.progress.emit(progress)
+                if last_progress is not None:
+                    load_span.set(files=last_progress.files_loaded, benchmarks=last_progress.benchmark_count)
+        except Exception:
+            logger.exception('Failed to load benchmarks.')
+        self.finished.emit(last_progress, self._cancelled.is_set())
 
 class MainWindow(QMainWindow):
     """Main application window for ccbenchmark.
@@ -424,8 +864,10 @@ class MainWindow(QMainWindow):
 
         table (QTableView): 
             Table widget displaying benchmark results.
-        tree (QTreeView): 
-            Tree widget for browsing benchmark categories.
+        tree (ProfileSelectionTreeView): 
+            Searchable tree for browsing benchmark categories.
+        chart (ChartView | None): 
+            Chart of the selected benchmarks over iterations, None without PyQtChart.
         toolbar (QToolBar): 
             Toolbar containing GUI actions and controls.
         selmodel (QItemSelectionModel): 
@@ -433,7 +875,7 @@ class MainWindow(QMainWindow):
         splitter (QSplitter): 
             Splits the window between the tree and the table.
     """
-    def __init__(self, benchmark_data: BenchmarkData):
+    def __init__(self, benchmark_data: BenchmarkData, noise_floors: 'NoiseFloors | None' = None):
         """Initializes GUI elements.
             
         Initializes table, treem toolbar, selmodel, and splitter.
@@ -441,24 +883,104 @@ class MainWindow(QMainWindow):
         Args:
             benchmark_data:
                 Model with names of rows, name of columns, and data.
+            noise_floors:
+                Noise floors the table is colored relative to, fixed limits if None.
         """
         super().__init__()
-        assert len(benchmark_data.benchmark_names) != 0, f'no benchmark names!'
         self.benchmark_data = benchmark_data
+        self.loader_thread: QtCore.QThread | None = None
+        self.loader_worker: LoaderWorker | None = None
 
-        self.profile_selection_tree = ProfileSelectionTreeView(self, self.benchmark_data.get_paths())
+        self.tree = ProfileSelectionTreeView(self, self.benchmark_data)
+        self.chart = ChartView() if ChartView is not None else None
         self.toolbar = ToolbarView('Main Toolbar', self, self.benchmark_data.get_columns(self.tree.selected_indicies), self.tree.selected_indicies)
-        self.benchmark_data_table = BenchmarkDataTableView(self.benchmark_data, self.tree.selected_indicies, self.toolbar.time_type)
+        self.table = BenchmarkDataTableView(self.benchmark_data, self.tree.selected_indicies, self.toolbar.time_type, noise_floors)
 
         self.splitter = QSplitter()
 
         self.splitter.addWidget(self.tree)
-        self.splitter.addWidget(self.table)
+        if self.chart is not None:
+            self.chart.hide()
+            self.table_splitter = QSplitter(QtCore.Qt.Vertical)
+            self.table_splitter.addWidget(self.table)
+            self.table_splitter.addWidget(self.chart)
+            self.splitter.addWidget(self.table_splitter)
+        else:
+            self.splitter.addWidget(self.table)
 
         self.setCentralWidget(self.splitter)
 
+        self.progress_bar = QProgressBar()
+        self.cancel_button = QPushButton('Cancel')
+        self.cancel_button.clicked.connect(self.cancel_loading)
+        self.statusBar().addPermanentWidget(self.progress_bar)
+        self.statusBar().addPermanentWidget(self.cancel_button)
+        self.progress_bar.hide()
+        self.cancel_button.hide()
+
         QTimer.singleShot(0, self.set_split_sizes)
 
+    def load(self, loader: Iterator[LoadProgress]):
+        """Loads benchmark data on a worker thread, filling in the window as it arrives.
+
+        Args:
+            loader:
+                Generator from `iter_load_iterations`, consumed on the worker thread.
+        """
+        self.loader_thread = QtCore.QThread(self)
+        self.loader_worker = LoaderWorker(loader)
+        self.loader_worker.moveToThread(self.loader_thread)
+        self.loader_thread.started.connect(self.loader_worker.run)
+        self.loader_worker.progress.connect(self.loading_progress)
+        self.loader_worker.finished.connect(self.loading_finished)
+        self.loader_worker.finished.connect(self.loader_thread.quit)
+
+        self.tree.start_loading()
+        self.progress_bar.setValue(0)
+        self.progress_bar.show()
+        self.cancel_button.show()
+        self.statusBar().showMessage('Searching for results...')
+        self.loader_thread.start()
+
+    def cancel_loading(self):
+        if self.loader_worker is not None:
+            self.loader_worker.cancel()
+            self.statusBar().showMessage('Cancelling...')
+
+    def _refresh(self, benchmark_data: BenchmarkData, benchmark_count: int):
+        self.benchmark_data = benchmark_data
+        self.tree.add_benchmarks(benchmark_data, benchmark_count)
+        if len(self.tree.selected_indicies) != 0:
+            self.table.modify_table(self.benchmark_data, self.tree.selected_indicies, self.toolbar.time_type)
+            self.update_chart()
+
+    def loading_progress(self, progress: LoadProgress):
+        self.progress_bar.setMaximum(max(progress.file_count, 1))
+        self.progress_bar.setValue(progress.files_loaded)
+        if progress.iteration_name != '':
+            self.statusBar().showMessage(f'Loading {progress.iteration_name}... {progress.benchmark_count} benchmarks')
+        self._refresh(progress.benchmark_data, progress.benchmark_count)
+
+    def loading_finished(self, progress: LoadProgress | None, cancelled: bool):
+        self.progress_bar.hide()
+        self.cancel_button.hide()
+        self.loader_worker = None
+        if progress is None:
+            self.statusBar().showMessage('No benchmarks loaded.')
+            return
+        self._refresh(progress.benchmark_data, progress.benchmark_count)
+        self.tree.loading_finished()
+        state = 'Loading cancelled' if cancelled else 'Loaded'
+        self.statusBar().showMessage(
+            f'{state}: {progress.files_loaded}/{progress.file_count} files, {progress.benchmark_count} benchmarks.'
+        )
+
+    def closeEvent(self, event: QtGui.QCloseEvent):
+        if self.loader_thread is not None and self.loader_thread.isRunning():
+            self.cancel_loading()
+            self.loader_thread.wait()
+        super().closeEvent(event)
+
     def change_parent_selected(self):
         action: QAction = self.sender()
         name = action.text()
@@ -478,16 +1000,16 @@ class MainWindow(QMainWindow):
         self.splitter.setSizes([left, right])
 
     def selection_change(self, selected: QtCore.QItemSelection, deselected: QtCore.QItemSelection):
-        for index in selected.indexes():
-            item = self.tree.itemFromIndex(index)
-            column_index: int | None = item.data(0, QtCore.Qt.UserRole)
+        # Recomputed from the selection model, since a model reset from searching drops
+        # the selection without reporting what was deselected.
+        now_selected: set[int] = set()
+        for index in self.tree.selmodel.selectedIndexes():
+            column_index: int | None = index.data(QtCore.Qt.UserRole)
             if column_index is not None:
-                self.tree.selected_indicies.append(column_index)
-        for index in deselected.indexes():
-            item = self.tree.itemFromIndex(index)
-            column_index: int | None = item.data(0, QtCore.Qt.UserRole)
-            if column_index is not None:
-                self.tree.selected_indicies.remove(column_index)
+                now_selected.add(column_index)
+        kept = [i for i in self.tree.selected_indicies if i in now_selected]
+        kept_set = set(kept)
+        self.tree.selected_indicies[:] = kept + sorted(now_selected - kept_set)
 
         self.tree.selected_names = [self.benchmark_data.benchmark_names[i] for i in self.tree.selected_indicies]
 
@@ -497,28 +1019,98 @@ class MainWindow(QMainWindow):
         column_names = self.benchmark_data.get_columns(self.tree.selected_indicies)
 
         self.table.modify_table(self.benchmark_data, self.tree.selected_indicies, self.toolbar.time_type)
-        self.toolbar.modify_toolbar(column_names, self.tree.selected_names, self)
+        self.toolbar.modify_toolbar(column_names, self.tree.selected_names, self, self.table.table_model.valid_columns)
+        self.update_chart()
+
+    def toggle_chart(self, checked: bool):
+        self.chart.setVisible(checked)
+        self.update_chart()
+
+    def update_chart(self):
+        """Charts the selected benchmarks, if the chart is shown."""
+        if self.chart is None or not self.chart.isVisible():
+            return
+        self.chart.set_benchmarks(self.benchmark_data, self.tree.selected_indicies, self.toolbar.time_type)
+
+    def show_scaling(self):
+        scaling_view = ScalingView(self, self.benchmark_data, self.tree.selected_indicies, self.toolbar.time_type)
+        scaling_view.show()
+
+    def show_heatmap(self):
+        heatmap_view = HeatmapView(self, self.benchmark_data, self.toolbar.time_type)
+        heatmap_view.show()
+
+    def show_distribution(self):
+        distribution_view = DistributionView(self, self.benchmark_data, self.tree.selected_indicies, self.toolbar.time_type)
+        distribution_view.show()
 
     def export_to_csv(self):
         file = QFileDialog(self)
         data = get_csv(self.table.to_matrix())
         file.saveFileContent(data, f'benchmark.csv')
 
-def show_gui(benchmark_data: BenchmarkData) -> int:
+    def export_all(self):
+        """Exports every result of every iteration, not only the table."""
+        from ccbenchmark.export import ExportFormat, export_benchmark_data
+
+        name_filters = {
+            'CSV (*.csv)': ExportFormat.CSV,
+            'NDJSON (*.ndjson)': ExportFormat.NDJSON,
+            'Parquet (*.parquet)': ExportFormat.PARQUET,
+        }
+        file_name, name_filter = QFileDialog.getSaveFileName(self, 'Export All', 'benchmarks.csv', ';;'.join(name_filters))
+        if file_name == '':
+            return
+        export_format = name_filters[name_filter]
+
+        progress_dialog = QProgressDialog('Exporting...', 'Cancel', 0, 0, self)
+        progress_dialog.setWindowModality(QtCore.Qt.WindowModal)
+        progress_dialog.setMinimumDuration(500)
+        row_count = 0
+        canceled = False
+        exporter = export_benchmark_data(self.benchmark_data, Path(file_name), export_format)
+        try:
+            for row_count in exporter:
+                progress_dialog.setLabelText(f'Exporting... {row_count} rows')
+                QApplication.processEvents()
+                if progress_dialog.wasCanceled():
+                    canceled = True
+                    break
+        except (ImportError, ValueError, OSError) as e:
+            QMessageBox.warning(self, 'Export All', f'Export failed: {e}')
+            return
+        finally:
+            exporter.close()
+            progress_dialog.close()
+        if canceled:
+            # The file only holds the rows written before the export was canceled.
+            Path(file_name).unlink(missing_ok=True)
+            self.statusBar().showMessage(f'Export canceled, {file_name} was not written.')
+            return
+        self.statusBar().showMessage(f'{row_count} rows exported to {file_name}.')
+
+def show_gui(benchmark_data: BenchmarkData | None = None, loader: Iterator[LoadProgress] | None = None, noise_floors: 'NoiseFloors | None' = None) -> int:
     """Display the benchmark comparison GUI.
 
     Launches a Qt application showing benchmark results in a
     tabular/graphical interface.
 
     Args:
-        benchmark_data (BenchmarkData): 
+        benchmark_data (BenchmarkData | None): 
             Structured benchmark results including the data matrix, 
             row labels, and column labels.
+        loader (Iterator[LoadProgress] | None): 
+            Loads benchmark data on a worker thread after the window is shown,
+            replacing ``benchmark_data``.
+        noise_floors (NoiseFloors | None): 
+            Noise floors from ``ccbenchmark calibrate`` the table is colored relative to.
 
     Returns:
         int: Exit code from ``QApplication.exec_()``.
     """
     app = QApplication(sys.argv)
-    window = MainWindow(benchmark_data)
+    window = MainWindow(benchmark_data if benchmark_data is not None else BenchmarkData([]), noise_floors)
     window.show()
-    return app.exec_()
\ No newline at end of file
+    if loader is not None:
+        window.load(loader)
+    return app.exec_()
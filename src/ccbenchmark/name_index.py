@@ -0,0 +1,431 @@
+"""Benchmark name index and filters.
+
+`NameIndex` is a trie over the parts of a benchmark's id, the path of the runnable
+that produced it followed by its name split on '/'. For example, the benchmark
+`BM_Sort/1024` of `cpp/sort_benchmark` has the id `cpp/sort_benchmark/BM_Sort/1024`.
+Walking the trie with a `BenchmarkFilter` skips every subtree the filter can not
+match, so a filter on one subsystem never looks at the rest.
+
+Defines:
+    - BenchmarkFilter: Regex or glob matched against benchmark ids.
+    - NameIndex: Trie mapping benchmark ids to benchmark indices.
+    - SearchIndex: Incremental substring and fuzzy search over benchmark ids.
+    - glob_to_regex(): Translates a glob into a regex frameworks accept.
+    - escape_regex(): Escapes text for Python and POSIX extended regexes.
+    - get_names_pattern(): Regex frameworks accept matching exactly some names.
+"""
+
+from __future__ import annotations
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Generator
+import re
+
+_REGEX_SPECIAL_CHARS = set('.^$*+?()[]{}|\\')
+
+def escape_regex(text: str) -> str:
+    """Escapes the special characters of `text`, the result matches it literally
+    in Python and POSIX extended regexes.
+
+    Unlike `re.escape`, other characters (e.g., '-') are left alone, POSIX leaves
+    escaping them undefined.
+    """
+    return ''.join('\\' + char if char in _REGEX_SPECIAL_CHARS else char for char in text)
+
+def get_names_pattern(names: list[str]) -> str:
+    """Anchored POSIX extended regex matching exactly `names`, only the empty name if there are none."""
+    if len(names) == 0:
+        return '^$'
+    return f"^({'|'.join(escape_regex(name) for name in names)})$"
+
+def _glob_segment_to_regex(segment: str) -> str:
+    if segment == '**':
+        return '.*'
+    regex = ''
+    i = 0
+    while i < len(segment):
+        char = segment[i]
+        if char == '*':
+            regex += '[^/]*'
+        elif char == '?':
+            regex += '[^/]'
+        elif char == '[':
+            end = segment.find(']', i + 1)
+            if end == -1:
+                regex += '\\['
+            else:
+                body = segment[i + 1:end]
+                if body.startswith('!'):
+                    body = '^' + body[1:]
+                regex += f'[{body}]'
+                i = end
+        else:
+            regex += escape_regex(char)
+        i += 1
+    return regex
+
+def glob_to_regex(glob_segments: list[str]) -> str:
+    """Translates glob segments into an anchored POSIX extended regex.
+
+    The output only uses syntax shared by Python and POSIX extended regexes, so it
+    can be passed to frameworks such as Google Benchmark's `--benchmark_filter`.
+
+    Args:
+        glob_segments: Glob split on '/'. '**' matches any number of segments.
+
+    Returns:
+        str: Regex matching the same names as the glob.
+    """
+    regex = ''
+    for i, segment in enumerate(glob_segments):
+        if segment == '**':
+            # Matches zero or more whole segments.
+            regex += '(.*/)?' if i + 1 < len(glob_segments) else '.*'
+            continue
+        regex += _glob_segment_to_regex(segment)
+        if i + 1 < len(glob_segments):
+            regex += '/'
+    return f'^{regex}$'
+
+class BenchmarkFilter:
+    """Regex or glob matched against benchmark ids (`<runnable path>/<benchmark name>`).
+
+    A regex matches if it is found anywhere in the id (`re.search`), so a plain
+    benchmark name pattern works as well. A glob must match the whole id, segment
+    by segment: '*' does not cross '/', and '**' matches any number of segments.
+
+    The filter is walked one id part at a time so tries can skip subtrees that
+    can not match.
+    """
+    def __init__(self, pattern: str, is_glob: bool = False):
+        """
+        Args:
+            pattern:
+                Regex or glob.
+            is_glob:
+                True if pattern is a glob.
+        Raises:
+            re.error: If pattern is not a valid regex.
+        """
+        self.pattern = pattern
+        self.is_glob = is_glob
+        self.glob_segments: list[str] = pattern.split('/') if is_glob else []
+        self.regex = re.compile(glob_to_regex(self.glob_segments) if is_glob else pattern)
+        self._literal_prefix = '' if is_glob else self._get_literal_prefix(pattern)
+
+    @staticmethod
+    def _get_literal_prefix(pattern: str) -> str:
+        """Returns the literal text an anchored regex starts with, e.g. '^cpp/sort.*' -> 'cpp/sort'."""
+        # An alternation may match without the prefix, e.g. '^cpp/sort|BM_Hash'.
+        if not pattern.startswith('^') or '|' in pattern:
+            return ''
+        prefix = ''
+        for char in pattern[1:]:
+            if char in _REGEX_SPECIAL_CHARS:
+                # A quantifier applies to the character before it, which may then be absent.
+                if char in '*?{' and len(prefix) != 0:
+                    prefix = prefix[:-1]
+                break
+            prefix += char
+        return prefix
+
+    def _closure(self, states: set[int]) -> frozenset[int]:
+        closed = set(states)
+        pending = list(states)
+        while len(pending) != 0:
+            i = pending.pop()
+            if i < len(self.glob_segments) and self.glob_segments[i] == '**' and i + 1 not in closed:
+                closed.add(i + 1)
+                pending.append(i + 1)
+        return frozenset(closed)
+
+    def start(self) -> frozenset[int] | str:
+        """Returns the state before any id part was walked."""
+        if self.is_glob:
+            return self._closure({0})
+        return ''
+
+    def advance(self, state: frozenset[int] | str, part: str) -> frozenset[int] | str | None:
+        """Walks one id part. Returns None if no id starting with the walked parts can match."""
+        if not self.is_glob:
+            walked = f'{state}{part}/'
+            common_length = min(len(walked), len(self._literal_prefix))
+            if walked[:common_length] != self._literal_prefix[:common_length]:
+                return None
+            return walked
+
+        next_states: set[int] = set()
+        for i in state:
+            if i >= len(self.glob_segments):
+                continue
+            segment = self.glob_segments[i]
+            if segment == '**':
+                next_states.add(i)
+            elif fnmatchcase(part, segment):
+                next_states.add(i + 1)
+        if len(next_states) == 0:
+            return None
+        return self._closure(next_states)
+
+    def accepts(self, state: frozenset[int] | str) -> bool:
+        """Returns True if the walked parts form an id the filter matches."""
+        if self.is_glob:
+            return len(self.glob_segments) in state
+        return self.regex.search(state[:-1]) is not None
+
+    def could_match_under(self, path: Path) -> bool:
+        """Returns True if any benchmark of the runnable at `path` could match."""
+        state = self.start()
+        for part in path.parts:
+            state = self.advance(state, part)
+            if state is None:
+                return False
+        return True
+
+    def matches(self, path: Path, name: str) -> bool:
+        """Returns True if the benchmark `name` of the runnable at `path` matches."""
+        if not self.is_glob:
+            return self.regex.search(f'{path.as_posix()}/{name}') is not None
+        state = self.start()
+        for part in (*path.parts, *name.split('/')):
+            state = self.advance(state, part)
+            if state is None:
+                return False
+        return self.accepts(state)
+
+    def get_name_pattern(self, path: Path, names: list[str] | None = None) -> str | None:
+        """Returns a regex for the names of the runnable at `path`, or None if none can match.
+
+        Frameworks only see benchmark names, so for globs the segments matched by
+        `path`, or by any trailing part of it, are removed. A regex may match across
+        the path and the name, so it is matched against the id of each of `names`,
+        the benchmarks the runnable has, and the matching ones are selected exactly.
+        Without `names`, '' is returned if any benchmark could match: every benchmark
+        is run and the results are filtered with `matches` afterwards.
+        """
+        if not self.is_glob:
+            if not self.could_match_under(path):
+                return None
+            if names is None:
+                return ''
+            matching_names = [name for name in names if self.matches(path, name)]
+            if len(matching_names) == 0:
+                return None
+            return get_names_pattern(matching_names)
+
+        remaining: set[int] = set()
+        for start_index in range(len(path.parts)):
+            state = self.start()
+            for part in path.parts[start_index:]:
+                state = self.advance(state, part)
+                if state is None:
+                    break
+            if state is not None:
+                remaining |= state
+        remaining.discard(len(self.glob_segments))
+        if len(remaining) == 0:
+            return None
+        name_regexes = sorted({glob_to_regex(self.glob_segments[i:])[1:-1] for i in remaining})
+        if len(name_regexes) == 1:
+            return f'^{name_regexes[0]}$'
+        return f'^({"|".join(name_regexes)})$'
+
+class _Node:
+    __slots__ = ('children', 'names', 'index')
+
+    def __init__(self):
+        self.children: dict[str, _Node] = {}
+        # Root of the name trie if a runnable's results are at this path.
+        self.names: _Node | None = None
+        self.index: int | None = None
+
+class NameIndex:
+    """Trie mapping (runnable path, benchmark name) to a benchmark index.
+
+    Path parts and name parts are kept in separate tries, so a runnable named like
+    a directory never collides with it.
+    """
+    def __init__(self):
+        self._root = _Node()
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _find_names(self, path: Path, create: bool) -> _Node | None:
+        node = self._root
+        for part in path.parts:
+            next_node = node.children.get(part)
+            if next_node is None:
+                if not create:
+                    return None
+                next_node = _Node()
+                node.children[part] = next_node
+            node = next_node
+        if node.names is None and create:
+            node.names = _Node()
+        return node.names
+
+    def _find(self, key: tuple[Path, str], create: bool) -> _Node | None:
+        path, name = key
+        node = self._find_names(path, create)
+        if node is None:
+            return None
+        for part in name.split('/'):
+            next_node = node.children.get(part)
+            if next_node is None:
+                if not create:
+                    return None
+                next_node = _Node()
+                node.children[part] = next_node
+            node = next_node
+        return node
+
+    def add_path(self, path: Path) -> None:
+        """Adds a runnable path without any benchmarks."""
+        self._find_names(path, True)
+
+    def get(self, key: tuple[Path, str], default: int | None = None) -> int | None:
+        node = self._find(key, False)
+        if node is None or node.index is None:
+            return default
+        return node.index
+
+    def __contains__(self, key: tuple[Path, str]) -> bool:
+        return self.get(key) is not None
+
+    def __getitem__(self, key: tuple[Path, str]) -> int:
+        index = self.get(key)
+        if index is None:
+            raise KeyError(key)
+        return index
+
+    def __setitem__(self, key: tuple[Path, str], index: int) -> None:
+        node = self._find(key, True)
+        if node.index is None:
+            self._length += 1
+        node.index = index
+
+    def _walk(self, node: _Node, parts: list[str], benchmark_filter: BenchmarkFilter | None,
+              state) -> Generator[tuple[list[str], _Node, object], None, None]:
+        """Yields every node below `node` the filter has not ruled out, depth first."""
+        yield (parts, node, state)
+        for part, child in node.children.items():
+            child_state = state
+            if benchmark_filter is not None:
+                child_state = benchmark_filter.advance(state, part)
+                if child_state is None:
+                    continue
+            parts.append(part)
+            yield from self._walk(child, parts, benchmark_filter, child_state)
+            parts.pop()
+
+    def match_paths(self, benchmark_filter: BenchmarkFilter | None = None) -> list[Path]:
+        """Returns runnable paths whose benchmarks could match the filter.
+
+        Args:
+            benchmark_filter: Filter walked down the trie, every path if None.
+
+        Returns:
+            list[Path]: Matching runnable paths.
+        """
+        start = benchmark_filter.start() if benchmark_filter is not None else None
+        return [
+            Path(*parts)
+            for parts, node, _ in self._walk(self._root, [], benchmark_filter, start)
+            if node.names is not None
+        ]
+
+    def match(self, benchmark_filter: BenchmarkFilter | None = None) -> list[int]:
+        """Returns indices of the benchmarks the filter matches, in trie order.
+
+        Args:
+            benchmark_filter: Filter walked down the trie, every benchmark if None.
+
+        Returns:
+            list[int]: Matching benchmark indices.
+        """
+        start = benchmark_filter.start() if benchmark_filter is not None else None
+        indices: list[int] = []
+        for _, path_node, path_state in self._walk(self._root, [], benchmark_filter, start):
+            if path_node.names is None:
+                continue
+            for _, name_node, name_state in self._walk(path_node.names, [], benchmark_filter, path_state):
+                if name_node.index is None:
+                    continue
+                if benchmark_filter is None or benchmark_filter.accepts(name_state):
+                    indices.append(name_node.index)
+        return indices
+
+class SearchIndex:
+    """Incremental substring and fuzzy search over benchmark ids.
+
+    Ids are matched case-insensitively. Substring matches are returned in the
+    order benchmarks were added. Only if there are none, fuzzy matches (the query's
+    characters in order, e.g. 'bmsrt' matches 'BM_Sort') are returned from the
+    tightest to the loosest.
+
+    When a query contains the previous query, as it does while typing, only ids
+    the previous query matched fuzzily can match, so only they are searched.
+    """
+    def __init__(self):
+        self._ids: list[str] = []
+        self._indices: list[int] = []
+        self._last_query = ''
+        self._last_positions: list[int] | None = None
+        self._last_id_count = 0
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, benchmark_index: int, benchmark_id: str) -> None:
+        """Adds a benchmark, it is matched by searches from then on.
+
+        Args:
+            benchmark_index: Index of the benchmark in BenchmarkData.
+            benchmark_id: Text searched, usually `<path>/<name>`.
+        """
+        self._ids.append(benchmark_id.lower())
+        self._indices.append(benchmark_index)
+
+    def search(self, query: str) -> list[int]:
+        """Returns indices of the benchmarks matching `query`, every benchmark if it is empty.
+
+        Args:
+            query: Text typed by the user.
+
+        Returns:
+            list[int]: Benchmark indices of substring matches, or of fuzzy matches if there are none.
+        """
+        query = query.strip().lower()
+        if query == '':
+            self._last_query = ''
+            self._last_positions = None
+            return list(self._indices)
+
+        if self._last_positions is not None and self._last_query in query:
+            # Benchmarks added since the last search have not been narrowed yet.
+            candidates = self._last_positions + list(range(self._last_id_count, len(self._ids)))
+        else:
+            candidates = range(len(self._ids))
+
+        ids = self._ids
+        # Every substring match is also a fuzzy match, so fuzzy matches are kept for narrowing.
+        fuzzy_regex = re.compile('.*?'.join(re.escape(char) for char in query))
+        spans: list[tuple[int, int]] = []
+        substring_positions: list[int] = []
+        for position in candidates:
+            match = fuzzy_regex.search(ids[position])
+            if match is None:
+                continue
+            spans.append((match.end() - match.start(), position))
+            if query in ids[position]:
+                substring_positions.append(position)
+
+        self._last_query = query
+        self._last_positions = sorted(position for _, position in spans)
+        self._last_id_count = len(self._ids)
+        if len(substring_positions) != 0:
+            return [self._indices[position] for position in substring_positions]
+        spans.sort()
+        return [self._indices[position] for _, position in spans]
@@ -0,0 +1,308 @@
+"""Headless comparison reports.
+
+Compares two iterations of every benchmark and streams the comparison, sorted
+from the largest regression to the largest improvement, as Markdown, HTML or JSON.
+Rows are written as they are produced so the report is never held in memory.
+Benchmarks whose runnable ran under load in either iteration (see
+`ccbenchmark.telemetry`) are flagged. With noise floors from `ccbenchmark
+calibrate`, Δ is colored relative to the noise floor of each benchmark.
+Benchmarks re-run by `ccbenchmark confirm` are labeled confirmed or refuted.
+
+Defines:
+    - ReportFormat: Supported report formats.
+    - Comparison: Comparison of one benchmark between two iterations.
+    - compare_iterations(): Compares two iterations using the Rust Manager.
+    - write_report(): Streams comparisons to a text stream.
+"""
+
+from enum import StrEnum
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Generator, Iterable, TextIO
+import html
+import json
+import math
+
+from ccbenchmark.benchmark_data import BenchmarkData, TimeType
+from ccbenchmark.confirm import Confirmation, Verdict
+from ccbenchmark.frameworks.util.metrics import METRICS, MetricIndices
+from ccbenchmark.trace import span
+
+if TYPE_CHECKING:
+    from ccbenchmark.calibration import NoiseFloors
+
+"""Metrics compared, in order of preference, for each benchmark."""
+COMPARED_METRICS = [MetricIndices.Time.value, MetricIndices.Mean.value, MetricIndices.Median.value]
+
+class ReportFormat(StrEnum):
+    """Report formats supported by ccbenchmark"""
+    MARKDOWN = 'md'
+    HTML = 'html'
+    JSON = 'json'
+
+@dataclass(slots=True)
+class Comparison:
+    """Comparison of one benchmark between two iterations.
+
+    Attributes:
+        benchmark_index: Index of the benchmark in BenchmarkData.
+        path: Path of the runnable the benchmark belongs to.
+        name: Name of the benchmark.
+        metric_name: Metric that was compared (e.g., 'Time', 'μ').
+        baseline: Value in the baseline iteration, in ns.
+        candidate: Value in the candidate iteration, in ns.
+        delta: Change from baseline to candidate in percent, positive is slower.
+        load_warning: Iterations whose result was taken under load and why, '' if neither was.
+        confirmation: Outcome of re-running the benchmark with `ccbenchmark confirm`, None if it was not.
+    """
+    benchmark_index: int
+    path: Path
+    name: str
+    metric_name: str
+    baseline: float
+    candidate: float
+    delta: float
+    load_warning: str = ''
+    confirmation: Confirmation | None = None
+
+def _get_load_warning(benchmark_data: BenchmarkData, benchmark_index: int, iteration_indices: dict[str, int]) -> str:
+    warnings = []
+    for iteration_name, iteration_index in iteration_indices.items():
+        warning = benchmark_data.get_load_warning(iteration_index, benchmark_index)
+        if warning != '':
+            warnings.append(f'{iteration_name}: {warning}')
+    return ', '.join(warnings)
+
+def compare_iterations(
+    benchmark_data: BenchmarkData,
+    baseline_name: str,
+    candidate_name: str,
+    time_type: TimeType
+) -> Generator[Comparison, None, None]:
+    """Compares two iterations of every benchmark.
+
+    The comparison and sort are done by the Rust Manager, Comparison objects are
+    only created as they are consumed.
+
+    Args:
+        benchmark_data: Loaded benchmark data.
+        baseline_name: Name of the iteration compared against.
+        candidate_name: Name of the iteration being checked.
+        time_type: Real or CPU time.
+
+    Returns:
+        Generator[Comparison]: Comparisons sorted from the largest Δ to the smallest.
+    """
+    baseline_index = benchmark_data.iteration_names.index(baseline_name)
+    candidate_index = benchmark_data.iteration_names.index(candidate_name)
+    with span('Manager.compare_iterations', category='rust', benchmarks=len(benchmark_data.benchmark_names)):
+        comparisons = benchmark_data.benchmark_types[time_type].compare_iterations(
+            baseline_index, candidate_index, COMPARED_METRICS, 'ns'
+        )
+    iteration_indices = {baseline_name: baseline_index, candidate_name: candidate_index}
+    for benchmark_index, metric_index, baseline, candidate, delta in comparisons:
+        yield Comparison(
+            benchmark_index,
+            benchmark_data.benchmark_paths[benchmark_index],
+            benchmark_data.benchmark_names[benchmark_index],
+            METRICS[metric_index],
+            baseline,
+            candidate,
+            delta,
+            _get_load_warning(benchmark_data, benchmark_index, iteration_indices),
+            benchmark_data.get_confirmation(candidate_index, benchmark_index, baseline_name)
+        )
+
+class _ReportWriter:
+    """Writes a report one comparison at a time."""
+    def __init__(self, stream: TextIO, baseline_name: str, candidate_name: str, time_type: TimeType, noise_floors: 'NoiseFloors | None'):
+        self.stream = stream
+        self.noise_floors = noise_floors
+        self.baseline_name = baseline_name
+        self.candidate_name = candidate_name
+        self.time_type = time_type
+        self.compared_count = 0
+        self.slower_count = 0
+        self.faster_count = 0
+        self.under_load_count = 0
+        self.verdict_counts = {verdict: 0 for verdict in Verdict}
+
+    def count(self, comparison: Comparison) -> None:
+        self.compared_count += 1
+        if comparison.delta > 0.0:
+            self.slower_count += 1
+        elif comparison.delta < 0.0:
+            self.faster_count += 1
+        if comparison.load_warning != '':
+            self.under_load_count += 1
+        if comparison.confirmation is not None:
+            self.verdict_counts[comparison.confirmation.verdict] += 1
+
+    def delta_color(self, comparison: Comparison) -> str:
+        """Color of Δ, relative to the noise floor of the benchmark if known."""
+        if self.noise_floors is None:
+            return _delta_color(comparison.delta)
+        return _delta_color(comparison.delta, self.noise_floors.get_color_limits(comparison.path, comparison.name)[0])
+
+    def noise_floor(self, comparison: Comparison) -> float | None:
+        """Noise floor of the benchmark in Δ%, None if unknown."""
+        if self.noise_floors is None:
+            return None
+        noise_floor = self.noise_floors.get_delta_floor(comparison.path, comparison.name)
+        return noise_floor if noise_floor == noise_floor else None
+
+    def summary(self) -> str:
+        summary = f'{self.compared_count} benchmarks compared, {self.slower_count} slower, {self.faster_count} faster.'
+        if self.under_load_count != 0:
+            summary += f' {self.under_load_count} taken under load.'
+        if sum(self.verdict_counts.values()) != 0:
+            summary += ' Re-run: ' + ', '.join(f'{count} {verdict}' for verdict, count in self.verdict_counts.items()) + '.'
+        return summary
+
+    def write_header(self) -> None: ...
+    def write_row(self, comparison: Comparison) -> None: ...
+    def write_footer(self) -> None: ...
+
+class _MarkdownWriter(_ReportWriter):
+    def write_header(self) -> None:
+        self.stream.write(f'# Benchmark report: {self.baseline_name} → {self.candidate_name} ({self.time_type.name.lower()} time)\n\n')
+        self.stream.write('| Path | Benchmark | Metric | Baseline (ns) | Candidate (ns) | Δ (%) | Under load | Confirmation |\n')
+        self.stream.write('|---|---|---|---:|---:|---:|---|---|\n')
+
+    def write_row(self, comparison: Comparison) -> None:
+        path = str(comparison.path).replace('|', '\\|')
+        name = comparison.name.replace('|', '\\|')
+        load_warning = f'⚠ {comparison.load_warning}' if comparison.load_warning != '' else ''
+        confirmation = comparison.confirmation.describe() if comparison.confirmation is not None else ''
+        self.stream.write(
+            f'| {path} | {name} | {comparison.metric_name} | {comparison.baseline:.2f} '
+            f'| {comparison.candidate:.2f} | {comparison.delta:+.2f} | {load_warning} | {confirmation} |\n'
+        )
+
+    def write_footer(self) -> None:
+        self.stream.write(f'\n{self.summary()}\n')
+
+def _delta_color(delta: float, peak_delta_value: float = 20.0) -> str:
+    """Same scheme as the GUI, red for slower and green for faster."""
+    if delta != delta:
+        return '#222222'
+    t = max(min(delta / peak_delta_value, 1.0), -1.0)
+    default_color = (34, 34, 34)
+    selected_color = (0, 160, 80) if t < 0.0 else (220, 50, 50)
+    t = abs(t)
+    red, green, blue = (int((1.0 - t)*a + t*b) for a, b in zip(default_color, selected_color))
+    return f'#{red:02x}{green:02x}{blue:02x}'
+
+class _HtmlWriter(_ReportWriter):
+    def write_header(self) -> None:
+        title = html.escape(f'Benchmark report: {self.baseline_name} → {self.candidate_name}')
+        noise_note = ''
+        if self.noise_floors is not None:
+            noise_note = f'<p>Δ colored relative to the noise floors of {html.escape(self.noise_floors.host)}.</p>\n'
+        self.stream.write(
+            '<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+            f'<title>{title}</title>\n'
+            '<style>\n'
+            'body { font-family: sans-serif; color: #222; }\n'
+            'table { border-collapse: collapse; }\n'
+            'th, td { padding: 2px 8px; border-bottom: 1px solid #ddd; }\n'
+            'td.number { text-align: right; font-family: monospace; }\n'
+            '</style>\n</head>\n<body>\n'
+            f'<h1>{title} ({self.time_type.name.lower()} time)</h1>\n'
+            f'{noise_note}'
+            '<table>\n<tr><th>Path</th><th>Benchmark</th><th>Metric</th>'
+            '<th>Baseline (ns)</th><th>Candidate (ns)</th><th>Δ (%)</th><th>Under load</th><th>Confirmation</th></tr>\n'
+        )
+
+    def write_row(self, comparison: Comparison) -> None:
+        confirmation = comparison.confirmation.describe() if comparison.confirmation is not None else ''
+        self.stream.write(
+            f'<tr><td>{html.escape(str(comparison.path))}</td><td>{html.escape(comparison.name)}</td>'
+            f'<td>{html.escape(comparison.metric_name)}</td>'
+            f'<td class="number">{comparison.baseline:.2f}</td><td class="number">{comparison.candidate:.2f}</td>'
+            f'<td class="number" style="color: {self.delta_color(comparison)}">{comparison.delta:+.2f}</td>'
+            f'<td>{html.escape(comparison.load_warning)}</td><td>{html.escape(confirmation)}</td></tr>\n'
+        )
+
+    def write_footer(self) -> None:
+        self.stream.write(f'</table>\n<p>{html.escape(self.summary())}</p>\n</body>\n</html>\n')
+
+class _JsonWriter(_ReportWriter):
+    def write_header(self) -> None:
+        self.stream.write('{\n')
+        self.stream.write(f'"baseline": {json.dumps(self.baseline_name)},\n')
+        self.stream.write(f'"candidate": {json.dumps(self.candidate_name)},\n')
+        self.stream.write(f'"time_type": {json.dumps(self.time_type.name.lower())},\n')
+        self.stream.write('"benchmarks": [')
+
+    def write_row(self, comparison: Comparison) -> None:
+        row = {
+            'path': str(comparison.path),
+            'name': comparison.name,
+            'metric': comparison.metric_name,
+            'baseline': _finite_or_none(comparison.baseline),
+            'candidate': _finite_or_none(comparison.candidate),
+            'delta': _finite_or_none(comparison.delta),
+            'noise_floor': _finite_or_none(self.noise_floor(comparison)),
+            'under_load': comparison.load_warning or None,
+            'confirmation': _confirmation_to_json(comparison.confirmation)
+        }
+        separator = '\n' if self.compared_count == 1 else ',\n'
+        self.stream.write(f'{separator}{json.dumps(row, ensure_ascii=False, allow_nan=False)}')
+
+    def write_footer(self) -> None:
+        self.stream.write(
+            f'\n],\n"compared": {self.compared_count},\n'
+            f'"slower": {self.slower_count},\n"faster": {self.faster_count},\n'
+            f'"under_load": {self.under_load_count},\n'
+            f'"confirmations": {json.dumps(self.verdict_counts)}\n}}\n'
+        )
+
+def _finite_or_none(value: float | None) -> float | None:
+    """None for NaN and infinities (e.g., the Δ of a baseline of 0), which are not valid JSON."""
+    return value if value is not None and math.isfinite(value) else None
+
+def _confirmation_to_json(confirmation: Confirmation | None) -> dict | None:
+    if confirmation is None:
+        return None
+    return {
+        'verdict': confirmation.verdict.value,
+        'delta': _finite_or_none(confirmation.delta),
+        'p_value': _finite_or_none(confirmation.p_value),
+        'baseline_samples': confirmation.baseline_samples,
+        'candidate_samples': confirmation.candidate_samples,
+        'interleaved': confirmation.interleaved
+    }
+
+_WRITERS: dict[ReportFormat, type[_ReportWriter]] = {
+    ReportFormat.MARKDOWN: _MarkdownWriter,
+    ReportFormat.HTML: _HtmlWriter,
+    ReportFormat.JSON: _JsonWriter,
+}
+
+def write_report(
+    stream: TextIO,
+    comparisons: Iterable[Comparison],
+    report_format: ReportFormat,
+    baseline_name: str,
+    candidate_name: str,
+    time_type: TimeType,
+    noise_floors: 'NoiseFloors | None' = None
+) -> None:
+    """Streams comparisons to `stream` in the given format.
+
+    Args:
+        stream: Text stream the report is written to.
+        comparisons: Comparisons in the order they should be reported.
+        report_format: Markdown, HTML or JSON.
+        baseline_name: Name of the baseline iteration.
+        candidate_name: Name of the candidate iteration.
+        time_type: Real or CPU time, used in the report title.
+        noise_floors: Noise floors Δ is colored relative to, fixed limits if None.
+    """
+    writer = _WRITERS[report_format](stream, baseline_name, candidate_name, time_type, noise_floors)
+    writer.write_header()
+    for comparison in comparisons:
+        writer.count(comparison)
+        writer.write_row(comparison)
+    writer.write_footer()
@@ -0,0 +1,327 @@
+"""Runs runnables as asyncio subprocesses and journals runs.
+
+`run_single_benchmark` of a framework lets the runnable write to the terminal
+and nothing is known about it until it exits. For frameworks that provide
+`get_command`, `run_runnable` instead starts the runnable with
+`asyncio.create_subprocess_exec` and:
+
+- Reads stdout and stderr concurrently, writing both to
+  `_iter_<name>/.ccbenchmark/<runnable>.log` as lines arrive.
+- Parses stdout with the framework's `parse_progress_line` (the console table
+  of Google Benchmark), showing the latest result and results per second on a
+  status line when stderr is a terminal, or in the debug log otherwise.
+- Stops the runnable and every process it started once `RunOptions.timeout`
+  seconds passed (SIGTERM, then SIGKILL after `KILL_GRACE` seconds).
+
+`RunJournal` appends every runnable of a run that finished to
+`.ccbenchmark/journal/<iteration>.jsonl`, so `ccbenchmark run --resume` restarts
+an interrupted run after the last runnable that finished.
+
+Defines:
+    - RunOutcome: How a runnable exited.
+    - RunProgress: Live progress of one runnable.
+    - RunJournal: Journal of the runnables of a run that finished.
+    - run_runnable(): Runs a runnable, capturing its output.
+    - get_journal_path(): Journal file of an iteration.
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, TextIO
+import asyncio
+import json
+import logging
+import os
+import shutil
+import signal
+import sys
+import time
+
+from ccbenchmark.benchmark_framework import Framework, RunOptions
+
+if TYPE_CHECKING:
+    from ccbenchmark.frameworks.util.parse_result import ParseResult
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger()
+
+"""Seconds a runnable has to exit after SIGTERM before it is killed."""
+KILL_GRACE = 5.0
+"""Lines of stderr kept to log when a runnable fails."""
+STDERR_TAIL_LINES = 10
+"""Longest line read at once, longer lines are split."""
+LINE_LIMIT = 1024*1024
+"""Seconds between redraws of the status line."""
+STATUS_INTERVAL = 0.1
+JOURNAL_DIR = 'journal'
+JOURNAL_VERSION = 1
+
+@dataclass(slots=True)
+class RunOutcome:
+    """How a runnable exited.
+
+    Attributes:
+        exit_code: Exit code, negative if it was stopped by a signal.
+        seconds: Time it ran for.
+        timed_out: True if it was stopped after its timeout.
+        result_count: Results parsed from its stdout while it ran.
+        stderr_tail: Last lines it wrote to stderr.
+    """
+    exit_code: int
+    seconds: float
+    timed_out: bool = False
+    result_count: int = 0
+    stderr_tail: list[str] = field(default_factory=lambda: [])
+
+class RunProgress:
+    """Live progress of one runnable, on a status line if `stream` is a terminal."""
+    def __init__(self, runnable_name: str, stream: TextIO = sys.stderr):
+        self.runnable_name = runnable_name
+        self.stream = stream
+        self.live = stream.isatty()
+        self.result_count = 0
+        self._start_time = time.perf_counter()
+        self._last_draw = 0.0
+        self._drawn = False
+
+    def add(self, parse_result: 'ParseResult') -> None:
+        """Counts a result parsed from stdout and shows it."""
+        self.result_count += 1
+        elapsed = time.perf_counter() - self._start_time
+        rate = self.result_count/elapsed if elapsed > 0.0 else 0.0
+        status = f'{self.runnable_name}: {self.result_count} results, {rate:.1f}/s, {parse_result.name} {parse_result.real_time}'
+        if not self.live:
+            logger.debug(status)
+            return
+        now = time.perf_counter()
+        if now - self._last_draw < STATUS_INTERVAL:
+            return
+        self._last_draw = now
+        width = shutil.get_terminal_size().columns - 1
+        self.stream.write(f'\r\033[K{status[:width]}')
+        self.stream.flush()
+        self._drawn = True
+
+    def close(self) -> None:
+        """Clears the status line."""
+        if self._drawn:
+            self.stream.write('\r\033[K')
+            self.stream.flush()
+            self._drawn = False
+
+async def _read_lines(stream: asyncio.StreamReader, log_file: TextIO, on_line: Callable[[str], None]) -> None:
+    while True:
+        try:
+            data = await stream.readline()
+        except ValueError:
+            # The line is longer than LINE_LIMIT, the rest of it is read as the next line.
+            data = await stream.read(LINE_LIMIT)
+        if len(data) == 0:
+            return
+        line = data.decode(errors='replace')
+        log_file.write(line)
+        on_line(line)
+
+def _signal_group(process: asyncio.subprocess.Process, signal_number: int) -> None:
+    try:
+        os.killpg(process.pid, signal_number)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+async def _stop(process: asyncio.subprocess.Process) -> None:
+    """Stops the runnable and every process it started, which share its process group."""
+    _signal_group(process, signal.SIGTERM)
+    try:
+        await asyncio.wait_for(process.wait(), KILL_GRACE)
+    except TimeoutError:
+        _signal_group(process, signal.SIGKILL)
+        await process.wait()
+
+async def _run(
+    command: list[str],
+    run_options: RunOptions,
+    log_path: Path,
+    progress: RunProgress,
+    parse_progress_line: Callable[[str], 'ParseResult | None'] | None
+) -> RunOutcome:
+    start_time = time.perf_counter()
+    # Its own session, so a timeout stops the processes it starts too (e.g., pyperf's workers).
+    process = await asyncio.create_subprocess_exec(
+        *command, stdin=asyncio.subprocess.DEVNULL, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+        env=run_options.get_environment(), limit=LINE_LIMIT, start_new_session=True
+    )
+    stderr_tail: deque[str] = deque(maxlen=STDERR_TAIL_LINES)
+
+    def on_stdout(line: str) -> None:
+        if parse_progress_line is None:
+            return
+        parse_result = parse_progress_line(line)
+        if parse_result is not None:
+            progress.add(parse_result)
+
+    timed_out = False
+    with open(log_path, 'w', encoding='utf-8') as log_file:
+        readers = asyncio.gather(
+            _read_lines(process.stdout, log_file, on_stdout),
+            _read_lines(process.stderr, log_file, lambda line: stderr_tail.append(line.rstrip()))
+        )
+        try:
+            await asyncio.wait_for(process.wait(), run_options.timeout)
+        except TimeoutError:
+            timed_out = True
+            await _stop(process)
+        finally:
+            # Interrupted (e.g., Ctrl+C), the runnable is in another session and would keep running.
+            if process.returncode is None:
+                await _stop(process)
+        await readers
+    return RunOutcome(process.returncode, time.perf_counter() - start_time, timed_out, progress.result_count, list(stderr_tail))
+
+def run_runnable(
+    framework: Framework,
+    runnable_path: Path,
+    output_location: Path,
+    output_format: str,
+    run_options: RunOptions,
+    log_path: Path
+) -> RunOutcome:
+    """Runs a runnable, capturing its output and showing its progress.
+
+    The result of a previous run at `output_location` is removed first, so a
+    runnable that fails or times out never leaves a stale result.
+
+    Args:
+        framework: Framework of the runnable.
+        runnable_path: Runnable to run.
+        output_location: File results are written to.
+        output_format: Format of the results.
+        run_options: Options of the run, including the timeout.
+        log_path: File stdout and stderr are written to.
+
+    Returns:
+        RunOutcome: How the runnable exited, exit code 127 if it could not be started.
+    """
+    runnable_name = runnable_path.with_suffix('').name
+    get_command = getattr(framework, 'get_command', None)
+    if get_command is None:
+        if run_options.timeout is not None:
+            logger.warning(f'{runnable_name}: The framework can not be run with a timeout, running without one.')
+        start_time = time.perf_counter()
+        exit_code = framework.run_single_benchmark(runnable_path, output_location, output_format, run_options)
+        return RunOutcome(exit_code, time.perf_counter() - start_time)
+
+    output_location.unlink(missing_ok=True)
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    command = [str(argument) for argument in get_command(runnable_path, output_location, output_format, run_options)]
+    progress = RunProgress(runnable_name)
+    try:
+        outcome = asyncio.run(_run(command, run_options, log_path, progress, getattr(framework, 'parse_progress_line', None)))
+    except OSError as e:
+        logger.error(f'{runnable_name}: Could not start {command[0]}: {e}')
+        return RunOutcome(127, 0.0, stderr_tail=[str(e)])
+    finally:
+        progress.close()
+
+    finish_run = getattr(framework, 'finish_run', None)
+    if finish_run is not None:
+        finish_run(output_location, run_options)
+    return outcome
+
+def get_journal_path(iteration_name: str, workspace: Path = Path('.')) -> Path:
+    """Journal file of the runs of an iteration, which may not exist."""
+    return workspace / '.ccbenchmark' / JOURNAL_DIR / f'{iteration_name}.jsonl'
+
+def _read_journal(path: Path) -> tuple[dict | None, dict[str, dict], bool]:
+    """Header, entry by runnable and whether the run finished, (None, {}, False) if there is no journal."""
+    header = None
+    entries: dict[str, dict] = {}
+    finished = False
+    try:
+        # Undecodable bytes make their line invalid JSON, which is skipped.
+        with open(path, 'r', encoding='utf-8', errors='replace') as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # The last line of an interrupted run may be cut off.
+                    continue
+                if not isinstance(record, dict):
+                    continue
+                if header is None:
+                    header = record
+                elif record.get('finished'):
+                    finished = True
+                elif 'runnable' in record:
+                    entries[record['runnable']] = record
+    except OSError:
+        return None, {}, False
+    return header, entries, finished
+
+class RunJournal:
+    """Append-only journal of the runnables of a run that finished, one JSON object per line.
+
+    Example:
+        >>> journal = RunJournal.start('nightly', {'profile': 'full'}, resume=True)
+        >>> if not journal.is_completed(runnable_path):
+        ...     journal.record(runnable_path, run_runnable(...))
+        >>> journal.finish()
+    """
+    def __init__(self, path: Path, completed: dict[str, dict]):
+        self.path = path
+        self.completed = completed
+
+    @staticmethod
+    def start(iteration_name: str, options: dict, resume: bool, workspace: Path = Path('.')) -> 'RunJournal':
+        """Starts the journal of a run, continuing the journal of an interrupted run if `resume`.
+
+        Args:
+            iteration_name: Iteration being run.
+            options: Options of the run, a resumed run with other options is warned about.
+            resume: Skip the runnables that finished before the run was interrupted.
+            workspace: Directory containing `.ccbenchmark`.
+        """
+        path = get_journal_path(iteration_name, workspace)
+        header, entries, finished = _read_journal(path)
+        interrupted = header is not None and not finished
+        if resume and interrupted:
+            if header.get('options') != options:
+                logger.warning(f"Resuming '{iteration_name}' with other options than the interrupted run: {header.get('options')}")
+            logger.info(f"Resuming '{iteration_name}', {len(entries)} runnables already ran.")
+            return RunJournal(path, entries)
+        if resume:
+            logger.warning(f"No interrupted run of '{iteration_name}' to resume, running every runnable.")
+        elif interrupted:
+            logger.info(f"Replacing the journal of an interrupted run of '{iteration_name}' ({len(entries)} runnables ran), pass --resume to continue it instead.")
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as file:
+            header = {'version': JOURNAL_VERSION, 'iteration': iteration_name, 'started': time.time(), 'options': options}
+            file.write(json.dumps(header, ensure_ascii=False) + '\n')
+        return RunJournal(path, {})
+
+    def is_completed(self, runnable_path: Path) -> bool:
+        """True if the runnable finished before the run was interrupted."""
+        return runnable_path.as_posix() in self.completed
+
+    def _append(self, record: dict) -> None:
+        with open(self.path, 'a', encoding='utf-8') as file:
+            file.write(json.dumps(record, ensure_ascii=False) + '\n')
+            file.flush()
+            os.fsync(file.fileno())
+
+    def record(self, runnable_path: Path, outcome: RunOutcome) -> None:
+        """Records that a runnable finished, whether it succeeded or not."""
+        record = {
+            'runnable': runnable_path.as_posix(),
+            'exit_code': outcome.exit_code,
+            'seconds': round(outcome.seconds, 3),
+            'timed_out': outcome.timed_out,
+            'finished_at': time.time()
+        }
+        self.completed[record['runnable']] = record
+        self._append(record)
+
+    def finish(self) -> None:
+        """Marks the run as finished, it can no longer be resumed."""
+        self._append({'finished': True, 'finished_at': time.time()})
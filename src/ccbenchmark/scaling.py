@@ -0,0 +1,220 @@
+"""Scaling analysis of parameterized benchmarks.
+
+Benchmarks such as ``BM_Sort/8``, ``BM_Sort/64`` and ``BM_Sort/512`` form a family
+that only differs in one argument. Fitting their times against that argument shows
+how the benchmark scales, and comparing the fit across iterations shows when a
+change made it scale worse.
+
+Defines:
+    - FamilyKind: Whether a family varies its first argument or its thread count.
+    - BenchmarkFamily: Benchmarks grouped by family.
+    - ScalingResult: Complexity fit of a family for one iteration.
+    - ThreadScalingResult: Parallel efficiency of a family for one iteration.
+    - get_benchmark_families(): Groups benchmarks into families.
+    - analyze_complexity(): Fits complexity curves per iteration.
+    - analyze_thread_scaling(): Computes thread scaling efficiency per iteration.
+"""
+
+from enum import IntEnum
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from ccbenchmark.benchmark_data import BenchmarkData, TimeType
+from ccbenchmark.frameworks.util.benchmark_name import parse_benchmark_name
+from ccbenchmark.frameworks.util.metrics import MetricIndices
+
+class FamilyKind(IntEnum):
+    """What varies between the benchmarks of a family."""
+    COMPLEXITY = 0
+    THREADS = 1
+
+@dataclass(slots=True)
+class BenchmarkFamily:
+    """Benchmarks that only differ by their first argument or their thread count.
+
+    Attributes:
+        kind: What varies between the benchmarks.
+        path: Path of the runnable the benchmarks belong to.
+        label: Family name with the fixed arguments (e.g., 'BM_Sort/threads:8').
+        benchmark_indices: Index of each benchmark, sorted by `x_values`.
+        x_values: Argument or thread count of each benchmark.
+    """
+    kind: FamilyKind
+    path: Path
+    label: str
+    benchmark_indices: list[int] = field(default_factory=lambda: [])
+    x_values: list[float] = field(default_factory=lambda: [])
+
+@dataclass(slots=True)
+class ScalingResult:
+    """Complexity fit of a family for one iteration.
+
+    Attributes:
+        iteration_name: Name of the iteration.
+        complexity: Best fitting complexity (e.g., 'NlgN').
+        coefficient: Coefficient of the fitted curve in ns.
+        rms: Normalized root mean square error of the fit, as a percentage.
+        exponent: The `k` in `time = a*n^k`.
+        regressed: True if the exponent got worse than in the previous iteration.
+    """
+    iteration_name: str
+    complexity: str
+    coefficient: float
+    rms: float
+    exponent: float
+    regressed: bool
+
+@dataclass(slots=True)
+class ThreadScalingResult:
+    """Parallel efficiency of a family for one iteration.
+
+    Attributes:
+        iteration_name: Name of the iteration.
+        threads: Thread count of each benchmark.
+        efficiency: Speedup divided by added threads, 1.0 is perfect scaling.
+        regressed: True if efficiency at the highest thread count got worse
+            than in the previous iteration.
+    """
+    iteration_name: str
+    threads: list[int]
+    efficiency: list[float]
+    regressed: bool
+
+def _format_args(args: list[float], arg_names: list[str]) -> list[str]:
+    return [
+        f'{name}:{arg:g}' if name != '' else f'{arg:g}'
+        for arg, name in zip(args, arg_names)
+    ]
+
+def get_benchmark_families(benchmark_data: BenchmarkData, benchmark_indices: list[int] | None = None) -> list[BenchmarkFamily]:
+    """Groups benchmarks into families.
+
+    Benchmarks with the same path, family name, thread count and trailing
+    arguments form a complexity family over their first argument. Benchmarks
+    with the same path, family name and arguments form a thread family over
+    their thread count. Families with fewer than two benchmarks are dropped.
+
+    Args:
+        benchmark_data: Loaded benchmark data.
+        benchmark_indices: Only families containing one of these benchmarks are returned.
+            If None, every family is returned.
+
+    Returns:
+        list[BenchmarkFamily]: Families sorted by label.
+    """
+    families: dict[tuple, BenchmarkFamily] = {}
+    for i, (path, name) in enumerate(zip(benchmark_data.benchmark_paths, benchmark_data.benchmark_names)):
+        benchmark_name = parse_benchmark_name(name)
+        options = tuple(sorted((key, value) for key, value in benchmark_name.options.items() if key != 'threads'))
+
+        keys_and_families: list[tuple[tuple, FamilyKind, str, float]] = []
+        if len(benchmark_name.args) != 0:
+            fixed_args = _format_args(benchmark_name.args[1:], benchmark_name.arg_names[1:])
+            label = '/'.join([benchmark_name.family, '*', *fixed_args, f'threads:{benchmark_name.threads}'])
+            key = (FamilyKind.COMPLEXITY, path, benchmark_name.family, tuple(fixed_args), benchmark_name.threads, options)
+            keys_and_families.append((key, FamilyKind.COMPLEXITY, label, benchmark_name.args[0]))
+
+        args = _format_args(benchmark_name.args, benchmark_name.arg_names)
+        label = '/'.join([benchmark_name.family, *args, 'threads:*'])
+        key = (FamilyKind.THREADS, path, benchmark_name.family, tuple(args), options)
+        keys_and_families.append((key, FamilyKind.THREADS, label, float(benchmark_name.threads)))
+
+        for key, kind, label, x_value in keys_and_families:
+            family = families.get(key)
+            if family is None:
+                family = BenchmarkFamily(kind, path, label)
+                families[key] = family
+            family.benchmark_indices.append(i)
+            family.x_values.append(x_value)
+
+    selected = set(benchmark_indices) if benchmark_indices is not None else None
+    output: list[BenchmarkFamily] = []
+    for family in families.values():
+        if len(set(family.x_values)) < 2:
+            continue
+        if selected is not None and selected.isdisjoint(family.benchmark_indices):
+            continue
+        order = sorted(range(len(family.x_values)), key=lambda j: family.x_values[j])
+        family.benchmark_indices = [family.benchmark_indices[j] for j in order]
+        family.x_values = [family.x_values[j] for j in order]
+        output.append(family)
+
+    return sorted(output, key=lambda family: (str(family.path), family.label))
+
+def _select_metric_index(benchmark_data: BenchmarkData, family: BenchmarkFamily, time_type: TimeType) -> int:
+    """Uses Time if the family has any, Mean otherwise (benchmarks ran with repetitions)."""
+    manager = benchmark_data.benchmark_types[time_type]
+    for benchmark_index in family.benchmark_indices:
+        values = manager.get_values(benchmark_index, MetricIndices.Time.value, 'ns')
+        if any(value == value for value in values):
+            return MetricIndices.Time.value
+    return MetricIndices.Mean.value
+
+def analyze_complexity(
+    benchmark_data: BenchmarkData,
+    family: BenchmarkFamily,
+    time_type: TimeType,
+    exponent_tolerance: float = 0.1
+) -> list[ScalingResult]:
+    """Fits complexity curves (1, lgN, N, NlgN, N^2, N^3) to a family per iteration.
+
+    Args:
+        benchmark_data: Loaded benchmark data.
+        family: Family to fit, should be a `FamilyKind.COMPLEXITY` family.
+        time_type: Real or CPU time.
+        exponent_tolerance: How much the exponent may grow between iterations
+            before the iteration is flagged as regressed.
+
+    Returns:
+        list[ScalingResult]: One result per iteration that has enough data to fit.
+    """
+    metric_index = _select_metric_index(benchmark_data, family, time_type)
+    fits = benchmark_data.benchmark_types[time_type].fit_scaling(family.benchmark_indices, family.x_values, metric_index)
+
+    results: list[ScalingResult] = []
+    previous_exponent: float | None = None
+    for iteration_name, (complexity, coefficient, rms, exponent) in zip(benchmark_data.iteration_names, fits):
+        if complexity == '' and exponent != exponent:
+            continue
+        regressed = previous_exponent is not None and exponent > previous_exponent + exponent_tolerance
+        if exponent == exponent:
+            previous_exponent = exponent
+        results.append(ScalingResult(iteration_name, complexity, coefficient, rms*100.0, exponent, regressed))
+    return results
+
+def analyze_thread_scaling(
+    benchmark_data: BenchmarkData,
+    family: BenchmarkFamily,
+    time_type: TimeType,
+    efficiency_tolerance: float = 0.1
+) -> list[ThreadScalingResult]:
+    """Computes parallel efficiency of a family per iteration.
+
+    Real time should be used, CPU time is summed over threads and does not
+    shrink when work is split between them.
+
+    Args:
+        benchmark_data: Loaded benchmark data.
+        family: Family to analyze, should be a `FamilyKind.THREADS` family.
+        time_type: Real or CPU time.
+        efficiency_tolerance: How much the efficiency at the highest thread count
+            may drop between iterations before the iteration is flagged as regressed.
+
+    Returns:
+        list[ThreadScalingResult]: One result per iteration that has data.
+    """
+    metric_index = _select_metric_index(benchmark_data, family, time_type)
+    efficiencies = benchmark_data.benchmark_types[time_type].fit_thread_scaling(family.benchmark_indices, family.x_values, metric_index)
+    threads = [int(x_value) for x_value in family.x_values]
+
+    results: list[ThreadScalingResult] = []
+    previous_efficiency: float | None = None
+    for iteration_name, efficiency in zip(benchmark_data.iteration_names, efficiencies):
+        if all(value != value for value in efficiency):
+            continue
+        top_efficiency = efficiency[-1]
+        regressed = previous_efficiency is not None and top_efficiency < previous_efficiency - efficiency_tolerance
+        if top_efficiency == top_efficiency:
+            previous_efficiency = top_efficiency
+        results.append(ThreadScalingResult(iteration_name, threads, efficiency, regressed))
+    return results
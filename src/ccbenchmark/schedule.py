@@ -0,0 +1,356 @@
+"""Time-budgeted runs of `ccbenchmark run --budget`.
+
+Plans which benchmarks run, and how often they are repeated, so a run fits a
+fixed time window, from the durations and results of earlier iterations:
+
+- The duration of a runnable is taken from its telemetry. Frameworks run every
+  benchmark for about the same minimum time, so it is split evenly across the
+  benchmarks and repetitions that ran, giving seconds per benchmark repetition.
+- Benchmarks are ranked by priority: the larger of their noise floor (variance
+  of their history, as in `calibrate`) and their |Δ| between the last two
+  iterations, in %, plus `STALE_PRIORITY` for every iteration since they last
+  ran, so skipped benchmarks are sampled by later runs.
+- Benchmarks, and runnables, without history always run. The rest are added
+  from the highest priority down while they fit in the budget. Time left over
+  doubles the repetitions of runnables, highest priority first, up to
+  `MAX_REPETITION_FACTOR` times their usual repetitions. Runnables that repeat
+  their benchmarks once have their minimum time doubled instead, since a second
+  repetition makes Google Benchmark report aggregates instead of each run.
+
+While running, the ETA is corrected by how long runnables took compared to
+their estimate. What was planned, skipped and how long it took is written next
+to each result as `_iter_<name>/.ccbenchmark/<runnable>.schedule.json`, also for
+runnables that were skipped entirely.
+
+Defines:
+    - BenchmarkHistory: Priority of one benchmark.
+    - RunnableHistory: Durations and benchmarks of one runnable.
+    - ScheduledRunnable: What runs of one runnable.
+    - RunSchedule: Plan of a run and its progress.
+    - parse_duration(): Parses durations like '30m' or '1h30m'.
+    - format_duration(): Formats seconds like '1h 30m'.
+    - plan_budget(): Plans a run that fits a budget.
+    - read_schedule_record(): Reads what was planned for a result.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+import json
+import math
+import re
+import time
+
+from ccbenchmark.name_index import get_names_pattern
+from ccbenchmark.util import METADATA_DIR
+
+"""Priority (%) added for every iteration since a benchmark last ran."""
+STALE_PRIORITY = 1.0
+"""Repetitions of a runnable are at most this many times its usual repetitions."""
+MAX_REPETITION_FACTOR = 4
+"""Iterations whose durations are used, the most recent ones."""
+DURATION_HISTORY = 5
+
+_DURATION_PART = re.compile(r'(\d+(?:\.\d+)?)([hms]?)')
+_DURATION_SECONDS = {'h': 3600.0, 'm': 60.0, 's': 1.0, '': 60.0}
+
+def parse_duration(text: str) -> float:
+    """Parses a duration into seconds, e.g. '30m', '1h30m', '90s' or '45' (minutes).
+
+    Raises:
+        ValueError: `text` is not a positive duration.
+    """
+    text = text.strip().lower()
+    position = 0
+    seconds = 0.0
+    while position < len(text):
+        match = _DURATION_PART.match(text, position)
+        if match is None or match.end() == position:
+            raise ValueError(f"Invalid duration '{text}', expected e.g. 30m, 1h30m or 90s")
+        seconds += float(match.group(1))*_DURATION_SECONDS[match.group(2)]
+        position = match.end()
+    if seconds <= 0.0:
+        raise ValueError(f"Invalid duration '{text}', expected e.g. 30m, 1h30m or 90s")
+    return seconds
+
+def format_duration(seconds: float) -> str:
+    """Formats seconds as e.g. '1h 05m', '4m 10s', '12s' or '2.5s'."""
+    if seconds < 10.0:
+        return f'{max(seconds, 0.0):.1f}s'
+    seconds = round(seconds)
+    hours, seconds = divmod(seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+    if hours != 0:
+        return f'{hours}h {minutes:02d}m'
+    if minutes != 0:
+        return f'{minutes}m {seconds:02d}s'
+    return f'{seconds}s'
+
+@dataclass(slots=True)
+class BenchmarkHistory:
+    """Priority of one benchmark of a runnable.
+
+    Attributes:
+        name: Benchmark name, as passed to the framework's filter.
+        priority: Larger runs first, infinite for benchmarks without history.
+    """
+    name: str
+    priority: float
+
+@dataclass(slots=True)
+class RunnableHistory:
+    """What earlier iterations recorded of one runnable.
+
+    Attributes:
+        runnable_path: Runnable, as found from `benchmark_runnables`.
+        repetitions: Repetitions it runs with, from the run profile or the framework's default.
+        repetition_seconds: Seconds one repetition of one benchmark takes, None without history.
+        benchmarks: Benchmarks it ran before, benchmarks matching no filter are left out.
+        min_time: Seconds it runs each benchmark for at least, from the run profile or the
+            framework's default, None if unknown.
+    """
+    runnable_path: Path
+    repetitions: int
+    repetition_seconds: float | None = None
+    benchmarks: list[BenchmarkHistory] = field(default_factory=lambda: [])
+    min_time: float | None = None
+
+    def benchmark_seconds(self, repetitions: int) -> float:
+        """Seconds one benchmark takes with `repetitions`, 0 without history."""
+        return (self.repetition_seconds or 0.0)*repetitions
+
+@dataclass(slots=True)
+class ScheduledRunnable:
+    """What runs of one runnable.
+
+    Attributes:
+        runnable_path: Runnable, as found from `benchmark_runnables`.
+        repetitions: Repetitions it runs with.
+        repetition_factor: `repetitions` in multiples of its usual repetitions, or
+            `min_time` in multiples of its usual minimum time if that was doubled instead.
+        selected: Benchmarks that run, every benchmark runs if `skipped` is empty.
+        skipped: Benchmarks that do not run.
+        estimated_seconds: Expected duration, NaN if unknown.
+        actual_seconds: Duration once it ran, None before.
+        min_time: Minimum time it runs each benchmark for if it was doubled instead of
+            `repetitions`, the usual one if None.
+    """
+    runnable_path: Path
+    repetitions: int
+    repetition_factor: int = 1
+    selected: list[str] = field(default_factory=lambda: [])
+    skipped: list[str] = field(default_factory=lambda: [])
+    estimated_seconds: float = math.nan
+    actual_seconds: float | None = None
+    min_time: float | None = None
+
+    @property
+    def runs(self) -> bool:
+        """False if every benchmark it ran before is skipped."""
+        return len(self.selected) != 0 or len(self.skipped) == 0
+
+    def get_selected_names(self, name_pattern: str | None, names: list[str] | None = None) -> list[str] | None:
+        """Names of the benchmarks that run, None if every benchmark does.
+
+        Args:
+            name_pattern: Regex names must also match, e.g. from `--filter`, any name if None.
+            names: Benchmarks the runnable has, so benchmarks added since the last
+                iteration still run. Only the selected ones run if None.
+        """
+        if len(self.skipped) == 0:
+            return None
+        skipped = set(self.skipped)
+        regex = re.compile(name_pattern) if name_pattern is not None else None
+        return [
+            name for name in (names if names is not None else self.selected)
+            if name not in skipped and (regex is None or regex.search(name) is not None)
+        ]
+
+    def get_name_pattern(self, name_pattern: str | None, names: list[str] | None = None) -> str | None:
+        """Regex for the names of the benchmarks that run, see `get_selected_names`.
+
+        Google Benchmark's filter is a POSIX extended regex, which has no lookahead
+        to exclude the skipped benchmarks, so the ones that run are listed.
+
+        Returns:
+            str | None: `name_pattern` if no benchmark is skipped, else a regex matching
+            exactly the benchmarks that run.
+        """
+        selected_names = self.get_selected_names(name_pattern, names)
+        if selected_names is None:
+            return name_pattern
+        return get_names_pattern(selected_names)
+
+@dataclass(slots=True)
+class RunSchedule:
+    """Plan of a time-budgeted run and its progress.
+
+    Attributes:
+        budget_seconds: Time the run should fit in.
+        runnables: Plan of every runnable by runnable path.
+        started: Time the run started, in seconds since the epoch.
+    """
+    budget_seconds: float
+    runnables: dict[Path, ScheduledRunnable] = field(default_factory=lambda: {})
+    started: float = field(default_factory=time.time)
+
+    @property
+    def estimated_seconds(self) -> float:
+        """Expected duration of every runnable that runs, unknown durations count as 0."""
+        return sum(
+            runnable.estimated_seconds for runnable in self.runnables.values()
+            if runnable.runs and math.isfinite(runnable.estimated_seconds)
+        )
+
+    def get(self, runnable_path: Path) -> ScheduledRunnable | None:
+        """Plan of a runnable, None if it was not planned (then it runs as usual)."""
+        return self.runnables.get(runnable_path)
+
+    def get_eta(self) -> float:
+        """Seconds until every runnable that runs has finished.
+
+        Estimates of runnables that did not run yet are scaled by how long the
+        finished ones took compared to their estimates.
+        """
+        estimated_done = 0.0
+        actual_done = 0.0
+        remaining = 0.0
+        for runnable in self.runnables.values():
+            if not runnable.runs or not math.isfinite(runnable.estimated_seconds):
+                continue
+            if runnable.actual_seconds is None:
+                remaining += runnable.estimated_seconds
+            else:
+                estimated_done += runnable.estimated_seconds
+                actual_done += runnable.actual_seconds
+        correction = actual_done/estimated_done if estimated_done > 0.0 and actual_done > 0.0 else 1.0
+        return remaining*correction
+
+    def describe_progress(self, runnable_path: Path) -> str:
+        """Position of a runnable in the run and the ETA, e.g. '3/12, ETA 4m 10s'."""
+        running = [path for path, runnable in self.runnables.items() if runnable.runs]
+        position = running.index(runnable_path) + 1 if runnable_path in running else 0
+        eta = self.get_eta()
+        finish = time.strftime('%H:%M', time.localtime(time.time() + eta))
+        return f'{position}/{len(running)}, ETA {format_duration(eta)} ({finish})'
+
+    def finish(self, runnable_path: Path, seconds: float) -> None:
+        """Records how long a runnable took."""
+        runnable = self.runnables.get(runnable_path)
+        if runnable is not None:
+            runnable.actual_seconds = seconds
+
+    def write_record(self, output_path: Path, benchmark_name: str, runnable: ScheduledRunnable) -> Path:
+        """Writes what was planned for a runnable next to its result.
+
+        Args:
+            output_path: Iteration directory the result is written to.
+            benchmark_name: Name of the runnable, without suffix.
+            runnable: Plan of the runnable.
+
+        Returns:
+            Path: File written.
+        """
+        record = {
+            'budget_seconds': self.budget_seconds,
+            'started': self.started,
+            'ran': runnable.runs,
+            'repetitions': runnable.repetitions,
+            'repetition_factor': runnable.repetition_factor,
+            'min_time': runnable.min_time,
+            'estimated_seconds': runnable.estimated_seconds if math.isfinite(runnable.estimated_seconds) else None,
+            'actual_seconds': runnable.actual_seconds,
+            'selected': runnable.selected,
+            'skipped': runnable.skipped,
+        }
+        record_path = output_path / METADATA_DIR / f'{benchmark_name}.schedule.json'
+        record_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(record_path, 'w', encoding='utf-8') as file:
+            json.dump(record, file, indent=1, ensure_ascii=False)
+        return record_path
+
+def read_schedule_record(result_path: Path) -> dict | None:
+    """Reads what `RunSchedule.write_record` wrote for a result file, None if nothing was."""
+    record_path = result_path.parent / METADATA_DIR / f"{result_path.name.split('.')[0]}.schedule.json"
+    try:
+        with open(record_path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+def plan_budget(histories: list[RunnableHistory], budget_seconds: float) -> RunSchedule:
+    """Plans a run of every runnable that fits in `budget_seconds`.
+
+    Args:
+        histories: Every runnable that may run, in the order they run.
+        budget_seconds: Time the run should fit in.
+
+    Returns:
+        RunSchedule: Plan of every runnable. Runnables and benchmarks without
+        history always run, even if that exceeds the budget.
+    """
+    schedule = RunSchedule(budget_seconds)
+    known_seconds = [history.repetition_seconds for history in histories if history.repetition_seconds is not None]
+    # Runnables without history are expected to take as long as a typical one.
+    typical_seconds = sorted(known_seconds)[len(known_seconds)//2] if len(known_seconds) != 0 else None
+
+    used_seconds = 0.0
+    candidates: list[tuple[float, int, RunnableHistory, BenchmarkHistory]] = []
+    for history in histories:
+        runnable = ScheduledRunnable(history.runnable_path, history.repetitions)
+        schedule.runnables[history.runnable_path] = runnable
+        if history.repetition_seconds is None:
+            if typical_seconds is not None:
+                runnable.estimated_seconds = typical_seconds*history.repetitions*max(len(history.benchmarks), 1)
+                used_seconds += runnable.estimated_seconds
+            runnable.selected = [benchmark.name for benchmark in history.benchmarks]
+            continue
+        runnable.estimated_seconds = 0.0
+        for benchmark in history.benchmarks:
+            if math.isinf(benchmark.priority):
+                runnable.selected.append(benchmark.name)
+                runnable.estimated_seconds += history.benchmark_seconds(history.repetitions)
+            else:
+                candidates.append((benchmark.priority, len(candidates), history, benchmark))
+        used_seconds += runnable.estimated_seconds
+
+    # Highest priority first, ties keep the order benchmarks run in.
+    candidates.sort(key=lambda candidate: (-candidate[0], candidate[1]))
+    for _, _, history, benchmark in candidates:
+        runnable = schedule.runnables[history.runnable_path]
+        seconds = history.benchmark_seconds(history.repetitions)
+        if used_seconds + seconds <= budget_seconds:
+            runnable.selected.append(benchmark.name)
+            runnable.estimated_seconds += seconds
+            used_seconds += seconds
+        else:
+            runnable.skipped.append(benchmark.name)
+
+    # Double the repetitions of the highest priority runnables while time is left.
+    def runnable_priority(history: RunnableHistory) -> float:
+        selected = set(schedule.runnables[history.runnable_path].selected)
+        return max((benchmark.priority for benchmark in history.benchmarks if benchmark.name in selected), default=0.0)
+    ranked = sorted(
+        (history for history in histories if history.repetition_seconds is not None),
+        key=runnable_priority, reverse=True
+    )
+    doubled = True
+    while doubled:
+        doubled = False
+        for history in ranked:
+            runnable = schedule.runnables[history.runnable_path]
+            if runnable.repetition_factor*2 > MAX_REPETITION_FACTOR or len(runnable.selected) == 0:
+                continue
+            if history.repetitions <= 1 and history.min_time is None:
+                continue
+            # Doubling the repetitions doubles the estimate.
+            if used_seconds + runnable.estimated_seconds > budget_seconds:
+                continue
+            used_seconds += runnable.estimated_seconds
+            runnable.estimated_seconds *= 2
+            runnable.repetition_factor *= 2
+            if history.repetitions <= 1:
+                runnable.min_time = history.min_time*runnable.repetition_factor
+            else:
+                runnable.repetitions = history.repetitions*runnable.repetition_factor
+            doubled = True
+    return schedule
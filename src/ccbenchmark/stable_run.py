@@ -0,0 +1,260 @@
+"""Stable-run mode of `ccbenchmark run --stable`.
+
+Reduces run-to-run noise on Linux before runnables are started:
+    - Pins ccbenchmark, and so every runnable it starts, to isolated cores
+      (`isolcpus`/`nohz_full`), using one logical CPU per physical core and
+      skipping cores whose SMT siblings are not isolated (busy).
+    - Raises scheduling priority.
+    - Optionally disables ASLR with `personality(ADDR_NO_RANDOMIZE)`, which
+      runnables inherit like `setarch -R` does.
+    - Drops the page cache before each runnable, when permitted.
+    - Checks that the cpufreq governor of the selected cores is `performance`,
+      warning (`--stable`) or refusing to run (`--stable strict`) otherwise.
+
+Steps that need privileges ccbenchmark does not have are skipped with a warning.
+What was done is written next to each result as
+`_iter_<name>/.ccbenchmark/<runnable>.stable.json`, which the loader ignores.
+
+Defines:
+    - StableRunMode: Warn about or refuse an unstable system.
+    - StableRun: Settings applied to the process and what was done.
+    - parse_cpu_list(): Parses sysfs CPU lists (e.g., '0-3,8').
+    - select_cpus(): Picks CPUs without busy SMT siblings.
+    - start_stable_run(): Applies the settings to this process.
+"""
+
+from enum import StrEnum
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+import ctypes
+import ctypes.util
+import json
+import logging
+import os
+import time
+
+from ccbenchmark.util import METADATA_DIR
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger()
+
+_CPU_DIR = Path('/sys/devices/system/cpu')
+_DROP_CACHES_FILE = Path('/proc/sys/vm/drop_caches')
+"""Nice value runnables are started with, lower runs first."""
+STABLE_NICE = -20
+"""`personality` flag disabling address space layout randomization, see personality(2)."""
+ADDR_NO_RANDOMIZE = 0x0040000
+PERFORMANCE_GOVERNOR = 'performance'
+
+class StableRunMode(StrEnum):
+    """What happens when the system can not be made stable."""
+    WARN = 'warn'
+    STRICT = 'strict'
+
+@dataclass(slots=True)
+class StableRun:
+    """Settings applied to this process by `start_stable_run`, inherited by every runnable.
+
+    Attributes:
+        mode: Warn about or refuse an unstable system.
+        cpus: CPUs runnables are pinned to.
+        isolated_cpus: CPUs isolated from the scheduler, empty if none are.
+        excluded_cpus: Available CPUs not used, SMT siblings and busy cores.
+        nice: Nice value runnables are started with, None if it could not be raised.
+        aslr_disabled: True if ASLR is disabled for runnables.
+        governors: cpufreq governor of each selected CPU, empty if cpufreq is not available.
+        warnings: Every step that was skipped or found the system unstable.
+    """
+    mode: StableRunMode
+    cpus: list[int] = field(default_factory=lambda: [])
+    isolated_cpus: list[int] = field(default_factory=lambda: [])
+    excluded_cpus: list[int] = field(default_factory=lambda: [])
+    nice: int | None = None
+    aslr_disabled: bool = False
+    governors: dict[int, str] = field(default_factory=lambda: {})
+    warnings: list[str] = field(default_factory=lambda: [])
+    _previous_affinity: set[int] | None = None
+    _previous_nice: int | None = None
+    _previous_personality: int | None = None
+
+    def _warn(self, message: str) -> None:
+        self.warnings.append(message)
+        logger.warning(f'Stable run: {message}')
+
+    def before_runnable(self) -> dict:
+        """Prepares the system for the next runnable.
+
+        Returns:
+            dict: What was done, passed to `write_metadata`.
+        """
+        return {'page_cache_dropped': _drop_page_cache(), 'started_at': time.time()}
+
+    def write_metadata(self, output_path: Path, benchmark_name: str, runnable_record: dict) -> Path:
+        """Writes what was done for a runnable next to its result.
+
+        Args:
+            output_path: Iteration directory the result was written to.
+            benchmark_name: Name of the runnable, without suffix.
+            runnable_record: Returned by `before_runnable`.
+
+        Returns:
+            Path: File written.
+        """
+        metadata = {
+            field_name: value for field_name, value in asdict(self).items() if not field_name.startswith('_')
+        }
+        metadata.update(runnable_record)
+        metadata_path = output_path / METADATA_DIR / f'{benchmark_name}.stable.json'
+        metadata_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(metadata_path, 'w', encoding='utf-8') as file:
+            json.dump(metadata, file, indent=2)
+        return metadata_path
+
+    def restore(self) -> None:
+        """Restores the affinity, nice value and personality this process had before."""
+        if self._previous_affinity is not None:
+            os.sched_setaffinity(0, self._previous_affinity)
+        if self._previous_nice is not None and self.nice is not None:
+            # Raising the nice value again never needs privileges.
+            os.setpriority(os.PRIO_PROCESS, 0, self._previous_nice)
+        if self._previous_personality is not None:
+            _personality(self._previous_personality)
+
+def parse_cpu_list(text: str) -> list[int]:
+    """Parses a sysfs CPU list (e.g., '0-3,8,10-11') into CPU numbers."""
+    cpus: list[int] = []
+    for part in text.strip().split(','):
+        if part == '':
+            continue
+        first, _, last = part.partition('-')
+        cpus += range(int(first), int(last or first) + 1)
+    return cpus
+
+def _read_cpu_list(path: Path) -> list[int]:
+    try:
+        return parse_cpu_list(path.read_text())
+    except (OSError, ValueError):
+        return []
+
+def _get_smt_siblings(cpus: set[int]) -> dict[int, set[int]]:
+    return {
+        cpu: set(_read_cpu_list(_CPU_DIR / f'cpu{cpu}' / 'topology' / 'thread_siblings_list')) or {cpu}
+        for cpu in cpus
+    }
+
+def _get_governors(cpus: list[int]) -> dict[int, str]:
+    governors: dict[int, str] = {}
+    for cpu in cpus:
+        try:
+            governors[cpu] = (_CPU_DIR / f'cpu{cpu}' / 'cpufreq' / 'scaling_governor').read_text().strip()
+        except OSError:
+            continue
+    return governors
+
+def select_cpus(available: set[int], isolated: set[int], siblings: dict[int, set[int]]) -> list[int]:
+    """Picks one logical CPU of every physical core whose SMT siblings are idle.
+
+    Isolated CPUs are used if any are available, otherwise every available CPU
+    except CPU 0, which handles most interrupts. A core is skipped if one of its
+    SMT siblings is outside of the candidates, since another process may be
+    running on it.
+
+    Args:
+        available: CPUs this process may run on.
+        isolated: CPUs isolated from the scheduler.
+        siblings: SMT siblings of each CPU, including itself.
+
+    Returns:
+        list[int]: Selected CPUs, never empty if `available` is not.
+    """
+    candidates = (isolated & available) or available
+    if len(isolated & available) == 0 and len(candidates) > 1:
+        candidates = candidates - {0}
+    selected: list[int] = []
+    used: set[int] = set()
+    for cpu in sorted(candidates):
+        if cpu in used:
+            continue
+        cpu_siblings = siblings.get(cpu, {cpu})
+        if not cpu_siblings <= candidates:
+            continue
+        selected.append(cpu)
+        used |= cpu_siblings
+    if len(selected) == 0 and len(candidates) != 0:
+        selected.append(min(candidates))
+    return selected
+
+def _personality(persona: int) -> int:
+    libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+    return libc.personality(ctypes.c_ulong(persona))
+
+def _drop_page_cache() -> bool:
+    os.sync()
+    try:
+        _DROP_CACHES_FILE.write_text('3\n')
+    except OSError:
+        return False
+    return True
+
+def start_stable_run(mode: StableRunMode, disable_aslr: bool = False) -> StableRun | None:
+    """Applies stable-run settings to this process, which every runnable inherits.
+
+    Call `StableRun.restore` once every runnable has run.
+
+    Args:
+        mode: Warn about or refuse an unstable system.
+        disable_aslr: Disable ASLR for runnables.
+
+    Returns:
+        StableRun | None: Settings applied, None if `mode` is strict and a
+        selected CPU does not use the performance governor (nothing is changed then).
+    """
+    stable_run = StableRun(mode)
+    if not hasattr(os, 'sched_setaffinity'):
+        stable_run._warn('CPU pinning is only supported on Linux.')
+        return None if mode == StableRunMode.STRICT else stable_run
+
+    available = os.sched_getaffinity(0)
+    isolated = set(_read_cpu_list(_CPU_DIR / 'isolated')) & available
+    stable_run.isolated_cpus = sorted(isolated)
+    stable_run.cpus = select_cpus(available, isolated, _get_smt_siblings(available))
+    stable_run.excluded_cpus = sorted(available - set(stable_run.cpus))
+    stable_run.governors = _get_governors(stable_run.cpus)
+
+    if len(isolated) == 0:
+        stable_run._warn('No CPUs are isolated (isolcpus), other processes may run on the selected CPUs.')
+    slow_governors = {cpu: governor for cpu, governor in stable_run.governors.items() if governor != PERFORMANCE_GOVERNOR}
+    if len(slow_governors) != 0:
+        message = (
+            f"cpufreq governor is not '{PERFORMANCE_GOVERNOR}' on CPUs "
+            f"{', '.join(f'{cpu} ({governor})' for cpu, governor in slow_governors.items())}."
+        )
+        if mode == StableRunMode.STRICT:
+            logger.error(f'Error: Refusing to run (--stable strict), {message}')
+            return None
+        stable_run._warn(message)
+
+    stable_run._previous_affinity = available
+    os.sched_setaffinity(0, stable_run.cpus)
+    logger.info(f'Stable run: Pinned to CPUs {stable_run.cpus}.')
+
+    stable_run._previous_nice = os.getpriority(os.PRIO_PROCESS, 0)
+    try:
+        os.setpriority(os.PRIO_PROCESS, 0, STABLE_NICE)
+        stable_run.nice = STABLE_NICE
+    except OSError:
+        stable_run._warn(f'Could not raise scheduling priority to nice {STABLE_NICE} (needs CAP_SYS_NICE).')
+
+    if disable_aslr:
+        try:
+            previous_personality = _personality(0xffffffff)
+            if previous_personality == -1 or _personality(previous_personality | ADDR_NO_RANDOMIZE) == -1:
+                raise OSError(ctypes.get_errno(), 'personality failed')
+            stable_run._previous_personality = previous_personality
+            stable_run.aslr_disabled = True
+        except (OSError, AttributeError):
+            stable_run._warn('Could not disable ASLR.')
+
+    if not os.access(_DROP_CACHES_FILE, os.W_OK):
+        stable_run._warn('Page caches will not be dropped (needs root).')
+    return stable_run
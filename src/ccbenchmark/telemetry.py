@@ -0,0 +1,241 @@
+"""Machine telemetry sampled while runnables run.
+
+A background thread samples `/proc/loadavg`, `/proc/stat`, the cpufreq of every
+CPU and the thermal zones (when present) while a runnable runs. The samples are
+written as a compact, column-oriented time series next to the result as
+`_iter_<name>/.ccbenchmark/<runnable>.telemetry.json`, together with a summary
+that the loader reads to flag results taken under load.
+
+A result is taken under load when other processes kept more than
+`LOAD_THRESHOLD_CORES` CPUs busy on average (CPU time of ccbenchmark and the
+runnable is subtracted from the busy time in `/proc/stat`), or when a thermal
+zone reached `THERMAL_THRESHOLD_C`.
+
+Defines:
+    - TelemetrySummary: Summary of the samples of one runnable.
+    - TelemetrySampler: Samples telemetry on a background thread.
+    - get_telemetry_path(): Telemetry file of a result file.
+    - read_telemetry_summary(): Reads the summary of a result file.
+"""
+
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+import json
+import os
+import threading
+import time
+
+from ccbenchmark.util import METADATA_DIR
+
+"""Seconds between samples."""
+SAMPLE_INTERVAL = 0.25
+"""Average number of CPUs other processes may keep busy before a result is taken under load."""
+LOAD_THRESHOLD_CORES = 0.5
+"""Temperature in °C of any thermal zone above which a result is taken under load."""
+THERMAL_THRESHOLD_C = 90.0
+"""Seconds a runnable must run for to be checked for load, `/proc/stat` counts CPU time in clock ticks."""
+MIN_LOAD_DURATION = 1.0
+TELEMETRY_VERSION = 1
+
+_PROC_STAT = Path('/proc/stat')
+_PROC_LOADAVG = Path('/proc/loadavg')
+_CPU_DIR = Path('/sys/devices/system/cpu')
+_THERMAL_DIR = Path('/sys/class/thermal')
+
+@dataclass(slots=True)
+class TelemetrySummary:
+    """Summary of the telemetry of one runnable.
+
+    Values are None if their source is not available (e.g., no cpufreq in a VM).
+
+    Attributes:
+        duration: Seconds the runnable ran for.
+        sample_count: Number of samples taken.
+        load_average_max: Highest 1 minute load average.
+        other_cpu_cores: CPUs kept busy by other processes on average.
+        cpu_mhz_min: Lowest frequency of any CPU.
+        cpu_mhz_max: Highest frequency of any CPU.
+        temperature_max: Highest temperature of any thermal zone in °C.
+        under_load: True if the result was taken under load.
+        reasons: Why the result was taken under load.
+    """
+    duration: float = 0.0
+    sample_count: int = 0
+    load_average_max: float | None = None
+    other_cpu_cores: float | None = None
+    cpu_mhz_min: float | None = None
+    cpu_mhz_max: float | None = None
+    temperature_max: float | None = None
+    under_load: bool = False
+    reasons: list[str] = field(default_factory=lambda: [])
+
+    def describe(self) -> str:
+        """Reasons the result was taken under load, '' if it was not."""
+        return '; '.join(self.reasons)
+
+def _read_cpu_jiffies() -> tuple[int, int] | None:
+    """Busy and total jiffies of every CPU since boot."""
+    try:
+        with open(_PROC_STAT, 'r', encoding='ascii') as file:
+            values = [int(value) for value in file.readline().split()[1:9]]
+    except (OSError, ValueError):
+        return None
+    # user nice system idle iowait irq softirq steal
+    total = sum(values)
+    return total - values[3] - values[4], total
+
+def _read_load_average() -> float | None:
+    try:
+        return float(_PROC_LOADAVG.read_text().split()[0])
+    except (OSError, ValueError, IndexError):
+        return None
+
+def _read_number(path: Path, scale: float) -> float | None:
+    try:
+        return int(path.read_text())*scale
+    except (OSError, ValueError):
+        return None
+
+def _own_cpu_seconds() -> float:
+    """CPU time of ccbenchmark and every runnable it waited for."""
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+class TelemetrySampler:
+    """Samples telemetry on a background thread between `start()` and `stop()`.
+
+    Example:
+        >>> sampler = TelemetrySampler()
+        >>> sampler.start()
+        >>> framework.run_single_benchmark(...)
+        >>> summary = sampler.stop()
+        >>> sampler.write(output_path, benchmark_name)
+    """
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        self.interval = interval
+        self.summary = TelemetrySummary()
+        self._frequency_paths = sorted(
+            _CPU_DIR.glob('cpu[0-9]*/cpufreq/scaling_cur_freq'), key=lambda path: int(path.parent.parent.name[3:])
+        )
+        self._thermal_paths = sorted(_THERMAL_DIR.glob('thermal_zone*/temp'))
+        self._columns: dict[str, list] = {
+            'time': [], 'load1': [], 'cpu_busy': [], 'cpu_mhz': [], 'temperature_c': []
+        }
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._start_time = 0.0
+        self._start_cpu_seconds = 0.0
+        self._first_jiffies: tuple[int, int] | None = None
+        self._last_jiffies: tuple[int, int] | None = None
+
+    def _sample(self) -> None:
+        columns = self._columns
+        columns['time'].append(round(time.perf_counter() - self._start_time, 3))
+        columns['load1'].append(_read_load_average())
+
+        jiffies = _read_cpu_jiffies()
+        cpu_busy = None
+        if jiffies is not None and self._last_jiffies is not None and jiffies[1] != self._last_jiffies[1]:
+            cpu_busy = round((jiffies[0] - self._last_jiffies[0])/(jiffies[1] - self._last_jiffies[1]), 3)
+        if jiffies is not None:
+            self._first_jiffies = self._first_jiffies or jiffies
+            self._last_jiffies = jiffies
+        columns['cpu_busy'].append(cpu_busy)
+
+        columns['cpu_mhz'].append([_read_number(path, 1e-3) for path in self._frequency_paths])
+        temperatures = [value for value in (_read_number(path, 1e-3) for path in self._thermal_paths) if value is not None]
+        columns['temperature_c'].append(max(temperatures) if len(temperatures) != 0 else None)
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self._sample()
+
+    def start(self) -> None:
+        """Takes the first sample and starts sampling every `interval` seconds."""
+        self._start_time = time.perf_counter()
+        self._start_cpu_seconds = _own_cpu_seconds()
+        self._sample()
+        self._thread = threading.Thread(target=self._run, name='telemetry', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> TelemetrySummary:
+        """Stops sampling, takes the last sample and summarizes every sample.
+
+        Returns:
+            TelemetrySummary: Also kept as `summary`.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._sample()
+
+        summary = self.summary
+        columns = self._columns
+        summary.duration = columns['time'][-1]
+        summary.sample_count = len(columns['time'])
+
+        load_averages = [value for value in columns['load1'] if value is not None]
+        summary.load_average_max = max(load_averages) if len(load_averages) != 0 else None
+
+        if self._first_jiffies is not None and self._last_jiffies is not None and summary.duration >= MIN_LOAD_DURATION:
+            busy_seconds = (self._last_jiffies[0] - self._first_jiffies[0])/os.sysconf('SC_CLK_TCK')
+            own_seconds = _own_cpu_seconds() - self._start_cpu_seconds
+            summary.other_cpu_cores = round(max(busy_seconds - own_seconds, 0.0)/summary.duration, 3)
+
+        frequencies = [value for sample in columns['cpu_mhz'] for value in sample if value is not None]
+        if len(frequencies) != 0:
+            summary.cpu_mhz_min = min(frequencies)
+            summary.cpu_mhz_max = max(frequencies)
+
+        temperatures = [value for value in columns['temperature_c'] if value is not None]
+        summary.temperature_max = max(temperatures) if len(temperatures) != 0 else None
+
+        summary.reasons = []
+        if summary.other_cpu_cores is not None and summary.other_cpu_cores > LOAD_THRESHOLD_CORES:
+            summary.reasons.append(f'other processes kept {summary.other_cpu_cores:.2f} CPUs busy')
+        if summary.temperature_max is not None and summary.temperature_max >= THERMAL_THRESHOLD_C:
+            summary.reasons.append(f'a thermal zone reached {summary.temperature_max:.0f} °C')
+        summary.under_load = len(summary.reasons) != 0
+        return summary
+
+    def write(self, output_path: Path, benchmark_name: str) -> Path:
+        """Writes the summary and samples next to a result.
+
+        Args:
+            output_path: Iteration directory the result was written to.
+            benchmark_name: Name of the runnable, without suffix.
+
+        Returns:
+            Path: File written.
+        """
+        telemetry_path = output_path / METADATA_DIR / f'{benchmark_name}.telemetry.json'
+        telemetry_path.parent.mkdir(parents=True, exist_ok=True)
+        telemetry = {
+            'version': TELEMETRY_VERSION,
+            'interval': self.interval,
+            'summary': asdict(self.summary),
+            'samples': self._columns
+        }
+        with open(telemetry_path, 'w', encoding='utf-8') as file:
+            json.dump(telemetry, file, ensure_ascii=False, separators=(',', ':'))
+        return telemetry_path
+
+def get_telemetry_path(result_path: Path) -> Path:
+    """Telemetry file written for a result file, which may not exist."""
+    return result_path.parent / METADATA_DIR / f"{result_path.name.split('.')[0]}.telemetry.json"
+
+def read_telemetry_summary(result_path: Path) -> TelemetrySummary | None:
+    """Reads the telemetry summary of a result file.
+
+    Args:
+        result_path: Result file in an iteration directory.
+
+    Returns:
+        TelemetrySummary | None: None if no telemetry was recorded or it can not be read.
+    """
+    try:
+        with open(get_telemetry_path(result_path), 'r', encoding='utf-8') as file:
+            summary = json.load(file)['summary']
+        return TelemetrySummary(**summary)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
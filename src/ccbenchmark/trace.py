@@ -0,0 +1,166 @@
+"""Phase-level tracing of ccbenchmark itself.
+
+Records timed spans in the Chrome trace event format, which can be opened in
+Perfetto (https://ui.perfetto.dev) or chrome://tracing. Tracing is enabled by
+`ccbenchmark --trace <FILE>`. While it is disabled `span()` returns a shared
+no-op span, so traced code only pays for one global lookup.
+
+Calls into the Rust extension are traced at the Python boundary with the
+'rust' category, so they are told apart from the Python phases around them.
+
+Example:
+    >>> with span('parse', file=file_path.name) as parse_span:
+    ...     parse_results = list(framework.parse(file_stream, file_path))
+    ...     parse_span.set(results=len(parse_results))
+
+Defines:
+    - Span: Timed block, added to the trace when it ends.
+    - span(): Times a block.
+    - traced(): Decorator timing every call of a function.
+    - start_tracing(): Enables tracing.
+    - stop_tracing(): Disables tracing and writes the trace.
+    - is_tracing(): True while tracing is enabled.
+"""
+
+import functools
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+CallableT = TypeVar('CallableT', bound=Callable)
+
+class _Tracer:
+    """Collects complete ('X') events until the trace is written."""
+    def __init__(self, output_path: Path):
+        self.output_path = output_path
+        self.pid = os.getpid()
+        self.events: list[dict[str, Any]] = []
+        self.thread_names: dict[int, str] = {}
+
+    def add_span(self, name: str, category: str, start_ns: int, end_ns: int, args: dict[str, Any]) -> None:
+        tid = threading.get_native_id()
+        if tid not in self.thread_names:
+            self.thread_names[tid] = threading.current_thread().name
+        # list.append is atomic, spans of the loader thread need no lock.
+        self.events.append({
+            'name': name, 'cat': category, 'ph': 'X',
+            'ts': start_ns/1000.0, 'dur': (end_ns - start_ns)/1000.0,
+            'pid': self.pid, 'tid': tid, 'args': args
+        })
+
+    def write(self) -> None:
+        import json
+
+        thread_events = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': tid, 'args': {'name': thread_name}}
+            for tid, thread_name in self.thread_names.items()
+        ]
+        with open(self.output_path, 'w', encoding='utf-8') as file:
+            json.dump({'traceEvents': thread_events + self.events, 'displayTimeUnit': 'ms'}, file, default=str)
+
+_tracer: _Tracer | None = None
+
+class Span:
+    """Timed block, added to the trace when it ends."""
+    __slots__ = ('name', 'category', 'args', 'start_ns')
+
+    def __init__(self, name: str, category: str, args: dict[str, Any]):
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start_ns = 0
+
+    def set(self, **args: Any) -> None:
+        """Adds arguments shown with the span (e.g., counts known once the block ran)."""
+        self.args.update(args)
+
+    def __enter__(self) -> 'Span':
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        end_ns = time.perf_counter_ns()
+        # Tracing may have stopped while the span was open.
+        if _tracer is not None:
+            _tracer.add_span(self.name, self.category, self.start_ns, end_ns, self.args)
+
+class _NullSpan(Span):
+    """Span used while tracing is disabled, records nothing."""
+    __slots__ = ()
+
+    def __init__(self):
+        super().__init__('', '', {})
+
+    def set(self, **args: Any) -> None:
+        pass
+
+    def __enter__(self) -> Span:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+_NULL_SPAN = _NullSpan()
+
+def span(name: str, category: str = 'python', **args: Any) -> Span:
+    """Times a `with` block.
+
+    Args:
+        name: Name of the phase (e.g., 'parse', 'Manager.update_profile').
+        category: 'python', or 'rust' for calls into the Rust extension.
+        **args: Shown with the span in the trace viewer (e.g., file and benchmark counts).
+
+    Returns:
+        Span: Context manager, a shared no-op span if tracing is disabled.
+    """
+    if _tracer is None:
+        return _NULL_SPAN
+    return Span(name, category, args)
+
+def traced(name: str | None = None, category: str = 'python') -> Callable[[CallableT], CallableT]:
+    """Decorator timing every call of a function, see `span()`.
+
+    Not meant for Qt slots, since PyQt picks the arguments passed to a slot from its signature.
+
+    Args:
+        name: Name of the span, the qualified name of the function if None.
+        category: 'python', or 'rust' for calls into the Rust extension.
+    """
+    def decorator(func: CallableT) -> CallableT:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return func(*args, **kwargs)
+            with Span(span_name, category, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def start_tracing(output_path: Path) -> None:
+    """Enables tracing, spans are kept in memory until `stop_tracing()`."""
+    global _tracer
+    _tracer = _Tracer(output_path)
+
+def stop_tracing() -> int:
+    """Disables tracing and writes the trace to the file given to `start_tracing()`.
+
+    Returns:
+        int: Number of spans written, 0 if tracing was not enabled.
+
+    Raises:
+        OSError: The trace could not be written.
+    """
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is None:
+        return 0
+    tracer.write()
+    return len(tracer.events)
+
+def is_tracing() -> bool:
+    """True while tracing is enabled."""
+    return _tracer is not None
@@ -1,11 +1,50 @@
 """Utility functions shared across ccbenchmark modules."""
 
 from pathlib import Path
-from copy import deepcopy
 import logging
 
 logger = logging.getLogger(__name__)
 
+"""Directory in iterations holding metadata of the run (e.g., telemetry), skipped when loading results."""
+METADATA_DIR = '.ccbenchmark'
+"""Prefix of the iterations `bisect` stores results of other commits as, see `ccbenchmark.bisection`."""
+BISECT_ITERATION_PREFIX = 'bisect_'
+
+def is_history_iteration(iteration_name: str) -> bool:
+    """Returns True if an iteration belongs to the history of the workspace's build.
+
+    'recent' repeats the latest named iteration, and `bisect_<commit>` iterations
+    hold other commits run with other options, so noise floors and durations
+    measured from them would be skewed.
+    """
+    return iteration_name != 'recent' and not iteration_name.startswith(BISECT_ITERATION_PREFIX)
+
+def get_common_part_count(paths: list[Path]) -> int:
+    """Count the leading path components shared by every path.
+
+    The last component of the shortest path is never counted, so stripping the
+    counted components leaves every path non-empty.
+
+    For example:
+        ['/a/b/c', '/a/b/d'] -> 3 ('/', 'a' and 'b')
+
+    Args:
+        paths (list[Path]): List of paths to process.
+
+    Returns:
+        int: Number of shared leading components, 0 if the input is empty.
+    """
+    if len(paths) == 0:
+        return 0
+    max_count = min(len(path.parts) for path in paths) - 1
+    first_parts = paths[0].parts
+    for i in range(max_count):
+        part = first_parts[i]
+        for path in paths:
+            if path.parts[i] != part:
+                return i
+    return max(max_count, 0)
+
 def strip_common_paths(paths: list[Path]) -> list[Path]:
     """Remove common leading path components from a list of paths.
 
@@ -19,24 +58,8 @@ def strip_common_paths(paths: list[Path]) -> list[Path]:
         list[Path]: A new list of paths with the shared leading components removed.
         If the input is empty, returns an empty list.
     """
-    paths_copy = deepcopy(paths)
-    lengths = [len(path.parts) for path in paths_copy]
-    if len(lengths) == 0:
+    if len(paths) == 0:
         logger.warning(f'No paths!')
         return []
-    max_iterations = min(lengths) - 1
-
-    for _ in range(max_iterations):
-        common_part = None
-        for path in paths_copy:
-            assert(len(path.parts) != 0)
-            part = path.parts[0]
-            if common_part is None:
-                common_part = part
-            elif common_part != part:
-                return paths_copy
-
-        for j in range(len(paths_copy)):
-            parts = paths_copy[j].parts[1:]
-            paths_copy[j] = Path(*parts)
-    return paths_copy
\ No newline at end of file
+    common_part_count = get_common_part_count(paths)
+    return [Path(*path.parts[common_part_count:]) for path in paths]
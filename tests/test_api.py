@@ -0,0 +1,85 @@
+import json
+import math
+import re
+from pathlib import Path
+
+import pytest
+
+# Values are read from the Rust Manager, which is only there once the extension is built.
+pytest.importorskip('ccbenchmark._ccbenchmark')
+pytest.importorskip('numpy')
+
+from ccbenchmark import api
+from ccbenchmark.benchmark_data import TimeType
+from ccbenchmark.frameworks.util.metrics import METRICS
+
+SETTINGS = """\
+cpp.google_benchmark:
+  output_dir: out
+  output_format: json
+"""
+
+def write_result(workspace: Path, iteration_name: str, times: dict[str, float]) -> None:
+    iteration_path = workspace / 'out' / 'sort' / f'_iter_{iteration_name}'
+    iteration_path.mkdir(parents=True)
+    benchmarks = [{
+        'name': name, 'run_name': name, 'run_type': 'iteration', 'repetitions': 1, 'repetition_index': 0,
+        'threads': 1, 'iterations': 1, 'real_time': time, 'cpu_time': time/2, 'time_unit': 'us'
+    } for name, time in times.items()]
+    with open(iteration_path / 'sort.json', 'w', encoding='utf-8') as file:
+        json.dump({'context': {}, 'benchmarks': benchmarks}, file)
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Path:
+    (tmp_path / '.ccbenchmark').mkdir()
+    (tmp_path / '.ccbenchmark' / 'settings.yaml').write_text(SETTINGS)
+    write_result(tmp_path, 'base', {'BM_Sort/8': 1.0, 'BM_Sort/64': 2.0})
+    # BM_Sort/64 has no result in 'cand', its value is NaN.
+    write_result(tmp_path, 'cand', {'BM_Sort/8': 1.5})
+    return tmp_path
+
+def test_load_arrays(workspace: Path):
+    history = api.load(workspace)
+
+    assert history.benchmark_ids == ['sort/BM_Sort/8', 'sort/BM_Sort/64']
+    assert history.iteration_names == ['base', 'cand']
+    assert history.metric_names == METRICS
+    assert history.real_time.shape == history.cpu_time.shape == (2, len(METRICS), 2)
+    assert list(history.get('sort/BM_Sort/8')) == [1000.0, 1500.0]
+    assert list(history.get('sort/BM_Sort/8', time_type=TimeType.CPU)) == [500.0, 750.0]
+    assert history.get('sort/BM_Sort/64')[0] == 2000.0
+    assert math.isnan(history.get('sort/BM_Sort/64')[1])
+
+def test_get_unknown_benchmark(workspace: Path):
+    history = api.load(workspace)
+
+    with pytest.raises(ValueError):
+        history.get('sort/BM_Missing')
+    with pytest.raises(ValueError):
+        history.get('sort/BM_Sort/8', metric='Missing')
+
+def test_load_with_filter(workspace: Path):
+    assert api.load(workspace, filter='/8$').benchmark_ids == ['sort/BM_Sort/8']
+    assert api.load(workspace, filter='sort/*/64', glob=True).benchmark_ids == ['sort/BM_Sort/64']
+    with pytest.raises(re.error):
+        api.load(workspace, filter='(')
+
+def test_load_without_settings(tmp_path: Path):
+    with pytest.raises(FileNotFoundError):
+        api.load(tmp_path)
+
+def test_to_dataframe(workspace: Path):
+    pytest.importorskip('pandas')
+
+    dataframe = api.load(workspace).to_dataframe()
+
+    assert list(dataframe.columns) == ['path', 'benchmark', 'iteration', 'metric', 'unit', 'real_time', 'cpu_time']
+    # Only the values present are kept: Time of both iterations of BM_Sort/8 and of 'base' of BM_Sort/64.
+    rows = list(dataframe[['benchmark', 'iteration', 'metric', 'real_time', 'cpu_time']].itertuples(index=False, name=None))
+    assert rows == [
+        ('BM_Sort/8', 'base', 'Time', 1000.0, 500.0),
+        ('BM_Sort/8', 'cand', 'Time', 1500.0, 750.0),
+        ('BM_Sort/64', 'base', 'Time', 2000.0, 1000.0),
+    ]
+    assert set(dataframe['path']) == {'sort'} and set(dataframe['unit']) == {'ns'}
+    assert dataframe['benchmark'].dtype == 'category'
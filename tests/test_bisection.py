@@ -0,0 +1,76 @@
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from ccbenchmark.bisection import BisectVerdict, get_commit_range, get_iteration_name, get_regressed_benchmarks, get_verdict, next_commit
+from ccbenchmark.util import is_history_iteration
+
+COMMITS = [f'{index:040x}' for index in range(1, 11)]
+
+def bisect(culprit: int, skipped: set[int] = set()) -> tuple[int, list[int]]:
+    """First bad commit of COMMITS found with `next_commit`, and the commits tested."""
+    last_good, first_bad = -1, len(COMMITS) - 1
+    tested = []
+    while (commit_index := next_commit(last_good, first_bad, skipped)) is not None:
+        tested.append(commit_index)
+        if commit_index >= culprit:
+            first_bad = commit_index
+        else:
+            last_good = commit_index
+    return first_bad, tested
+
+@pytest.mark.parametrize('culprit', range(len(COMMITS)))
+def test_next_commit_finds_culprit(culprit: int):
+    first_bad, tested = bisect(culprit)
+
+    assert first_bad == culprit
+    assert len(tested) <= 4
+
+def test_next_commit_passes_over_skipped():
+    first_bad, tested = bisect(6, skipped={4, 5})
+
+    assert 4 not in tested and 5 not in tested
+    assert first_bad == 6
+    assert next_commit(3, 6, {4, 5}) is None
+
+def test_bisect_iterations_are_not_history():
+    assert not is_history_iteration(get_iteration_name(COMMITS[0]))
+    assert not is_history_iteration('recent')
+    assert is_history_iteration('nightly')
+    assert is_history_iteration('bisected_sort')
+
+def test_verdict_of_commits():
+    pytest.importorskip('ccbenchmark._ccbenchmark')
+    from ccbenchmark._ccbenchmark import Manager
+
+    manager = Manager()
+    manager.emplace(1, 4, 'ns')
+    manager.emplace(1, 4, 'ns')
+    good, half, bad, untested = 0, 1, 2, 3
+    for iteration_index, time in ((good, 100.0), (half, 110.0), (bad, 120.0)):
+        manager.set_samples(0, iteration_index, [time + offset for offset in range(8)], 'ns')
+        manager.set_samples(1, iteration_index, [100.0 + offset for offset in range(8)], 'ns')
+    ids = ['sort/BM_Sort', 'sort/BM_Copy']
+
+    regressed = get_regressed_benchmarks(manager, good, bad, 5.0)
+
+    assert list(regressed) == [0]
+    assert get_verdict(manager, good, half, regressed, ids)[0] == BisectVerdict.BAD
+    assert get_verdict(manager, good, good, regressed, ids)[0] == BisectVerdict.GOOD
+    assert get_verdict(manager, good, untested, regressed, ids)[0] == BisectVerdict.SKIPPED
+
+def test_commit_range(tmp_path: Path):
+    def git(*args: str) -> str:
+        return subprocess.run(['git', '-C', str(tmp_path), *args], capture_output=True, text=True, check=True).stdout.strip()
+
+    git('init', '-q')
+    for message in ('good', 'middle', 'bad'):
+        git('-c', 'user.name=ccbenchmark', '-c', 'user.email=ccbenchmark@localhost', 'commit', '-q', '--allow-empty', '-m', message)
+    hashes = git('rev-list', '--reverse', 'HEAD').split()
+
+    assert get_commit_range(tmp_path, 'HEAD~2', 'HEAD') == (hashes[0], hashes[2], hashes[1:])
+    with pytest.raises(ValueError):
+        get_commit_range(tmp_path, 'HEAD', 'HEAD~2')
+    with pytest.raises(ValueError):
+        get_commit_range(tmp_path, 'missing', 'HEAD')
@@ -0,0 +1,53 @@
+import json
+import math
+from pathlib import Path
+
+from ccbenchmark.calibration import BenchmarkNoise, NoiseFloors, get_noise_floors_path, load_noise_floors
+
+def make_noise_floors() -> NoiseFloors:
+    return NoiseFloors(
+        'bench host/1', created=1700000000.0, timer_resolution_ns=42.0, host_delta_percent=1.5, host_cv_percent=0.8,
+        references={'integer_loop': BenchmarkNoise(1.5, 29, 0.8)},
+        # A history with no repetitions has no CV.
+        benchmarks={'cpp/sort/BM_Sort/8': BenchmarkNoise(3.0, 6), 'cpp/sort/BM_Sort/64': BenchmarkNoise(0.5, 4, 2.0)},
+    )
+
+def reject_constant(constant: str) -> None:
+    raise ValueError(f'{constant} is not valid JSON')
+
+def test_save_load_round_trip(tmp_path: Path):
+    noise_floors = make_noise_floors()
+    path = get_noise_floors_path(tmp_path, noise_floors.host)
+
+    noise_floors.save(path)
+
+    # NaN is written as null, so the file is strict JSON.
+    with open(path, 'r', encoding='utf-8') as file:
+        assert json.load(file, parse_constant=reject_constant)['benchmarks']['cpp/sort/BM_Sort/8']['cv_percent'] is None
+
+    loaded = load_noise_floors(tmp_path, 'bench host/1')
+    assert math.isnan(loaded.benchmarks['cpp/sort/BM_Sort/8'].cv_percent)
+    loaded.benchmarks['cpp/sort/BM_Sort/8'].cv_percent = noise_floors.benchmarks['cpp/sort/BM_Sort/8'].cv_percent = 0.0
+    assert loaded == noise_floors
+
+def test_host_name_is_a_file_name(tmp_path: Path):
+    assert get_noise_floors_path(tmp_path, 'bench host/1') == tmp_path / '.ccbenchmark' / 'noise' / 'bench_host_1.json'
+
+def test_load_without_valid_noise_floors(tmp_path: Path):
+    assert load_noise_floors(tmp_path, 'other') is None
+
+    path = get_noise_floors_path(tmp_path, 'other')
+    path.parent.mkdir(parents=True)
+    path.write_text('{"benchmarks": {}}')
+    assert load_noise_floors(tmp_path, 'other') is None
+
+    path.write_text('not json')
+    assert load_noise_floors(tmp_path, 'other') is None
+
+def test_floors_fall_back_to_host():
+    noise_floors = make_noise_floors()
+
+    assert noise_floors.get_delta_floor(Path('cpp/sort'), 'BM_Sort/8') == 3.0
+    assert noise_floors.get_cv_floor(Path('cpp/sort'), 'BM_Sort/8') == 0.8
+    assert noise_floors.get_delta_floor(Path('cpp/hash'), 'BM_Hash') == 1.5
+    assert noise_floors.get_color_limits(Path('cpp/sort'), 'BM_Sort/64') == (2.0, 4.0)
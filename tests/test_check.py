@@ -0,0 +1,75 @@
+import json
+import sys
+import xml.etree.ElementTree as ElementTree
+from pathlib import Path
+
+import pytest
+
+# Results are loaded by the Rust Manager, which is only there once the extension is built.
+pytest.importorskip('ccbenchmark._ccbenchmark')
+
+from ccbenchmark.__main__ import ExitResult, entrypoint
+
+SETTINGS = """\
+cpp.google_benchmark:
+  output_dir: out
+  output_format: json
+check:
+  baseline: main
+  percent: 5.0
+  benchmarks:
+    "sort/BM_Noisy*":
+      percent: 50.0
+"""
+
+@pytest.fixture
+def workspace(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    (tmp_path / '.ccbenchmark').mkdir()
+    (tmp_path / '.ccbenchmark' / 'settings.yaml').write_text(SETTINGS)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+def write_result(iteration_name: str, times: dict[str, float]) -> None:
+    iteration_path = Path('out') / 'sort' / f'_iter_{iteration_name}'
+    iteration_path.mkdir(parents=True)
+    benchmarks = [{
+        'name': name, 'run_name': name, 'run_type': 'iteration', 'repetitions': 1, 'repetition_index': 0,
+        'threads': 1, 'iterations': 1, 'real_time': time, 'cpu_time': time, 'time_unit': 'ns'
+    } for name, time in times.items()]
+    with open(iteration_path / 'sort.json', 'w', encoding='utf-8') as file:
+        json.dump({'context': {}, 'benchmarks': benchmarks}, file)
+
+def check(monkeypatch: pytest.MonkeyPatch, *args: str) -> int:
+    monkeypatch.setattr(sys, 'argv', ['benchmark', 'check', *args])
+    with pytest.raises(SystemExit) as exit_info:
+        entrypoint()
+    return exit_info.value.code
+
+def read_junit(path: Path) -> dict[str, str]:
+    """Outcome of every test case by name: 'failure', 'skipped' or 'passed'."""
+    outcomes = {}
+    for test_case in ElementTree.parse(path).getroot().iter('testcase'):
+        children = [child.tag for child in test_case]
+        outcomes[test_case.get('name')] = children[0] if len(children) != 0 else 'passed'
+    return outcomes
+
+def test_regression_past_threshold(workspace: Path, monkeypatch: pytest.MonkeyPatch):
+    write_result('main', {'BM_Sort': 100.0, 'BM_Copy': 100.0, 'BM_NoisySort': 100.0})
+    write_result('recent', {'BM_Sort': 110.0, 'BM_Copy': 103.0, 'BM_NoisySort': 140.0})
+
+    assert check(monkeypatch, '--junit', 'check.xml') == ExitResult.REGRESSION_DETECTED
+    assert read_junit(workspace / 'check.xml') == {'BM_Sort': 'failure', 'BM_Copy': 'passed', 'BM_NoisySort': 'passed'}
+    suite = ElementTree.parse(workspace / 'check.xml').getroot().find('testsuite')
+    assert (suite.get('tests'), suite.get('failures')) == ('3', '1')
+
+def test_no_regression_succeeds(workspace: Path, monkeypatch: pytest.MonkeyPatch):
+    write_result('main', {'BM_Sort': 100.0, 'BM_Copy': 100.0})
+    write_result('recent', {'BM_Sort': 90.0, 'BM_Copy': 104.0})
+
+    assert check(monkeypatch, 'main', 'recent', '--junit', 'check.xml') == ExitResult.SUCCESS
+    assert read_junit(workspace / 'check.xml') == {'BM_Sort': 'passed', 'BM_Copy': 'passed'}
+
+def test_missing_iteration(workspace: Path, monkeypatch: pytest.MonkeyPatch):
+    write_result('main', {'BM_Sort': 100.0})
+
+    assert check(monkeypatch, 'main', 'nightly') == ExitResult.INVALID_ITERATION
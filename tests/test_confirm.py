@@ -0,0 +1,75 @@
+import json
+import math
+import os
+from pathlib import Path
+
+import pytest
+
+from ccbenchmark.benchmark_framework import RunOptions
+from ccbenchmark.confirm import Confirmation, Verdict, get_verdict, read_confirmations, run_rounds, write_confirmations
+from ccbenchmark.frameworks.cpp import google_benchmark
+
+NAMES = ['BM_Sort/8', 'BM_Sort/64']
+
+class FakeFramework:
+    """Writes Google Benchmark JSON with the times of each runnable, recording the order runnables ran in."""
+    SUPPORTED_FORMATS = {'json'}
+
+    def __init__(self, times: dict[str, float]):
+        self.times = times
+        self.runs: list[str] = []
+
+    def run_single_benchmark(self, runnable_path: Path, output_location: Path, output_format: str, run_options: RunOptions) -> int:
+        self.runs.append(runnable_path.name)
+        # Spread the samples of a side so the rank test has no ties.
+        time = self.times[runnable_path.name] + len(self.runs)
+        benchmarks = [{
+            'name': name, 'run_name': name, 'run_type': 'iteration', 'repetitions': 1, 'repetition_index': 0,
+            'threads': 1, 'iterations': 1, 'real_time': time, 'cpu_time': time, 'time_unit': 'ns'
+        } for name in NAMES]
+        with open(output_location, 'w', encoding='utf-8') as file:
+            json.dump({'context': {}, 'benchmarks': benchmarks}, file)
+        return 0
+
+    parse = staticmethod(google_benchmark.parse)
+
+def confirm(framework: FakeFramework, rounds: int = 5) -> dict[str, Verdict]:
+    comparisons = run_rounds(framework, Path('candidate'), Path('baseline'), 'json', NAMES, rounds, 1, 0)
+    return {name: get_verdict(delta, p_value, 5.0) for name, (delta, p_value, _, _) in comparisons.items()}
+
+def test_verdict():
+    assert get_verdict(1.0, 0.001, 5.0) == Verdict.REFUTED
+    assert get_verdict(6.0, 0.001, 5.0) == Verdict.CONFIRMED
+    assert get_verdict(6.0, 0.2, 5.0) == Verdict.INCONCLUSIVE
+    assert get_verdict(math.nan, math.nan, 5.0) == Verdict.INCONCLUSIVE
+
+def test_rounds_alternate_abba():
+    pytest.importorskip('ccbenchmark._ccbenchmark')
+    framework = FakeFramework({'baseline': 1000.0, 'candidate': 1000.0})
+
+    confirm(framework, rounds=4)
+
+    assert framework.runs == ['baseline', 'candidate', 'candidate', 'baseline'] * 2
+
+def test_slower_candidate_is_confirmed():
+    pytest.importorskip('ccbenchmark._ccbenchmark')
+
+    assert confirm(FakeFramework({'baseline': 1000.0, 'candidate': 1200.0})) == dict.fromkeys(NAMES, Verdict.CONFIRMED)
+    assert confirm(FakeFramework({'baseline': 1000.0, 'candidate': 1000.0})) == dict.fromkeys(NAMES, Verdict.REFUTED)
+
+def test_confirmations_round_trip(tmp_path: Path):
+    result_path = tmp_path / 'sort.json'
+    result_path.write_text('{}')
+    confirmations = {
+        'BM_Sort/8': Confirmation('main', Verdict.CONFIRMED, 12.5, 0.004, 5, 5),
+        'BM_Sort/64': Confirmation('main', Verdict.INCONCLUSIVE, math.nan, math.nan, 0, 5, interleaved=False)
+    }
+
+    write_confirmations(result_path, confirmations, 5, 1)
+    read = read_confirmations(result_path)
+
+    assert read['BM_Sort/8'] == confirmations['BM_Sort/8']
+    assert math.isnan(read['BM_Sort/64'].delta) and not read['BM_Sort/64'].interleaved
+    # A replaced result drops the confirmations of the previous one.
+    os.utime(result_path, (0, 0))
+    assert read_confirmations(result_path) == {}
@@ -0,0 +1,155 @@
+import json
+import platform
+import socket
+import struct
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from ccbenchmark.benchmark_framework import import_framework
+from ccbenchmark.benchmark_helpers import run_benchmarks
+from ccbenchmark.distributed import (
+    HELLO_MESSAGE_SIZE, PROTOCOL_VERSION, Worker, WorkerPool, _options_from_json, read_worker_record, receive_message, send_message
+)
+
+pytestmark = pytest.mark.skipif(sys.platform == 'win32', reason='Fake runnables are scripts with a shebang')
+
+# Writes a Google Benchmark JSON result with one benchmark, like a runnable built with Google Benchmark.
+FAKE_RUNNABLE = """#!{python}
+import json, sys, time
+args = dict(arg.split('=', 1) for arg in sys.argv[1:] if '=' in arg)
+time.sleep(0.3)
+print('BM_{name}   100 ns   100 ns   1', flush=True)
+benchmarks = [{{
+    'name': 'BM_{name}', 'run_name': 'BM_{name}', 'run_type': 'iteration', 'repetitions': 1, 'repetition_index': 0,
+    'threads': 1, 'iterations': 1, 'real_time': 100.0, 'cpu_time': 100.0, 'time_unit': 'ns'
+}}]
+with open(args['--benchmark_out'], 'w') as file:
+    json.dump({{'context': {{}}, 'benchmarks': benchmarks}}, file)
+"""
+RUNNABLE_NAMES = ['b0', 'b1', 'b2', 'b3']
+
+def write_runnables(workspace: Path) -> None:
+    (workspace / 'bin').mkdir()
+    for name in RUNNABLE_NAMES:
+        runnable_path = workspace / 'bin' / name
+        runnable_path.write_text(FAKE_RUNNABLE.format(python=sys.executable, name=name))
+        runnable_path.chmod(0o755)
+
+def start_worker(root: Path) -> Worker:
+    worker = Worker(('127.0.0.1', 0), root)
+    threading.Thread(target=worker.serve_forever, daemon=True).start()
+    return worker
+
+def start_lost_worker() -> tuple[str, int]:
+    """Worker that accepts one coordinator and disconnects once it sends a runnable, like a host that went down."""
+    listener = socket.create_server(('127.0.0.1', 0))
+
+    def serve() -> None:
+        connection, _ = listener.accept()
+        listener.close()
+        with connection:
+            receive_message(connection)
+            send_message(connection, {'type': 'hello', 'version': PROTOCOL_VERSION, 'host': 'lost'})
+            receive_message(connection)
+    threading.Thread(target=serve, daemon=True).start()
+    return listener.getsockname()[:2]
+
+@pytest.fixture
+def workspace(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    write_runnables(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+def run(worker_pool: WorkerPool) -> Path:
+    framework = import_framework('cpp.google_benchmark', 'json')
+    run_benchmarks([Path('bin/*')], Path('out'), framework, 'json', 'dist', telemetry=False, worker_pool=worker_pool)
+    return Path('out/_iter_dist')
+
+def test_runs_on_localhost_workers(workspace: Path):
+    workers = [start_worker(workspace) for _ in range(2)]
+    try:
+        output_path = run(WorkerPool([worker.server_address[:2] for worker in workers]))
+    finally:
+        for worker in workers:
+            worker.shutdown()
+            worker.server_close()
+
+    addresses = set()
+    for name in RUNNABLE_NAMES:
+        with open(output_path / f'{name}.json', 'r', encoding='utf-8') as file:
+            assert json.load(file)['benchmarks'][0]['name'] == f'BM_{name}'
+        assert (output_path / '.ccbenchmark' / f'{name}.log').is_file()
+        record = read_worker_record(output_path, name)
+        assert record['host'] == (platform.node() or 'localhost')
+        assert record['attempts'] == 1
+        addresses.add(record['address'])
+        assert (Path('out/_iter_recent') / f'{name}.json').is_file()
+        assert read_worker_record(Path('out/_iter_recent'), name) == record
+    assert len(addresses) == 2
+
+def test_retries_runnables_of_lost_workers(workspace: Path):
+    worker = start_worker(workspace)
+    try:
+        output_path = run(WorkerPool([start_lost_worker(), worker.server_address[:2]]))
+    finally:
+        worker.shutdown()
+        worker.server_close()
+
+    records = [read_worker_record(output_path, name) for name in RUNNABLE_NAMES]
+    assert all((output_path / f'{name}.json').is_file() for name in RUNNABLE_NAMES)
+    assert {record['address'] for record in records} == {f'127.0.0.1:{worker.server_address[1]}'}
+    assert sum(record['attempts'] for record in records) == len(RUNNABLE_NAMES) + 1
+
+def test_gives_up_without_workers(workspace: Path):
+    listener = socket.create_server(('127.0.0.1', 0))
+    address = listener.getsockname()[:2]
+    listener.close()
+
+    output_path = run(WorkerPool([address]))
+
+    assert not any(output_path.glob('*.json'))
+
+def test_refuses_other_hosts_without_token(tmp_path: Path):
+    with pytest.raises(ValueError):
+        Worker(('0.0.0.0', 0), tmp_path)
+
+def test_rejects_invalid_tokens(tmp_path: Path):
+    worker = Worker(('127.0.0.1', 0), tmp_path, token='secret')
+    threading.Thread(target=worker.serve_forever, daemon=True).start()
+    try:
+        with socket.create_connection(worker.server_address[:2]) as connection:
+            send_message(connection, {'type': 'hello', 'version': PROTOCOL_VERSION, 'token': 'sécret'})
+            assert receive_message(connection) == {'type': 'error', 'message': 'Invalid token'}
+    finally:
+        worker.shutdown()
+        worker.server_close()
+
+def test_refuses_large_messages_before_token(tmp_path: Path):
+    worker = Worker(('127.0.0.1', 0), tmp_path, token='secret')
+    threading.Thread(target=worker.serve_forever, daemon=True).start()
+    try:
+        with socket.create_connection(worker.server_address[:2]) as connection:
+            connection.settimeout(10.0)
+            connection.sendall(struct.pack('>I', HELLO_MESSAGE_SIZE + 1))
+            # Disconnected without waiting for the rest of the message.
+            assert connection.recv(1) == b''
+    finally:
+        worker.shutdown()
+        worker.server_close()
+
+def test_only_runs_allowed_options():
+    options = {'env': {'OMP_NUM_THREADS': '1'}, 'extra_args': ['--benchmark_enable_random_interleaving=true']}
+    run_options = _options_from_json(options, {'OMP_NUM_THREADS'}, {'--benchmark_enable_random_interleaving'})
+    assert run_options.env == {'OMP_NUM_THREADS': '1'}
+
+    with pytest.raises(ValueError):
+        _options_from_json(options, set(), {'--benchmark_enable_random_interleaving'})
+    with pytest.raises(ValueError):
+        _options_from_json(options, {'OMP_NUM_THREADS'}, set())
+    with pytest.raises(ValueError):
+        _options_from_json({'env': {'LD_PRELOAD': '/tmp/hook.so'}}, {'LD_PRELOAD'}, set())
+    with pytest.raises(ValueError):
+        _options_from_json({'extra_args': ['--benchmark_out', '/etc/passwd']}, set(), {'--benchmark_out'})
@@ -0,0 +1,82 @@
+import csv
+import json
+from pathlib import Path
+
+import pytest
+
+# Results are read from the Rust Manager, which is only there once the extension is built.
+pytest.importorskip('ccbenchmark._ccbenchmark')
+
+from ccbenchmark.benchmark_data import BenchmarkData
+from ccbenchmark.benchmark_framework import import_framework
+from ccbenchmark.benchmark_helpers import load_iterations
+from ccbenchmark.export import COLUMNS, ExportFormat, export_benchmark_data
+
+def write_result(output_path: Path, iteration_name: str, times: dict[str, float]) -> None:
+    iteration_path = output_path / 'sort' / f'_iter_{iteration_name}'
+    iteration_path.mkdir(parents=True)
+    benchmarks = [{
+        'name': name, 'run_name': name, 'run_type': 'iteration', 'repetitions': 1, 'repetition_index': 0,
+        'threads': 1, 'iterations': 1, 'real_time': time, 'cpu_time': time/2, 'time_unit': 'us'
+    } for name, time in times.items()]
+    with open(iteration_path / 'sort.json', 'w', encoding='utf-8') as file:
+        json.dump({'context': {}, 'benchmarks': benchmarks}, file)
+
+@pytest.fixture
+def benchmark_data(tmp_path: Path) -> BenchmarkData:
+    write_result(tmp_path / 'out', 'base', {'BM_Sort/8': 1.0, 'BM_Sort/64': 2.0})
+    # BM_Sort/64 has no result in 'cand', its row is left out.
+    write_result(tmp_path / 'out', 'cand', {'BM_Sort/8': 1.5})
+    return load_iterations([tmp_path / 'out'], [import_framework('cpp.google_benchmark', 'json')])
+
+EXPECTED_ROWS = [
+    ('BM_Sort/8', 'base', 1000.0, 500.0),
+    ('BM_Sort/8', 'cand', 1500.0, 750.0),
+    ('BM_Sort/64', 'base', 2000.0, 1000.0),
+]
+
+def export(benchmark_data: BenchmarkData, output_path: Path, export_format: ExportFormat, batch_size: int = 65536) -> list[int]:
+    return list(export_benchmark_data(benchmark_data, output_path, export_format, batch_size=batch_size))
+
+def test_csv_export(benchmark_data: BenchmarkData, tmp_path: Path):
+    assert export(benchmark_data, tmp_path / 'history.csv', ExportFormat.CSV, batch_size=2) == [2, 3]
+
+    with open(tmp_path / 'history.csv', 'r', encoding='utf-8', newline='') as file:
+        rows = list(csv.reader(file))
+    assert rows[0] == COLUMNS
+    assert [(row[1], row[2], float(row[5]), float(row[6])) for row in rows[1:]] == EXPECTED_ROWS
+    assert {(row[0], row[3], row[4]) for row in rows[1:]} == {('sort', 'Time', 'ns')}
+
+def test_ndjson_export(benchmark_data: BenchmarkData, tmp_path: Path):
+    export(benchmark_data, tmp_path / 'history.ndjson', ExportFormat.NDJSON)
+
+    with open(tmp_path / 'history.ndjson', 'r', encoding='utf-8') as file:
+        rows = [json.loads(line) for line in file]
+    assert [(row['benchmark'], row['iteration'], row['real_time'], row['cpu_time']) for row in rows] == EXPECTED_ROWS
+
+def test_parquet_export(benchmark_data: BenchmarkData, tmp_path: Path):
+    pytest.importorskip('pyarrow')
+    import pyarrow.parquet as pq
+
+    export(benchmark_data, tmp_path / 'history.parquet', ExportFormat.PARQUET, batch_size=2)
+
+    table = pq.read_table(tmp_path / 'history.parquet')
+    assert table.column_names == COLUMNS
+    rows = zip(*(table.column(column).to_pylist() for column in ('benchmark', 'iteration', 'real_time', 'cpu_time')))
+    assert list(rows) == EXPECTED_ROWS
+
+def test_closing_export_stops_it(benchmark_data: BenchmarkData, tmp_path: Path):
+    export_progress = export_benchmark_data(benchmark_data, tmp_path / 'history.ndjson', ExportFormat.NDJSON, batch_size=1)
+
+    assert next(export_progress) == 1
+    export_progress.close()
+
+    # The file is closed with the rows written before the export was stopped.
+    with open(tmp_path / 'history.ndjson', 'r', encoding='utf-8') as file:
+        assert len(file.readlines()) == 1
+
+def test_parquet_requires_output_file(benchmark_data: BenchmarkData):
+    pytest.importorskip('pyarrow')
+
+    with pytest.raises(ValueError):
+        export(benchmark_data, None, ExportFormat.PARQUET)
@@ -0,0 +1,78 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from ccbenchmark.benchmark_framework import import_framework
+from ccbenchmark.benchmark_helpers import run_benchmarks
+from ccbenchmark.name_index import BenchmarkFilter
+
+pytestmark = pytest.mark.skipif(sys.platform == 'win32', reason='Fake runnables are scripts with a shebang')
+
+# Runs the benchmarks its --benchmark_filter selects, like a runnable built with Google Benchmark.
+FAKE_RUNNABLE = """#!{python}
+import json, re, sys
+args = dict(arg.split('=', 1) for arg in sys.argv[1:] if '=' in arg)
+names = [f'BM_{name}/{{size}}' for size in (1, 2, 3)]
+benchmark_filter = args.get('--benchmark_filter')
+names = [name for name in names if benchmark_filter is None or re.search(benchmark_filter, name)]
+if args.get('--benchmark_list_tests') == 'true':
+    print('\\n'.join(names))
+    sys.exit(0)
+time = float(open('{time_path}').read())
+benchmarks = [{{
+    'name': name, 'run_name': name, 'run_type': 'iteration', 'repetitions': 1, 'repetition_index': 0,
+    'threads': 1, 'iterations': 1, 'real_time': time, 'cpu_time': time, 'time_unit': 'ns'
+}} for name in names]
+with open(args['--benchmark_out'], 'w') as file:
+    json.dump({{'context': {{}}, 'benchmarks': benchmarks}}, file)
+"""
+RUNNABLE_NAMES = ['sort', 'hash']
+
+@pytest.fixture
+def workspace(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    (tmp_path / 'bin').mkdir()
+    for name in RUNNABLE_NAMES:
+        runnable_path = tmp_path / 'bin' / name
+        runnable_path.write_text(FAKE_RUNNABLE.format(python=sys.executable, name=name, time_path=tmp_path / 'time'))
+        runnable_path.chmod(0o755)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+def run(time: float, benchmark_filter: BenchmarkFilter | None = None) -> None:
+    Path('time').write_text(str(time))
+    framework = import_framework('cpp.google_benchmark', 'json')
+    run_benchmarks([Path('bin/*')], Path('out'), framework, 'json', 'nightly', benchmark_filter, telemetry=False)
+
+def read_times(iteration_name: str, name: str) -> dict[str, float]:
+    with open(Path('out') / f'_iter_{iteration_name}' / f'{name}.json', 'r', encoding='utf-8') as file:
+        return {benchmark['name']: benchmark['real_time'] for benchmark in json.load(file)['benchmarks']}
+
+def test_name_pattern_of_path_regex():
+    benchmark_filter = BenchmarkFilter('^sort/BM_sort/[12]$')
+
+    assert benchmark_filter.get_name_pattern(Path('hash')) is None
+    assert benchmark_filter.get_name_pattern(Path('sort')) == ''
+    assert benchmark_filter.get_name_pattern(Path('sort'), ['BM_sort/1', 'BM_sort/2', 'BM_sort/3']) == '^(BM_sort/1|BM_sort/2)$'
+
+def test_filtered_run_keeps_other_results(workspace: Path):
+    run(100.0)
+    run(200.0, BenchmarkFilter('^sort/BM_sort/[12]$'))
+
+    for iteration_name in ('nightly', 'recent'):
+        assert read_times(iteration_name, 'sort') == {'BM_sort/1': 200.0, 'BM_sort/2': 200.0, 'BM_sort/3': 100.0}
+        assert read_times(iteration_name, 'hash') == {'BM_hash/1': 100.0, 'BM_hash/2': 100.0, 'BM_hash/3': 100.0}
+    assert not any(Path('out/_iter_nightly/.ccbenchmark').glob('*.previous'))
+
+def test_filter_applies_to_each_result(workspace: Path):
+    pytest.importorskip('ccbenchmark._ccbenchmark')
+    from ccbenchmark.benchmark_helpers import load_iterations
+
+    run(100.0)
+    framework = import_framework('cpp.google_benchmark', 'json')
+    benchmark_data = load_iterations([Path('out')], [framework], BenchmarkFilter('^sort/BM_sort/[12]$'))
+
+    assert sorted(zip(map(Path.as_posix, benchmark_data.benchmark_paths), benchmark_data.benchmark_names)) == [
+        ('sort', 'BM_sort/1'), ('sort', 'BM_sort/2')
+    ]
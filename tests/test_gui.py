@@ -0,0 +1,94 @@
+import json
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip('PyQt5')
+# The GUI reads cells from the Rust Manager, which is only there once the extension is built.
+pytest.importorskip('ccbenchmark._ccbenchmark')
+
+from PyQt5.QtWidgets import QApplication
+
+from ccbenchmark.benchmark_data import BenchmarkData, LoadProgress, TimeType
+from ccbenchmark.benchmark_framework import import_framework
+from ccbenchmark.benchmark_helpers import iter_load_iterations, load_iterations
+from ccbenchmark.gui import BenchmarkDataTableView, LoaderWorker
+
+@pytest.fixture(scope='module')
+def application() -> QApplication:
+    return QApplication.instance() or QApplication(['ccbenchmark', '-platform', 'offscreen'])
+
+def write_result(output_path: Path, iteration_name: str, real_time: float) -> None:
+    iteration_path = output_path / 'sort' / f'_iter_{iteration_name}'
+    iteration_path.mkdir(parents=True)
+    benchmarks = [{
+        'name': name, 'run_name': name, 'run_type': 'iteration', 'repetitions': 1, 'repetition_index': 0,
+        'threads': 1, 'iterations': 1, 'real_time': real_time, 'cpu_time': real_time, 'time_unit': 'ns'
+    } for name in ('BM_Sort/8', 'BM_Sort/64')]
+    with open(iteration_path / 'sort_benchmark.json', 'w', encoding='utf-8') as file:
+        json.dump({'context': {}, 'benchmarks': benchmarks}, file)
+
+def test_copy_writes_tab_separated_selection(application: QApplication, tmp_path: Path):
+    write_result(tmp_path, 'base', 100.0)
+    write_result(tmp_path, 'cand', 110.0)
+    benchmark_data = load_iterations([tmp_path], [import_framework('cpp.google_benchmark', 'json')])
+    view = BenchmarkDataTableView(benchmark_data, list(range(len(benchmark_data.benchmark_names))), TimeType.REAL)
+
+    view.selectAll()
+    view.copy()
+
+    rows = [line.split('\t') for line in QApplication.clipboard().text().splitlines()]
+    assert rows[0][0] == '"Label"'
+    assert len(rows) == 3
+    assert all(len(row) == len(rows[0]) > 1 for row in rows)
+
+def run_loader(worker: LoaderWorker) -> tuple[list[LoadProgress], list[tuple[LoadProgress | None, bool]]]:
+    """Progress and finished signals of a loader, run on this thread."""
+    progress: list[LoadProgress] = []
+    finished: list[tuple[LoadProgress | None, bool]] = []
+    worker.progress.connect(progress.append)
+    worker.finished.connect(lambda last_progress, cancelled: finished.append((last_progress, cancelled)))
+    worker.run()
+    return progress, finished
+
+def test_loader_reports_throttled_progress(application: QApplication, tmp_path: Path):
+    for iteration_name in ('base', 'cand', 'next'):
+        write_result(tmp_path, iteration_name, 100.0)
+    loader = iter_load_iterations([tmp_path], [import_framework('cpp.google_benchmark', 'json')])
+
+    progress, finished = run_loader(LoaderWorker(loader, report_interval=3600.0))
+
+    # Only the progress before the first file, the rest come sooner than the interval.
+    assert [report.files_loaded for report in progress] == [0]
+    last_progress, cancelled = finished[0]
+    assert not cancelled
+    assert (last_progress.files_loaded, last_progress.file_count, last_progress.benchmark_count) == (3, 3, 2)
+    assert len(last_progress.benchmark_data.iteration_names) == 3
+
+def test_loader_stops_once_cancelled(application: QApplication):
+    benchmark_data = BenchmarkData(['base'])
+    loaded: list[int] = []
+
+    def loader():
+        for files_loaded in range(100):
+            loaded.append(files_loaded)
+            if files_loaded == 1:
+                worker.cancel()
+            yield LoadProgress(benchmark_data, files_loaded, 100, 0)
+    worker = LoaderWorker(loader(), report_interval=0.0)
+
+    progress, finished = run_loader(worker)
+
+    assert loaded == [0, 1]
+    assert [report.files_loaded for report in progress] == [0]
+    assert finished[0][0].files_loaded == 1 and finished[0][1]
+
+def test_loader_finishes_after_errors(application: QApplication):
+    def loader():
+        yield LoadProgress(BenchmarkData(['base']), 0, 1, 0)
+        raise OSError('Result file vanished')
+
+    progress, finished = run_loader(LoaderWorker(loader()))
+
+    assert len(progress) == 1
+    assert finished[0][0].files_loaded == 0 and not finished[0][1]
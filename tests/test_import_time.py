@@ -0,0 +1,23 @@
+import pytest
+
+from benchmarks.import_time import (
+    ACTION_MODULES, CLI_MODULE, IMPORT_TIME_BUDGET_MS, get_deferred_imports, import_first, measure_import_times
+)
+
+def test_cli_defers_heavy_imports():
+    import_times = measure_import_times(CLI_MODULE, runs=1)
+
+    assert CLI_MODULE in import_times
+    assert get_deferred_imports(import_times) == []
+
+@pytest.mark.parametrize('module', ACTION_MODULES)
+def test_action_modules_import_first(module: str):
+    completed = import_first(module)
+
+    assert completed.returncode == 0, completed.stderr
+
+@pytest.mark.timing
+def test_cli_import_time_budget():
+    import_times = measure_import_times(CLI_MODULE, runs=5)
+
+    assert import_times[CLI_MODULE]/1000.0 <= IMPORT_TIME_BUDGET_MS
@@ -0,0 +1,8 @@
+from ccbenchmark.__main__ import EXPORT_FORMATS, REPORT_FORMATS
+from ccbenchmark.export import ExportFormat
+from ccbenchmark.report import ReportFormat
+
+def test_format_choices_match_formats():
+    # Listed in the CLI so parsing arguments does not import the writers.
+    assert REPORT_FORMATS == [report_format.value for report_format in ReportFormat]
+    assert EXPORT_FORMATS == [export_format.value for export_format in ExportFormat]
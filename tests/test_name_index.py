@@ -0,0 +1,35 @@
+from ccbenchmark.name_index import SearchIndex
+
+IDS = ['cpp/sort/BM_Sort/8', 'cpp/sort/BM_StableSort/8', 'cpp/hash/BM_Hash/8', 'py/sort/bench_sorted']
+
+def make_index() -> SearchIndex:
+    search_index = SearchIndex()
+    for benchmark_index, benchmark_id in enumerate(IDS):
+        search_index.add(10 + benchmark_index, benchmark_id)
+    return search_index
+
+def test_substring_matches_in_added_order():
+    search_index = make_index()
+
+    assert search_index.search('') == [10, 11, 12, 13]
+    assert search_index.search('SORT') == [10, 11, 13]
+    assert search_index.search('  hash ') == [12]
+
+def test_fuzzy_matches_only_without_substring_matches():
+    search_index = make_index()
+
+    # The tightest fuzzy match comes first.
+    assert search_index.search('bmsrt') == [10, 11]
+    assert search_index.search('stblsrt') == [11]
+    assert search_index.search('xyz') == []
+
+def test_narrowing_sees_benchmarks_added_since():
+    search_index = make_index()
+    assert search_index.search('sort') == [10, 11, 13]
+
+    search_index.add(14, 'cpp/sort/BM_Sort/64')
+
+    assert search_index.search('sort/bm') == [10, 11, 14]
+    # Not a continuation of the last query, every benchmark is searched again.
+    assert search_index.search('hash') == [12]
+    assert len(search_index) == 5
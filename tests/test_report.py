@@ -0,0 +1,90 @@
+import io
+import json
+import math
+from html.parser import HTMLParser
+from pathlib import Path
+
+import pytest
+
+from ccbenchmark.benchmark_data import TimeType
+from ccbenchmark.confirm import Confirmation, Verdict
+from ccbenchmark.report import Comparison, ReportFormat, write_report
+
+COMPARISONS = [
+    Comparison(0, Path('cpp/sort'), 'BM_Sort/8', 'Time', 100.0, 120.0, 20.0,
+               confirmation=Confirmation('main', Verdict.CONFIRMED, 19.5, 0.004, 5, 5)),
+    Comparison(1, Path('cpp/sort'), 'BM_Sort|Pipe', 'μ', 100.0, 90.0, -10.0, load_warning='recent: load 3.5'),
+    # A baseline of 0 has an infinite Δ, a missing candidate a NaN one.
+    Comparison(2, Path('cpp/hash'), 'BM_Hash<int>', 'Time', 0.0, 5.0, math.inf),
+    Comparison(3, Path('cpp/hash'), 'BM_Hash/new', 'Time', 10.0, math.nan, math.nan,
+               confirmation=Confirmation('main', Verdict.INCONCLUSIVE, math.nan, math.nan, 0, 5, interleaved=False)),
+]
+
+class TableParser(HTMLParser):
+    """Text of every table cell, by row."""
+    def __init__(self):
+        super().__init__()
+        self.rows: list[list[str]] = []
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        if tag == 'tr':
+            self.rows.append([])
+        elif tag in ('td', 'th'):
+            self.rows[-1].append('')
+
+    def handle_data(self, data: str) -> None:
+        if len(self.rows) != 0 and len(self.rows[-1]) != 0:
+            self.rows[-1][-1] += data
+
+def write(report_format: ReportFormat) -> str:
+    stream = io.StringIO()
+    write_report(stream, COMPARISONS, report_format, 'main', 'recent', TimeType.REAL)
+    return stream.getvalue()
+
+def reject_constant(constant: str) -> None:
+    raise ValueError(f'{constant} is not valid JSON')
+
+def test_json_report_is_strict_json():
+    report = json.loads(write(ReportFormat.JSON), parse_constant=reject_constant)
+
+    assert (report['baseline'], report['candidate'], report['time_type']) == ('main', 'recent', 'real')
+    assert [row['name'] for row in report['benchmarks']] == [comparison.name for comparison in COMPARISONS]
+    assert report['benchmarks'][0]['confirmation']['verdict'] == 'confirmed'
+    assert report['benchmarks'][1]['under_load'] == 'recent: load 3.5'
+    assert report['benchmarks'][2]['delta'] is None
+    assert report['benchmarks'][3]['candidate'] is None
+    assert report['benchmarks'][3]['confirmation']['p_value'] is None
+    assert (report['compared'], report['slower'], report['faster'], report['under_load']) == (4, 2, 1, 1)
+    assert report['confirmations'] == {'confirmed': 1, 'refuted': 0, 'inconclusive': 1}
+
+def test_markdown_report_rows():
+    lines = write(ReportFormat.MARKDOWN).splitlines()
+    rows = [line for line in lines if line.startswith('| cpp/')]
+
+    assert lines[0] == '# Benchmark report: main → recent (real time)'
+    assert len(rows) == len(COMPARISONS)
+    # Pipes in names are escaped, so every row has the same cells as the header.
+    assert all(len(row.replace('\\|', '').split('|')) == len(lines[2].split('|')) for row in rows)
+    assert 'BM_Sort\\|Pipe' in rows[1] and '⚠ recent: load 3.5' in rows[1]
+    assert 'confirmed: +19.50 %' in rows[0]
+    assert lines[-1] == '4 benchmarks compared, 2 slower, 1 faster. 1 taken under load. Re-run: 1 confirmed, 0 refuted, 1 inconclusive.'
+
+def test_html_report_rows():
+    parser = TableParser()
+    parser.feed(write(ReportFormat.HTML))
+    header, *rows = parser.rows
+
+    assert header[:3] == ['Path', 'Benchmark', 'Metric']
+    assert [row[1] for row in rows] == [comparison.name for comparison in COMPARISONS]
+    assert rows[0][2:6] == ['Time', '100.00', '120.00', '+20.00']
+    assert rows[1][6] == 'recent: load 3.5'
+
+@pytest.mark.parametrize('report_format', list(ReportFormat))
+def test_empty_report(report_format: ReportFormat):
+    stream = io.StringIO()
+    write_report(stream, [], report_format, 'main', 'recent', TimeType.CPU)
+
+    if report_format == ReportFormat.JSON:
+        assert json.loads(stream.getvalue())['benchmarks'] == []
+    else:
+        assert '0 benchmarks compared' in stream.getvalue()
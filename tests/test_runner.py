@@ -0,0 +1,116 @@
+import signal
+import sys
+from pathlib import Path
+
+import pytest
+
+from ccbenchmark import runner
+from ccbenchmark.benchmark_framework import RunOptions
+from ccbenchmark.runner import RunJournal, RunOutcome, get_journal_path, run_runnable
+
+pytestmark = pytest.mark.skipif(sys.platform == 'win32', reason='Runnables are stopped through their process group')
+
+# Sleeps like a long benchmark, after writing to both streams.
+SLEEPING_RUNNABLE = """
+import signal, sys, time
+if sys.argv[1] == 'ignore_term':
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+print('BM_Sleep started', flush=True)
+print('sleeping', file=sys.stderr, flush=True)
+time.sleep(float(sys.argv[2]))
+open(sys.argv[3], 'w').write('{}')
+"""
+
+class SleepingFramework:
+    """Runs SLEEPING_RUNNABLE through `ccbenchmark.runner`."""
+    SUPPORTED_FORMATS = {'json'}
+
+    def __init__(self, seconds: float, ignore_term: bool = False):
+        self.seconds = seconds
+        self.ignore_term = ignore_term
+
+    def get_command(self, runnable_path: Path, output_location: Path, output_format: str, run_options: RunOptions) -> list[str]:
+        mode = 'ignore_term' if self.ignore_term else 'default'
+        return [sys.executable, '-c', SLEEPING_RUNNABLE, mode, str(self.seconds), str(output_location)]
+
+def run(tmp_path: Path, framework: SleepingFramework, timeout: float | None) -> RunOutcome:
+    return run_runnable(
+        framework, Path('bin/sleep'), tmp_path / 'sleep.json', 'json', RunOptions(timeout=timeout), tmp_path / 'logs' / 'sleep.log'
+    )
+
+def test_runnable_within_timeout(tmp_path: Path):
+    outcome = run(tmp_path, SleepingFramework(0.0), timeout=30.0)
+
+    assert (outcome.exit_code, outcome.timed_out) == (0, False)
+    assert outcome.stderr_tail == ['sleeping']
+    assert (tmp_path / 'sleep.json').is_file()
+    assert (tmp_path / 'logs' / 'sleep.log').read_text().splitlines() == ['BM_Sleep started', 'sleeping']
+
+def test_timeout_stops_runnable(tmp_path: Path):
+    (tmp_path / 'sleep.json').write_text('stale')
+
+    outcome = run(tmp_path, SleepingFramework(60.0), timeout=0.5)
+
+    assert outcome.timed_out
+    assert outcome.exit_code == -signal.SIGTERM
+    assert outcome.seconds < 30.0
+    assert not (tmp_path / 'sleep.json').exists()
+
+def test_timeout_kills_runnable_ignoring_sigterm(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(runner, 'KILL_GRACE', 0.5)
+
+    outcome = run(tmp_path, SleepingFramework(60.0, ignore_term=True), timeout=0.5)
+
+    assert outcome.timed_out
+    assert outcome.exit_code == -signal.SIGKILL
+
+def test_resume_skips_completed_runnables(tmp_path: Path):
+    options = {'profile': 'full'}
+    journal = RunJournal.start('nightly', options, resume=False, workspace=tmp_path)
+    journal.record(Path('bin/sort'), RunOutcome(0, 1.5))
+
+    resumed = RunJournal.start('nightly', options, resume=True, workspace=tmp_path)
+
+    assert resumed.is_completed(Path('bin/sort'))
+    assert not resumed.is_completed(Path('bin/hash'))
+
+def test_finished_run_is_not_resumed(tmp_path: Path):
+    journal = RunJournal.start('nightly', {}, resume=False, workspace=tmp_path)
+    journal.record(Path('bin/sort'), RunOutcome(0, 1.5))
+    journal.finish()
+
+    assert not RunJournal.start('nightly', {}, resume=True, workspace=tmp_path).is_completed(Path('bin/sort'))
+
+def test_run_without_resume_replaces_journal(tmp_path: Path):
+    RunJournal.start('nightly', {}, resume=False, workspace=tmp_path).record(Path('bin/sort'), RunOutcome(0, 1.5))
+
+    RunJournal.start('nightly', {}, resume=False, workspace=tmp_path)
+
+    assert not RunJournal.start('nightly', {}, resume=True, workspace=tmp_path).is_completed(Path('bin/sort'))
+
+def test_resume_skips_corrupt_lines(tmp_path: Path):
+    journal = RunJournal.start('nightly', {}, resume=False, workspace=tmp_path)
+    journal.record(Path('bin/sort'), RunOutcome(0, 1.5))
+    with open(get_journal_path('nightly', tmp_path), 'a', encoding='utf-8') as file:
+        file.write('not json\n{"runnable": "bin/hash", "exit_')
+
+    resumed = RunJournal.start('nightly', {}, resume=True, workspace=tmp_path)
+
+    assert resumed.is_completed(Path('bin/sort'))
+    assert not resumed.is_completed(Path('bin/hash'))
+
+def test_resume_of_unreadable_journal_runs_everything(tmp_path: Path):
+    path = get_journal_path('nightly', tmp_path)
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b'\xff\xfe garbage')
+
+    journal = RunJournal.start('nightly', {}, resume=True, workspace=tmp_path)
+
+    assert journal.completed == {}
+
+def test_journal_of_other_values_is_ignored(tmp_path: Path):
+    path = get_journal_path('nightly', tmp_path)
+    path.parent.mkdir(parents=True)
+    path.write_text('[1, 2]\n"bin/sort"\n')
+
+    assert RunJournal.start('nightly', {}, resume=True, workspace=tmp_path).completed == {}
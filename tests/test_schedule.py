@@ -0,0 +1,95 @@
+import ctypes
+import ctypes.util
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+from ccbenchmark.schedule import (
+    BenchmarkHistory, RunnableHistory, RunSchedule, ScheduledRunnable, format_duration, parse_duration, plan_budget
+)
+
+REG_EXTENDED = 1
+REG_NOSUB = 8
+
+def search_ere(pattern: str, names: list[str]) -> list[str]:
+    """Names a POSIX extended regex matches, compiled by libc like Google Benchmark's filter."""
+    libc = ctypes.CDLL(ctypes.util.find_library('c'))
+    # Larger than regex_t of any libc.
+    regex = ctypes.create_string_buffer(1024)
+    assert libc.regcomp(regex, pattern.encode(), REG_EXTENDED | REG_NOSUB) == 0, f'Invalid ERE: {pattern}'
+    try:
+        return [name for name in names if libc.regexec(regex, name.encode(), 0, None, 0) == 0]
+    finally:
+        libc.regfree(regex)
+
+def make_history(name: str, priorities: list[float], repetition_seconds: float | None = 1.0, repetitions: int = 1) -> RunnableHistory:
+    benchmarks = [BenchmarkHistory(f'BM_{name}/{i}', priority) for i, priority in enumerate(priorities)]
+    return RunnableHistory(Path(name), repetitions, repetition_seconds, benchmarks, min_time=0.5)
+
+@pytest.mark.parametrize(('text', 'seconds'), [('30m', 1800.0), ('1h30m', 5400.0), ('90s', 90.0), ('45', 2700.0), (' 1.5H ', 5400.0)])
+def test_parse_duration(text: str, seconds: float):
+    assert parse_duration(text) == seconds
+
+@pytest.mark.parametrize('text', ['', '0m', 'soon', '10x', '-5m'])
+def test_parse_duration_rejects_invalid(text: str):
+    with pytest.raises(ValueError):
+        parse_duration(text)
+
+def test_format_duration():
+    assert [format_duration(seconds) for seconds in (2.5, 12.0, 250.0, 3900.0)] == ['2.5s', '12s', '4m 10s', '1h 05m']
+
+def test_budget_selects_highest_priority_first():
+    histories = [make_history('sort', [5.0, 1.0, math.inf]), make_history('hash', [3.0, 0.5])]
+
+    schedule = plan_budget(histories, budget_seconds=3.0)
+
+    sort, hash_ = schedule.runnables[Path('sort')], schedule.runnables[Path('hash')]
+    # BM_sort/2 has no history and always runs, then BM_sort/0 and BM_hash/0 fit.
+    assert sort.selected == ['BM_sort/2', 'BM_sort/0']
+    assert sort.skipped == ['BM_sort/1']
+    assert hash_.selected == ['BM_hash/0']
+    assert hash_.skipped == ['BM_hash/1']
+    assert schedule.estimated_seconds == 3.0
+    assert sort.repetition_factor == hash_.repetition_factor == 1
+
+def test_budget_skips_runnables_without_selected_benchmarks():
+    schedule = plan_budget([make_history('sort', [1.0]), make_history('hash', [2.0])], budget_seconds=1.0)
+
+    assert schedule.runnables[Path('hash')].runs
+    assert not schedule.runnables[Path('sort')].runs
+
+def test_budget_doubles_min_time_of_single_repetitions():
+    histories = [make_history('sort', [1.0]), make_history('hash', [1.0], repetitions=2)]
+
+    schedule = plan_budget(histories, budget_seconds=100.0)
+
+    sort, hash_ = schedule.runnables[Path('sort')], schedule.runnables[Path('hash')]
+    assert (sort.repetitions, sort.min_time, sort.repetition_factor) == (1, 2.0, 4)
+    assert (hash_.repetitions, hash_.min_time, hash_.repetition_factor) == (8, None, 4)
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Compiles the filter with glibc regcomp')
+def test_name_pattern_of_skipped_benchmarks_is_an_ere():
+    schedule = plan_budget([make_history('sort', [5.0, 1.0, 3.0])], budget_seconds=2.0)
+    runnable = schedule.runnables[Path('sort')]
+    names = ['BM_sort/0', 'BM_sort/1', 'BM_sort/2', 'BM_sort/new']
+
+    assert search_ere(runnable.get_name_pattern(None, names), names) == ['BM_sort/0', 'BM_sort/2', 'BM_sort/new']
+    assert search_ere(runnable.get_name_pattern(None), names) == ['BM_sort/0', 'BM_sort/2']
+    assert search_ere(runnable.get_name_pattern('^(BM_sort/2|BM_sort/new)$', names), names) == ['BM_sort/2', 'BM_sort/new']
+
+def test_name_pattern_without_skipped_benchmarks():
+    runnable = ScheduledRunnable(Path('sort'), 1, selected=['BM_sort/0'])
+
+    assert runnable.get_name_pattern(None) is None
+    assert runnable.get_name_pattern('^BM_sort/0$') == '^BM_sort/0$'
+
+def test_eta_is_corrected_by_finished_runnables():
+    schedule = RunSchedule(60.0)
+    for name in ('a', 'b', 'c'):
+        schedule.runnables[Path(name)] = ScheduledRunnable(Path(name), 1, selected=['BM'], estimated_seconds=10.0)
+
+    assert schedule.get_eta() == 30.0
+    schedule.finish(Path('a'), 20.0)
+    assert schedule.get_eta() == 40.0
@@ -0,0 +1,59 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from benchmarks.generate_history import FAMILY_ARGS, generate_history
+from benchmarks.self_benchmark import to_google_benchmark_json
+
+from ccbenchmark.benchmark_framework import import_framework
+from ccbenchmark.benchmark_settings import load_local_settings
+from ccbenchmark.frameworks.cpp.google_benchmark import parse_json
+from ccbenchmark.frameworks.util.metrics import MetricIndices
+
+def test_generated_history_parses(tmp_path: Path):
+    history = generate_history(tmp_path, benchmark_count=160, iteration_count=3, benchmarks_per_runnable=40)
+
+    local_settings = load_local_settings(tmp_path)
+    assert local_settings.framework_name_list == ['cpp.google_benchmark', 'python.pyperf']
+
+    names: set[str] = set()
+    suffixes: set[str] = set()
+    for framework_name, output_format, output_dir in zip(
+        local_settings.framework_name_list, local_settings.output_format_list, local_settings.output_dir_list
+    ):
+        framework = import_framework(framework_name, output_format)
+        iteration_dirs = sorted(output_dir.rglob('_iter_*'))
+        assert {path.name for path in iteration_dirs} == {'_iter_0000', '_iter_0001', '_iter_0002'}
+        for file_path in output_dir.rglob('_iter_0000/*'):
+            suffixes.add(file_path.suffix)
+            with open(file_path, 'r', encoding='utf-8') as file_stream:
+                names |= {f'{file_path.stem}/{result.name}' for result in framework.parse(file_stream, file_path)}
+
+    assert history.file_count == 4*3
+    assert suffixes == {'.json', '.csv', '.console'}
+    # Every family argument, plus one name per family with BigO and RMS entries.
+    assert len([name for name in names if name.rsplit('/', 1)[-1] in {str(arg) for arg in FAMILY_ARGS}]) >= 120
+    assert len(names) >= history.benchmark_count
+
+def test_self_benchmark_output_parses():
+    repetition_results = [
+        {'BM_Discovery': 0.010, 'BM_Parse': 0.5, 'peak_rss': 1e8},
+        {'BM_Discovery': 0.012, 'BM_Parse': 0.6, 'peak_rss': 1.1e8},
+    ]
+
+    results = list(parse_json(to_google_benchmark_json(repetition_results, Path('.'))))
+
+    means = {result.name: result for result in results if result.metric_index == MetricIndices.Mean.value}
+    assert set(means) == {'BM_Discovery/repeats:2', 'BM_Parse/repeats:2'}
+    assert means['BM_Parse/repeats:2'].real_samples == [500.0, 600.0]
+    assert abs(means['BM_Parse/repeats:2'].real_time.time_value - 550.0) < 1e-9
+
+def test_self_benchmark_accepts_run_profile_flags():
+    command = [
+        sys.executable, str(Path(__file__).parents[1] / 'benchmarks' / 'self_benchmark.py'), '--benchmark_list_tests=true',
+        '--benchmark_repetitions=3', '--benchmark_min_time=0.5s', '--benchmark_filter=BM_Parse'
+    ]
+
+    completed = subprocess.run(command, capture_output=True, text=True, check=True)
+
+    assert completed.stdout.split() == ['BM_Parse/repeats:3']
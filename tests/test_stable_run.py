@@ -0,0 +1,33 @@
+import pytest
+
+from ccbenchmark.stable_run import parse_cpu_list, select_cpus
+
+# 4 physical cores with 2 SMT siblings each: CPU n and n + 4.
+SIBLINGS = {cpu: {cpu % 4, cpu % 4 + 4} for cpu in range(8)}
+ALL_CPUS = set(range(8))
+
+def test_parse_cpu_list():
+    assert parse_cpu_list('0-3,8,10-11\n') == [0, 1, 2, 3, 8, 10, 11]
+    assert parse_cpu_list('5') == [5]
+    assert parse_cpu_list('\n') == []
+    with pytest.raises(ValueError):
+        parse_cpu_list('0-x')
+
+def test_isolated_cpus_one_per_core():
+    assert select_cpus(ALL_CPUS, {2, 3, 6, 7}, SIBLINGS) == [2, 3]
+
+def test_core_with_busy_sibling_is_skipped():
+    # CPU 7, the sibling of CPU 3, is not isolated.
+    assert select_cpus(ALL_CPUS, {2, 3, 6}, SIBLINGS) == [2]
+
+def test_without_isolated_cpus_cpu_0_is_left_out():
+    # The core of CPU 0 is skipped, CPU 4 shares it.
+    assert select_cpus(ALL_CPUS, set(), SIBLINGS) == [1, 2, 3]
+    # Isolated CPUs this process may not run on are ignored.
+    assert select_cpus({0, 1, 5}, {2, 3}, SIBLINGS) == [1]
+
+def test_never_empty_if_cpus_are_available():
+    assert select_cpus({0}, set(), SIBLINGS) == [0]
+    # Every isolated core has a busy sibling.
+    assert select_cpus(ALL_CPUS, {2}, SIBLINGS) == [2]
+    assert select_cpus(set(), set(), SIBLINGS) == []
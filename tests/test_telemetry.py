@@ -0,0 +1,81 @@
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from ccbenchmark import telemetry
+from ccbenchmark.telemetry import TelemetrySampler, get_telemetry_path, read_telemetry_summary
+
+pytestmark = pytest.mark.skipif(sys.platform == 'win32', reason='Telemetry is read from procfs and sysfs')
+
+@pytest.fixture
+def machine(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Fake sysfs and procfs with 2 CPUs and one thermal zone."""
+    for cpu, khz in ((0, '2400000'), (1, '1200000')):
+        (tmp_path / 'cpu' / f'cpu{cpu}' / 'cpufreq').mkdir(parents=True)
+        (tmp_path / 'cpu' / f'cpu{cpu}' / 'cpufreq' / 'scaling_cur_freq').write_text(khz)
+    (tmp_path / 'thermal' / 'thermal_zone0').mkdir(parents=True)
+    (tmp_path / 'loadavg').write_text('1.50 1.00 0.50 2/100 123\n')
+    monkeypatch.setattr(telemetry, '_CPU_DIR', tmp_path / 'cpu')
+    monkeypatch.setattr(telemetry, '_THERMAL_DIR', tmp_path / 'thermal')
+    monkeypatch.setattr(telemetry, '_PROC_LOADAVG', tmp_path / 'loadavg')
+    return tmp_path
+
+def sample(monkeypatch: pytest.MonkeyPatch, seconds: float, busy_seconds: float, own_seconds: float) -> TelemetrySampler:
+    """Samples once when starting and once when stopping, `seconds` apart."""
+    clock = iter([100.0, 100.0, 100.0 + seconds])
+    jiffies = iter([(1000, 10000), (1000 + round(busy_seconds*os.sysconf('SC_CLK_TCK')), 20000)])
+    cpu_seconds = iter([1.0, 1.0 + own_seconds])
+    monkeypatch.setattr(telemetry, 'time', SimpleNamespace(perf_counter=lambda: next(clock)))
+    monkeypatch.setattr(telemetry, '_read_cpu_jiffies', lambda: next(jiffies))
+    monkeypatch.setattr(telemetry, '_own_cpu_seconds', lambda: next(cpu_seconds))
+
+    # The interval is longer than the test, no sample is taken in between.
+    sampler = TelemetrySampler(interval=60.0)
+    sampler.start()
+    sampler.stop()
+    return sampler
+
+def test_summary_of_idle_machine(machine: Path, monkeypatch: pytest.MonkeyPatch):
+    (machine / 'thermal' / 'thermal_zone0' / 'temp').write_text('45000')
+
+    summary = sample(monkeypatch, 2.0, busy_seconds=1.0, own_seconds=0.9).summary
+
+    assert (summary.duration, summary.sample_count) == (2.0, 2)
+    assert summary.load_average_max == 1.5
+    assert summary.other_cpu_cores == 0.05
+    assert (summary.cpu_mhz_min, summary.cpu_mhz_max) == (1200.0, 2400.0)
+    assert summary.temperature_max == 45.0
+    assert not summary.under_load
+    assert summary.describe() == ''
+
+def test_summary_under_load(machine: Path, monkeypatch: pytest.MonkeyPatch):
+    (machine / 'thermal' / 'thermal_zone0' / 'temp').write_text('95000')
+
+    summary = sample(monkeypatch, 2.0, busy_seconds=3.0, own_seconds=0.5).summary
+
+    assert summary.other_cpu_cores == 1.25
+    assert summary.under_load
+    assert summary.describe() == 'other processes kept 1.25 CPUs busy; a thermal zone reached 95 °C'
+
+def test_short_run_is_not_checked_for_load(machine: Path, monkeypatch: pytest.MonkeyPatch):
+    summary = sample(monkeypatch, 0.5, busy_seconds=3.0, own_seconds=0.0).summary
+
+    assert summary.other_cpu_cores is None
+    assert summary.temperature_max is None
+    assert not summary.under_load
+
+def test_summary_round_trip(machine: Path, monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    (machine / 'thermal' / 'thermal_zone0' / 'temp').write_text('95000')
+    sampler = sample(monkeypatch, 2.0, busy_seconds=3.0, own_seconds=0.5)
+    result_path = tmp_path / 'out' / '_iter_main' / 'sort.json'
+
+    assert read_telemetry_summary(result_path) is None
+
+    assert sampler.write(result_path.parent, 'sort') == get_telemetry_path(result_path)
+    assert read_telemetry_summary(result_path) == sampler.summary
+
+    get_telemetry_path(result_path).write_text('{"summary": {"unknown": 1}}')
+    assert read_telemetry_summary(result_path) is None